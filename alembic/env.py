@@ -20,11 +20,15 @@ import sys
 import os
 sys.path.insert(0, os.getcwd())
 
-from src.api.database import Base
+from src.api.database import SQLALCHEMY_DATABASE_URL, Base
 from src.api.models import User, ProjectModel  # Ensure models are loaded
 
 target_metadata = Base.metadata
 
+# 앱과 같은 DB(DATABASE_URL, 없으면 temp/justjam.db)에 마이그레이션한다
+# (ini 값은 % 보간을 거치므로 비밀번호의 %를 이스케이프)
+config.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL.replace("%", "%%"))
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -0,0 +1,33 @@
+"""Add project content hash
+
+Revision ID: 3c1d2e4f5a6b
+Revises: fba774b6c06b
+Create Date: 2026-10-19 10:12:41.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1d2e4f5a6b"
+down_revision: Union[str, Sequence[str], None] = "fba774b6c06b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.create_index("ix_projects_content_hash", ["content_hash"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.drop_index("ix_projects_content_hash")
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,102 @@
+"""Move asset content to blob store
+
+Revision ID: 7e4b2a9c1d0f
+Revises: 3c1d2e4f5a6b
+Create Date: 2026-10-19 14:05:12.000000
+
+"""
+
+import base64
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7e4b2a9c1d0f"
+down_revision: Union[str, Sequence[str], None] = "3c1d2e4f5a6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MEDIA_TYPES = {"score": "application/xml", "midi": "audio/midi", "tab": "application/json"}
+
+assets = sa.table(
+    "project_assets",
+    sa.column("id", sa.Integer),
+    sa.column("asset_type", sa.String),
+    sa.column("content", sa.String),
+    sa.column("content_hash", sa.String),
+    sa.column("size", sa.Integer),
+    sa.column("media_type", sa.String),
+)
+
+
+def _inline_bytes(asset_type: str, content: str) -> bytes:
+    # MIDI was stored inline as base64
+    if asset_type == "midi":
+        return base64.b64decode(content)
+    return content.encode("utf-8")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("project_assets", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("size", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("media_type", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("params", sa.String(), nullable=True))
+        batch_op.create_index("ix_project_assets_content_hash", ["content_hash"], unique=False)
+
+    # Move inline content into the configured blob store (ASSET_STORE) one row at a time
+    from src.api.services.blob_store import get_blob_store
+
+    store = get_blob_store()
+    bind = op.get_bind()
+    ids = [
+        row.id for row in bind.execute(sa.select(assets.c.id).where(assets.c.content.isnot(None)))
+    ]
+    for asset_id in ids:
+        row = bind.execute(
+            sa.select(assets.c.asset_type, assets.c.content).where(assets.c.id == asset_id)
+        ).first()
+        data = _inline_bytes(row.asset_type, row.content)
+        key = store.put(data)
+        bind.execute(
+            assets.update()
+            .where(assets.c.id == asset_id)
+            .values(
+                content_hash=key,
+                size=len(data),
+                media_type=MEDIA_TYPES.get(row.asset_type),
+                content=None,
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from src.api.services.blob_store import get_blob_store
+
+    store = get_blob_store()
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(assets.c.id, assets.c.asset_type, assets.c.content_hash).where(
+            assets.c.content_hash.isnot(None)
+        )
+    ).all()
+    for row in rows:
+        data = store.get(row.content_hash)
+        content = (
+            base64.b64encode(data).decode("utf-8")
+            if row.asset_type == "midi"
+            else data.decode("utf-8")
+        )
+        bind.execute(assets.update().where(assets.c.id == row.id).values(content=content))
+
+    with op.batch_alter_table("project_assets", schema=None) as batch_op:
+        batch_op.drop_index("ix_project_assets_content_hash")
+        batch_op.drop_column("params")
+        batch_op.drop_column("media_type")
+        batch_op.drop_column("size")
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,45 @@
+"""Add project listing indexes
+
+Revision ID: 9a5f3c8e2b71
+Revises: 7e4b2a9c1d0f
+Create Date: 2026-10-19 16:40:27.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a5f3c8e2b71"
+down_revision: Union[str, Sequence[str], None] = "7e4b2a9c1d0f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_project_owner_created", "projects", ["user_id", "created_at", "id"], unique=False
+    )
+    op.create_index("idx_project_owner_name", "projects", ["user_id", "name", "id"], unique=False)
+    op.create_index(
+        "idx_project_member_user_project",
+        "project_members",
+        ["user_id", "project_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_project_asset_summary",
+        "project_assets",
+        ["project_id", "asset_type", "instrument"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_project_asset_summary", table_name="project_assets")
+    op.drop_index("idx_project_member_user_project", table_name="project_members")
+    op.drop_index("idx_project_owner_name", table_name="projects")
+    op.drop_index("idx_project_owner_created", table_name="projects")
@@ -0,0 +1,50 @@
+"""Add project search index
+
+Revision ID: b4d8e1f6a2c9
+Revises: 9a5f3c8e2b71
+Create Date: 2026-10-19 18:02:55.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d8e1f6a2c9"
+down_revision: Union[str, Sequence[str], None] = "9a5f3c8e2b71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "project_search_documents",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("project_id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("detected_key", sa.String(), nullable=True),
+        sa.Column("chords", sa.String(), nullable=True),
+        sa.Column("members", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("project_id"),
+    )
+
+    # FTS5 (SQLite) / tsvector + GIN (PostgreSQL) 인덱스를 만들고 기존 프로젝트로 채운다
+    from src.api.services.search_index import create_search_index, rebuild_search_index
+
+    bind = op.get_bind()
+    create_search_index(bind)
+    rebuild_search_index(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from src.api.services.search_index import drop_search_index
+
+    drop_search_index(op.get_bind())
+    op.drop_table("project_search_documents")
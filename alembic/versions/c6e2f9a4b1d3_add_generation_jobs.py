@@ -0,0 +1,88 @@
+"""Add generation jobs
+
+Revision ID: c6e2f9a4b1d3
+Revises: b4d8e1f6a2c9
+Create Date: 2026-10-19 21:14:08.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e2f9a4b1d3"
+down_revision: Union[str, Sequence[str], None] = "b4d8e1f6a2c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_STATUS_CLAUSE = sa.text("status IN ('pending', 'processing')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 앱 시작 시 create_all로 이미 테이블이 만들어진 DB에서는 빠진 인덱스만 추가한다
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("generation_jobs"):
+        op.create_table(
+            "generation_jobs",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("project_id", sa.String(), nullable=True),
+            sa.Column("asset_type", sa.String(), nullable=True),
+            sa.Column("instrument", sa.String(), nullable=True),
+            sa.Column("status", sa.String(), nullable=True),
+            sa.Column("progress", sa.Integer(), nullable=True),
+            sa.Column("error", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        existing = set()
+    else:
+        existing = {index["name"] for index in inspector.get_indexes("generation_jobs")}
+
+    if "ix_generation_jobs_id" not in existing:
+        op.create_index("ix_generation_jobs_id", "generation_jobs", ["id"], unique=False)
+    if "ix_generation_jobs_project_id" not in existing:
+        op.create_index(
+            "ix_generation_jobs_project_id", "generation_jobs", ["project_id"], unique=False
+        )
+    if "idx_generation_job_target" not in existing:
+        op.create_index(
+            "idx_generation_job_target",
+            "generation_jobs",
+            ["project_id", "asset_type", "instrument"],
+            unique=False,
+        )
+    if "uq_generation_job_active" not in existing:
+        # 같은 대상에 진행 중인 작업이 여럿 남아 있으면 하나만 두고 실패로 표시해야 유일 인덱스를 만들 수 있다
+        op.execute(
+            "UPDATE generation_jobs SET status = 'failed' "
+            "WHERE status IN ('pending', 'processing') AND EXISTS ("
+            "SELECT 1 FROM generation_jobs other "
+            "WHERE other.project_id = generation_jobs.project_id "
+            "AND other.asset_type = generation_jobs.asset_type "
+            "AND other.instrument = generation_jobs.instrument "
+            "AND other.status IN ('pending', 'processing') "
+            "AND other.id < generation_jobs.id)"
+        )
+        op.create_index(
+            "uq_generation_job_active",
+            "generation_jobs",
+            ["project_id", "asset_type", "instrument"],
+            unique=True,
+            sqlite_where=ACTIVE_STATUS_CLAUSE,
+            postgresql_where=ACTIVE_STATUS_CLAUSE,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_generation_job_active", table_name="generation_jobs")
+    op.drop_index("idx_generation_job_target", table_name="generation_jobs")
+    op.drop_index("ix_generation_jobs_project_id", table_name="generation_jobs")
+    op.drop_index("ix_generation_jobs_id", table_name="generation_jobs")
+    op.drop_table("generation_jobs")
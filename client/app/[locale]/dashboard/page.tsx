@@ -164,6 +164,7 @@ export default function DashboardPage() {
               <SelectItem value="newest">최신순</SelectItem>
               <SelectItem value="oldest">오래된순</SelectItem>
               <SelectItem value="name">이름순</SelectItem>
+              <SelectItem value="relevance" disabled={!searchQuery}>관련도순</SelectItem>
             </SelectContent>
           </Select>
           <input
@@ -1,5 +1,12 @@
+import { useEffect } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { fetchProject, processProject, fetchProjectStems } from '@/lib/api';
+import {
+    fetchProject,
+    processProject,
+    fetchProjectStems,
+    subscribeProjectEvents,
+    Project,
+} from '@/lib/api';
 
 export function useProject(id: string) {
     const queryClient = useQueryClient();
@@ -7,9 +14,35 @@ export function useProject(id: string) {
     const projectQuery = useQuery({
         queryKey: ['project', id],
         queryFn: () => fetchProject(id),
-        refetchInterval: (query) => (query.state.data?.status === 'processing' ? 1000 : false),
+        // 진행률은 SSE로 받으므로 폴링은 스트림이 끊겼을 때를 대비한 느린 백업용
+        refetchInterval: (query) => (query.state.data?.status === 'processing' ? 15000 : false),
     });
 
+    const isProjectProcessing = projectQuery.data?.status === 'processing';
+
+    useEffect(() => {
+        if (!isProjectProcessing) return;
+        const controller = new AbortController();
+
+        subscribeProjectEvents(
+            id,
+            (event) => {
+                if (event.status === 'processing') {
+                    queryClient.setQueryData<Project>(['project', id], (prev) =>
+                        prev ? { ...prev, progress: event.percent } : prev
+                    );
+                } else {
+                    queryClient.invalidateQueries({ queryKey: ['project', id] });
+                }
+            },
+            controller.signal
+        ).catch((error) => {
+            if (!controller.signal.aborted) console.warn('Progress stream closed', error);
+        });
+
+        return () => controller.abort();
+    }, [id, isProjectProcessing, queryClient]);
+
     const stemsQuery = useQuery({
         queryKey: ['project', id, 'stems'],
         queryFn: () => fetchProjectStems(id),
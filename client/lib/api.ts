@@ -1,4 +1,5 @@
-import apiClient from './api-client';
+import { getSession } from 'next-auth/react';
+import apiClient, { API_BASE_URL } from './api-client';
 
 export interface User {
   id: number;
@@ -66,6 +67,23 @@ export const fetchProjects = async (params?: { q?: string; sort?: string }): Pro
   return response.data;
 };
 
+export interface ProjectPage {
+  projects: Project[];
+  nextCursor: string | null;
+}
+
+// 목록은 keyset 페이지로 나뉜다. 다음 페이지는 X-Next-Cursor 값을 cursor로 넘겨 받는다
+// (같은 q/sort로 요청해야 한다).
+export const fetchProjectPage = async (params?: {
+  q?: string;
+  sort?: string;
+  cursor?: string;
+  limit?: number;
+}): Promise<ProjectPage> => {
+  const response = await apiClient.get('/projects/', { params });
+  return { projects: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
+};
+
 export const updateProject = async (id: string, data: { name: string }): Promise<Project> => {
   const response = await apiClient.patch(`/projects/${id}`, data);
   return response.data;
@@ -81,7 +99,62 @@ export const fetchProject = async (id: string): Promise<Project> => {
   return response.data;
 };
 
-export const createProject = async (file: File): Promise<Project> => {
+// 이 크기를 넘는 파일은 이어받기 가능한 청크 업로드로 전송
+const CHUNKED_UPLOAD_THRESHOLD = 32 * 1024 * 1024;
+const UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024;
+const UPLOAD_MAX_RETRIES = 5;
+
+interface UploadSession {
+  upload_id: string;
+  file_name: string;
+  total_size: number;
+  received: number;
+}
+
+const uploadInChunks = async (
+  file: File,
+  onProgress?: (percent: number) => void
+): Promise<Project> => {
+  const { data: session } = await apiClient.post<UploadSession>('/projects/uploads', {
+    file_name: file.name,
+    total_size: file.size,
+  });
+
+  let offset = 0;
+  let retries = 0;
+  while (offset < file.size) {
+    try {
+      const { data } = await apiClient.put<UploadSession>(
+        `/projects/uploads/${session.upload_id}`,
+        file.slice(offset, offset + UPLOAD_CHUNK_SIZE),
+        { params: { offset }, headers: { 'Content-Type': 'application/octet-stream' } }
+      );
+      offset = data.received;
+      retries = 0;
+      onProgress?.(Math.round((offset / file.size) * 100));
+    } catch (error: any) {
+      const status = error?.response?.status;
+      if ((status && status !== 409 && status < 500) || ++retries > UPLOAD_MAX_RETRIES) {
+        throw error;
+      }
+      // 서버가 실제로 받은 위치부터 이어서 전송
+      const { data } = await apiClient.get<UploadSession>(`/projects/uploads/${session.upload_id}`);
+      offset = data.received;
+    }
+  }
+
+  const response = await apiClient.post(`/projects/uploads/${session.upload_id}/complete`);
+  return response.data;
+};
+
+export const createProject = async (
+  file: File,
+  onProgress?: (percent: number) => void
+): Promise<Project> => {
+  if (file.size > CHUNKED_UPLOAD_THRESHOLD) {
+    return uploadInChunks(file, onProgress);
+  }
+
   const formData = new FormData();
   formData.append('file', file);
 
@@ -98,6 +171,49 @@ export const processProject = async (id: string): Promise<Project> => {
   return response.data;
 };
 
+export interface ProgressEvent {
+  project_id: string;
+  status: Project['status'];
+  percent: number;
+  stage?: string;
+  stage_status?: 'skipped' | 'started' | 'completed' | 'failed';
+  error?: string;
+}
+
+// 서버가 보내는 처리 진행률 SSE 구독 (EventSource는 Authorization 헤더를 보낼 수 없어 fetch 사용)
+export const subscribeProjectEvents = async (
+  id: string,
+  onEvent: (event: ProgressEvent) => void,
+  signal: AbortSignal
+): Promise<void> => {
+  const session = await getSession();
+  const response = await fetch(`${API_BASE_URL}/projects/${id}/events`, {
+    headers: session?.accessToken ? { Authorization: `Bearer ${session.accessToken}` } : {},
+    signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Progress stream failed: ${response.status}`);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += value;
+    const messages = buffer.split('\n\n');
+    buffer = messages.pop() ?? '';
+    for (const message of messages) {
+      const data = message
+        .split('\n')
+        .filter((line) => line.startsWith('data: '))
+        .map((line) => line.slice(6))
+        .join('\n');
+      if (data) onEvent(JSON.parse(data));
+    }
+  }
+};
+
 export const fetchProjectStems = async (id: string): Promise<StemFiles> => {
   const response = await apiClient.get(`/projects/${id}/stems`);
   const data = response.data;
@@ -119,27 +235,128 @@ export const fetchProjectStems = async (id: string): Promise<StemFiles> => {
   };
 };
 
-export const generateScore = async (id: string, instrument: string): Promise<string> => {
-  const response = await apiClient.post(`/projects/${id}/score/${instrument}`);
-  // Assuming backend returns string content for score or path, checking original it was text
-  // If it's returning raw text/xml content:
-  if (typeof response.data === 'string') return response.data;
-  // If object?
-  return JSON.stringify(response.data);
+export interface GenerationJob {
+  id: string;
+  project_id: string;
+  asset_type: 'score' | 'midi' | 'tab';
+  instrument: string;
+  status: 'pending' | 'processing' | 'completed' | 'failed';
+  progress: number;
+  error?: string | null;
+  status_url: string;
+  result_url: string;
+}
+
+const JOB_POLL_INTERVAL_MS = 1500;
+
+// 생성 요청: 캐시 히트면 200으로 결과가 바로 오고, 아니면 202 + 작업 정보가 온다.
+// 202인 경우 결과 엔드포인트가 200을 줄 때까지 폴링한다.
+const requestGeneratedAsset = async <T>(
+  path: string,
+  responseType: 'text' | 'json' | 'blob',
+  onProgress?: (job: GenerationJob) => void,
+): Promise<T> => {
+  const response = await apiClient.post(path, null, { responseType });
+  if (response.status !== 202) return response.data;
+
+  const parseJob = async (data: unknown): Promise<GenerationJob> => {
+    if (data instanceof Blob) return JSON.parse(await data.text());
+    if (typeof data === 'string') return JSON.parse(data);
+    return data as GenerationJob;
+  };
+
+  let job = await parseJob(response.data);
+  for (;;) {
+    onProgress?.(job);
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    const result = await apiClient.get(job.result_url, { responseType });
+    if (result.status !== 202) return result.data;
+    job = await parseJob(result.data);
+  }
 };
 
-export const generateTab = async (id: string, instrument: string): Promise<TabResponse> => {
-  const response = await apiClient.post(`/projects/${id}/tabs/${instrument}`);
-  return response.data;
+export const generateScore = async (
+  id: string,
+  instrument: string,
+  onProgress?: (job: GenerationJob) => void,
+): Promise<string> => {
+  const data = await requestGeneratedAsset<unknown>(
+    `/projects/${id}/score/${instrument}`,
+    'text',
+    onProgress,
+  );
+  if (typeof data === 'string') return data;
+  return JSON.stringify(data);
 };
 
-export const generateMidi = async (id: string, instrument: string): Promise<Blob> => {
-  const response = await apiClient.post(`/projects/${id}/midi/${instrument}`, null, {
-    responseType: 'blob',
+export const generateTab = async (
+  id: string,
+  instrument: string,
+  onProgress?: (job: GenerationJob) => void,
+): Promise<TabResponse> => {
+  return requestGeneratedAsset<TabResponse>(`/projects/${id}/tabs/${instrument}`, 'json', onProgress);
+};
+
+export interface MeasurePage {
+  from_measure: number;
+  count: number;
+  total_measures: number;
+  next_from_measure: number | null;
+}
+
+export interface TabPageResponse extends TabResponse {
+  page: MeasurePage;
+}
+
+export interface ScorePage {
+  xml: string;
+  totalMeasures: number;
+  nextFromMeasure: number | null;
+}
+
+const MEASURES_PER_PAGE = 16;
+
+// 긴 곡은 마디 구간으로 나눠 받아 스크롤에 맞춰 지연 로딩한다.
+// 구간마다 ETag가 있어 브라우저가 같은 구간을 다시 받을 때 304로 재검증한다.
+// 자산이 아직 없으면 404이므로 generateTab/generateScore로 먼저 생성한다.
+export const fetchTabPage = async (
+  id: string,
+  instrument: string,
+  fromMeasure: number,
+  count: number = MEASURES_PER_PAGE,
+): Promise<TabPageResponse> => {
+  const response = await apiClient.get(`/projects/${id}/tabs/${instrument}/measures`, {
+    params: { from_measure: fromMeasure, count },
   });
   return response.data;
 };
 
+export const fetchScorePage = async (
+  id: string,
+  instrument: string,
+  fromMeasure: number,
+  count: number = MEASURES_PER_PAGE,
+): Promise<ScorePage> => {
+  const response = await apiClient.get(`/projects/${id}/score/${instrument}/measures`, {
+    params: { from_measure: fromMeasure, count },
+    responseType: 'text',
+  });
+  const next = response.headers['x-next-from-measure'];
+  return {
+    xml: response.data,
+    totalMeasures: Number(response.headers['x-total-measures']),
+    nextFromMeasure: next ? Number(next) : null,
+  };
+};
+
+export const generateMidi = async (
+  id: string,
+  instrument: string,
+  onProgress?: (job: GenerationJob) => void,
+): Promise<Blob> => {
+  return requestGeneratedAsset<Blob>(`/projects/${id}/midi/${instrument}`, 'blob', onProgress);
+};
+
 export const downloadMix = async (
   id: string,
   volumes: Record<string, number>,
@@ -32,6 +32,8 @@ setup(
         "python-dotenv>=1.0.0",
     ],
     extras_require={
+        "s3": ["boto3>=1.34"],
+        "postgres": ["psycopg2-binary>=2.9"],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
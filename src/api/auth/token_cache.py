@@ -0,0 +1,123 @@
+"""
+검증된 액세스 토큰 캐시
+
+인증이 필요한 요청마다 JWT 서명 검증과 users 조회가 반복되지 않도록
+토큰 문자열 → (만료 시각, 사용자 컬럼 스냅샷)을 프로세스 안의 LRU에 잠시 보관한다.
+
+- 한 번 검증한 토큰과 바이트가 같아야 찾을 수 있으므로 캐시 적중 시 서명을 다시 확인하지 않는다.
+  항목은 토큰의 exp와 AUTH_CACHE_TTL_SEC 중 빠른 쪽에 만료된다.
+- 적중 시 스냅샷을 요청 세션에 SELECT 없이 붙여(merge load=False) 일반 User 객체처럼 수정/commit할 수 있다.
+- User 행이 바뀌면(프로필 수정, 탈퇴, 로그인 정보 갱신) commit 뒤에 그 사용자의 항목을 지운다.
+  로그아웃도 그 사용자의 항목을 지운다.
+
+캐시는 프로세스별이라 다른 프로세스에서 바뀐 사용자 상태는 최대 TTL만큼 늦게 반영된다.
+TTL을 짧게 두고, 0으로 설정하면 캐시를 쓰지 않는다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.api.models import User
+
+AUTH_CACHE_TTL = int(os.getenv("AUTH_CACHE_TTL_SEC", "30"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "4096"))
+
+USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+class TokenCache:
+    def __init__(self, ttl: int = AUTH_CACHE_TTL, max_entries: int = AUTH_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+
+    def get(self, db: Session, token: str) -> Optional[User]:
+        """캐시된 토큰이면 요청 세션에 붙인 User를, 아니면 None"""
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            item = self._entries.get(token)
+            if item is None:
+                return None
+            expires_at, snapshot = item
+            if expires_at <= time.time():
+                self._discard(token)
+                return None
+            self._entries.move_to_end(token)
+
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    def set(self, token: str, payload: dict, user: User) -> None:
+        """검증된 토큰과 조회한 사용자를 저장 (토큰 exp보다 오래 두지 않는다)"""
+        if self.ttl <= 0:
+            return
+        expires_at = min(time.time() + self.ttl, float(payload.get("exp") or 0))
+        snapshot = {key: getattr(user, key) for key in USER_COLUMNS}
+        with self._lock:
+            self._discard(token)
+            self._entries[token] = (expires_at, snapshot)
+            self._tokens_by_user.setdefault(user.id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자의 모든 토큰 항목 삭제"""
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._discard(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def _discard(self, token: str) -> None:
+        item = self._entries.pop(token, None)
+        if item is None:
+            return
+        user_id = item[1]["id"]
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+
+token_cache = TokenCache()
+
+_CHANGED_USERS_KEY = "token_cache_changed_users"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    """flush된 User 변경을 모아 두었다가 commit 뒤에 무효화한다
+    (commit 전에 지우면 동시 요청이 이전 상태를 다시 캐시할 수 있다)"""
+    user_ids = [
+        instance.id
+        for instance in list(session.dirty) + list(session.deleted)
+        if isinstance(instance, User)
+        and (instance in session.deleted or session.is_modified(instance))
+    ]
+    if user_ids:
+        session.info.setdefault(_CHANGED_USERS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    for user_id in session.info.pop(_CHANGED_USERS_KEY, ()):
+        token_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_changed_users(session: Session, previous_transaction) -> None:
+    session.info.pop(_CHANGED_USERS_KEY, None)
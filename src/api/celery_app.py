@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from kombu import Queue
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
@@ -17,7 +18,49 @@ celery_app.conf.update(
     enable_utc=True,
     task_track_started=True,
     task_time_limit=3600,  # 1 hour limit for demucs
+    # 워커가 작업 도중 죽으면 메시지를 재전달하여 파이프라인 manifest 기준으로 이어서 처리
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # 리소스 등급별 큐 - 큐마다 별도 워커를 띄워 동시 실행 수를 따로 조정한다
+    #   separation       : Demucs (GPU/CPU 점유가 큼, 짧은 곡)
+    #   separation_long  : LONG_AUDIO_SEC보다 긴 음원의 Demucs (짧은 곡을 막지 않도록 분리)
+    #   transcription    : Basic Pitch 채보 (악보/MIDI/타브)
+    #   light            : 분석/렌더링 등 짧은 작업
+    task_queues=[
+        Queue(name, queue_arguments={"x-max-priority": 10})
+        for name in ("separation", "separation_long", "transcription", "light")
+    ],
+    task_default_queue="light",
+    task_routes={
+        "process_audio_task": {"queue": "separation"},
+        "generate_asset_task": {"queue": "transcription"},
+        "collect_asset_blobs_task": {"queue": "light"},
+    },
+    # celery beat를 띄우면 참조가 없어진 자산 내용을 주기적으로 정리한다
+    beat_schedule={
+        "collect-asset-blobs": {
+            "task": "collect_asset_blobs_task",
+            "schedule": float(os.getenv("ASSET_BLOB_GC_INTERVAL_SEC", "21600")),
+        },
+    },
+    # 긴 작업을 미리 가져가 쌓아두지 않도록 한 번에 하나씩만 예약
+    worker_prefetch_multiplier=1,
+    # 누수로 죽기 전에 자식 프로세스를 교체 (교체된 프로세스는 다시 모델을 예열한다)
+    worker_max_tasks_per_child=int(os.getenv("WORKER_MAX_TASKS_PER_CHILD", "50")),
+    worker_max_memory_per_child=int(os.getenv("WORKER_MAX_MEMORY_MB", "4096")) * 1024,  # KB
+    # 자식 프로세스의 모델 예열(worker_process_init)이 끝날 때까지 기다리는 시간
+    worker_proc_alive_timeout=float(os.getenv("WORKER_PRELOAD_TIMEOUT", "180")),
+    # Redis 브로커 우선순위: 0이 가장 높음
+    task_default_priority=5,
+    broker_transport_options={
+        "queue_order_strategy": "priority",
+        "priority_steps": list(range(10)),
+        "sep": ":",
+    },
 )
 
 # Auto-discover tasks
 celery_app.autodiscover_tasks(["src.api.services"])
+
+# 워커 생명주기 훅(모델 예열, readiness) 등록
+import src.api.worker  # noqa: E402,F401
@@ -1,20 +1,60 @@
+"""
+DB 엔진/세션 설정
+
+DATABASE_URL이 없으면 temp/justjam.db SQLite 파일을 쓴다. 여러 uvicorn/Celery 워커가 함께 쓰는
+배포에서는 PostgreSQL을 권장한다 (SQLite는 쓰기 잠금이 DB 전체에 걸려 진행률 기록 등이 직렬화된다).
+
+- SQLite: 스레드 간 연결 공유 허용, 잠금 대기 시간, WAL 등 PRAGMA
+- 그 외(PostgreSQL 등): 연결 풀 크기/대기/재활용 설정과 pre-ping (끊긴 연결을 쓰기 전에 걸러냄)
+"""
+
 import os
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-# Use DATABASE_URL from env if available, otherwise default to sqlite in temp dir
-SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
-if not SQLALCHEMY_DATABASE_URL:
-    DB_PATH = os.path.join(PROJECT_ROOT, "temp", "justjam.db")
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# 연결 풀 (SQLite 외의 DB) - 프로세스마다 pool_size + max_overflow개까지 연결한다
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT_SEC", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE_SEC", "1800"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+DB_APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "justjam")
+# 다른 연결이 쓰기 잠금을 잡고 있을 때 SQLite가 기다리는 시간
+SQLITE_BUSY_TIMEOUT = float(os.getenv("SQLITE_BUSY_TIMEOUT_SEC", "15"))
+
+
+def normalize_database_url(url: str) -> str:
+    """Heroku/Fly 형식의 postgres:// 주소를 SQLAlchemy가 아는 postgresql://로 바꾼다"""
+    if url.startswith("postgres://"):
+        return "postgresql://" + url[len("postgres://") :]
+    return url
+
+
+def build_engine_kwargs(url: str) -> dict:
+    """DB 종류별 create_engine 인자"""
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        return {"connect_args": {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT}}
+
+    kwargs = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+    if backend == "postgresql":
+        connect_args = {"application_name": DB_APPLICATION_NAME}
+        if DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+        kwargs["connect_args"] = connect_args
+    return kwargs
 
 
-@event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
@@ -24,11 +64,34 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.close()
 
 
+def create_db_engine(url: str) -> Engine:
+    url = normalize_database_url(url)
+    db_engine = create_engine(url, **build_engine_kwargs(url))
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine, "connect", set_sqlite_pragma)
+    return db_engine
+
+
+# Use DATABASE_URL from env if available, otherwise default to sqlite in temp dir
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
+if not SQLALCHEMY_DATABASE_URL:
+    DB_PATH = os.path.join(PROJECT_ROOT, "temp", "justjam.db")
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+SQLALCHEMY_DATABASE_URL = normalize_database_url(SQLALCHEMY_DATABASE_URL)
+
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+def dispose_engine_after_fork() -> None:
+    """fork된 자식 프로세스(Celery prefork)가 부모의 풀 연결을 함께 쓰지 않도록 풀을 새로 만든다"""
+    engine.dispose(close=False)
+
+
 def get_db():
     db = SessionLocal()
     try:
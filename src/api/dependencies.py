@@ -1,5 +1,8 @@
 """
 FastAPI 의존성 함수들
+
+DB를 조회하는 의존성은 일반 `def`로 선언해 FastAPI가 스레드풀에서 실행하도록 한다.
+한 번 검증한 액세스 토큰은 token_cache에 잠시 보관해 폴링 요청마다 서명 검증과 users 조회를 반복하지 않는다.
 """
 
 from typing import Optional
@@ -9,15 +12,17 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from src.api.auth.jwt import verify_token
+from src.api.auth.token_cache import token_cache
 from src.api.database import get_db
 from src.api.exceptions import AuthenticationError, InvalidTokenError
 from src.api.models import User
+from src.api.services.project_access import ProjectAccess, load_project_access
 
 # HTTP Bearer 토큰 스키마
 security = HTTPBearer()
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)
 ) -> User:
     """
@@ -35,6 +40,10 @@ async def get_current_user(
     """
     # 토큰 검증
     token = credentials.credentials
+    user = token_cache.get(db, token)
+    if user is not None:
+        return user
+
     payload = verify_token(token, token_type="access")
 
     if payload is None:
@@ -54,6 +63,7 @@ async def get_current_user(
     if user is None:
         raise AuthenticationError(detail="사용자를 찾을 수 없습니다")
 
+    token_cache.set(token, payload, user)
     return user
 
 
@@ -75,7 +85,7 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     return current_user
 
 
-async def get_optional_current_user(
+def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_db),
 ) -> Optional[User]:
@@ -93,6 +103,10 @@ async def get_optional_current_user(
         return None
 
     token = credentials.credentials
+    user = token_cache.get(db, token)
+    if user is not None:
+        return user
+
     payload = verify_token(token, token_type="access")
 
     if payload is None:
@@ -108,4 +122,23 @@ async def get_optional_current_user(
         .first()
     )
 
+    if user is not None:
+        token_cache.set(token, payload, user)
     return user
+
+
+def get_project_access(
+    project_id: str,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+) -> ProjectAccess:
+    """
+    경로의 project_id 프로젝트와 현재 사용자의 역할을 한 번의 쿼리로 조회
+
+    FastAPI가 요청마다 결과를 캐시하므로 한 요청 안의 여러 의존성/서비스 호출이 같은 결과를 쓴다.
+    권한 단계(view/edit/owner) 확인은 작업마다 ProjectAccess.require로 한다.
+
+    Raises:
+        ProjectNotFoundError: 프로젝트가 없을 때 404 에러
+    """
+    return load_project_access(db, project_id, current_user)
@@ -61,6 +61,13 @@ class ProjectNotFoundError(JustJamException):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
 
 
+class ProjectPermissionError(JustJamException):
+    """프로젝트에 접근은 가능하지만 요청한 작업 권한이 없을 때"""
+
+    def __init__(self, detail: str = "권한이 없습니다."):
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
 class InvalidTokenError(JustJamException):
     """유효하지 않은 토큰일 때"""
 
@@ -88,3 +95,42 @@ class UserNotFoundError(JustJamException):
 
     def __init__(self, detail: str = "사용자를 찾을 수 없습니다."):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class FileTooLargeError(JustJamException):
+    """업로드 파일 크기 또는 음원 길이가 상한을 넘을 때"""
+
+    def __init__(self, detail: str = "파일이 너무 큽니다."):
+        super().__init__(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+
+class UnsupportedMediaTypeError(JustJamException):
+    """지원하지 않는 오디오 형식일 때"""
+
+    def __init__(self, detail: str = "지원하지 않는 파일 형식입니다."):
+        super().__init__(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=detail)
+
+
+class UploadSessionNotFoundError(JustJamException):
+    """이어받기 업로드 세션을 찾을 수 없을 때"""
+
+    def __init__(self, detail: str = "업로드 세션을 찾을 수 없습니다."):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class UploadInProgressError(JustJamException):
+    """다른 요청이 같은 업로드 세션에 청크를 기록하고 있을 때"""
+
+    def __init__(self, detail: str = "다른 요청이 이 업로드에 청크를 기록하고 있습니다."):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+class UploadOffsetMismatchError(JustJamException):
+    """청크 업로드 위치가 서버가 받은 크기와 다를 때"""
+
+    def __init__(self, received: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"업로드 위치가 맞지 않습니다 (서버 수신: {received}).",
+            headers={"Upload-Offset": str(received)},
+        )
@@ -1,15 +1,11 @@
 import os
 from datetime import datetime
 
-import redis.asyncio as redis
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.inmemory import InMemoryBackend
-from fastapi_cache.backends.redis import RedisBackend
 from prometheus_fastapi_instrumentator import Instrumentator
 
 import sentry_sdk
@@ -51,23 +47,6 @@ app = FastAPI(
 # Gzip 압축 미들웨어 추가 (성능 최적화)
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-
-@app.on_event("startup")
-async def startup():
-    redis_url = os.getenv("REDIS_URL")
-    if redis_url:
-        try:
-            r = redis.from_url(redis_url, encoding="utf8", decode_responses=True)
-            FastAPICache.init(RedisBackend(r), prefix="fastapi-cache")
-            logger.info("FastAPICache initialized with Redis")
-        except Exception as e:
-            logger.error(f"Failed to connect to Redis, falling back to InMemory: {e}")
-            FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
-    else:
-        FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
-        logger.info("FastAPICache initialized with InMemoryBackend")
-
-
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
@@ -103,6 +82,7 @@ async def justjam_exception_handler(request: Request, exc: JustJamException):
                 "timestamp": datetime.utcnow().isoformat() + "Z"
             }
         },
+        headers=exc.headers,
     )
 
 
@@ -124,6 +104,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
                 "timestamp": datetime.utcnow().isoformat() + "Z"
             }
         },
+        headers=exc.headers,
     )
 
 
@@ -142,6 +123,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 마디 구간 조회 응답의 구간 정보/재검증 헤더를 브라우저에서 읽을 수 있게 한다
+    expose_headers=["ETag", "X-Cache", "X-Total-Measures", "X-Next-From-Measure", "X-Next-Cursor"],
 )
 
 
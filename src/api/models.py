@@ -1,7 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, event, text
+from sqlalchemy.orm import deferred, relationship
 
 from src.api.database import Base
 
@@ -48,6 +48,9 @@ class ProjectMember(Base):
     project = relationship("ProjectModel", back_populates="members")
     user = relationship("User", back_populates="shared_projects")
 
+    # 목록 조회의 멤버십 EXISTS 조건 (user_id로 찾고 project_id까지 인덱스에서 확인)
+    __table_args__ = (Index("idx_project_member_user_project", "user_id", "project_id"),)
+
 
 class ProjectModel(Base):
     """프로젝트 모델 - 사용자별 음악 프로젝트"""
@@ -64,6 +67,9 @@ class ProjectModel(Base):
     chord_progression = Column(String, nullable=True)  # JSON formatted string
     structure = Column(String, nullable=True)  # JSON formatted string
     thumbnail_url = Column(String, nullable=True)
+    content_hash = Column(
+        String(64), nullable=True, index=True
+    )  # 원본 음원 SHA-256 (중복 처리 재사용)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # 사용자 연결
@@ -73,6 +79,15 @@ class ProjectModel(Base):
     owner = relationship("User", back_populates="projects")
     members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
     assets = relationship("ProjectAsset", back_populates="project", cascade="all, delete-orphan")
+    generation_jobs = relationship(
+        "GenerationJob", back_populates="project", cascade="all, delete-orphan"
+    )
+
+    # 목록 keyset 페이지: 소유자별 정렬 키 + id
+    __table_args__ = (
+        Index("idx_project_owner_created", "user_id", "created_at", "id"),
+        Index("idx_project_owner_name", "user_id", "name", "id"),
+    )
 
 
 class ProjectAsset(Base):
@@ -82,10 +97,76 @@ class ProjectAsset(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     project_id = Column(String, ForeignKey("projects.id"), index=True)
-    asset_type = Column(String)  # 'score', 'tab'
+    asset_type = Column(String)  # 'score', 'midi', 'tab'
     instrument = Column(String)  # 'vocals', 'guitar', 'bass', etc.
-    content = Column(String)  # XML string for score, ASCII for tab
+    # 내용은 blob 저장소(services/blob_store)에 두고 여기에는 메타데이터만 남긴다
+    content_hash = Column(String(64), nullable=True, index=True)  # 저장소 키 (내용 SHA-256)
+    size = Column(Integer, nullable=True)  # 바이트 수
+    media_type = Column(String, nullable=True)
+    params = Column(String, nullable=True)  # 생성 옵션 (JSON)
+    # 저장소 도입 전에 인라인으로 저장된 내용 - 목록 조회 시 읽지 않도록 지연 로딩
+    content = deferred(Column(String, nullable=True))
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     project = relationship("ProjectModel", back_populates="assets")
+
+    # 목록 조회의 (자산 종류, 악기) 집계를 테이블을 읽지 않고 인덱스만으로 처리
+    __table_args__ = (Index("idx_project_asset_summary", "project_id", "asset_type", "instrument"),)
+
+
+class ProjectSearchDocument(Base):
+    """프로젝트 검색 문서 - 검색 대상 텍스트를 프로젝트당 한 행으로 모은 것 (services/search_index가 관리)"""
+
+    __tablename__ = "project_search_documents"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # 전문 검색 인덱스의 rowid
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), unique=True, nullable=False
+    )
+    name = Column(String, default="")
+    detected_key = Column(String, default="")
+    chords = Column(String, default="")  # 코드 이름 (공백 구분, 중복 제거)
+    members = Column(String, default="")  # 협업 멤버 닉네임 (공백 구분)
+
+
+@event.listens_for(ProjectSearchDocument.__table__, "after_create")
+def _create_project_search_index(target, connection, **kw):
+    # 문서 테이블이 새로 만들어질 때 DB별 전문 검색 인덱스를 붙이고 기존 프로젝트로 채운다
+    from src.api.services.search_index import create_search_index, rebuild_search_index
+
+    create_search_index(connection)
+    rebuild_search_index(connection)
+
+
+class GenerationJob(Base):
+    """악보/MIDI/타브 백그라운드 생성 작업 모델"""
+
+    __tablename__ = "generation_jobs"
+
+    id = Column(String, primary_key=True, index=True)
+    project_id = Column(String, ForeignKey("projects.id", ondelete="CASCADE"), index=True)
+    asset_type = Column(String)  # 'score', 'midi', 'tab'
+    instrument = Column(String)
+    status = Column(String, default="pending")
+    progress = Column(Integer, default=0)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    project = relationship("ProjectModel", back_populates="generation_jobs")
+
+    __table_args__ = (
+        Index("idx_generation_job_target", "project_id", "asset_type", "instrument"),
+        # 대상별로 진행 중인 작업은 하나만 - 동시에 들어온 요청이 둘 다 작업을 만들지 못하게 한다
+        Index(
+            "uq_generation_job_active",
+            "project_id",
+            "asset_type",
+            "instrument",
+            unique=True,
+            sqlite_where=text("status IN ('pending', 'processing')"),
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
+    )
@@ -7,6 +7,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
+from src.api.auth.token_cache import token_cache
 from src.api.database import get_db
 from src.api.dependencies import get_current_user
 from src.api.limiter import limiter
@@ -27,7 +28,9 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
     },
 )
 @limiter.limit("5/minute")
-async def login(request: Request, login_data: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
+def login(
+    request: Request, login_data: LoginRequest, db: Session = Depends(get_db)
+) -> TokenResponse:
     """
     소셜 로그인 (Google, Kakao)
 
@@ -54,7 +57,9 @@ async def login(request: Request, login_data: LoginRequest, db: Session = Depend
         401: {"description": "유효하지 않은 Refresh Token"},
     },
 )
-async def refresh_access_token(refresh_data: RefreshTokenRequest, db: Session = Depends(get_db)) -> TokenResponse:
+def refresh_access_token(
+    refresh_data: RefreshTokenRequest, db: Session = Depends(get_db)
+) -> TokenResponse:
     """
     Refresh Token으로 새로운 Access Token 발급
 
@@ -79,6 +84,7 @@ async def logout(current_user: User = Depends(get_current_user)) -> dict:
 
     현재는 클라이언트 측에서 토큰을 삭제하는 것으로 처리합니다.
     향후 Redis를 사용한 토큰 블랙리스트 기능을 추가할 수 있습니다.
+    서버에는 이 사용자의 검증 캐시만 비웁니다.
 
     Args:
         current_user: 현재 인증된 사용자
@@ -86,4 +92,5 @@ async def logout(current_user: User = Depends(get_current_user)) -> dict:
     Returns:
         성공 메시지
     """
+    token_cache.invalidate_user(current_user.id)
     return {"message": "로그아웃되었습니다", "user_id": current_user.id}
@@ -1,25 +1,85 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Response, UploadFile
-from fastapi.responses import JSONResponse
-from fastapi_cache.decorator import cache
+"""
+프로젝트 API 라우트
+
+DB 조회, Celery 호출, 오디오 처리처럼 블로킹되는 작업만 하는 핸들러는 일반 `def`로 선언해
+FastAPI가 스레드풀에서 실행하도록 한다. 업로드처럼 비동기 I/O가 필요한 핸들러만
+`async def`로 두고, 그 안의 블로킹 호출은 run_in_threadpool로 넘긴다.
+"""
+
+import hashlib
+import json
+import os
+from functools import partial
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from src.api.database import get_db
-from src.api.dependencies import get_current_user, get_optional_current_user
+from src.api.dependencies import get_current_user, get_optional_current_user, get_project_access
 from src.api.models import User
 from src.api.schemas.project import (
+    GenerationJob as GenerationJobSchema,
     Project,
     ProjectMember as ProjectMemberSchema,
     ProjectShareRequest,
     ProjectUpdate,
     StemFiles,
+    TaskStatus,
     MixRequest,
+    UploadSession,
+    UploadSessionCreate,
 )
-from src.api.services.project_service import ProjectService, generate_thumbnail, process_audio_task
+from src.api.services.project_service import (
+    UPLOAD_DIR,
+    ASSET_MEDIA_TYPES,
+    ProjectService,
+    generate_thumbnail,
+    measure_page,
+    project_cache_tags,
+    read_asset_content,
+    render_score_page,
+    render_tab_asset,
+    render_tab_page,
+    validate_tab_options,
+)
+from src.api.services.blob_store import get_blob_store
+from src.api.services.progress_broker import progress_broker
+from src.api.services.project_access import EDIT, VIEW, ProjectAccess
+from src.api.services.response_cache import (
+    CachedResponse,
+    body_etag,
+    project_list_tag,
+    project_tag,
+    response_cache,
+)
+from src.api.services.task_routing import processing_route
+from src.api.services.upload_service import UploadService
 
 router = APIRouter()
 
 
+def _start_project(
+    background_tasks: BackgroundTasks,
+    db: Session,
+    project_id: str,
+    file_name: str,
+    saved_filename: str,
+    stored,
+    current_user: Optional[User],
+):
+    """저장된 업로드로 프로젝트 레코드 생성 + 썸네일 작업 등록 (스레드풀에서 호출)"""
+    project = ProjectService.create_project(
+        db, project_id, file_name, saved_filename, current_user, content_hash=stored.content_hash
+    )
+    thumbnail_path = os.path.join(UPLOAD_DIR, f"thumb_{project.id}.png")
+    background_tasks.add_task(generate_thumbnail, stored.path, thumbnail_path)
+    return project
+
+
 @router.post(
     "/",
     # response_model=Project, # Remove to avoid circular dependency or use strings if needed, but Project is imported
@@ -32,46 +92,97 @@ async def create_project(
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
 ) -> Project:
-    project, file_path = ProjectService.create_project(db, file.filename, file.file, current_user)
-    
-    # 썸네일 생성 백그라운드 작업
-    from src.api.services.project_service import UPLOAD_DIR
-    import os
-    thumbnail_filename = f"thumb_{project.id}.png"
-    thumbnail_path = os.path.join(UPLOAD_DIR, thumbnail_filename)
-    background_tasks.add_task(generate_thumbnail, file_path, thumbnail_path)
-    
-    project.thumbnail_url = f"/static/uploads/{thumbnail_filename}"
-    db.commit()
-    
-    return project
+    project_id, saved_filename, file_path = ProjectService.allocate_upload(file.filename)
+    stored = await UploadService.save_audio(file, file_path)
+
+    return await run_in_threadpool(
+        _start_project,
+        background_tasks,
+        db,
+        project_id,
+        file.filename,
+        saved_filename,
+        stored,
+        current_user,
+    )
+
+
+@router.post(
+    "/uploads", response_model=UploadSession, status_code=201, summary="이어받기 업로드 세션 생성"
+)
+def create_upload_session(
+    body: UploadSessionCreate,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+):
+    return UploadService.create_session(
+        body.file_name, body.total_size, current_user.id if current_user else None
+    )
+
+
+@router.get("/uploads/{upload_id}", response_model=UploadSession, summary="업로드 세션 상태 조회")
+def get_upload_session(
+    upload_id: str,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+):
+    return UploadService.get_session(upload_id, current_user.id if current_user else None)
+
+
+@router.put("/uploads/{upload_id}", response_model=UploadSession, summary="업로드 청크 전송")
+async def upload_chunk(
+    upload_id: str,
+    offset: int,
+    request: Request,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+):
+    """요청 본문(raw bytes)을 offset 위치에 이어 쓴다. 위치가 다르면 409 + Upload-Offset 헤더"""
+    return await UploadService.append_chunk(
+        upload_id, offset, request.stream(), current_user.id if current_user else None
+    )
+
+
+@router.post("/uploads/{upload_id}/complete", summary="업로드 완료 및 프로젝트 생성")
+def complete_upload(
+    upload_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+) -> Project:
+    user_id = current_user.id if current_user else None
+    session = UploadService.get_session(upload_id, user_id)
+    project_id, saved_filename, file_path = ProjectService.allocate_upload(session["file_name"])
+    stored = UploadService.finalize_session(upload_id, file_path, user_id)
+    return _start_project(
+        background_tasks, db, project_id, session["file_name"], saved_filename, stored, current_user
+    )
 
 
 @router.post("/{project_id}/process", summary="음원 분리 시작")
-async def process_project(
+def process_project(
     project_id: str,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> dict:
     from src.api.services.project_service import process_audio_task, process_audio_logic
-    from src.api.models import ProjectModel
     from src.api.schemas.project import TaskStatus
-    
+
     # 1. DB 상태를 즉시 PROCESSING으로 변경하여 프론트엔드 폴링 유도
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if not project:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail="Project not found")
-    
+    project = access.require(EDIT, "프로젝트 처리 권한이 없습니다.")
+
     project.status = TaskStatus.PROCESSING.value
     project.progress = 0
     db.commit()
+    response_cache.invalidate(*project_cache_tags(db, project_id))
+    # 이전 실행의 완료 이벤트가 남아 있으면 SSE 구독자가 바로 종료되므로 초기화
+    progress_broker.publish(project_id, status="processing", stage="queued", percent=0)
 
     # 2. Celery 작업 호출 (로컬 개발 환경에서는 Redis가 없을 수 있으므로 짧은 타임아웃 적용 시도)
     try:
         # delay()는 비동기지만, 브로커 연결 실패 시 에러가 발생할 수 있음
         # 여기서는 단순히 시도하고 실패하면 바로 BackgroundTasks로 전환
-        process_audio_task.apply_async(args=[project_id], connect_timeout=1)
+        # 음원 길이/사용자별 진행 중 작업 수에 따라 큐와 우선순위 결정
+        route = processing_route(db, project, os.path.join(UPLOAD_DIR, project.original_filename))
+        process_audio_task.apply_async(args=[project_id], connect_timeout=1, **route)
         return {"message": "Processing started via Celery", "status": "processing"}
     except Exception as e:
         from src.api.logging_config import logger
@@ -80,141 +191,464 @@ async def process_project(
         return {"message": "Processing started via BackgroundTasks", "status": "processing"}
 
 
+@router.get("/{project_id}/events", summary="처리 진행률 스트림 (SSE)")
+async def stream_project_events(
+    project_id: str,
+    access: ProjectAccess = Depends(get_project_access),
+    db: Session = Depends(get_db),
+):
+    """
+    처리 진행률을 Server-Sent Events로 전달
+
+    처리 중이 아니면 현재 상태 이벤트 하나만 보내고 종료한다.
+    처리 중이면 단계/진행률 이벤트를 받는 대로 보내고, 완료나 실패 이벤트 후 종료한다.
+    이벤트가 없는 동안에는 하트비트마다 DB 상태를 다시 읽어 처리 중이 아니게 되면 그 상태를 보내고 종료한다.
+    """
+    project = access.require(VIEW)
+    current = {"project_id": project_id, "status": project.status, "percent": project.progress or 0}
+
+    def finished_status() -> Optional[dict]:
+        event = ProjectService.get_status_event(db, project_id)
+        if event is None:
+            return {
+                "project_id": project_id,
+                "status": TaskStatus.FAILED.value,
+                "percent": current["percent"],
+            }
+        return event if event["status"] != TaskStatus.PROCESSING.value else None
+
+    async def event_stream():
+        if current["status"] != TaskStatus.PROCESSING.value:
+            yield _sse_event(current)
+            return
+        async for event in progress_broker.subscribe(project_id, check_status=finished_status):
+            # 이벤트가 한동안 없으면 프록시가 연결을 끊지 않도록 주석 라인 전송
+            yield _sse_event(event) if event else ": keep-alive\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse_event(event: dict) -> str:
+    return f"event: progress\ndata: {json.dumps(event)}\n\n"
+
+
+def _cached_json(
+    request: Request, scope: str, current_user: Optional[User], tags: List[str], build
+) -> Response:
+    """사용자/쿼리 파라미터/태그 버전별로 캐시한 JSON 응답 (If-None-Match가 같으면 304)
+
+    build()는 (본문으로 보낼 값, 추가 헤더)를 반환한다. 예외(403/404 등)는 캐시하지 않는다.
+    """
+    principal = current_user.id if current_user else None
+    key = response_cache.key(scope, principal, request.query_params.multi_items(), tags)
+    entry = response_cache.get(key)
+    cache_status = "HIT"
+    if entry is None:
+        content, headers = build()
+        body = json.dumps(
+            jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        entry = CachedResponse(body, body_etag(body), headers)
+        response_cache.set(key, entry)
+        cache_status = "MISS"
+
+    not_modified = _not_modified(request, entry.etag)
+    if not_modified is not None:
+        return not_modified
+    headers = {
+        **entry.headers,
+        "ETag": entry.etag,
+        "Cache-Control": "private, no-cache",
+        "X-Cache": cache_status,
+    }
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
 
 @router.get("/{project_id}", response_model=Project)
-@cache(expire=300)
-async def get_project(
+def get_project(
+    request: Request,
     project_id: str,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
 ):
-    return ProjectService.get_project(db, project_id, current_user)
+    def build():
+        project = ProjectService.get_project(db, project_id, current_user)
+        return Project.model_validate(project), {}
+
+    return _cached_json(request, "project", current_user, [project_tag(project_id)], build)
 
 
 @router.get("/", response_model=List[Project])
-@cache(expire=60)
-async def list_projects(
+def list_projects(
+    request: Request,
     q: Optional[str] = None,
     sort: str = "newest",
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 50,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
 ):
-    return ProjectService.list_projects(db, current_user, q, sort, skip, limit)
+    """프로젝트 목록 (keyset 페이지) - 다음 페이지가 있으면 X-Next-Cursor 헤더 값을 cursor로 넘긴다"""
+
+    def build():
+        projects, next_cursor = ProjectService.list_projects(
+            db, current_user, q, sort, cursor, limit
+        )
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        return [Project.model_validate(p) for p in projects], headers
+
+    tags = [project_list_tag(current_user.id if current_user else None)]
+    return _cached_json(request, "projects", current_user, tags, build)
 
 
 @router.post("/{project_id}/clone", response_model=Project)
-async def clone_project(
+def clone_project(
     project_id: str,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    return ProjectService.clone_project(db, project_id, current_user)
+    return ProjectService.clone_project(db, project_id, current_user, access)
 
 
 @router.patch("/{project_id}", response_model=Project)
-async def update_project(
+def update_project(
     project_id: str,
     project_update: ProjectUpdate,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    return ProjectService.update_project(db, project_id, project_update.name, current_user)
+    return ProjectService.update_project(db, project_id, project_update.name, current_user, access)
 
 
 @router.delete("/{project_id}")
-async def delete_project(
+def delete_project(
     project_id: str,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> dict:
-    return ProjectService.delete_project(db, project_id, current_user)
+    return ProjectService.delete_project(db, project_id, current_user, access)
 
 
 @router.get("/{project_id}/stems", response_model=StemFiles)
-async def get_project_stems(
+def get_project_stems(
     project_id: str,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    return ProjectService.get_project_stems(db, project_id, current_user)
+    return ProjectService.get_project_stems(db, project_id, current_user, access)
 
 
-@router.post("/{project_id}/score/{instrument}")
-async def generate_project_score(
+def _asset_response(asset_type: str, content, headers: Optional[dict] = None):
+    if asset_type == "midi":
+        return Response(content=content, media_type="audio/midi", headers=headers)
+    if asset_type == "tab" and isinstance(content, dict):
+        return JSONResponse(content=content, headers=headers)
+    return Response(content=content, media_type="application/xml", headers=headers)
+
+
+def _stored_asset_response(asset, headers: Optional[dict] = None, render=None):
+    """저장된 자산 응답 - 악보/MIDI는 저장소 파일을 읽지 않고 그대로 전송 (로컬이면 sendfile)"""
+    if asset.asset_type == "tab" or not asset.content_hash:
+        content = read_asset_content(asset)
+        if render:
+            content = render(content)
+        return _asset_response(asset.asset_type, content, headers=headers)
+
+    media_type = asset.media_type or ASSET_MEDIA_TYPES[asset.asset_type]
+    store = get_blob_store()
+    path = store.local_path(asset.content_hash)
+    if path:
+        return FileResponse(path, media_type=media_type, headers=headers)
+    return StreamingResponse(
+        store.iter_chunks(asset.content_hash), media_type=media_type, headers=headers
+    )
+
+
+def _job_payload(request: Request, job) -> dict:
+    payload = jsonable_encoder(GenerationJobSchema.model_validate(job))
+    payload["status_url"] = str(
+        request.url_for("get_generation_job", project_id=job.project_id, job_id=job.id)
+    )
+    payload["result_url"] = str(
+        request.url_for("get_generation_result", project_id=job.project_id, job_id=job.id)
+    )
+    if request.url.query:
+        # 렌더링 옵션(format 등)을 결과 조회에도 그대로 전달
+        payload["result_url"] += f"?{request.url.query}"
+    return payload
+
+
+def _request_asset(
+    request: Request,
+    db: Session,
+    project_id: str,
+    asset_type: str,
+    instrument: str,
+    current_user,
+    access: ProjectAccess,
+    render=None,
+):
+    """캐시 히트면 결과를 바로 반환하고, 아니면 202 + 작업 정보 반환"""
+    asset, job = ProjectService.request_asset(
+        db, project_id, asset_type, instrument, current_user, access
+    )
+    if job is None:
+        return _stored_asset_response(asset, headers={"X-Cache": "HIT"}, render=render)
+    return JSONResponse(status_code=202, content=_job_payload(request, job))
+
+
+@router.post("/{project_id}/score/{instrument}", summary="악보 생성 요청")
+def generate_project_score(
+    request: Request,
     project_id: str,
     instrument: str,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    content, cached = ProjectService.generate_score(db, project_id, instrument, current_user)
-    headers = {"X-Cache": "HIT"} if cached else {}
-    return Response(content=content, media_type="application/xml", headers=headers)
+    """instrument를 "all"로 주면 모든 스템을 파트로 묶은 합본 악보를 만든다"""
+    return _request_asset(request, db, project_id, "score", instrument, current_user, access)
 
 
-@router.post("/{project_id}/midi/{instrument}")
-async def generate_project_midi(
+@router.post("/{project_id}/midi/{instrument}", summary="MIDI 생성 요청")
+def generate_project_midi(
+    request: Request,
     project_id: str,
     instrument: str,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    midi_bytes, cached = ProjectService.generate_midi(db, project_id, instrument, current_user)
-    headers = {"X-Cache": "HIT"} if cached else {}
-    return Response(content=midi_bytes, media_type="audio/midi", headers=headers)
+    """instrument를 "all"로 주면 스템마다 트랙을 둔 합본 MIDI를 만든다"""
+    return _request_asset(request, db, project_id, "midi", instrument, current_user, access)
 
 
-@router.post("/{project_id}/tabs/{instrument}")
-async def generate_project_tab(
+@router.post("/{project_id}/tabs/{instrument}", summary="타브 생성 요청")
+def generate_project_tab(
+    request: Request,
+    project_id: str,
+    instrument: str,
+    format: str = "ascii",
+    measures_per_line: Optional[int] = None,
+    tuning: Optional[str] = None,
+    capo: int = 0,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
+):
+    """format: ascii(기본) | json(구조화 모델) | musicxml(TAB 보표)
+
+    tuning: 프리셋 이름(drop_d, dadgad, five_string 등) 또는 "D2,A2,D3,G3,B3,E4"
+    capo: 카포 위치 (0~12)
+
+    캐시된 모델과 음표에서 렌더링하므로 형식/튜닝/카포를 바꿔도 다시 채보하지 않는다.
+    """
+    validate_tab_options(format, measures_per_line, instrument, tuning, capo)
+    render = partial(
+        render_tab_asset,
+        format=format,
+        measures_per_line=measures_per_line,
+        tuning=tuning,
+        capo=capo,
+    )
+    return _request_asset(
+        request, db, project_id, "tab", instrument, current_user, access, render=render
+    )
+
+
+def _page_etag(asset, **params) -> str:
+    """구간 응답의 ETag - 자산 내용은 생성 후 바뀌지 않으므로 자산과 조회 옵션으로 정해진다"""
+    created_at = asset.created_at.isoformat() if asset.created_at else None
+    key = json.dumps([asset.content_hash or asset.id, created_at, params], sort_keys=True)
+    return '"' + hashlib.sha1(key.encode("utf-8")).hexdigest()[:24] + '"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """If-None-Match가 현재 ETag와 같으면 304 응답"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in tags or etag in tags:
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"}
+        )
+    return None
+
+
+def _page_response(asset_type: str, content, page: dict, etag: str):
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "X-Total-Measures": str(page["total_measures"]),
+    }
+    if page["next_from_measure"]:
+        headers["X-Next-From-Measure"] = str(page["next_from_measure"])
+    return _asset_response(asset_type, content, headers=headers)
+
+
+@router.get("/{project_id}/tabs/{instrument}/measures", summary="타브 마디 구간 조회")
+def get_project_tab_measures(
+    request: Request,
+    project_id: str,
+    instrument: str,
+    from_measure: int = 1,
+    count: int = 16,
+    format: str = "ascii",
+    measures_per_line: Optional[int] = None,
+    tuning: Optional[str] = None,
+    capo: int = 0,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
+):
+    """생성된 타브에서 from_measure(1부터)부터 count 마디만 반환 (스크롤하며 지연 로딩용)
+
+    옵션은 타브 생성 요청과 같다. 아직 생성되지 않았으면 404 - 먼저 POST로 생성을 요청한다.
+    구간마다 ETag가 있어 If-None-Match가 같으면 304를 돌려준다.
+    """
+    asset = ProjectService.get_asset(db, project_id, "tab", instrument, current_user, access)
+    validate_tab_options(format, measures_per_line, instrument, tuning, capo)
+    measure_page(from_measure, count, 0)
+
+    etag = _page_etag(
+        asset,
+        from_measure=from_measure,
+        count=count,
+        format=format,
+        measures_per_line=measures_per_line,
+        tuning=tuning,
+        capo=capo,
+    )
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    content, page = render_tab_page(
+        read_asset_content(asset), from_measure, count, format, measures_per_line, tuning, capo
+    )
+    return _page_response("tab", content, page, etag)
+
+
+@router.get("/{project_id}/score/{instrument}/measures", summary="악보 마디 구간 조회")
+def get_project_score_measures(
+    request: Request,
     project_id: str,
     instrument: str,
+    from_measure: int = 1,
+    count: int = 16,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
+):
+    """생성된 MusicXML 악보에서 from_measure(1부터)부터 count 마디만 반환
+
+    각 파트의 첫 마디에 그 시점의 조표/박자/음자리표/템포가 들어가 단독으로 렌더링된다.
+    전체 마디 수와 다음 구간 시작은 X-Total-Measures / X-Next-From-Measure 헤더로 알려준다.
+    """
+    asset = ProjectService.get_asset(db, project_id, "score", instrument, current_user, access)
+    measure_page(from_measure, count, 0)
+
+    etag = _page_etag(asset, from_measure=from_measure, count=count)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    document, page = render_score_page(read_asset_content(asset), from_measure, count)
+    return _page_response("score", document, page, etag)
+
+
+@router.get(
+    "/{project_id}/jobs/{job_id}", response_model=GenerationJobSchema, summary="생성 작업 상태 조회"
+)
+def get_generation_job(
+    project_id: str,
+    job_id: str,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
+):
+    return ProjectService.get_generation_job(db, project_id, job_id, current_user, access)
+
+
+@router.get("/{project_id}/jobs/{job_id}/result", summary="생성 작업 결과 조회")
+def get_generation_result(
+    request: Request,
+    project_id: str,
+    job_id: str,
+    format: str = "ascii",
+    measures_per_line: Optional[int] = None,
+    tuning: Optional[str] = None,
+    capo: int = 0,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    result, cached = ProjectService.generate_tab(db, project_id, instrument, current_user)
-    headers = {"X-Cache": "HIT"} if cached else {}
-    return JSONResponse(content=result, headers=headers)
+    job, asset = ProjectService.get_generation_result(db, project_id, job_id, current_user, access)
+    if asset is None:
+        return JSONResponse(status_code=202, content=_job_payload(request, job))
+    render = partial(
+        render_tab_asset,
+        format=format,
+        measures_per_line=measures_per_line,
+        tuning=tuning,
+        capo=capo,
+    )
+    return _stored_asset_response(asset, render=render if job.asset_type == "tab" else None)
 
 
 @router.post("/{project_id}/mix")
-async def mix_audio(
+def mix_audio(
     project_id: str,
     request: MixRequest,
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> dict:
-    url = ProjectService.mix_audio(db, project_id, request, current_user)
+    url = ProjectService.mix_audio(db, project_id, request, current_user, access)
     return {"url": url}
 
 
 # --- 협업 관련 엔드포인트 ---
 
 @router.post("/{project_id}/share", response_model=ProjectMemberSchema)
-async def share_project(
+def share_project(
     project_id: str,
     share_request: ProjectShareRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    return ProjectService.share_project(db, project_id, share_request.email, share_request.role, current_user)
+    return ProjectService.share_project(
+        db, project_id, share_request.email, share_request.role, current_user, access
+    )
 
 
 @router.get("/{project_id}/members", response_model=List[ProjectMemberSchema])
-async def list_project_members(
+def list_project_members(
     project_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ):
-    return ProjectService.list_members(db, project_id, current_user)
+    return ProjectService.list_members(db, project_id, current_user, access)
 
 
 @router.delete("/{project_id}/members/{user_id}")
-async def remove_project_member(
+def remove_project_member(
     project_id: str,
     user_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> dict:
-    return ProjectService.remove_member(db, project_id, user_id, current_user)
+    return ProjectService.remove_member(db, project_id, user_id, current_user, access)
 
@@ -5,6 +5,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.api.database import get_db
@@ -12,6 +13,7 @@ from src.api.dependencies import get_current_user
 from src.api.models import User
 from src.api.schemas.user import UserResponse, UserUpdate
 
+from src.api.services.upload_service import UploadService
 from src.api.services.user_service import UserService
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -32,7 +34,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user))
 
 
 @router.patch("/me", response_model=UserResponse, summary="사용자 프로필 업데이트")
-async def update_current_user(
+def update_current_user(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -62,12 +64,15 @@ async def upload_profile_image(
     """
     if not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="이미지 파일만 업로드할 수 있습니다.")
-        
-    return UserService.upload_profile_image(db, current_user, file.filename, file.file)
+
+    saved_filename, file_path = UserService.allocate_profile_image(current_user, file.filename)
+    await UploadService.save(file, file_path)
+
+    return await run_in_threadpool(UserService.set_profile_image, db, current_user, saved_filename)
 
 
 @router.delete("/me", summary="계정 삭제 (Soft Delete)")
-async def delete_current_user(
+def delete_current_user(
     current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ) -> dict:
     """
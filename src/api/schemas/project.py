@@ -83,3 +83,30 @@ class MixRequest(BaseModel):
     bpm: float
     metronome: float
     start_offset: float = 0.0
+
+
+class GenerationJob(BaseModel):
+    id: str = Field(..., example="9b2f6c1e-3c41-4d8e-9a57-0f2d4c6b8e11")
+    project_id: str = Field(..., example="123e4567-e89b-12d3-a456-426614174000")
+    asset_type: str = Field(..., example="score")  # 'score', 'midi', 'tab'
+    instrument: str = Field(..., example="guitar")
+    status: TaskStatus = Field(..., example=TaskStatus.PROCESSING)
+    progress: int = Field(0, example=40)
+    error: Optional[str] = Field(None, example=None)
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class UploadSessionCreate(BaseModel):
+    file_name: str = Field(..., example="live_session.wav")
+    total_size: int = Field(..., gt=0, example=734003200)
+
+
+class UploadSession(BaseModel):
+    upload_id: str = Field(..., example="9f1c2b7e4a5d4c3b8e6f0a1b2c3d4e5f")
+    file_name: str = Field(..., example="live_session.wav")
+    total_size: int = Field(..., example=734003200)
+    received: int = Field(0, example=10485760)
@@ -52,17 +52,22 @@ def analyze_key(y: np.ndarray, sr: int) -> str:
         return "Unknown"
 
 
-def analyze_chords(y: np.ndarray, sr: int, bpm: float) -> List[Dict]:
+def compute_harmonic_chroma(y: np.ndarray, sr: int) -> np.ndarray:
     """
-    Analyze chord progression.
+    Compute chroma features of the harmonic component (the expensive part of chord analysis).
+    """
+    # Harmonic-Percussive Source Separation
+    y_harmonic, _ = librosa.effects.hpss(y)
+
+    # Chroma features
+    return librosa.feature.chroma_cqt(y=y_harmonic, sr=sr)
+
+
+def segment_chords(chroma: np.ndarray, sr: int, bpm: float) -> List[Dict]:
+    """
+    Match beat-aligned chroma segments against major/minor triads.
     """
     try:
-        # Harmonic-Percussive Source Separation
-        y_harmonic, _ = librosa.effects.hpss(y)
-        
-        # Chroma features
-        chroma = librosa.feature.chroma_cqt(y=y_harmonic, sr=sr)
-        
         # Frequency of changes (e.g., every 2 beats)
         beat_dur = 60.0 / bpm
         hop_length = 512
@@ -102,8 +107,8 @@ def analyze_chords(y: np.ndarray, sr: int, bpm: float) -> List[Dict]:
                     best_c_score = score_min
                     best_c_name = f"{PITCH_NAMES[root]}m"
             
-            start_t = librosa.frames_to_time(i, sr=sr, hop_length=hop_length)
-            end_t = librosa.frames_to_time(end_f, sr=sr, hop_length=hop_length)
+            start_t = float(librosa.frames_to_time(i, sr=sr, hop_length=hop_length))
+            end_t = float(librosa.frames_to_time(end_f, sr=sr, hop_length=hop_length))
             
             # Deduplicate sequential identical chords
             if chords and chords[-1]["name"] == best_c_name:
@@ -120,6 +125,19 @@ def analyze_chords(y: np.ndarray, sr: int, bpm: float) -> List[Dict]:
         logger.error(f"Chord analysis failed: {e}")
         return []
 
+
+def analyze_chords(y: np.ndarray, sr: int, bpm: float) -> List[Dict]:
+    """
+    Analyze chord progression.
+    """
+    try:
+        chroma = compute_harmonic_chroma(y, sr)
+    except Exception as e:
+        logger.error(f"Chord analysis failed: {e}")
+        return []
+    return segment_chords(chroma, sr, bpm)
+
+
 def detect_structure(chords: List[Dict], duration: float) -> List[Dict]:
     """
     Detect song structure (segments) based on chords and duration.
@@ -149,24 +167,41 @@ def detect_structure(chords: List[Dict], duration: float) -> List[Dict]:
     return segments
 
 
+def extract_mix_features(audio_path: str) -> Dict:
+    """
+    Mix-only analysis stage: load the original mix and compute key + harmonic chroma.
+
+    Needs nothing from source separation, so it can run concurrently with Demucs.
+    The BPM-dependent chord segmentation is done later by `finalize_analysis`.
+    """
+    # Load audio (mono, 22.05kHz)
+    y, sr = librosa.load(audio_path, sr=22050, duration=180)  # Analyze first 3 mins
+    duration = librosa.get_duration(y=y, sr=sr)
+
+    return {
+        "sr": sr,
+        "duration": duration,
+        "key": analyze_key(y, sr),
+        "chroma": compute_harmonic_chroma(y, sr),
+    }
+
+
+def finalize_analysis(features: Dict, bpm: float) -> Dict:
+    """
+    Turn precomputed mix features into chords and structure once the BPM is known.
+    """
+    chords = segment_chords(features["chroma"], features["sr"], bpm)
+    structure = detect_structure(chords, features["duration"])
+
+    return {"key": features["key"], "chords": chords, "structure": structure}
+
+
 def perform_full_analysis(audio_path: str, bpm: float) -> Dict:
     """
     Perform full analysis: Key + Chords + Structure
     """
     try:
-        # Load audio (mono, 22.05kHz)
-        y, sr = librosa.load(audio_path, sr=22050, duration=180)  # Analyze first 3 mins
-        duration = librosa.get_duration(y=y, sr=sr)
-        
-        key = analyze_key(y, sr)
-        chords = analyze_chords(y, sr, bpm)
-        structure = detect_structure(chords, duration)
-        
-        return {
-            "key": key,
-            "chords": chords,
-            "structure": structure
-        }
+        return finalize_analysis(extract_mix_features(audio_path), bpm)
     except Exception as e:
         logger.error(f"Full analysis failed: {e}")
         return {"key": "Unknown", "chords": [], "structure": []}
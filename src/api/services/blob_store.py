@@ -0,0 +1,285 @@
+"""
+생성 자산(악보/MIDI/타브) 저장소
+
+내용의 SHA-256을 키로 쓰는 content-addressed 저장소라 같은 내용은 한 번만 저장되고,
+DB의 project_assets에는 키/크기/형식 같은 메타데이터만 남는다.
+
+- local (기본): ASSET_STORE_DIR 아래 파일로 저장 - FileResponse로 복사 없이 전송
+- s3: S3 호환 저장소 (MinIO 등 로컬 대체 서버는 ASSET_S3_ENDPOINT_URL로 지정, boto3 필요)
+
+같은 내용을 다시 put하면 수정 시각이 갱신된다. 참조가 없는 내용은 수정 시각이 유예 기간보다 오래된 것만
+지우므로(delete_if_older), 같은 내용을 방금 저장하고 아직 행을 커밋하지 않은 요청과 경합하지 않는다.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+ASSET_STORE = os.getenv("ASSET_STORE", "local")
+ASSET_STORE_DIR = os.getenv("ASSET_STORE_DIR", os.path.join(PROJECT_ROOT, "temp", "assets"))
+
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+def content_key(data: bytes) -> str:
+    """저장 키 (내용의 SHA-256 hex)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _is_key(name: str) -> bool:
+    return len(name) == 64 and all(c in "0123456789abcdef" for c in name)
+
+
+class BlobStore(ABC):
+    """자산 저장소 인터페이스"""
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """내용을 저장하고 키를 반환 (이미 있으면 다시 쓰지 않고 수정 시각만 갱신)"""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        pass
+
+    def iter_chunks(self, key: str) -> Iterator[bytes]:
+        """스트리밍 응답용 조각 단위 읽기"""
+        yield self.get(key)
+
+    def local_path(self, key: str) -> Optional[str]:
+        """로컬 파일 경로 (FileResponse로 바로 보낼 수 있을 때), 아니면 None"""
+        return None
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def last_modified(self, key: str) -> Optional[float]:
+        """마지막으로 put된 시각 (epoch 초), 없으면 None"""
+
+    @abstractmethod
+    def iter_keys(self) -> Iterator[str]:
+        """저장된 모든 키 (GC용)"""
+
+    def delete_if_older(self, key: str, cutoff: float) -> bool:
+        """cutoff보다 먼저 put된 내용만 삭제 - 삭제했으면 True"""
+        modified = self.last_modified(key)
+        if modified is None or modified >= cutoff:
+            return False
+        self.delete(key)
+        return True
+
+
+class LocalBlobStore(BlobStore):
+    """로컬 디렉터리 저장소 - root/ab/cd/<sha256>"""
+
+    def __init__(self, root: str = ASSET_STORE_DIR):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        if not _is_key(key):
+            raise ValueError(f"Invalid asset key: {key}")
+        return os.path.join(self.root, key[:2], key[2:4], key)
+
+    def put(self, data: bytes) -> str:
+        key = content_key(data)
+        path = self._path(key)
+        try:
+            # 이미 있으면 수정 시각만 갱신 - GC 유예 기간이 다시 시작된다
+            os.utime(path)
+            return key
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체 - 동시에 같은 내용을 저장해도 반쯤 쓴 파일이 보이지 않는다
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return key
+
+    def get(self, key: str) -> bytes:
+        with open(self._path(key), "rb") as f:
+            return f.read()
+
+    def iter_chunks(self, key: str) -> Iterator[bytes]:
+        with open(self._path(key), "rb") as f:
+            while True:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def local_path(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        return path if os.path.exists(path) else None
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def last_modified(self, key: str) -> Optional[float]:
+        try:
+            return os.path.getmtime(self._path(key))
+        except FileNotFoundError:
+            return None
+
+    def iter_keys(self) -> Iterator[str]:
+        for _, _, files in os.walk(self.root):
+            for name in files:
+                if _is_key(name):
+                    yield name
+
+    def delete_if_older(self, key: str, cutoff: float) -> bool:
+        """먼저 다른 이름으로 옮긴 뒤 수정 시각을 확인한다
+
+        옮긴 뒤에 들어온 put은 파일이 없으므로 새로 쓰고, 옮기기 전에 들어온 put은 수정 시각을
+        갱신했으므로 되돌린다. 확인과 삭제 사이에 같은 내용이 저장되어도 지워지지 않는다.
+        """
+        path = self._path(key)
+        tombstone = f"{path}.gc-{uuid.uuid4().hex}"
+        try:
+            os.rename(path, tombstone)
+        except FileNotFoundError:
+            return False
+        if os.path.getmtime(tombstone) >= cutoff:
+            try:
+                os.link(tombstone, path)
+            except FileExistsError:
+                pass  # 그 사이에 같은 내용이 다시 저장됨
+            os.remove(tombstone)
+            return False
+        os.remove(tombstone)
+        return True
+
+
+class S3BlobStore(BlobStore):
+    """S3 호환 저장소 (AWS S3, MinIO 등) - 인증 정보는 boto3 기본 방식(AWS_ACCESS_KEY_ID 등)을 따른다"""
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "assets/",
+        endpoint_url: Optional[str] = None,
+        client=None,
+    ):
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise RuntimeError(
+                    "ASSET_STORE=s3 requires boto3 (pip install 'justjam[s3]')"
+                ) from e
+            client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key[:2]}/{key}"
+
+    def put(self, data: bytes) -> str:
+        key = content_key(data)
+        object_key = self._object_key(key)
+        if self.exists(key):
+            # 제자리 복사로 LastModified만 갱신 (내용은 다시 올리지 않음)
+            self.client.copy_object(
+                Bucket=self.bucket,
+                Key=object_key,
+                CopySource={"Bucket": self.bucket, "Key": object_key},
+                MetadataDirective="REPLACE",
+            )
+        else:
+            self.client.put_object(Bucket=self.bucket, Key=object_key, Body=data)
+        return key
+
+    def _body(self, key: str) -> BinaryIO:
+        return self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))["Body"]
+
+    def get(self, key: str) -> bytes:
+        return self._body(key).read()
+
+    def iter_chunks(self, key: str) -> Iterator[bytes]:
+        body = self._body(key)
+        try:
+            while True:
+                chunk = body.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except Exception:
+            return False
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+
+    def last_modified(self, key: str) -> Optional[float]:
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        except Exception:
+            return None
+        return head["LastModified"].timestamp()
+
+    def iter_keys(self) -> Iterator[str]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for obj in page.get("Contents", []):
+                name = obj["Key"].rsplit("/", 1)[-1]
+                if _is_key(name):
+                    yield name
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """환경 설정(ASSET_STORE)에 맞는 저장소 (프로세스당 하나)"""
+    global _blob_store
+    if _blob_store is None:
+        if ASSET_STORE == "s3":
+            _blob_store = S3BlobStore(
+                bucket=os.environ["ASSET_S3_BUCKET"],
+                prefix=os.getenv("ASSET_S3_PREFIX", "assets/"),
+                endpoint_url=os.getenv("ASSET_S3_ENDPOINT_URL"),
+            )
+        else:
+            _blob_store = LocalBlobStore(ASSET_STORE_DIR)
+        logger.info(f"Asset store: {type(_blob_store).__name__}")
+    return _blob_store
+
+
+def set_blob_store(store: Optional[BlobStore]) -> None:
+    """저장소 교체 (테스트, 마이그레이션 스크립트용)"""
+    global _blob_store
+    _blob_store = store
@@ -0,0 +1,280 @@
+"""
+프로젝트 처리 단계(Stage) 그래프 실행기
+
+각 단계는 입력(선행 단계), 출력(파일), 파라미터를 선언하고
+원본 음원의 콘텐츠 해시와 선행 단계 키로부터 캐시 키를 계산한다.
+완료된 단계는 작업 디렉터리의 manifest(pipeline.json)에 기록되므로
+워커가 중간에 죽더라도 재실행 시 Demucs부터 다시 시작하지 않고
+남은 단계만 이어서 실행한다. 서로 독립적인 단계는 병렬로 실행된다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "pipeline.json"
+
+# on_stage(name, state) 콜백
+StageCallback = Callable[[str, str], None]
+
+
+class PipelineError(Exception):
+    """필수 단계가 실패했을 때"""
+
+
+class Stage:
+    """파이프라인 단계 선언
+
+    Args:
+        name: 단계 이름 (그래프 내 고유)
+        func: 선행 단계 결과 dict를 받아 JSON 직렬화 가능한 결과를 반환하는 함수
+        inputs: 선행 단계 이름 목록 (실패한 선택 단계의 결과는 None으로 전달)
+        outputs: 완료 여부를 판단할 출력 파일 경로 목록
+        params: 캐시 키에 포함할 파라미터 (모델 이름 등)
+        version: 단계 구현이 바뀌어 기존 결과를 무효화해야 할 때 올리는 값
+        required: False면 실패해도 파이프라인 전체를 실패로 만들지 않는다
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        inputs: Sequence[str] = (),
+        outputs: Sequence[str] = (),
+        params: Optional[Dict[str, Any]] = None,
+        version: int = 1,
+        required: bool = True,
+    ):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params or {}
+        self.version = version
+        self.required = required
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, inputs={self.inputs!r})"
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Pipeline:
+    """Stage 그래프 실행기
+
+    Args:
+        stages: 실행할 단계 목록
+        work_dir: manifest를 저장할 디렉터리
+        source_hash: 원본 입력의 콘텐츠 해시 (모든 단계 키의 기반)
+        max_workers: 동시에 실행할 최대 단계 수
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        work_dir: str,
+        source_hash: str,
+        max_workers: int = 3,
+    ):
+        self.stages = {s.name: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names in pipeline")
+        for stage in stages:
+            for dep in stage.inputs:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage {stage.name!r} depends on unknown stage {dep!r}")
+
+        self.order = self._topological_order()
+        self.work_dir = work_dir
+        self.source_hash = source_hash
+        self.max_workers = max_workers
+        self.manifest_path = os.path.join(work_dir, MANIFEST_FILENAME)
+        self.keys = self._compute_keys()
+
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+        self.skipped: List[str] = []
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str):
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Cycle detected at stage {name!r}")
+            state[name] = 1
+            for dep in self.stages[name].inputs:
+                visit(dep)
+            state[name] = 2
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _compute_keys(self) -> Dict[str, str]:
+        keys: Dict[str, str] = {}
+        for name in self.order:
+            stage = self.stages[name]
+            payload = json.dumps(
+                {
+                    "stage": name,
+                    "version": stage.version,
+                    "params": stage.params,
+                    "source": self.source_hash,
+                    "inputs": {dep: keys[dep] for dep in sorted(stage.inputs)},
+                },
+                sort_keys=True,
+                default=str,
+            )
+            keys[name] = hashlib.sha256(payload.encode()).hexdigest()
+        return keys
+
+    def load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("stages", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable pipeline manifest {self.manifest_path}: {e}")
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, Any]]):
+        os.makedirs(self.work_dir, exist_ok=True)
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"source": self.source_hash, "stages": manifest}, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def is_complete(self, name: str, manifest: Dict[str, Dict[str, Any]]) -> bool:
+        """manifest 키가 일치하고 선언된 출력 파일이 모두 존재하면 완료된 단계"""
+        entry = manifest.get(name)
+        if not entry or entry.get("key") != self.keys[name]:
+            return False
+        return all(os.path.exists(p) for p in self.stages[name].outputs)
+
+    def run(
+        self,
+        on_poll: Optional[Callable[[], None]] = None,
+        poll_interval: float = 1.0,
+        on_stage: Optional[Callable[[str, str], None]] = None,
+    ) -> Dict[str, Any]:
+        """그래프 실행
+
+        on_poll은 실행 중 poll_interval마다 호출 스레드에서 호출된다.
+        (DB 세션처럼 스레드 간 공유할 수 없는 자원은 여기서만 다룬다.)
+        on_stage(name, state)는 단계 상태가 바뀔 때 호출 스레드에서 호출된다.
+        state: "skipped" | "started" | "completed" | "failed"
+
+        Returns:
+            단계 이름 → 결과 dict (실패한 단계는 포함되지 않음)
+
+        Raises:
+            PipelineError: 필수 단계가 실패하거나 선행 단계 실패로 실행되지 못한 경우
+        """
+        manifest = self.load_manifest()
+        notify = on_stage or (lambda name, state: None)
+        pending = self._skip_completed(manifest, notify)
+        failed: set = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running: Dict[Future, str] = {}
+
+            while pending or running:
+                self._submit_ready(executor, pending, running, failed, notify)
+                if not running:
+                    # 선행 단계 실패로 정리된 단계만 남았으면 다음 루프에서 종료된다
+                    continue
+
+                done, _ = wait(list(running), timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._collect(future, running.pop(future), manifest, failed, notify)
+
+                if on_poll:
+                    on_poll()
+
+        required_failures = [n for n in failed if self.stages[n].required]
+        if required_failures:
+            raise PipelineError(
+                "Required stages failed: "
+                + ", ".join(f"{n} ({self.errors[n]})" for n in sorted(required_failures))
+            )
+        return self.results
+
+    def _skip_completed(
+        self, manifest: Dict[str, Dict[str, Any]], notify: StageCallback
+    ) -> List[str]:
+        """manifest에서 완료된 단계의 결과를 불러오고 아직 실행할 단계 목록을 반환"""
+        pending = list(self.order)
+        for name in self.order:
+            if self.is_complete(name, manifest):
+                self.results[name] = manifest[name].get("result")
+                self.skipped.append(name)
+                pending.remove(name)
+                notify(name, "skipped")
+        if self.skipped:
+            logger.info(f"Resuming pipeline, skipping completed stages: {self.skipped}")
+        return pending
+
+    def _submit_ready(
+        self,
+        executor: ThreadPoolExecutor,
+        pending: List[str],
+        running: Dict[Future, str],
+        failed: set,
+        notify: StageCallback,
+    ):
+        """선행 단계가 끝난 단계를 빈 슬롯만큼 실행하고, 필수 선행 단계가 실패한 단계는 실패 처리"""
+        for name in list(pending):
+            stage = self.stages[name]
+            if any(dep in failed and self.stages[dep].required for dep in stage.inputs):
+                pending.remove(name)
+                failed.add(name)
+                self.errors[name] = "upstream stage failed"
+                notify(name, "failed")
+                continue
+            if len(running) >= self.max_workers:
+                break
+            # 실패한 선택(required=False) 단계의 결과는 None으로 전달된다
+            if all(dep in self.results or dep in failed for dep in stage.inputs):
+                deps = {dep: self.results.get(dep) for dep in stage.inputs}
+                running[executor.submit(stage.func, deps)] = name
+                pending.remove(name)
+                notify(name, "started")
+
+    def _collect(
+        self,
+        future: Future,
+        name: str,
+        manifest: Dict[str, Dict[str, Any]],
+        failed: set,
+        notify: StageCallback,
+    ):
+        """끝난 단계의 결과를 manifest에 기록하거나 실패로 표시"""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Pipeline stage {name!r} failed: {e}")
+            failed.add(name)
+            self.errors[name] = str(e)
+            notify(name, "failed")
+            return
+        self.results[name] = result
+        manifest[name] = {"key": self.keys[name], "result": result}
+        self._save_manifest(manifest)
+        notify(name, "completed")
@@ -0,0 +1,209 @@
+"""
+프로젝트 처리 진행률 브로커
+
+처리 작업(Celery 워커, BackgroundTasks)은 진행률 이벤트를 발행하고,
+API의 SSE 엔드포인트는 이를 구독해 클라이언트로 바로 밀어준다.
+REDIS_URL이 설정되어 있으면 Redis pub/sub으로 프로세스 간에 전달하고,
+없거나 연결에 실패하면 같은 프로세스 안의 구독자에게만 전달한다.
+마지막 이벤트는 보관해 두었다가 늦게 연결한 구독자에게 먼저 보낸다.
+워커가 죽어 완료/실패 이벤트가 오지 않아도 구독이 끝나도록, 하트비트마다 호출자가 넘긴 상태 확인을 하고
+PROGRESS_STREAM_MAX_IDLE 동안 이벤트가 없으면 구독을 닫는다 (EventSource는 다시 연결해 현재 상태를 받는다).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import AsyncIterator, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "justjam:progress:"
+LAST_EVENT_TTL = 3600  # 초
+TERMINAL_STATUSES = {"completed", "failed"}
+# 이 시간 동안 진행률 이벤트가 없으면 구독 종료
+PROGRESS_STREAM_MAX_IDLE = float(os.getenv("PROGRESS_STREAM_MAX_IDLE_SEC", "600"))
+# Redis 구독 확인을 기다리는 최대 시간 (넘으면 확인 없이 진행)
+REDIS_SUBSCRIBE_TIMEOUT = 2.0
+
+
+class ProgressBroker:
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._last: Dict[str, Tuple[float, dict]] = {}
+        self._redis = None
+
+    def _get_redis(self):
+        if not self.redis_url:
+            return None
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(
+                self.redis_url, socket_connect_timeout=1, socket_timeout=1
+            )
+        return self._redis
+
+    def publish(self, project_id: str, **event):
+        """진행률 이벤트 발행 (어느 스레드에서 호출해도 됨)
+
+        event 예: status="processing", stage="separate", percent=42
+        """
+        event = {"project_id": project_id, **event}
+        client = self._get_redis()
+        if client is not None:
+            payload = json.dumps(event)
+            try:
+                pipe = client.pipeline()
+                pipe.publish(CHANNEL_PREFIX + project_id, payload)
+                pipe.setex(CHANNEL_PREFIX + project_id + ":last", LAST_EVENT_TTL, payload)
+                pipe.execute()
+                return
+            except Exception as e:
+                logger.warning(f"Redis progress publish failed, delivering in-process only: {e}")
+        self._publish_local(project_id, event)
+
+    def _publish_local(self, project_id: str, event: dict):
+        with self._lock:
+            self._last[project_id] = (time.monotonic(), event)
+            self._prune_last()
+            subscribers = list(self._subscribers.get(project_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                # 구독자의 이벤트 루프가 이미 닫힘
+                pass
+
+    def _prune_last(self):
+        expired_before = time.monotonic() - LAST_EVENT_TTL
+        for key in [k for k, (ts, _) in self._last.items() if ts < expired_before]:
+            del self._last[key]
+
+    def last_event(self, project_id: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._last.get(project_id)
+        if entry:
+            return entry[1]
+        client = self._get_redis()
+        if client is not None:
+            try:
+                payload = client.get(CHANNEL_PREFIX + project_id + ":last")
+                return json.loads(payload) if payload else None
+            except Exception:
+                return None
+        return None
+
+    async def subscribe(
+        self,
+        project_id: str,
+        heartbeat: float = 15.0,
+        check_status: Optional[Callable[[], Optional[dict]]] = None,
+        max_idle: Optional[float] = None,
+    ) -> AsyncIterator[Optional[dict]]:
+        """이벤트 구독 - 완료/실패 이벤트를 받으면 종료
+
+        heartbeat초 동안 이벤트가 없으면 None을 내보내 연결 유지용 주석을 보낼 수 있게 한다.
+        check_status는 하트비트마다 스레드풀에서 호출되며, 이벤트를 반환하면 그 이벤트를 보내고 종료한다
+        (DB상 처리가 이미 끝난 경우). max_idle(기본 PROGRESS_STREAM_MAX_IDLE)초 동안 이벤트가 없어도 종료한다.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        entry = (loop, queue)
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(entry)
+        max_idle = PROGRESS_STREAM_MAX_IDLE if max_idle is None else max_idle
+
+        redis_task = None
+        try:
+            if self.redis_url:
+                subscribed = asyncio.Event()
+                redis_task = asyncio.create_task(self._forward_redis(project_id, queue, subscribed))
+                await self._wait_subscribed(redis_task, subscribed)
+
+            # 구독이 확인된 뒤에 마지막 이벤트를 조회해야 그 사이에 발행된 이벤트를 놓치지 않는다
+            last = await loop.run_in_executor(None, self.last_event, project_id)
+            if last:
+                yield last
+                if last.get("status") in TERMINAL_STATUSES:
+                    return
+
+            last_event_at = loop.time()
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    if check_status is not None:
+                        final = await loop.run_in_executor(None, check_status)
+                        if final:
+                            yield final
+                            return
+                    if loop.time() - last_event_at >= max_idle:
+                        logger.info(f"Closing idle progress stream for {project_id}")
+                        return
+                    yield None
+                    continue
+                last_event_at = loop.time()
+                yield event
+                if event.get("status") in TERMINAL_STATUSES:
+                    return
+        finally:
+            if redis_task:
+                redis_task.cancel()
+            with self._lock:
+                subscribers = self._subscribers.get(project_id)
+                if subscribers:
+                    subscribers.discard(entry)
+                    if not subscribers:
+                        del self._subscribers[project_id]
+
+    @staticmethod
+    async def _wait_subscribed(redis_task: asyncio.Task, subscribed: asyncio.Event):
+        """Redis 구독이 확인될 때까지 대기 - 구독이 실패하거나 REDIS_SUBSCRIBE_TIMEOUT이 지나면 그냥 진행"""
+        waiter = asyncio.ensure_future(subscribed.wait())
+        try:
+            await asyncio.wait(
+                {waiter, redis_task},
+                timeout=REDIS_SUBSCRIBE_TIMEOUT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            waiter.cancel()
+        if not subscribed.is_set():
+            logger.warning(
+                "Redis progress subscription not confirmed, "
+                "events published meanwhile may be missed"
+            )
+
+    async def _forward_redis(
+        self, project_id: str, queue: asyncio.Queue, subscribed: asyncio.Event
+    ):
+        import redis.asyncio as aioredis
+
+        client = aioredis.from_url(self.redis_url)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(CHANNEL_PREFIX + project_id)
+            async for message in pubsub.listen():
+                if message.get("type") == "subscribe":
+                    # 서버가 구독을 확인한 뒤부터 발행되는 메시지는 모두 받는다
+                    subscribed.set()
+                elif message.get("type") == "message":
+                    queue.put_nowait(json.loads(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Redis progress subscription failed for {project_id}: {e}")
+        finally:
+            try:
+                await pubsub.close()
+                await client.close()
+            except Exception:
+                pass
+
+
+progress_broker = ProgressBroker(os.getenv("REDIS_URL"))
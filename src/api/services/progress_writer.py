@@ -0,0 +1,106 @@
+"""
+진행률 DB 기록 묶음 처리
+
+처리/생성 작업의 진행률은 바뀔 때마다 progress_broker로 바로 전달하고(SSE),
+DB에는 프로세스 안에서 모았다가 PROGRESS_DB_INTERVAL마다 한 트랜잭션으로 기록한다.
+같은 행의 여러 값은 마지막 값 하나로 합쳐지고, 여러 작업의 행도 한 번의 executemany UPDATE가 된다.
+작업 세션과 별도 세션으로 쓰므로 작업 객체가 만료되지 않고, 쓰기 잠금도 주기마다 한 번만 잡는다.
+
+진행 중(pending/processing)인 행만 갱신하므로 완료/실패 후 늦게 도착한 값이 상태를 덮어쓰지 않는다.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from src.api.models import GenerationJob, ProjectModel
+from src.api.schemas.project import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = (TaskStatus.PENDING.value, TaskStatus.PROCESSING.value)
+
+PROGRESS_TABLES = {
+    "project": ProjectModel.__table__,
+    "job": GenerationJob.__table__,
+}
+
+
+def _update_statement(table):
+    return (
+        update(table)
+        .where(table.c.id == bindparam("row_id"), table.c.status.in_(ACTIVE_STATUSES))
+        .values(progress=bindparam("percent"))
+    )
+
+
+class ProgressWriter:
+    def __init__(self, session_factory: Callable[[], Session], interval: float = 5.0):
+        self.session_factory = session_factory
+        self.interval = interval
+        self._lock = threading.Lock()
+        # (종류, id) -> (진행률, 기록 후 실행할 콜백)
+        self._pending: Dict[Tuple[str, str], Tuple[int, Optional[Callable[[], None]]]] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    def record(
+        self, kind: str, row_id: str, percent: int, on_flush: Optional[Callable[[], None]] = None
+    ) -> None:
+        """진행률을 모아 둔다 - 모으기 시작하고 interval이 지나면 백그라운드에서 한 번에 기록된다
+
+        on_flush는 이 값이 commit된 뒤 한 번 호출된다 (응답 캐시 무효화 등).
+        """
+        if kind not in PROGRESS_TABLES:
+            raise ValueError(f"Unknown progress kind: {kind}")
+        with self._lock:
+            self._pending[(kind, row_id)] = (percent, on_flush)
+            if self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def discard(self, kind: str, row_id: str) -> None:
+        """작업이 끝나 최종 값을 직접 기록할 때 남은 값을 버린다"""
+        with self._lock:
+            self._pending.pop((kind, row_id), None)
+
+    def flush(self) -> int:
+        """모아 둔 진행률을 한 트랜잭션으로 기록 - 기록한 행 수(요청 기준) 반환"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            timer, self._timer = self._timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if not pending:
+            return 0
+
+        rows: Dict[str, list] = {}
+        for (kind, row_id), (percent, _) in pending.items():
+            rows.setdefault(kind, []).append({"row_id": row_id, "percent": percent})
+
+        db = self.session_factory()
+        try:
+            for kind, params in rows.items():
+                db.execute(_update_statement(PROGRESS_TABLES[kind]), params)
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error writing progress for {len(pending)} rows: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+        self._run_callbacks(callback for _, callback in pending.values())
+        return len(pending)
+
+    def _run_callbacks(self, callbacks: Iterable[Optional[Callable[[], None]]]) -> None:
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Progress flush callback failed: {e}")
@@ -0,0 +1,97 @@
+"""
+프로젝트 접근 권한 확인
+
+프로젝트와 요청한 사용자의 멤버 역할을 한 번의 쿼리(projects LEFT JOIN project_members)로 읽고
+작업별 권한 단계를 같은 규칙으로 판정한다.
+
+- view: 소유자와 모든 멤버 (조회, 스템/믹스, 악보/MIDI/타브 생성과 조회, 멤버 목록)
+- edit: 소유자와 editor 멤버 (이름 수정, 음원 분리 시작)
+- owner: 소유자만 (삭제, 복제, 공유)
+
+소유자가 없는(로그인 없이 만든) 프로젝트는 누구나 모든 작업을 할 수 있다.
+라우트에서는 dependencies.get_project_access로 요청당 한 번만 읽어 서비스에 넘긴다.
+"""
+
+from typing import Optional
+
+from sqlalchemy import and_, literal
+from sqlalchemy.orm import Session
+
+from src.api.exceptions import AuthenticationError, ProjectNotFoundError, ProjectPermissionError
+from src.api.models import ProjectMember, ProjectModel, User
+
+VIEW = "view"
+EDIT = "edit"
+OWNER = "owner"
+
+# 역할별로 허용되는 가장 높은 단계 (알 수 없는 멤버 역할은 viewer로 취급)
+ROLE_LEVELS = {"viewer": VIEW, "editor": EDIT, "owner": OWNER}
+LEVEL_RANKS = {VIEW: 1, EDIT: 2, OWNER: 3}
+
+
+class ProjectAccess:
+    """프로젝트와 요청한 사용자의 역할 ('owner', 멤버 역할, 또는 접근 권한이 없으면 None)"""
+
+    __slots__ = ("project", "role", "user_id")
+
+    def __init__(self, project: ProjectModel, role: Optional[str], user_id: Optional[int] = None):
+        self.project = project
+        self.role = role
+        self.user_id = user_id
+
+    @property
+    def is_owner(self) -> bool:
+        return self.role == OWNER
+
+    def allows(self, level: str) -> bool:
+        if self.project.user_id is None:
+            return True
+        if self.role is None:
+            return False
+        return LEVEL_RANKS[ROLE_LEVELS.get(self.role, VIEW)] >= LEVEL_RANKS[level]
+
+    def require(self, level: str, detail: Optional[str] = None) -> ProjectModel:
+        """권한이 있으면 프로젝트를 반환
+
+        접근 자체가 불가능하면 401, 접근은 되지만 작업 권한이 부족하면 403.
+        """
+        if self.allows(level):
+            return self.project
+        if level == VIEW or not self.allows(VIEW):
+            raise AuthenticationError(detail="이 프로젝트에 접근할 권한이 없습니다.")
+        raise ProjectPermissionError(detail=detail) if detail else ProjectPermissionError()
+
+
+def load_project_access(
+    db: Session, project_id: str, current_user: Optional[User] = None, *options
+) -> ProjectAccess:
+    """프로젝트와 사용자의 멤버 역할을 한 번에 조회 (없으면 404) - options는 프로젝트 로딩 옵션"""
+    user_id = current_user.id if current_user else None
+    if user_id is not None:
+        query = db.query(ProjectModel, ProjectMember.role).outerjoin(
+            ProjectMember,
+            and_(ProjectMember.project_id == ProjectModel.id, ProjectMember.user_id == user_id),
+        )
+    else:
+        query = db.query(ProjectModel, literal(None))
+
+    row = query.options(*options).filter(ProjectModel.id == project_id).first()
+    if row is None:
+        raise ProjectNotFoundError()
+
+    project, member_role = row
+    role = OWNER if user_id is not None and project.user_id == user_id else member_role
+    return ProjectAccess(project, role, user_id)
+
+
+def resolve_project_access(
+    db: Session,
+    project_id: str,
+    current_user: Optional[User] = None,
+    access: Optional[ProjectAccess] = None,
+) -> ProjectAccess:
+    """라우트에서 이미 읽은 access가 같은 프로젝트/사용자의 것이면 재사용하고, 아니면 조회"""
+    user_id = current_user.id if current_user else None
+    if access is not None and access.project.id == project_id and access.user_id == user_id:
+        return access
+    return load_project_access(db, project_id, current_user)
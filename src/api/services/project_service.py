@@ -1,7 +1,13 @@
 """
 프로젝트 관리 서비스 레이어
+
+librosa, pydub, TensorFlow(basic_pitch), music21 등 오디오/ML 라이브러리는
+워커 경로에서만 필요하므로 사용하는 함수 안에서 import한다.
+모듈 최상단에 추가하면 API 프로세스 시작 시간과 메모리가 크게 늘어난다
+(tests/test_import_time.py가 이를 검사한다).
 """
 
+import base64
 import hashlib
 import json
 import logging
@@ -9,30 +15,39 @@ import math
 import os
 import shutil
 import tempfile
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import librosa
-import numpy as np
-import soundfile as sf
-from pydub import AudioSegment
-from sqlalchemy import desc, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, desc, literal, or_, select, union
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, joinedload, noload
 
 from src.api.database import SessionLocal
 from src.api.exceptions import (
     AudioProcessingError,
-    FileUploadError,
     ProjectNotFoundError,
+    ProjectPermissionError,
     TranscriptionError,
 )
-from src.api.models import ProjectAsset, ProjectMember, ProjectModel, User
+from src.api.models import GenerationJob, ProjectAsset, ProjectMember, ProjectModel, User
 from src.api.schemas.project import ProjectUpdate, TaskStatus, MixRequest
-from src.audio_processor import separate_audio
-from src.score_generator import create_score
-from src.tab_generator import TabGenerator
-from src.transcriber import transcribe_audio
+from src.api.services.blob_store import get_blob_store
+from src.api.services.pipeline import MANIFEST_FILENAME, Pipeline, Stage, hash_file
+from src.api.services.project_access import (
+    EDIT,
+    OWNER,
+    VIEW,
+    ProjectAccess,
+    load_project_access,
+    resolve_project_access,
+)
+from src.api.services.progress_broker import progress_broker
+from src.api.services.progress_writer import ProgressWriter
+from src.api.services.response_cache import project_list_tag, project_tag, response_cache
+from src.api.services.search_index import match_projects
+from src.api.services.task_routing import generation_route
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +57,39 @@ PROJECT_ROOT = os.path.dirname(
 UPLOAD_DIR = os.path.join(PROJECT_ROOT, "temp", "uploads")
 SEPARATED_DIR = os.path.join(PROJECT_ROOT, "temp", "separated")
 
+# 처리 중 진행률을 DB에 기록하는 최소 간격 (실시간 진행률은 progress_broker로 전달)
+PROGRESS_DB_INTERVAL = float(os.getenv("PROGRESS_DB_INTERVAL_SEC", "5"))
+
+# 처리/생성 작업의 진행률을 모아 PROGRESS_DB_INTERVAL마다 한 트랜잭션으로 기록
+progress_writer = ProgressWriter(SessionLocal, PROGRESS_DB_INTERVAL)
+
+# 생성 작업이 이 시간 동안 진행률 갱신이 없으면 (워커 종료, 대기열 유실 등) 실패로 보고 새로 만든다
+GENERATION_JOB_TIMEOUT = float(os.getenv("GENERATION_JOB_TIMEOUT_SEC", "900"))
+
+
+def _active_generation_job(
+    db: Session, project_id: str, asset_type: str, instrument: str
+) -> Optional[GenerationJob]:
+    """대상의 대기/진행 중인 생성 작업"""
+    return (
+        db.query(GenerationJob)
+        .filter(
+            GenerationJob.project_id == project_id,
+            GenerationJob.asset_type == asset_type,
+            GenerationJob.instrument == instrument,
+            GenerationJob.status.in_([TaskStatus.PENDING.value, TaskStatus.PROCESSING.value]),
+        )
+        .first()
+    )
+
+
+def _is_stale_job(job: GenerationJob) -> bool:
+    """마지막 갱신(없으면 생성) 후 GENERATION_JOB_TIMEOUT이 지난 작업인지"""
+    last_activity = job.updated_at or job.created_at
+    if last_activity is None:
+        return False
+    return (datetime.utcnow() - last_activity).total_seconds() > GENERATION_JOB_TIMEOUT
+
 
 def generate_thumbnail(audio_path: str, output_path: str):
     """오디오 파일을 기반으로 스펙트로그램 썸네일 생성"""
@@ -49,7 +97,9 @@ def generate_thumbnail(audio_path: str, output_path: str):
         import matplotlib
         matplotlib.use("Agg")
         import matplotlib.pyplot as plt
+        import librosa
         import librosa.display
+        import numpy as np
 
         y, sr = librosa.load(audio_path, duration=30, sr=22050)
         S = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=128)
@@ -71,94 +121,250 @@ def generate_thumbnail(audio_path: str, output_path: str):
 from src.api.celery_app import celery_app
 
 
+STEM_NAMES = ["vocals", "drums", "bass", "guitar", "piano", "other"]
+
+
+def detect_stem_bpm(stem_dir: str, input_path: str) -> int:
+    """드럼 스템(없으면 원본 믹스)에서 BPM 감지"""
+    import librosa
+
+    drums_path = os.path.join(stem_dir, "drums.wav")
+    target_path = drums_path if os.path.exists(drums_path) else input_path
+
+    y, sr = librosa.load(target_path, sr=None, duration=60)
+    tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
+    return int(round(tempo)) if isinstance(tempo, float) else int(round(tempo[0]))
+
+
+def build_master_mix(stem_dir: str) -> Optional[str]:
+    """분리된 스템을 합쳐 master.wav 생성"""
+    from pydub import AudioSegment
+
+    master = None
+    for stem in STEM_NAMES:
+        stem_path = os.path.join(stem_dir, f"{stem}.wav")
+        if os.path.exists(stem_path):
+            audio = AudioSegment.from_wav(stem_path)
+            if master is None:
+                master = audio
+            else:
+                master = master.overlay(audio)
+
+    if master is None:
+        return None
+
+    master_path = os.path.join(stem_dir, "master.wav")
+    master.export(master_path, format="wav")
+    return master_path
+
+
+def build_processing_stages(
+    input_path: str, stem_dir: str, progress_callback=None, model_name: str = "htdemucs_6s"
+) -> List[Stage]:
+    """업로드 음원 처리 단계 그래프
+
+        mix_features(키/크로마) ──────────────────┐
+        separate ─┬─ bpm(drums) ──────────────────┴─ analysis(코드/구조)
+                  └─ master_mix
+    원본 믹스만 필요한 분석은 Demucs와 동시에 실행되므로
+    전체 소요 시간은 두 작업의 합이 아니라 max(분리, 분석)이 된다.
+    """
+    import numpy as np
+
+    from src.api.services.analysis_service import extract_mix_features, finalize_analysis
+    from src.audio_processor import separate_audio
+
+    features_path = os.path.join(stem_dir, "mix_features.npz")
+    master_path = os.path.join(stem_dir, "master.wav")
+
+    def run_separation(_deps):
+        stems = separate_audio(
+            input_path, model_name=model_name, progress_callback=progress_callback
+        )
+        if not stems or "original" in stems:
+            raise RuntimeError("Source separation produced no stems")
+        # 절대 경로 대신 스템 이름만 기록해 manifest를 다른 디렉터리로 옮겨도 유효하게 한다
+        return sorted(stems)
+
+    def run_mix_features(_deps):
+        features = extract_mix_features(input_path)
+        os.makedirs(stem_dir, exist_ok=True)
+        with open(features_path, "wb") as f:
+            np.savez(f, chroma=features["chroma"])
+        return {"key": features["key"], "sr": features["sr"], "duration": features["duration"]}
+
+    def run_bpm(_deps):
+        return detect_stem_bpm(stem_dir, input_path)
+
+    def run_master_mix(_deps):
+        return build_master_mix(stem_dir)
+
+    def run_analysis(deps):
+        features = deps["mix_features"]
+        if features is None:
+            raise RuntimeError("Mix features are not available")
+        with np.load(features_path) as data:
+            features = dict(features, chroma=data["chroma"])
+        return finalize_analysis(features, float(deps["bpm"] or 120.0))
+
+    stem_outputs = [os.path.join(stem_dir, f"{stem}.wav") for stem in STEM_NAMES]
+    return [
+        Stage("separate", run_separation, outputs=stem_outputs, params={"model": model_name}),
+        Stage("mix_features", run_mix_features, outputs=[features_path], required=False),
+        Stage("bpm", run_bpm, inputs=["separate"], required=False),
+        Stage(
+            "master_mix", run_master_mix, inputs=["separate"], outputs=[master_path], required=False
+        ),
+        Stage("analysis", run_analysis, inputs=["mix_features", "bpm"], required=False),
+    ]
+
+
+def reuse_processed_stems(db: Session, project: ProjectModel, stem_dir: str) -> bool:
+    """같은 원본(content_hash)을 이미 처리한 프로젝트의 결과를 스템 디렉터리로 가져오기
+
+    단계 키는 원본 해시와 파라미터로만 결정되므로 manifest와 출력 파일을 그대로 옮기면
+    Pipeline이 모든 단계를 완료된 것으로 보고 Demucs를 다시 실행하지 않는다.
+    가능하면 하드링크를 사용해 디스크를 추가로 쓰지 않는다.
+    """
+    if not project.content_hash or os.path.exists(os.path.join(stem_dir, MANIFEST_FILENAME)):
+        return False
+
+    siblings = (
+        db.query(ProjectModel.id)
+        .filter(
+            ProjectModel.content_hash == project.content_hash,
+            ProjectModel.id != project.id,
+            ProjectModel.status == TaskStatus.COMPLETED.value,
+        )
+        .order_by(ProjectModel.created_at.desc())
+        .all()
+    )
+    for (sibling_id,) in siblings:
+        sibling_dir = os.path.join(SEPARATED_DIR, "htdemucs_6s", sibling_id)
+        if not os.path.exists(os.path.join(sibling_dir, MANIFEST_FILENAME)):
+            continue
+        try:
+            os.makedirs(stem_dir, exist_ok=True)
+            for name in os.listdir(sibling_dir):
+                src = os.path.join(sibling_dir, name)
+                dst = os.path.join(stem_dir, name)
+                if not os.path.isfile(src) or name.endswith(".tmp") or os.path.exists(dst):
+                    continue
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy2(src, dst)
+        except OSError as e:
+            logger.warning(f"Could not reuse stems of {sibling_id} for {project.id}: {e}")
+            continue
+        logger.info(f"Reusing processed stems of {sibling_id} for {project.id}")
+        return True
+    return False
+
+
+def _apply_processing_results(project: ProjectModel, results: Dict) -> None:
+    """파이프라인 단계 결과(BPM, 조/코드/구조 분석)를 프로젝트에 반영"""
+    if results.get("bpm"):
+        project.bpm = results["bpm"]
+        logger.info(f"Detected BPM: {project.bpm}")
+
+    analysis_results = results.get("analysis")
+    if analysis_results:
+        project.detected_key = analysis_results.get("key")
+        project.chord_progression = json.dumps(analysis_results.get("chords"))
+        project.structure = json.dumps(analysis_results.get("structure"))
+
+
 def process_audio_logic(project_id: str, celery_self=None):
-    """음원 분리 작업의 핵심 로직 (Celery와 BackgroundTasks 공통)"""
+    """음원 분리 작업의 핵심 로직 (Celery와 BackgroundTasks 공통)
+
+    단계 그래프(`build_processing_stages`)를 Pipeline으로 실행한다. 완료된 단계는
+    스템 디렉터리의 manifest에 기록되므로 워커 장애 후 재실행하면 남은 단계만 실행된다.
+    DB 세션은 스레드 간 공유할 수 없으므로 커밋은 모두 호출 스레드에서만 수행한다.
+    """
     db = SessionLocal()
     try:
         project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
         if not project:
             return
 
+        # 상태/진행률을 DB에 기록할 때마다 상세와 목록 응답 캐시를 무효화
+        cache_tags = project_cache_tags(db, project_id)
         project.status = TaskStatus.PROCESSING.value
         db.commit()
+        response_cache.invalidate(*cache_tags)
 
         input_path = os.path.join(UPLOAD_DIR, project.original_filename)
+        stem_dir = os.path.join(SEPARATED_DIR, "htdemucs_6s", project_id)
+        reuse_processed_stems(db, project, stem_dir)
+
+        # 진행률 이벤트는 변할 때마다 브로커로 바로 발행하고(SSE),
+        # DB에는 progress_writer가 모아서, Celery 상태에는 PROGRESS_DB_INTERVAL마다 한 번만 기록한다
+        state = {"percent": project.progress or 0}
+        persisted = {"percent": state["percent"], "at": time.monotonic()}
+
+        def on_separation_progress(percent: int):
+            # 작업 스레드에서 호출됨 - 브로커 발행은 스레드 안전
+            scaled = min(int(percent * 0.95), 99)
+            if scaled != state["percent"]:
+                state["percent"] = scaled
+                progress_broker.publish(
+                    project_id, status="processing", stage="separate", percent=scaled
+                )
 
-        def update_progress(percent: int):
-            scaled_req = min(int(percent * 0.95), 99)
-            try:
-                # DB 업데이트
-                project.progress = scaled_req
-                db.commit()
-                # Celery State 업데이트 (Celery 환경에서만)
-                if celery_self:
-                    celery_self.update_state(state="PROGRESS", meta={"percent": scaled_req})
-            except Exception as e:
-                logger.error(f"Error updating progress: {e}")
-                db.rollback()
+        def on_stage(name: str, stage_state: str):
+            progress_broker.publish(
+                project_id,
+                status="processing",
+                stage=name,
+                stage_status=stage_state,
+                percent=state["percent"],
+            )
+
+        def persist_progress():
+            percent = state["percent"]
+            if percent == persisted["percent"]:
+                return
+            persisted["percent"] = percent
+            progress_writer.record(
+                "project", project_id, percent, lambda: response_cache.invalidate(*cache_tags)
+            )
+            # Celery State 업데이트 (Celery 환경에서만)
+            now = time.monotonic()
+            if celery_self and now - persisted["at"] >= PROGRESS_DB_INTERVAL:
+                persisted["at"] = now
+                try:
+                    celery_self.update_state(state="PROGRESS", meta={"percent": percent})
+                except Exception as e:
+                    logger.error(f"Error updating progress: {e}")
 
         try:
-            stems = separate_audio(
-                input_path, model_name="htdemucs_6s", progress_callback=update_progress
+            pipeline = Pipeline(
+                build_processing_stages(input_path, stem_dir, on_separation_progress),
+                work_dir=stem_dir,
+                source_hash=project.content_hash or hash_file(input_path),
             )
-            
-            # BPM 감지
-            try:
-                stem_dir = os.path.join(SEPARATED_DIR, "htdemucs_6s", project_id)
-                drums_path = os.path.join(stem_dir, "drums.wav")
-                target_path = drums_path if os.path.exists(drums_path) else input_path
-
-                y, sr = librosa.load(target_path, sr=None, duration=60)
-                tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
-                detected_bpm = (
-                    int(round(tempo)) if isinstance(tempo, float) else int(round(tempo[0]))
-                )
+            results = pipeline.run(on_poll=persist_progress, on_stage=on_stage)
+            _apply_processing_results(project, results)
 
-                project.bpm = detected_bpm
-                logger.info(f"Detected BPM: {detected_bpm}")
-            except Exception as e:
-                logger.error(f"BPM Detection failed: {e}")
-
-            # 마스터 웨이브폼 생성
-            try:
-                stem_dir = os.path.join(SEPARATED_DIR, "htdemucs_6s", project_id)
-                master = None
-                for stem in ["vocals", "drums", "bass", "guitar", "piano", "other"]:
-                    stem_path = os.path.join(stem_dir, f"{stem}.wav")
-                    if os.path.exists(stem_path):
-                        audio = AudioSegment.from_wav(stem_path)
-                        if master is None:
-                            master = audio
-                        else:
-                            master = master.overlay(audio)
-
-                if master:
-                    master.export(os.path.join(stem_dir, "master.wav"), format="wav")
-                    logger.info(f"Generated master.wav for {project_id}")
-            except Exception as e:
-                logger.error(f"Master mix generation failed: {e}")
-
-            # 키/코드/구조 분석
-            try:
-                from src.api.services.analysis_service import perform_full_analysis
-                analysis_results = perform_full_analysis(input_path, float(project.bpm or 120.0))
-                project.detected_key = analysis_results.get("key")
-                project.chord_progression = json.dumps(analysis_results.get("chords"))
-                project.structure = json.dumps(analysis_results.get("structure"))
-            except Exception as e:
-                logger.error(f"Analysis failed for {project_id}: {e}")
-
-            if stems and "original" not in stems:
-                project.status = TaskStatus.COMPLETED.value
-                project.progress = 100
-            else:
-                project.status = TaskStatus.FAILED.value
+            for name, error in pipeline.errors.items():
+                logger.error(f"Stage {name} failed for {project_id}: {error}")
 
+            progress_writer.discard("project", project_id)
+            project.status = TaskStatus.COMPLETED.value
+            project.progress = 100
             db.commit()
+            response_cache.invalidate(*cache_tags)
+            progress_broker.publish(project_id, status="completed", percent=100)
         except Exception as e:
             logger.exception(f"{project_id} processing failed: {e}")
+            progress_writer.discard("project", project_id)
             project.status = TaskStatus.FAILED.value
             db.commit()
+            response_cache.invalidate(*cache_tags)
+            progress_broker.publish(
+                project_id, status="failed", percent=state["percent"], error=str(e)
+            )
     finally:
         db.close()
 
@@ -169,22 +375,544 @@ def process_audio_task(self, project_id: str):
     return process_audio_logic(project_id, celery_self=self)
 
 
+# 악기별 기본 타브 튜닝 (다른 튜닝 프리셋은 src.tab_generator.TUNING_PRESETS)
+TAB_TUNINGS = {
+    "bass": ["E1", "A1", "D2", "G2"],
+    "guitar": ["E2", "A2", "D3", "G3", "B3", "E4"],
+}
+
+# 참조가 없어진 자산 내용도 마지막 저장 후 이 시간이 지나야 지운다 (같은 내용을 막 저장한 요청 보호)
+ASSET_BLOB_GRACE = int(os.getenv("ASSET_BLOB_GRACE_SEC", "3600"))
+
+# 자산 종류별 응답 형식
+ASSET_MEDIA_TYPES = {
+    "score": "application/xml",
+    "midi": "audio/midi",
+    "tab": "application/json",
+}
+
+# 타브 응답 형식 (render_tab_asset)
+TAB_FORMATS = ("ascii", "json", "musicxml")
+
+# 악보/MIDI 요청 시 이 이름을 악기로 쓰면 모든 스템을 한 번에 채보한 합본을 만든다
+COMBINED_INSTRUMENT = "all"
+
+
+def build_asset_content(
+    input_path: str, project_id: str, asset_type: str, instrument: str, on_progress=None
+):
+    """채보 후 자산 종류에 맞는 저장용 내용 생성 (MIDI는 bytes, 악보/타브는 문자열)"""
+    from src.score_generator import create_score
+    from src.tab_generator import TabGenerator
+    from src.transcriber import transcribe_audio
+
+    if instrument == COMBINED_INSTRUMENT and asset_type in ("score", "midi"):
+        return build_combined_asset_content(input_path, asset_type, on_progress)
+
+    notes, bpm = transcribe_audio(input_path, target_stem=instrument.lower())
+    if on_progress:
+        on_progress(80)
+
+    if asset_type == "score":
+        return create_score(notes, bpm, instrument)
+
+    if asset_type == "midi":
+        return create_score(notes, bpm, instrument, format="midi")
+
+    if asset_type == "tab":
+        # 구조화된 타브 모델을 저장하고, ASCII/JSON/MusicXML은 요청 시 렌더링한다 (render_tab_asset)
+        # 채보된 음표도 함께 저장해 다른 튜닝/카포 변형을 재채보 없이 만든다 (render_tab_asset)
+        generator = TabGenerator(tuning=TAB_TUNINGS[instrument], bpm=bpm)
+        tab = generator.generate_tab(notes)
+        return json.dumps(
+            {
+                "project_id": project_id,
+                "instrument": instrument,
+                "bpm": bpm,
+                "notes_count": len(notes),
+                "model": tab.to_dict(),
+                "notes": pack_notes(notes),
+            },
+            separators=(",", ":"),
+        )
+
+    raise ValueError(f"Unknown asset type: {asset_type}")
+
+
+def build_combined_asset_content(input_path: str, asset_type: str, on_progress=None):
+    """전체 밴드 합본 악보/MIDI - 분리·BPM 검출·채보를 한 번만 수행하고
+    무음이 아닌 스템을 파트(트랙)로 묶어 템포와 마디를 공유한다"""
+    from src.score_generator import create_band_score
+    from src.transcriber import transcribe_stems
+
+    stem_notes, bpm = transcribe_stems(input_path)
+    if on_progress:
+        on_progress(80)
+
+    if asset_type == "midi":
+        return create_band_score(stem_notes, bpm, format="midi")
+    return create_band_score(stem_notes, bpm)
+
+
+def decode_asset_content(asset_type: str, content):
+    """저장된 자산 내용(bytes, 또는 저장소 도입 전의 인라인 문자열)을 응답용 값으로 변환"""
+    if asset_type == "midi":
+        if isinstance(content, str):
+            # 인라인으로 저장되던 MIDI는 base64 문자열
+            import base64
+
+            return base64.b64decode(content)
+        return content
+    if asset_type == "tab":
+        return json.loads(content)
+    return content.decode("utf-8") if isinstance(content, bytes) else content
+
+
+def store_asset(
+    db: Session,
+    project_id: str,
+    asset_type: str,
+    instrument: str,
+    content,
+    params: Optional[dict] = None,
+) -> ProjectAsset:
+    """자산 내용을 blob 저장소에 쓰고 메타데이터 행을 추가 (커밋은 호출한 쪽에서)"""
+    data = content if isinstance(content, bytes) else content.encode("utf-8")
+    asset = ProjectAsset(
+        project_id=project_id,
+        asset_type=asset_type,
+        instrument=instrument,
+        content_hash=get_blob_store().put(data),
+        size=len(data),
+        media_type=ASSET_MEDIA_TYPES.get(asset_type),
+        params=json.dumps(params, separators=(",", ":")) if params else None,
+    )
+    db.add(asset)
+    return asset
+
+
+def read_asset_content(asset: ProjectAsset):
+    """저장된 자산 내용 읽기 (응답용 값으로 변환)"""
+    if asset.content_hash:
+        return decode_asset_content(asset.asset_type, get_blob_store().get(asset.content_hash))
+    return decode_asset_content(asset.asset_type, asset.content)
+
+
+def release_asset_blobs(db: Session, keys) -> int:
+    """더 이상 어떤 자산도 가리키지 않는 저장소 내용 삭제 - 지운 수 반환
+
+    같은 내용은 여러 자산이 공유할 수 있고, 다른 요청이 같은 내용을 막 저장하고 아직 행을
+    커밋하지 않았을 수 있으므로 마지막 저장 후 ASSET_BLOB_GRACE가 지난 내용만 지운다.
+    남은 내용은 collect_asset_blobs가 나중에 정리한다.
+    """
+    keys = set(k for k in keys if k)
+    if not keys:
+        return 0
+    rows = db.query(ProjectAsset.content_hash).filter(ProjectAsset.content_hash.in_(keys))
+    used = {key for (key,) in rows}
+    store = get_blob_store()
+    cutoff = time.time() - ASSET_BLOB_GRACE
+    deleted = 0
+    for key in keys - used:
+        try:
+            deleted += store.delete_if_older(key, cutoff)
+        except Exception as e:
+            logger.warning(f"Failed to delete asset blob {key}: {e}")
+    return deleted
+
+
+def collect_asset_blobs(db: Session, batch_size: int = 500) -> int:
+    """저장소 전체를 훑어 참조가 없고 유예 기간이 지난 내용 삭제 (GC) - 지운 수 반환"""
+    deleted = 0
+    batch: List[str] = []
+    for key in get_blob_store().iter_keys():
+        batch.append(key)
+        if len(batch) >= batch_size:
+            deleted += release_asset_blobs(db, batch)
+            batch = []
+    deleted += release_asset_blobs(db, batch)
+    if deleted:
+        logger.info(f"Collected {deleted} unreferenced asset blobs")
+    return deleted
+
+
+def project_cache_tags(db: Session, project_id: str, *user_ids) -> List[str]:
+    """프로젝트 상세와 이 프로젝트가 보이는 목록(소유자, 멤버, 추가로 지정한 사용자)의 캐시 태그"""
+    owner_id = db.query(ProjectModel.user_id).filter(ProjectModel.id == project_id).scalar()
+    member_ids = [
+        user_id
+        for (user_id,) in db.query(ProjectMember.user_id).filter(
+            ProjectMember.project_id == project_id
+        )
+    ]
+    viewers = dict.fromkeys([owner_id, *member_ids, *user_ids])
+    return [project_tag(project_id)] + [project_list_tag(user_id) for user_id in viewers]
+
+
+def _member_payload(member: ProjectMember) -> dict:
+    """멤버 응답 (schemas.project.ProjectMember 형식)"""
+    return {
+        "id": member.id,
+        "project_id": member.project_id,
+        "user_id": member.user_id,
+        "role": member.role,
+        "created_at": member.created_at,
+        "email": member.user.email,
+        "nickname": member.user.nickname,
+    }
+
+
+def pack_notes(notes: List[Dict]) -> List[list]:
+    """음표를 [start, end, pitch, velocity, role] 배열로 압축 (자산 저장용)"""
+    return [
+        [n["start"], n["end"], n["pitch"], n["velocity"], n.get("role", "harmony")] for n in notes
+    ]
+
+
+def unpack_notes(rows: List[list]) -> List[Dict]:
+    """pack_notes의 역변환"""
+    return [
+        {"start": start, "end": end, "pitch": pitch, "velocity": velocity, "role": role}
+        for start, end, pitch, velocity, role in rows
+    ]
+
+
+def validate_tab_options(
+    format: str,
+    measures_per_line: Optional[int] = None,
+    instrument: Optional[str] = None,
+    tuning: Optional[str] = None,
+    capo: int = 0,
+) -> Optional[List[str]]:
+    """타브 렌더링 옵션 검사 (작업을 큐에 넣기 전에 잘못된 요청을 거른다)
+
+    tuning이 주어지면 해석된 줄별 음 목록을, 아니면 None을 반환한다.
+    """
+    from fastapi import HTTPException
+
+    from src.tab_generator import MAX_CAPO, resolve_tuning
+
+    if format not in TAB_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 타브 형식입니다: {format}")
+    if measures_per_line is not None and not 1 <= measures_per_line <= 32:
+        raise HTTPException(status_code=400, detail="measures_per_line은 1~32 사이여야 합니다.")
+    if not 0 <= capo <= MAX_CAPO:
+        raise HTTPException(status_code=400, detail=f"capo는 0~{MAX_CAPO} 사이여야 합니다.")
+    if tuning is None:
+        return None
+    try:
+        return resolve_tuning(instrument, tuning)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 튜닝입니다: {tuning}")
+
+
+def _load_tab_asset(
+    data: dict, format: str, measures_per_line: Optional[int], tuning: Optional[str], capo: int
+):
+    """옵션 검사 후 (meta, Tablature) 반환 - 구조화 모델이 없는 예전 ASCII 자산이면 (data, None)"""
+    from fastapi import HTTPException
+
+    from src.tab_generator import TabGenerator
+    from src.tab_model import Tablature
+
+    instrument = data.get("instrument") or "guitar"
+    strings = validate_tab_options(format, measures_per_line, instrument, tuning, capo)
+    is_variant = capo != 0 or (strings is not None and strings != TAB_TUNINGS.get(instrument))
+
+    model = data.get("model")
+    if model is None or (is_variant and data.get("notes") is None):
+        # 구조화 모델/음표 도입 전에 저장된 자산은 기본 튜닝 ASCII만 있다
+        if format != "ascii" or is_variant:
+            raise HTTPException(
+                status_code=409,
+                detail="이 타브는 다시 생성해야 다른 형식이나 튜닝으로 볼 수 있습니다.",
+            )
+        return data, None
+
+    meta = {key: data.get(key) for key in ("project_id", "instrument", "bpm", "notes_count")}
+    if is_variant:
+        generator = TabGenerator(
+            tuning=strings or TAB_TUNINGS.get(instrument), bpm=data["bpm"], capo=capo
+        )
+        tab = generator.generate_tab(unpack_notes(data["notes"]))
+    else:
+        tab = Tablature.from_dict(model)
+    meta["tuning"] = tab.tuning_names
+    meta["capo"] = tab.capo
+    return meta, tab
+
+
+def _render_tab(meta: dict, tab, format: str, measures_per_line: Optional[int]):
+    from src.tab_model import render_ascii, render_musicxml
+
+    if format == "json":
+        return {**meta, "model": tab.to_dict()}
+    if format == "musicxml":
+        instrument = meta["instrument"] or "guitar"
+        return render_musicxml(tab, title=instrument, instrument_name=instrument.capitalize())
+    return {**meta, "tab": render_ascii(tab, measures_per_line)}
+
+
+def render_tab_asset(
+    data: dict,
+    format: str = "ascii",
+    measures_per_line: Optional[int] = None,
+    tuning: Optional[str] = None,
+    capo: int = 0,
+):
+    """저장된 타브 자산을 요청한 형식으로 렌더링 (채보를 다시 하지 않음)
+
+    - ascii: 기존 응답 형식 (tab 필드에 ASCII 타브)
+    - json: 구조화 모델 (마디/코드/줄·프렛 이벤트) - 클라이언트가 직접 배치
+    - musicxml: TAB 보표 MusicXML 문자열
+
+    tuning(프리셋 이름 또는 "D2,A2,D3,G3,B3,E4")이나 capo를 주면 저장된 음표로
+    운지만 다시 계산한다. 튜닝별 포지션 테이블은 프로세스 안에서 공유된다.
+    """
+    meta, tab = _load_tab_asset(data, format, measures_per_line, tuning, capo)
+    if tab is None:
+        return meta
+    return _render_tab(meta, tab, format, measures_per_line)
+
+
+# 마디 구간 조회 시 한 번에 돌려주는 최대 마디 수
+MAX_PAGE_MEASURES = 64
+
+
+def measure_page(from_measure: int, count: int, total: int) -> dict:
+    """마디 구간 정보 (from_measure는 1부터) - 다음 구간이 없으면 next_from_measure는 None"""
+    from fastapi import HTTPException
+
+    if from_measure < 1 or not 1 <= count <= MAX_PAGE_MEASURES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"from_measure는 1 이상, count는 1~{MAX_PAGE_MEASURES} 사이여야 합니다.",
+        )
+    returned = max(0, min(count, total - from_measure + 1))
+    next_from = from_measure + count if from_measure + count <= total else None
+    return {
+        "from_measure": from_measure,
+        "count": returned,
+        "total_measures": total,
+        "next_from_measure": next_from,
+    }
+
+
+def render_tab_page(
+    data: dict,
+    from_measure: int = 1,
+    count: int = 16,
+    format: str = "ascii",
+    measures_per_line: Optional[int] = None,
+    tuning: Optional[str] = None,
+    capo: int = 0,
+):
+    """타브의 마디 구간만 렌더링 - (content, page) 반환
+
+    JSON 응답에는 page 정보가 함께 들어가고, MusicXML은 마디 번호가 곡 기준으로 유지된다.
+    """
+    from fastapi import HTTPException
+
+    meta, tab = _load_tab_asset(data, format, measures_per_line, tuning, capo)
+    if tab is None:
+        raise HTTPException(
+            status_code=409, detail="이 타브는 다시 생성해야 구간으로 볼 수 있습니다."
+        )
+
+    page = measure_page(from_measure, count, len(tab.measures))
+    content = _render_tab(
+        meta, tab.measure_range(from_measure - 1, count), format, measures_per_line
+    )
+    if isinstance(content, dict):
+        content["page"] = page
+    return content, page
+
+
+def render_score_page(document: str, from_measure: int = 1, count: int = 16):
+    """MusicXML 악보의 마디 구간만 잘라 반환 - (document, page)
+
+    각 파트의 첫 마디에 그 시점의 조표/박자/음자리표/템포를 넣어 단독으로 렌더링된다.
+    """
+    from src.musicxml_writer import measure_range
+
+    measure_page(from_measure, count, 0)  # 범위 검사
+    page_document, total = measure_range(document, from_measure - 1, count)
+    return page_document, measure_page(from_measure, count, total)
+
+
+def generate_asset_logic(job_id: str, celery_self=None):
+    """악보/MIDI/타브 생성 작업의 핵심 로직 (Celery와 로컬 워커 풀 공통)"""
+    db = SessionLocal()
+    try:
+        job = db.query(GenerationJob).filter(GenerationJob.id == job_id).first()
+        if not job:
+            return
+
+        def update_progress(percent: int):
+            progress_writer.record("job", job_id, percent)
+            if celery_self:
+                try:
+                    celery_self.update_state(state="PROGRESS", meta={"percent": percent})
+                except Exception as e:
+                    logger.error(f"Error updating job progress: {e}")
+
+        try:
+            # 다른 작업이 이미 같은 결과를 만들었으면 재사용
+            existing_asset = (
+                db.query(ProjectAsset)
+                .filter(
+                    ProjectAsset.project_id == job.project_id,
+                    ProjectAsset.asset_type == job.asset_type,
+                    ProjectAsset.instrument == job.instrument,
+                )
+                .first()
+            )
+
+            if not existing_asset:
+                project = db.query(ProjectModel).filter(ProjectModel.id == job.project_id).first()
+                if not project:
+                    raise ProjectNotFoundError()
+
+                job.status = TaskStatus.PROCESSING.value
+                job.progress = 10
+                db.commit()
+
+                input_path = os.path.join(UPLOAD_DIR, project.original_filename)
+                content = build_asset_content(
+                    input_path, job.project_id, job.asset_type, job.instrument, update_progress
+                )
+                store_asset(
+                    db,
+                    job.project_id,
+                    job.asset_type,
+                    job.instrument,
+                    content,
+                    params=(
+                        {"tuning": TAB_TUNINGS[job.instrument]} if job.asset_type == "tab" else None
+                    ),
+                )
+
+            progress_writer.discard("job", job_id)
+            job.status = TaskStatus.COMPLETED.value
+            job.progress = 100
+            db.commit()
+            if not existing_asset:
+                # 새 자산은 상세/목록의 보유 악기(has_score 등)를 바꾼다
+                response_cache.invalidate(*project_cache_tags(db, job.project_id))
+        except Exception as e:
+            logger.exception(f"{job.asset_type} generation failed for job {job_id}: {e}")
+            progress_writer.discard("job", job_id)
+            db.rollback()
+            job.status = TaskStatus.FAILED.value
+            job.error = str(getattr(e, "detail", None) or e)
+            db.commit()
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, name="generate_asset_task")
+def generate_asset_task(self, job_id: str):
+    """악보/MIDI/타브 생성 백그라운드 작업 (Celery Task Wrapper)"""
+    return generate_asset_logic(job_id, celery_self=self)
+
+
+@celery_app.task(name="collect_asset_blobs_task")
+def collect_asset_blobs_task():
+    """참조가 없는 자산 내용 정리 (Celery beat로 주기 실행)"""
+    db = SessionLocal()
+    try:
+        return collect_asset_blobs(db)
+    finally:
+        db.close()
+
+
+_local_generation_pool = None
+
+
+def _get_local_generation_pool():
+    """Celery를 사용할 수 없을 때 쓰는 프로세스 내 워커 풀 (채보 동시 실행 수 제한)"""
+    global _local_generation_pool
+    if _local_generation_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _local_generation_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("LOCAL_GENERATION_WORKERS", "2")),
+            thread_name_prefix="asset-generation",
+        )
+    return _local_generation_pool
+
+
+def dispatch_generation_job(job_id: str, **options) -> str:
+    """생성 작업을 Celery에 넘기고, 브로커에 연결할 수 없으면 로컬 워커 풀에서 실행
+
+    options는 apply_async에 그대로 전달된다 (queue, priority - task_routing 참고).
+    """
+    try:
+        generate_asset_task.apply_async(args=[job_id], connect_timeout=1, **options)
+        return "celery"
+    except Exception as e:
+        logger.warning(f"Celery dispatch failed (Redis down?), using local worker pool: {e}")
+        _get_local_generation_pool().submit(generate_asset_logic, job_id)
+        return "local"
+
+
+# 목록 정렬별 (키 컬럼 이름, 내림차순 여부)
+# 키가 같으면 id로 순서를 고정해 keyset 페이지가 겹치거나 빠지지 않는다
+LIST_SORTS = {
+    "newest": ("created_at", True),
+    "oldest": ("created_at", False),
+    "name": ("name", False),
+    "relevance": ("search_rank", False),  # 검색어가 있을 때만 (rank는 낮을수록 관련도가 높다)
+}
+MAX_LIST_LIMIT = 100
+
+
+def encode_list_cursor(sort: str, value, project_id: str) -> str:
+    """페이지 마지막 프로젝트의 (정렬 키, id)를 다음 페이지 cursor로 인코딩"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, project_id], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_list_cursor(sort: str, cursor: str):
+    """cursor -> (정렬 키 값, 마지막 id). 형식이 다르거나 다른 정렬의 cursor면 400"""
+    expected = {"created_at": str, "name": str, "search_rank": (int, float)}[LIST_SORTS[sort][0]]
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, last_id = json.loads(raw)
+        if cursor_sort != sort or not isinstance(last_id, str):
+            raise ValueError(cursor)
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise ValueError(cursor)
+        if LIST_SORTS[sort][0] == "created_at":
+            value = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        from fastapi import HTTPException
+
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+    return value, last_id
+
 
 class ProjectService:
     @staticmethod
-    def create_project(db: Session, file_name: str, file_content, current_user: Optional[User] = None):
-        """프로젝트 생성"""
+    def allocate_upload(file_name: str):
+        """새 프로젝트 ID와 업로드 저장 경로 할당"""
         project_id = str(uuid.uuid4())
         file_ext = os.path.splitext(file_name)[1]
         saved_filename = f"{project_id}{file_ext}"
-        file_path = os.path.join(UPLOAD_DIR, saved_filename)
-
-        try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file_content, buffer)
-        except Exception as e:
-            raise FileUploadError(detail=f"파일 업로드 실패: {str(e)}")
+        return project_id, saved_filename, os.path.join(UPLOAD_DIR, saved_filename)
 
+    @staticmethod
+    def create_project(
+        db: Session,
+        project_id: str,
+        file_name: str,
+        saved_filename: str,
+        current_user: Optional[User] = None,
+        content_hash: Optional[str] = None,
+    ):
+        """프로젝트 생성 (업로드 파일은 이미 saved_filename으로 저장되어 있어야 함)"""
         project = ProjectModel(
             id=project_id,
             name=file_name,
@@ -192,48 +920,38 @@ class ProjectService:
             status=TaskStatus.PENDING.value,
             progress=0,
             user_id=current_user.id if current_user else None,
+            thumbnail_url=f"/static/uploads/thumb_{project_id}.png",
+            content_hash=content_hash,
             created_at=datetime.utcnow(),
         )
 
         db.add(project)
         db.commit()
         db.refresh(project)
+        response_cache.invalidate(project_list_tag(project.user_id))
 
-        return project, file_path
+        return project
 
     @staticmethod
     def get_project(db: Session, project_id: str, current_user: Optional[User] = None):
-        """프로젝트 조회 및 권한 확인"""
-        project = (
-            db.query(ProjectModel)
-            .options(joinedload(ProjectModel.assets), joinedload(ProjectModel.members).joinedload(ProjectMember.user))
-            .filter(ProjectModel.id == project_id)
-            .first()
+        """프로젝트 조회 및 권한 확인 (자산 종류, 멤버와 요청한 사용자의 역할을 한 번에 읽는다)"""
+        access = load_project_access(
+            db,
+            project_id,
+            current_user,
+            joinedload(ProjectModel.assets).load_only(
+                ProjectAsset.asset_type, ProjectAsset.instrument
+            ),
+            joinedload(ProjectModel.members).joinedload(ProjectMember.user),
         )
-        if not project:
-            raise ProjectNotFoundError()
-
-        is_owner = current_user and project.user_id == current_user.id
-        is_member = False
-        if current_user and not is_owner:
-            member = (
-                db.query(ProjectMember)
-                .filter(ProjectMember.project_id == project_id, ProjectMember.user_id == current_user.id)
-                .first()
-            )
-            is_member = member is not None
-
-        if project.user_id is not None:
-            from src.api.exceptions import AuthenticationError
-            if not is_owner and not is_member:
-                raise AuthenticationError(detail="이 프로젝트에 접근할 권한이 없습니다.")
+        project = access.require(VIEW)
 
         # 자산 보유 여부 설정
         project.has_score = any(a.asset_type == "score" for a in project.assets)
         project.has_tab = any(a.asset_type == "tab" for a in project.assets)
         project.score_instruments = [a.instrument for a in project.assets if a.asset_type == "score"]
         project.tab_instruments = [a.instrument for a in project.assets if a.asset_type == "tab"]
-        project.is_owner = bool(current_user and project.user_id == current_user.id)
+        project.is_owner = access.is_owner
 
         for m in project.members:
             m.email = m.user.email
@@ -242,84 +960,187 @@ class ProjectService:
         return project
 
     @staticmethod
-    def list_projects(db: Session, current_user: Optional[User] = None, q: str = None, sort: str = "newest", skip: int = 0, limit: int = 50):
-        """프로젝트 목록 조회"""
-        query = db.query(ProjectModel).options(joinedload(ProjectModel.assets))
+    def list_projects(
+        db: Session,
+        current_user: Optional[User] = None,
+        q: str = None,
+        sort: str = "newest",
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ):
+        """프로젝트 목록 조회 - (프로젝트 목록, 다음 페이지 cursor 또는 None)
+
+        한 번의 쿼리로 페이지(limit + 1개)를 고르고 (자산 종류, 악기) 집계만 붙여 읽는다.
+        자산 행과 멤버 목록은 읽지 않는다. q는 검색 인덱스(services/search_index)의 단어별 접두사 검색이고,
+        sort="relevance"면 관련도 순으로 정렬한다.
+        """
+        if sort not in LIST_SORTS or (sort == "relevance" and not q):
+            sort = "newest"
+        hits = match_projects(db, q, ranked=sort == "relevance")
+        if hits is None and sort == "relevance":
+            sort = "newest"
+        key_name, descending = LIST_SORTS[sort]
+        limit = max(1, min(limit, MAX_LIST_LIMIT))
+        last = decode_list_cursor(sort, cursor) if cursor else None
+
+        def ordering(key, tiebreak):
+            return (desc(key), desc(tiebreak)) if descending else (key.asc(), tiebreak.asc())
+
+        def first_rows(query):
+            """정렬 인덱스를 따라 cursor 다음 limit + 1개만 읽는 후보 구간"""
+            rank = literal(0.0)
+            if hits is not None:
+                query = query.join(hits, hits.c.project_id == ProjectModel.id)
+                rank = hits.c.rank
+            key = rank if key_name == "search_rank" else getattr(ProjectModel, key_name)
+            if last:
+                value, last_id = last
+                if descending:
+                    query = query.filter(
+                        or_(key < value, and_(key == value, ProjectModel.id < last_id))
+                    )
+                else:
+                    query = query.filter(
+                        or_(key > value, and_(key == value, ProjectModel.id > last_id))
+                    )
+            return (
+                query.add_columns(rank.label("search_rank"))
+                .order_by(*ordering(key, ProjectModel.id))
+                .limit(limit + 1)
+                .subquery()
+            )
 
         if current_user:
-            shared_project_ids = db.query(ProjectMember.project_id).filter(ProjectMember.user_id == current_user.id).all()
-            shared_project_ids = [p[0] for p in shared_project_ids]
-            query = query.filter(or_(ProjectModel.user_id == current_user.id, ProjectModel.id.in_(shared_project_ids)))
+            # 소유/공유 프로젝트를 각자 인덱스로 고른 뒤 합친다 (OR 조건이면 전체 프로젝트를 훑고 정렬)
+            owned = first_rows(
+                db.query(ProjectModel).filter(ProjectModel.user_id == current_user.id)
+            )
+            shared = first_rows(
+                db.query(ProjectModel)
+                .join(ProjectMember, ProjectMember.project_id == ProjectModel.id)
+                .filter(ProjectMember.user_id == current_user.id)
+            )
+            candidates = union(select(owned), select(shared)).subquery()
         else:
-            query = query.filter(ProjectModel.user_id == None)
-
-        if q:
-            query = query.filter(ProjectModel.name.ilike(f"%{q}%"))
+            candidates = first_rows(db.query(ProjectModel).filter(ProjectModel.user_id.is_(None)))
 
-        if sort == "newest":
-            query = query.order_by(desc(ProjectModel.created_at))
-        elif sort == "oldest":
-            query = query.order_by(ProjectModel.created_at.asc())
-        elif sort == "name":
-            query = query.order_by(ProjectModel.name.asc())
+        page = (
+            db.query(aliased(ProjectModel, candidates), candidates.c.search_rank)
+            .order_by(*ordering(candidates.c[key_name], candidates.c.id))
+            .limit(limit + 1)
+            .cte("project_page")
+        )
+        page_project = aliased(ProjectModel, page)
+        asset_summary = (
+            select(ProjectAsset.project_id, ProjectAsset.asset_type, ProjectAsset.instrument)
+            .where(
+                ProjectAsset.project_id.in_(select(page.c.id)),
+                ProjectAsset.asset_type.in_(("score", "tab")),
+            )
+            .group_by(ProjectAsset.project_id, ProjectAsset.asset_type, ProjectAsset.instrument)
+            .subquery()
+        )
+        rows = (
+            db.query(
+                page_project,
+                page.c.search_rank,
+                asset_summary.c.asset_type,
+                asset_summary.c.instrument,
+            )
+            .outerjoin(asset_summary, asset_summary.c.project_id == page_project.id)
+            .options(noload(page_project.members))
+            .order_by(
+                *ordering(page.c[key_name], page.c.id),
+                asset_summary.c.asset_type,
+                asset_summary.c.instrument,
+            )
+            .all()
+        )
 
-        projects = query.offset(skip).limit(limit).all()
+        projects = []
+        ranks = {}
+        for project, rank, asset_type, instrument in rows:
+            if not projects or projects[-1] is not project:
+                project.score_instruments = []
+                project.tab_instruments = []
+                project.is_owner = bool(current_user and project.user_id == current_user.id)
+                projects.append(project)
+                ranks[project.id] = rank
+            if asset_type == "score":
+                project.score_instruments.append(instrument)
+            elif asset_type == "tab":
+                project.tab_instruments.append(instrument)
 
         for p in projects:
-            p.has_score = any(a.asset_type == "score" for a in p.assets)
-            p.has_tab = any(a.asset_type == "tab" for a in p.assets)
-            p.score_instruments = [a.instrument for a in p.assets if a.asset_type == "score"]
-            p.tab_instruments = [a.instrument for a in p.assets if a.asset_type == "tab"]
-            p.is_owner = bool(current_user and p.user_id == current_user.id)
-
-        return projects
+            p.has_score = bool(p.score_instruments)
+            p.has_tab = bool(p.tab_instruments)
+
+        next_cursor = None
+        if len(projects) > limit:
+            projects = projects[:limit]
+            last_project = projects[-1]
+            value = (
+                ranks[last_project.id]
+                if key_name == "search_rank"
+                else getattr(last_project, key_name)
+            )
+            next_cursor = encode_list_cursor(sort, value, last_project.id)
+        return projects, next_cursor
 
     @staticmethod
-    def update_project(db: Session, project_id: str, name: str, current_user: Optional[User] = None):
-        """프로젝트 정보 수정"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        if project.user_id is not None:
-            if not current_user or project.user_id != current_user.id:
-                from fastapi import HTTPException
-                raise HTTPException(status_code=403, detail="프로젝트 수정 권한이 없습니다.")
+    def update_project(
+        db: Session,
+        project_id: str,
+        name: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ):
+        """프로젝트 정보 수정 (소유자와 editor 멤버)"""
+        access = resolve_project_access(db, project_id, current_user, access)
+        project = access.require(EDIT, "프로젝트 수정 권한이 없습니다.")
 
         if name is not None:
             project.name = name
 
         db.commit()
+        response_cache.invalidate(*project_cache_tags(db, project_id))
         db.refresh(project)
         return project
 
     @staticmethod
-    def delete_project(db: Session, project_id: str, current_user: Optional[User] = None):
+    def delete_project(
+        db: Session,
+        project_id: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ):
         """프로젝트 삭제"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        if project.user_id is not None:
-            if not current_user or project.user_id != current_user.id:
-                from fastapi import HTTPException
-                raise HTTPException(status_code=403, detail="이 프로젝트를 삭제할 권한이 없습니다")
+        access = resolve_project_access(db, project_id, current_user, access)
+        project = access.require(OWNER, "이 프로젝트를 삭제할 권한이 없습니다")
 
+        blob_keys = [
+            key
+            for (key,) in db.query(ProjectAsset.content_hash).filter(
+                ProjectAsset.project_id == project_id
+            )
+        ]
+        cache_tags = project_cache_tags(db, project_id)
         db.delete(project)
         db.commit()
+        response_cache.invalidate(*cache_tags)
+        release_asset_blobs(db, blob_keys)
         return {"message": "Project deleted successfully"}
 
     @staticmethod
-    def clone_project(db: Session, project_id: str, current_user: Optional[User] = None):
+    def clone_project(
+        db: Session,
+        project_id: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ):
         """프로젝트 복제"""
-        source_project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not source_project:
-            raise ProjectNotFoundError()
-
-        if source_project.user_id is not None:
-            if not current_user or source_project.user_id != current_user.id:
-                from fastapi import HTTPException
-                raise HTTPException(status_code=403, detail="프로젝트 복제 권한이 없습니다.")
+        access = resolve_project_access(db, project_id, current_user, access)
+        source_project = access.require(OWNER, "프로젝트 복제 권한이 없습니다.")
 
         new_project_id = str(uuid.uuid4())
         source_ext = os.path.splitext(source_project.original_filename)[1]
@@ -342,6 +1163,7 @@ class ProjectService:
             status=TaskStatus.PENDING.value,
             progress=0,
             bpm=source_project.bpm,
+            content_hash=source_project.content_hash,
             user_id=current_user.id if current_user else None,
             created_at=datetime.utcnow(),
         )
@@ -349,19 +1171,18 @@ class ProjectService:
         db.add(new_project)
         db.commit()
         db.refresh(new_project)
+        response_cache.invalidate(project_list_tag(new_project.user_id))
         return new_project
 
     @staticmethod
-    def get_project_stems(db: Session, project_id: str, current_user: Optional[User] = None):
+    def get_project_stems(
+        db: Session,
+        project_id: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ):
         """스템 파일 목록 조회"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        if project.user_id is not None:
-            if not current_user or project.user_id != current_user.id:
-                from src.api.exceptions import AuthenticationError
-                raise AuthenticationError(detail="이 프로젝트에 접근할 권한이 없습니다.")
+        project = resolve_project_access(db, project_id, current_user, access).require(VIEW)
 
         if project.status != TaskStatus.COMPLETED.value:
             from fastapi import HTTPException
@@ -380,179 +1201,200 @@ class ProjectService:
         )
 
     @staticmethod
-    def generate_score(db: Session, project_id: str, instrument: str, current_user: Optional[User] = None):
-        """악보 생성"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        if project.user_id is not None:
-            if not current_user or project.user_id != current_user.id:
-                from src.api.exceptions import AuthenticationError
-                raise AuthenticationError(detail="이 프로젝트에 접근할 권한이 없습니다.")
+    def _get_generation_project(
+        db: Session,
+        project_id: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ) -> ProjectModel:
+        """생성 요청 대상 프로젝트 조회 및 권한/상태 확인 (모든 자산 종류를 멤버에게 허용)"""
+        project = resolve_project_access(db, project_id, current_user, access).require(VIEW)
 
         if project.status != TaskStatus.COMPLETED.value:
             from fastapi import HTTPException
             raise HTTPException(status_code=400, detail="먼저 음원 분리가 완료되어야 합니다.")
 
-        existing_asset = db.query(ProjectAsset).filter(
-            ProjectAsset.project_id == project_id,
-            ProjectAsset.asset_type == "score",
-            ProjectAsset.instrument == instrument,
-        ).first()
-
-        if existing_asset:
-            return existing_asset.content, True
-
-        input_path = os.path.join(UPLOAD_DIR, project.original_filename)
-        target_stem = instrument.lower()
+        return project
 
+    @staticmethod
+    def get_status_event(db: Session, project_id: str) -> Optional[dict]:
+        """처리 상태를 진행률 이벤트 형식으로 조회 (없으면 None) - 하트비트 사이에 연결을 붙잡지 않도록 세션을 닫는다"""
         try:
-            notes, bpm = transcribe_audio(input_path, target_stem=target_stem)
-            xml_content = create_score(notes, bpm, instrument)
-
-            new_asset = ProjectAsset(
-                project_id=project_id, asset_type="score", instrument=instrument, content=xml_content
+            row = (
+                db.query(ProjectModel.status, ProjectModel.progress)
+                .filter(ProjectModel.id == project_id)
+                .first()
             )
-            db.add(new_asset)
-            db.commit()
-
-            return xml_content, False
-        except Exception as e:
-            logger.exception(f"Score generation failed: {e}")
-            raise TranscriptionError(detail=f"악보 생성 실패: {str(e)}")
+        finally:
+            db.close()
+        if row is None:
+            return None
+        return {"project_id": project_id, "status": row.status, "percent": row.progress or 0}
 
     @staticmethod
-    def generate_midi(db: Session, project_id: str, instrument: str, current_user: Optional[User] = None):
-        """MIDI 생성"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        is_owner = current_user and project.user_id == current_user.id
-        is_member = False
-        if current_user and not is_owner:
-            member = db.query(ProjectMember).filter(
-                ProjectMember.project_id == project_id, ProjectMember.user_id == current_user.id
-            ).first()
-            is_member = member is not None
-
-        if project.user_id is not None:
-            if not is_owner and not is_member:
-                from src.api.exceptions import AuthenticationError
-                raise AuthenticationError(detail="이 프로젝트에 접근할 권한이 없습니다.")
-
-        if project.status != TaskStatus.COMPLETED.value:
+    def request_asset(
+        db: Session,
+        project_id: str,
+        asset_type: str,
+        instrument: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ):
+        """악보/MIDI/타브 요청
+
+        캐시된 결과가 있으면 (asset, None)을 즉시 반환하고,
+        없으면 생성 작업을 대기열에 넣고 (None, job)을 반환한다.
+        같은 대상에 대해 진행 중인 작업이 있으면 새 작업을 만들지 않고 재사용한다.
+        """
+        ProjectService._get_generation_project(db, project_id, current_user, access)
+
+        if asset_type == "tab" and instrument not in TAB_TUNINGS:
             from fastapi import HTTPException
-            raise HTTPException(status_code=400, detail="먼저 음원 분리가 완료되어야 합니다.")
+            raise HTTPException(status_code=400, detail="지원하지 않는 악기입니다.")
 
-        existing_asset = db.query(ProjectAsset).filter(
-            ProjectAsset.project_id == project_id,
-            ProjectAsset.asset_type == "midi",
-            ProjectAsset.instrument == instrument,
-        ).first()
+        existing_asset = (
+            db.query(ProjectAsset)
+            .filter(
+                ProjectAsset.project_id == project_id,
+                ProjectAsset.asset_type == asset_type,
+                ProjectAsset.instrument == instrument,
+            )
+            .first()
+        )
 
-        import base64
         if existing_asset:
-            return base64.b64decode(existing_asset.content), True
-
-        input_path = os.path.join(UPLOAD_DIR, project.original_filename)
-        target_stem = instrument.lower()
-
-        try:
-            notes, bpm = transcribe_audio(input_path, target_stem=target_stem)
-            midi_bytes = create_score(notes, bpm, instrument, format="midi")
-
-            new_asset = ProjectAsset(
-                project_id=project_id,
-                asset_type="midi",
-                instrument=instrument,
-                content=base64.b64encode(midi_bytes).decode("utf-8"),
-            )
-            db.add(new_asset)
+            return existing_asset, None
+
+        active_job = _active_generation_job(db, project_id, asset_type, instrument)
+        if active_job and _is_stale_job(active_job):
+            logger.warning(f"Generation job {active_job.id} timed out, queueing a new one")
+            progress_writer.discard("job", active_job.id)
+            active_job.status = TaskStatus.FAILED.value
+            active_job.error = "작업이 제한 시간 안에 끝나지 않았습니다."
             db.commit()
+            active_job = None
+        if active_job:
+            return None, active_job
+
+        job = GenerationJob(
+            id=str(uuid.uuid4()),
+            project_id=project_id,
+            asset_type=asset_type,
+            instrument=instrument,
+            status=TaskStatus.PENDING.value,
+            progress=0,
+            created_at=datetime.utcnow(),
+        )
+        try:
+            with db.begin_nested():
+                db.add(job)
+        except IntegrityError:
+            # 동시에 들어온 요청이 먼저 작업을 만들었다 (uq_generation_job_active) - 그 작업을 재사용
+            active_job = _active_generation_job(db, project_id, asset_type, instrument)
+            if active_job is None:
+                raise
+            return None, active_job
+        db.commit()
+        db.refresh(job)
 
-            return midi_bytes, False
-        except Exception as e:
-            logger.exception(f"MIDI generation failed: {e}")
-            raise TranscriptionError(detail=f"MIDI 생성 실패: {str(e)}")
+        dispatch_generation_job(job.id, **generation_route(db, job))
+        return None, job
 
     @staticmethod
-    def generate_tab(db: Session, project_id: str, instrument: str, current_user: Optional[User] = None):
-        """타브 악보 생성"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        if project.user_id is not None:
-            if not current_user or project.user_id != current_user.id:
-                from src.api.exceptions import AuthenticationError
-                raise AuthenticationError(detail="이 프로젝트에 접근할 권한이 없습니다.")
-
-        if project.status != TaskStatus.COMPLETED.value:
+    def get_asset(
+        db: Session,
+        project_id: str,
+        asset_type: str,
+        instrument: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ) -> ProjectAsset:
+        """이미 생성된 자산 조회 (구간 조회용 - 없으면 생성하지 않고 404)"""
+        ProjectService._get_generation_project(db, project_id, current_user, access)
+
+        asset = (
+            db.query(ProjectAsset)
+            .filter(
+                ProjectAsset.project_id == project_id,
+                ProjectAsset.asset_type == asset_type,
+                ProjectAsset.instrument == instrument,
+            )
+            .first()
+        )
+        if not asset:
             from fastapi import HTTPException
-            raise HTTPException(status_code=400, detail="먼저 음원 분리가 완료되어야 합니다.")
-
-        existing_asset = db.query(ProjectAsset).filter(
-            ProjectAsset.project_id == project_id,
-            ProjectAsset.asset_type == "tab",
-            ProjectAsset.instrument == instrument,
-        ).first()
-
-        if existing_asset:
-            return json.loads(existing_asset.content), True
-
-        input_path = os.path.join(UPLOAD_DIR, project.original_filename)
+            raise HTTPException(
+                status_code=404, detail="아직 생성되지 않았습니다. 먼저 생성을 요청하세요."
+            )
+        return asset
 
-        if instrument == "bass":
-            tuning = ["E1", "A1", "D2", "G2"]
-            target_stem = "bass"
-        elif instrument == "guitar":
-            tuning = ["E2", "A2", "D3", "G3", "B3", "E4"]
-            target_stem = "guitar"
-        else:
+    @staticmethod
+    def get_generation_job(
+        db: Session,
+        project_id: str,
+        job_id: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ) -> GenerationJob:
+        """생성 작업 상태 조회"""
+        ProjectService._get_generation_project(db, project_id, current_user, access)
+        job = (
+            db.query(GenerationJob)
+            .filter(GenerationJob.id == job_id, GenerationJob.project_id == project_id)
+            .first()
+        )
+        if not job:
             from fastapi import HTTPException
-            raise HTTPException(status_code=400, detail="지원하지 않는 악기입니다.")
 
-        try:
-            from src.tab_generator import TabGenerator
-            notes, bpm = transcribe_audio(input_path, target_stem=target_stem)
-            generator = TabGenerator(tuning=tuning, bpm=bpm)
-            ascii_tab = generator.generate_ascii_tab(notes)
-
-            result = {
-                "project_id": project_id,
-                "instrument": instrument,
-                "bpm": bpm,
-                "tab": ascii_tab,
-                "notes_count": len(notes),
-            }
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+        return job
 
-            new_asset = ProjectAsset(
-                project_id=project_id,
-                asset_type="tab",
-                instrument=instrument,
-                content=json.dumps(result),
+    @staticmethod
+    def get_generation_result(
+        db: Session,
+        project_id: str,
+        job_id: str,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ):
+        """생성 작업 결과 조회 - (job, asset), 완료 전이면 (job, None)"""
+        job = ProjectService.get_generation_job(db, project_id, job_id, current_user, access)
+
+        if job.status == TaskStatus.FAILED.value:
+            raise TranscriptionError(detail=job.error or "생성 작업이 실패했습니다.")
+
+        if job.status != TaskStatus.COMPLETED.value:
+            return job, None
+
+        asset = (
+            db.query(ProjectAsset)
+            .filter(
+                ProjectAsset.project_id == project_id,
+                ProjectAsset.asset_type == job.asset_type,
+                ProjectAsset.instrument == job.instrument,
             )
-            db.add(new_asset)
-            db.commit()
+            .first()
+        )
+        if not asset:
+            raise TranscriptionError(detail="생성된 결과를 찾을 수 없습니다.")
 
-            return result, False
-        except Exception as e:
-            logger.exception(f"Tab generation failed: {e}")
-            raise TranscriptionError(detail=f"타브 생성 실패: {str(e)}")
+        return job, asset
 
     @staticmethod
-    def mix_audio(db: Session, project_id: str, request, current_user: Optional[User] = None):
+    def mix_audio(
+        db: Session,
+        project_id: str,
+        request,
+        current_user: Optional[User] = None,
+        access: Optional[ProjectAccess] = None,
+    ):
         """오디오 믹싱 (퀄리티 향상 버전)"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
+        project = resolve_project_access(db, project_id, current_user, access).require(VIEW)
 
-        if project.user_id is not None:
-            if not current_user or project.user_id != current_user.id:
-                from src.api.exceptions import AuthenticationError
-                raise AuthenticationError(detail="이 프로젝트에 접근할 권한이 없습니다.")
+        import librosa
+        import numpy as np
+        import soundfile as sf
+        from pydub import AudioSegment
 
         if project.status != TaskStatus.COMPLETED.value:
             from fastapi import HTTPException
@@ -627,15 +1469,19 @@ class ProjectService:
             raise AudioProcessingError(detail=f"믹싱 실패: {str(e)}")
 
     @staticmethod
-    def share_project(db: Session, project_id: str, email: str, role: str, current_user: User):
-        """프로젝트 공유 초대"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        if project.user_id != current_user.id:
-            from fastapi import HTTPException
-            raise HTTPException(status_code=403, detail="프로젝트 공유 권한이 없습니다.")
+    def share_project(
+        db: Session,
+        project_id: str,
+        email: str,
+        role: str,
+        current_user: User,
+        access: Optional[ProjectAccess] = None,
+    ):
+        """프로젝트 공유 초대 (소유자가 있는 프로젝트의 소유자만)"""
+        access = resolve_project_access(db, project_id, current_user, access)
+        access.require(VIEW)
+        if not access.is_owner:
+            raise ProjectPermissionError(detail="프로젝트 공유 권한이 없습니다.")
 
         target_user = db.query(User).filter(User.email == email).first()
         if not target_user:
@@ -648,45 +1494,39 @@ class ProjectService:
 
         if existing_member:
             existing_member.role = role
+            member = existing_member
         else:
-            new_member = ProjectMember(project_id=project_id, user_id=target_user.id, role=role)
-            db.add(new_member)
+            member = ProjectMember(project_id=project_id, user_id=target_user.id, role=role)
+            db.add(member)
 
         db.commit()
-        return {"message": f"Project shared with {email}"}
+        response_cache.invalidate(*project_cache_tags(db, project_id))
+        return _member_payload(member)
 
     @staticmethod
-    def list_members(db: Session, project_id: str, current_user: User):
-        """멤버 목록 조회"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
-
-        # 권한 확인 생략 (프로젝트 접근 가능하면 멤버 목록 볼 수 있음)
+    def list_members(
+        db: Session, project_id: str, current_user: User, access: Optional[ProjectAccess] = None
+    ):
+        """멤버 목록 조회 (프로젝트에 접근할 수 있으면 볼 수 있음)"""
+        resolve_project_access(db, project_id, current_user, access).require(VIEW)
         members = db.query(ProjectMember).options(joinedload(ProjectMember.user)).filter(ProjectMember.project_id == project_id).all()
-        
-        result = []
-        for m in members:
-            result.append({
-                "user_id": m.user_id,
-                "email": m.user.email,
-                "nickname": m.user.nickname,
-                "role": m.role,
-                "joined_at": m.joined_at
-            })
-        return result
+        return [_member_payload(m) for m in members]
 
     @staticmethod
-    def remove_member(db: Session, project_id: str, user_id: int, current_user: User):
+    def remove_member(
+        db: Session,
+        project_id: str,
+        user_id: int,
+        current_user: User,
+        access: Optional[ProjectAccess] = None,
+    ):
         """멤버 삭제"""
-        project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-        if not project:
-            raise ProjectNotFoundError()
+        access = resolve_project_access(db, project_id, current_user, access)
+        access.require(VIEW)
 
         # 권한 확인: 소유자이거나 본인 탈퇴
-        if project.user_id != current_user.id and user_id != current_user.id:
-            from fastapi import HTTPException
-            raise HTTPException(status_code=403, detail="권한이 없습니다.")
+        if not access.is_owner and user_id != current_user.id:
+            raise ProjectPermissionError()
 
         member = db.query(ProjectMember).filter(
             ProjectMember.project_id == project_id, ProjectMember.user_id == user_id
@@ -696,6 +1536,8 @@ class ProjectService:
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail="멤버를 찾을 수 없습니다.")
 
+        cache_tags = project_cache_tags(db, project_id)
         db.delete(member)
         db.commit()
+        response_cache.invalidate(*cache_tags)
         return {"message": "Member removed successfully"}
@@ -0,0 +1,168 @@
+"""
+프로젝트 API 응답 캐시
+
+응답 본문을 (범위, 사용자, 쿼리 파라미터, 태그 버전)으로 만든 키에 저장한다.
+데이터가 바뀌면 관련 태그의 버전을 올려(invalidate) 이전 키를 더 이상 찾지 않게 한다.
+키마다 지울 필요가 없어 프로젝트 하나가 바뀌어도 그 프로젝트가 보이는 모든 목록이 한 번에 무효화된다.
+
+- 태그: project:<id> (상세), projects:user:<id|anon> (그 사용자의 목록)
+- 무효화는 DB commit 뒤에 호출한다. commit 전에 올리면 동시에 들어온 요청이
+  이전 상태를 새 버전 키로 저장할 수 있다.
+
+REDIS_URL이 설정되어 있으면 Redis에 저장해 API 프로세스와 워커가 같은 캐시/태그를 쓰고,
+없거나 연결에 실패하면 프로세스 안의 LRU에 저장한다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "justjam:cache:"
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL_SEC", "300"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+# 태그 버전은 항목보다 오래 남아야 한다 (버전이 사라져 0으로 돌아가도 그 버전의 항목은 이미 만료됨)
+TAG_TTL = 24 * 3600
+
+
+def project_tag(project_id: str) -> str:
+    return f"project:{project_id}"
+
+
+def project_list_tag(user_id: Optional[int]) -> str:
+    return f"projects:user:{user_id if user_id is not None else 'anon'}"
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "headers")
+
+    def __init__(self, body: bytes, etag: str, headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.etag = etag
+        self.headers = headers or {}
+
+    def dumps(self) -> str:
+        return json.dumps(
+            {"body": self.body.decode("utf-8"), "etag": self.etag, "headers": self.headers}
+        )
+
+    @classmethod
+    def loads(cls, payload) -> "CachedResponse":
+        data = json.loads(payload)
+        return cls(data["body"].encode("utf-8"), data["etag"], data["headers"])
+
+
+def body_etag(body: bytes) -> str:
+    """본문 내용으로 정해지는 강한 ETag - 같은 내용이면 캐시 항목이 달라도 304가 된다"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class ResponseCache:
+    def __init__(
+        self, redis_url: Optional[str] = None, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES
+    ):
+        self.redis_url = redis_url
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._redis = None
+
+    def _get_redis(self):
+        if not self.redis_url:
+            return None
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(
+                self.redis_url, socket_connect_timeout=1, socket_timeout=1
+            )
+        return self._redis
+
+    def key(self, scope: str, principal, params: Iterable[Tuple[str, str]], tags: List[str]) -> str:
+        """캐시 키 - 태그 버전이 바뀌면 키도 바뀐다"""
+        versions = self.tag_versions(tags)
+        raw = json.dumps([scope, principal, sorted(params), list(zip(tags, versions))], default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def tag_versions(self, tags: List[str]) -> List[int]:
+        client = self._get_redis()
+        if client is not None:
+            try:
+                return [
+                    int(v or 0) for v in client.mget([KEY_PREFIX + "tag:" + tag for tag in tags])
+                ]
+            except Exception as e:
+                logger.warning(f"Redis cache tag lookup failed, using in-process cache: {e}")
+        with self._lock:
+            return [self._versions.get(tag, 0) for tag in tags]
+
+    def invalidate(self, *tags: str) -> None:
+        """태그 버전을 올려 그 태그가 붙은 캐시 항목을 모두 무효화"""
+        tags = [tag for tag in dict.fromkeys(tags) if tag]
+        if not tags:
+            return
+        client = self._get_redis()
+        if client is not None:
+            try:
+                pipe = client.pipeline()
+                for tag in tags:
+                    pipe.incr(KEY_PREFIX + "tag:" + tag)
+                    pipe.expire(KEY_PREFIX + "tag:" + tag, TAG_TTL)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(
+                    f"Redis cache invalidation failed, invalidating in-process only: {e}"
+                )
+        # Redis를 쓰더라도 연결이 끊겼다 돌아오는 사이 로컬에 저장된 항목이 남지 않도록 함께 올린다
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        client = self._get_redis()
+        if client is not None:
+            try:
+                payload = client.get(KEY_PREFIX + "entry:" + key)
+                return CachedResponse.loads(payload) if payload else None
+            except Exception as e:
+                logger.warning(f"Redis cache read failed, using in-process cache: {e}")
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse, ttl: int = RESPONSE_CACHE_TTL) -> None:
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.setex(KEY_PREFIX + "entry:" + key, ttl, entry.dumps())
+                return
+            except Exception as e:
+                logger.warning(f"Redis cache write failed, using in-process cache: {e}")
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """프로세스 안의 항목/태그 버전 초기화 (테스트용)"""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+response_cache = ResponseCache(os.getenv("REDIS_URL"))
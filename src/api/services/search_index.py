@@ -0,0 +1,306 @@
+"""
+프로젝트 검색 인덱스
+
+프로젝트 이름, 감지된 키, 코드 진행, 협업 멤버 이름을 project_search_documents에 한 행으로 모으고
+DB의 전문 검색 인덱스로 찾는다. 프로젝트가 늘어나도 검색어마다 projects를 훑지 않는다.
+
+- SQLite: FTS5 가상 테이블 project_search (external content, 트리거로 동기화)
+- PostgreSQL: tsvector 생성 컬럼 + GIN 인덱스
+- 그 외: 문서 테이블에 대한 LIKE 검색 (인덱스 없음)
+
+검색어는 단어별 접두사 검색(AND)이고 결과에는 관련도 순위(rank, 낮을수록 관련도가 높음)가 붙는다.
+ORM으로 프로젝트/멤버/닉네임을 바꾸면 같은 트랜잭션의 flush 시점에 문서가 갱신된다
+(query.update() 같은 일괄 UPDATE는 ORM 이벤트를 거치지 않으므로 rebuild_search_index로 다시 채운다).
+"""
+
+import json
+import logging
+import re
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import (
+    and_,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import column, table
+
+from src.api.models import ProjectMember, ProjectModel, ProjectSearchDocument, User
+
+logger = logging.getLogger(__name__)
+
+documents = ProjectSearchDocument.__table__
+
+# 코드 이름(C#m7 등)이 한 단어로 유지되도록 '#'을 단어 문자로 취급
+TERM_PATTERN = re.compile(r"[\w#]+")
+MAX_SEARCH_TERMS = 8
+
+# 열별 가중치 (name, detected_key, chords, members) - 이름 일치가 가장 앞에 온다
+BM25_WEIGHTS = (10.0, 2.0, 1.0, 4.0)
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS project_search USING fts5(
+        name, detected_key, chords, members,
+        content='project_search_documents', content_rowid='id',
+        tokenize="unicode61 remove_diacritics 2 tokenchars '#'",
+        prefix='1 2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS project_search_ai AFTER INSERT ON project_search_documents BEGIN
+        INSERT INTO project_search(rowid, name, detected_key, chords, members)
+        VALUES (new.id, new.name, new.detected_key, new.chords, new.members);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS project_search_ad AFTER DELETE ON project_search_documents BEGIN
+        INSERT INTO project_search(project_search, rowid, name, detected_key, chords, members)
+        VALUES ('delete', old.id, old.name, old.detected_key, old.chords, old.members);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS project_search_au AFTER UPDATE ON project_search_documents BEGIN
+        INSERT INTO project_search(project_search, rowid, name, detected_key, chords, members)
+        VALUES ('delete', old.id, old.name, old.detected_key, old.chords, old.members);
+        INSERT INTO project_search(rowid, name, detected_key, chords, members)
+        VALUES (new.id, new.name, new.detected_key, new.chords, new.members);
+    END
+    """,
+]
+
+POSTGRES_DDL = [
+    """
+    ALTER TABLE project_search_documents ADD COLUMN IF NOT EXISTS document tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(members, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(detected_key, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(chords, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_project_search_document "
+    "ON project_search_documents USING GIN (document)",
+]
+
+SQLITE_DROP_DDL = [
+    "DROP TRIGGER IF EXISTS project_search_au",
+    "DROP TRIGGER IF EXISTS project_search_ad",
+    "DROP TRIGGER IF EXISTS project_search_ai",
+    "DROP TABLE IF EXISTS project_search",
+]
+
+
+def create_search_index(connection: Connection) -> None:
+    """문서 테이블 위에 DB별 전문 검색 인덱스를 만든다 (문서 테이블 생성 직후 호출)"""
+    dialect = connection.dialect.name
+    statements = (
+        SQLITE_DDL if dialect == "sqlite" else POSTGRES_DDL if dialect == "postgresql" else []
+    )
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def drop_search_index(connection: Connection) -> None:
+    if connection.dialect.name == "sqlite":
+        for statement in SQLITE_DROP_DDL:
+            connection.execute(text(statement))
+
+
+def search_terms(q: Optional[str]) -> List[str]:
+    """검색어를 단어 목록으로 (구두점은 버린다)"""
+    return TERM_PATTERN.findall(q or "")[:MAX_SEARCH_TERMS]
+
+
+def match_projects(db: Session, q: Optional[str], ranked: bool = False):
+    """검색어와 일치하는 (project_id, rank) 집합 - 검색할 단어가 없으면 None
+
+    rank는 ranked=True일 때만 계산하며 낮을수록 관련도가 높다 (정렬 방향을 DB와 관계없이 맞춘다).
+    일치 집합을 먼저 구한 뒤(MATERIALIZED) 프로젝트와 잇는다. 그렇지 않으면 SQLite 플래너가
+    소유자 인덱스로 사용자의 모든 프로젝트를 훑으며 행마다 전문 검색을 다시 실행할 수 있다.
+    """
+    terms = search_terms(q)
+    if not terms:
+        return None
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        expression = " ".join(f'"{term}"*' for term in terms)
+        fts = table("project_search", column("rowid"))
+        rank = (
+            func.bm25(literal_column("project_search"), *BM25_WEIGHTS)
+            if ranked
+            else literal_column("0.0")
+        )
+        stmt = (
+            select(documents.c.project_id, rank.label("rank"))
+            .select_from(documents.join(fts, fts.c.rowid == documents.c.id))
+            .where(
+                text("project_search MATCH :search_expression").bindparams(
+                    search_expression=expression
+                )
+            )
+        )
+    elif dialect == "postgresql":
+        query = func.to_tsquery("simple", " & ".join(f"{term.lower()}:*" for term in terms))
+        document = literal_column("project_search_documents.document")
+        rank = -func.ts_rank(document, query) if ranked else literal_column("0.0")
+        stmt = select(documents.c.project_id, rank.label("rank")).where(document.op("@@")(query))
+    else:
+        columns = (
+            documents.c.name,
+            documents.c.detected_key,
+            documents.c.chords,
+            documents.c.members,
+        )
+        stmt = select(documents.c.project_id, literal_column("0.0").label("rank")).where(
+            and_(*(or_(*(column.ilike(f"%{term}%") for column in columns)) for term in terms))
+        )
+        return stmt.subquery("search_hits")
+    return stmt.cte("search_hits").prefix_with("MATERIALIZED")
+
+
+def _chord_names(chord_progression: Optional[str]) -> str:
+    try:
+        chords = json.loads(chord_progression) if chord_progression else []
+    except ValueError:
+        return ""
+    names = []
+    for chord in chords or []:
+        name = chord.get("name") if isinstance(chord, dict) else chord
+        if name and name not in names:
+            names.append(str(name))
+    return " ".join(names)
+
+
+def _documents_for(connection: Connection, project_ids: List[str]) -> Dict[str, dict]:
+    projects = connection.execute(
+        select(
+            ProjectModel.id,
+            ProjectModel.name,
+            ProjectModel.detected_key,
+            ProjectModel.chord_progression,
+        ).where(ProjectModel.id.in_(project_ids))
+    ).all()
+    members: Dict[str, List[str]] = {}
+    for project_id, nickname, email in connection.execute(
+        select(ProjectMember.project_id, User.nickname, User.email)
+        .join(User, User.id == ProjectMember.user_id)
+        .where(ProjectMember.project_id.in_(project_ids))
+        .order_by(ProjectMember.id)
+    ):
+        members.setdefault(project_id, []).append(nickname or (email or "").split("@")[0])
+
+    return {
+        project.id: {
+            "project_id": project.id,
+            "name": project.name or "",
+            "detected_key": project.detected_key or "",
+            "chords": _chord_names(project.chord_progression),
+            "members": " ".join(members.get(project.id, [])),
+        }
+        for project in projects
+    }
+
+
+def refresh_documents(connection: Connection, project_ids: Iterable[str]) -> None:
+    """프로젝트 문서를 현재 값으로 다시 쓴다 (없어진 프로젝트는 문서 삭제)"""
+    project_ids = list(dict.fromkeys(project_ids))
+    if not project_ids:
+        return
+    current = _documents_for(connection, project_ids)
+    existing = {
+        project_id
+        for (project_id,) in connection.execute(
+            select(documents.c.project_id).where(documents.c.project_id.in_(project_ids))
+        )
+    }
+
+    removed = [project_id for project_id in project_ids if project_id not in current]
+    if removed:
+        connection.execute(delete(documents).where(documents.c.project_id.in_(removed)))
+    for project_id, document in current.items():
+        if project_id in existing:
+            connection.execute(
+                update(documents).where(documents.c.project_id == project_id).values(**document)
+            )
+        else:
+            connection.execute(insert(documents).values(**document))
+
+
+def rebuild_search_index(connection: Connection, batch_size: int = 1000) -> int:
+    """모든 프로젝트 문서를 다시 채운다 (마이그레이션, 일괄 수정 후 복구용) - 처리한 프로젝트 수 반환"""
+    connection.execute(delete(documents))
+    count = 0
+    last_id = ""
+    while True:
+        batch = [
+            project_id
+            for (project_id,) in connection.execute(
+                select(ProjectModel.id)
+                .where(ProjectModel.id > last_id)
+                .order_by(ProjectModel.id)
+                .limit(batch_size)
+            )
+        ]
+        if not batch:
+            return count
+        refresh_documents(connection, batch)
+        count += len(batch)
+        last_id = batch[-1]
+
+
+INDEXED_PROJECT_FIELDS = ("name", "detected_key", "chord_progression")
+
+
+def _changed(instance, fields) -> bool:
+    state = inspect(instance)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_search_index(session: Session, flush_context) -> None:
+    """flush된 변경 중 검색 문서에 영향을 주는 것만 골라 같은 트랜잭션에서 문서를 갱신"""
+    project_ids = []
+    renamed_user_ids = []
+    for instance in session.new:
+        if isinstance(instance, ProjectModel):
+            project_ids.append(instance.id)
+        elif isinstance(instance, ProjectMember):
+            project_ids.append(instance.project_id)
+    for instance in session.dirty:
+        if isinstance(instance, ProjectModel) and _changed(instance, INDEXED_PROJECT_FIELDS):
+            project_ids.append(instance.id)
+        elif isinstance(instance, ProjectMember) and _changed(instance, ("project_id", "user_id")):
+            # 다른 프로젝트로 옮겨진 멤버는 이전 프로젝트 문서에서도 빠진다
+            project_ids.append(instance.project_id)
+            project_ids.extend(inspect(instance).attrs.project_id.history.deleted)
+        elif isinstance(instance, User) and _changed(instance, ("nickname", "email")):
+            renamed_user_ids.append(instance.id)
+    for instance in session.deleted:
+        if isinstance(instance, ProjectModel):
+            project_ids.append(instance.id)
+        elif isinstance(instance, ProjectMember):
+            project_ids.append(instance.project_id)
+
+    if not project_ids and not renamed_user_ids:
+        return
+    connection = session.connection()
+    if renamed_user_ids:
+        project_ids.extend(
+            project_id
+            for (project_id,) in connection.execute(
+                select(ProjectMember.project_id).where(ProjectMember.user_id.in_(renamed_user_ids))
+            )
+        )
+    refresh_documents(connection, [project_id for project_id in project_ids if project_id])
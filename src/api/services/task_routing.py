@@ -0,0 +1,82 @@
+"""
+Celery 작업 큐/우선순위 결정
+
+긴 음원은 전용 큐(separation_long)로 보내 짧은 곡의 처리를 막지 않게 하고,
+같은 큐 안에서는 음원 길이와 사용자별 진행 중 작업 수로 우선순위를 정해
+한 사용자가 여러 곡을 한꺼번에 올려도 다른 사용자의 작업이 뒤로 밀리지 않게 한다.
+(Redis 브로커 기준 우선순위는 0이 가장 높고 9가 가장 낮다.)
+"""
+
+import os
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from src.api.models import GenerationJob, ProjectModel
+from src.api.schemas.project import TaskStatus
+from src.api.services.upload_service import PROBE_HEADER_SIZE, probe_audio_header
+
+LONG_AUDIO_SEC = float(os.getenv("LONG_AUDIO_SEC", "1200"))  # 20분
+DEFAULT_PRIORITY = 5
+LOWEST_PRIORITY = 9
+
+# 음원 길이(초) 상한별 기본 우선순위 - 짧은 곡일수록 먼저
+_DURATION_PRIORITY = ((240, 2), (600, 4), (LONG_AUDIO_SEC, 6))
+
+
+def estimate_duration(path: str) -> Optional[float]:
+    """파일 앞부분만 읽어 음원 길이 추정 (알 수 없으면 None)"""
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            header = f.read(PROBE_HEADER_SIZE)
+    except OSError:
+        return None
+    probe = probe_audio_header(header, size)
+    return probe.get("duration") if probe else None
+
+
+def _active_job_count(db: Session, user_id: Optional[int], exclude_project_id: str = None) -> int:
+    """사용자가 이미 큐에 올려둔(처리 중인) 작업 수"""
+    if user_id is None:
+        return 0
+    active = [TaskStatus.PENDING.value, TaskStatus.PROCESSING.value]
+    processing = db.query(ProjectModel).filter(
+        ProjectModel.user_id == user_id, ProjectModel.status == TaskStatus.PROCESSING.value
+    )
+    if exclude_project_id:
+        processing = processing.filter(ProjectModel.id != exclude_project_id)
+    generating = (
+        db.query(GenerationJob)
+        .join(ProjectModel, GenerationJob.project_id == ProjectModel.id)
+        .filter(ProjectModel.user_id == user_id, GenerationJob.status.in_(active))
+    )
+    return processing.count() + generating.count()
+
+
+def _fair_priority(base: int, active_jobs: int) -> int:
+    # 진행 중인 작업이 하나 늘 때마다 한 단계씩 낮춤
+    return min(base + active_jobs, LOWEST_PRIORITY)
+
+
+def processing_route(db: Session, project: ProjectModel, input_path: str) -> Dict:
+    """음원 분리 작업의 apply_async 옵션 (queue, priority)"""
+    duration = estimate_duration(input_path)
+    queue = "separation"
+    base = DEFAULT_PRIORITY
+    if duration is not None:
+        if duration > LONG_AUDIO_SEC:
+            queue = "separation_long"
+        else:
+            base = next(p for limit, p in _DURATION_PRIORITY if duration <= limit)
+
+    active = _active_job_count(db, project.user_id, exclude_project_id=project.id)
+    return {"queue": queue, "priority": _fair_priority(base, active)}
+
+
+def generation_route(db: Session, job: GenerationJob) -> Dict:
+    """채보 작업의 apply_async 옵션 - 이 작업 자신은 진행 중 작업 수에서 제외"""
+    project = db.query(ProjectModel).filter(ProjectModel.id == job.project_id).first()
+    user_id = project.user_id if project else None
+    active = max(_active_job_count(db, user_id) - 1, 0)
+    return {"queue": "transcription", "priority": _fair_priority(DEFAULT_PRIORITY - 1, active)}
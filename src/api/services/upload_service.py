@@ -0,0 +1,551 @@
+"""
+업로드 파일 저장 서비스 레이어
+
+UploadFile을 청크 단위로 읽어 aiofiles로 기록하므로
+큰 음원 업로드 중에도 이벤트 루프가 막히지 않는다.
+음원 업로드는 기록과 동시에 SHA-256 해시를 계산하고, 첫 청크에서 컨테이너 형식과
+길이를 판별해 지원하지 않거나 너무 큰 파일을 끝까지 받기 전에 거부한다.
+대용량 합주 녹음을 위한 이어받기(resumable) 청크 업로드 세션도 여기서 관리한다.
+세션 디렉터리의 잠금 파일(POSIX는 flock, Windows는 msvcrt.locking)로 같은 세션에 대한 청크 기록은 프로세스와 무관하게 한 번에 하나만 진행되고,
+UPLOAD_SESSION_TTL 동안 청크가 오지 않은 세션은 만료되어 정리된다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import struct
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+import aiofiles
+from fastapi import UploadFile
+
+from src.api.exceptions import (
+    FileTooLargeError,
+    FileUploadError,
+    UnsupportedMediaTypeError,
+    UploadInProgressError,
+    UploadOffsetMismatchError,
+    UploadSessionNotFoundError,
+)
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+PROBE_HEADER_SIZE = 64 * 1024  # 형식/길이 판별에 사용하는 앞부분 크기
+
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE_MB", "500")) * 1024 * 1024
+MAX_AUDIO_DURATION = float(os.getenv("MAX_AUDIO_DURATION_SEC", "7200"))  # 2시간
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+PARTIAL_UPLOAD_DIR = os.path.join(PROJECT_ROOT, "temp", "uploads", "partial")
+
+# 마지막 청크 이후 이 시간이 지난 이어받기 세션은 만료 (받은 데이터와 해시 상태를 지운다)
+UPLOAD_SESSION_TTL = int(os.getenv("UPLOAD_SESSION_TTL_SEC", "86400"))
+# 만료 세션 정리 주기 - 세션을 만들 때 이 간격이 지났으면 한 번 훑는다
+UPLOAD_SESSION_SWEEP_INTERVAL = int(os.getenv("UPLOAD_SESSION_SWEEP_INTERVAL_SEC", "3600"))
+
+# MPEG-1 / MPEG-2(2.5) Layer III 비트레이트 (kbps)
+_MP3_BITRATES = {
+    3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def _probe_wav(header: bytes) -> Dict:
+    info: Dict = {"format": "wav"}
+    pos = 12
+    byte_rate = 0
+    while pos + 8 <= len(header):
+        chunk_id = header[pos : pos + 4]
+        (chunk_size,) = struct.unpack("<I", header[pos + 4 : pos + 8])
+        if chunk_id == b"fmt " and pos + 24 <= len(header):
+            channels, sample_rate, byte_rate = struct.unpack("<HII", header[pos + 10 : pos + 20])
+            info.update(channels=channels, sample_rate=sample_rate)
+        elif chunk_id == b"data":
+            # 스트리밍으로 기록된 WAV는 data 크기가 0 또는 0xFFFFFFFF일 수 있다
+            if byte_rate and chunk_size not in (0, 0xFFFFFFFF):
+                info["duration"] = chunk_size / byte_rate
+            break
+        pos += 8 + chunk_size + (chunk_size & 1)
+    return info
+
+
+def _probe_flac(header: bytes) -> Dict:
+    info: Dict = {"format": "flac"}
+    # 첫 메타데이터 블록은 항상 STREAMINFO (34바이트)
+    if len(header) >= 8 + 18 and header[4] & 0x7F == 0:
+        streaminfo = header[8:26]
+        sample_rate = (streaminfo[10] << 12) | (streaminfo[11] << 4) | (streaminfo[12] >> 4)
+        channels = ((streaminfo[12] >> 1) & 0x07) + 1
+        total_samples = ((streaminfo[13] & 0x0F) << 32) | struct.unpack(">I", streaminfo[14:18])[0]
+        info.update(sample_rate=sample_rate, channels=channels)
+        if sample_rate and total_samples:
+            info["duration"] = total_samples / sample_rate
+    return info
+
+
+def _probe_mp3(header: bytes, total_size: Optional[int]) -> Optional[Dict]:
+    offset = 0
+    if header[:3] == b"ID3" and len(header) >= 10:
+        tag_size = (
+            (header[6] & 0x7F) << 21
+            | (header[7] & 0x7F) << 14
+            | (header[8] & 0x7F) << 7
+            | (header[9] & 0x7F)
+        )
+        offset = 10 + tag_size
+        if offset + 4 > len(header):
+            # 태그가 판별 구간보다 크면 프레임은 확인하지 못하지만 ID3 자체로 MP3로 본다
+            return {"format": "mp3"}
+
+    if offset + 4 > len(header) or header[offset] != 0xFF or header[offset + 1] & 0xE0 != 0xE0:
+        return {"format": "mp3"} if offset else None
+
+    version_bits = (header[offset + 1] >> 3) & 0x03
+    layer_bits = (header[offset + 1] >> 1) & 0x03
+    bitrate_idx = header[offset + 2] >> 4
+    sample_idx = (header[offset + 2] >> 2) & 0x03
+    if layer_bits != 0x01 or version_bits == 0x01 or sample_idx == 3 or bitrate_idx in (0, 15):
+        return {"format": "mp3"} if offset else None
+
+    bitrate = _MP3_BITRATES[3 if version_bits == 3 else 2][bitrate_idx] * 1000
+    info: Dict = {
+        "format": "mp3",
+        "sample_rate": _MP3_SAMPLE_RATES[version_bits][sample_idx],
+        "channels": 1 if (header[offset + 3] >> 6) == 0x03 else 2,
+    }
+    if total_size:
+        # CBR 기준 추정치 (VBR이면 오차가 있지만 상한 검사 용도로는 충분)
+        info["duration"] = (total_size - offset) * 8 / bitrate
+        info["duration_estimated"] = True
+    return info
+
+
+def probe_audio_header(header: bytes, total_size: Optional[int] = None) -> Optional[Dict]:
+    """
+    파일 앞부분만으로 오디오 컨테이너 형식과 (가능하면) 길이를 판별
+
+    Args:
+        header: 파일 앞부분 바이트 (PROBE_HEADER_SIZE 권장)
+        total_size: 전체 파일 크기 (MP3 길이 추정에 사용)
+
+    Returns:
+        {"format", "sample_rate", "channels", "duration"} 중 판별된 값, 알 수 없는 형식이면 None
+    """
+    if len(header) >= 12 and header[:4] in (b"RIFF", b"RF64") and header[8:12] == b"WAVE":
+        return _probe_wav(header)
+    if header[:4] == b"fLaC":
+        return _probe_flac(header)
+    if header[:4] == b"OggS":
+        return {"format": "ogg"}
+    if len(header) >= 8 and header[4:8] == b"ftyp":
+        return {"format": "m4a"}
+    # ADTS AAC: 프레임 동기 + layer 비트 00 (MPEG 오디오와 구분)
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xF6 == 0xF0:
+        return {"format": "aac"}
+    return _probe_mp3(header, total_size)
+
+
+def validate_audio_probe(file_name: str, probe: Optional[Dict]):
+    """판별 결과로 지원 형식/길이 상한 검사"""
+    supported = set(config.get("audio", "supported_formats", []))
+    ext = os.path.splitext(file_name)[1].lower()
+    if ext not in supported:
+        raise UnsupportedMediaTypeError(
+            detail=f"지원하지 않는 파일 형식입니다: {ext or file_name} (지원: {', '.join(sorted(supported))})"
+        )
+    if probe is None:
+        raise UnsupportedMediaTypeError(detail="오디오 파일 형식을 인식할 수 없습니다.")
+    duration = probe.get("duration")
+    if duration and duration > MAX_AUDIO_DURATION:
+        raise FileTooLargeError(
+            detail=f"음원 길이가 너무 깁니다 ({duration / 60:.0f}분, 최대 {MAX_AUDIO_DURATION / 60:.0f}분)."
+        )
+
+
+def validate_upload_size(size: int):
+    if size > MAX_UPLOAD_SIZE:
+        raise FileTooLargeError(
+            detail=f"파일이 너무 큽니다 (최대 {MAX_UPLOAD_SIZE // (1024 * 1024)}MB)."
+        )
+
+
+class StoredUpload:
+    """디스크에 기록된 업로드 결과"""
+
+    def __init__(self, path: str, size: int, content_hash: str, probe: Optional[Dict] = None):
+        self.path = path
+        self.size = size
+        self.content_hash = content_hash
+        self.probe = probe or {}
+
+
+# 이어받기 세션별 진행 중 해시 상태 (같은 프로세스에서 이어질 때 재해싱 방지)
+_session_hashers: Dict[str, "hashlib._Hash"] = {}
+_last_sweep = 0.0
+
+
+def _session_idle_seconds(session: Dict, now: Optional[datetime] = None) -> float:
+    last_activity = session.get("updated_at") or session.get("created_at")
+    if not last_activity:
+        return 0.0
+    return ((now or datetime.utcnow()) - datetime.fromisoformat(last_activity)).total_seconds()
+
+
+def _lock_file(fd: int) -> None:
+    """fd에 배타 잠금 - 이미 잠겨 있으면 기다리지 않고 BlockingIOError/PermissionError"""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _unlock_file(fd: int) -> None:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class UploadService:
+    @staticmethod
+    async def save(upload: UploadFile, file_path: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> int:
+        """
+        업로드 파일을 스트리밍으로 디스크에 저장
+
+        Args:
+            upload: FastAPI UploadFile
+            file_path: 저장할 경로
+            chunk_size: 한 번에 읽을 바이트 수
+
+        Returns:
+            저장된 바이트 수
+
+        Raises:
+            FileUploadError: 저장 실패 시 (부분 파일은 삭제)
+        """
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        written = 0
+        try:
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while True:
+                    chunk = await upload.read(chunk_size)
+                    if not chunk:
+                        break
+                    await buffer.write(chunk)
+                    written += len(chunk)
+        except Exception as e:
+            logger.error(f"Upload to {file_path} failed: {e}")
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise FileUploadError(detail=f"파일 업로드 실패: {str(e)}")
+        return written
+
+    @staticmethod
+    async def save_audio(
+        upload: UploadFile, file_path: str, chunk_size: int = UPLOAD_CHUNK_SIZE
+    ) -> StoredUpload:
+        """
+        음원 업로드를 저장하면서 해시 계산과 형식 판별을 함께 수행
+
+        첫 청크에서 형식/길이를 확인하고, 크기 상한을 넘는 순간 중단하므로
+        잘못된 파일은 끝까지 받지 않고 거부된다.
+
+        Raises:
+            UnsupportedMediaTypeError: 지원하지 않는 형식
+            FileTooLargeError: 크기 또는 길이 상한 초과
+            FileUploadError: 저장 실패
+        """
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        digest = hashlib.sha256()
+        written = 0
+        header = b""
+        probe: Optional[Dict] = None
+        try:
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while True:
+                    chunk = await upload.read(chunk_size)
+                    if not chunk:
+                        break
+                    written += len(chunk)
+                    validate_upload_size(written)
+                    if probe is None and len(header) < PROBE_HEADER_SIZE:
+                        header += chunk[: PROBE_HEADER_SIZE - len(header)]
+                        if len(header) >= PROBE_HEADER_SIZE:
+                            probe = probe_audio_header(header, upload.size)
+                            validate_audio_probe(upload.filename or file_path, probe)
+                    digest.update(chunk)
+                    await buffer.write(chunk)
+
+            if probe is None:
+                probe = probe_audio_header(header, written)
+                validate_audio_probe(upload.filename or file_path, probe)
+            elif probe.get("duration_estimated") and upload.size is None:
+                probe = probe_audio_header(header, written)
+                validate_audio_probe(upload.filename or file_path, probe)
+        except (UnsupportedMediaTypeError, FileTooLargeError):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+        except Exception as e:
+            logger.error(f"Upload to {file_path} failed: {e}")
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise FileUploadError(detail=f"파일 업로드 실패: {str(e)}")
+
+        return StoredUpload(file_path, written, digest.hexdigest(), probe)
+
+    # --- 이어받기(resumable) 청크 업로드 ---
+
+    @staticmethod
+    def _session_dir(upload_id: str) -> str:
+        # upload_id는 uuid4 hex만 허용 (경로 조작 방지)
+        if not upload_id or not all(c in "0123456789abcdef" for c in upload_id):
+            raise UploadSessionNotFoundError()
+        return os.path.join(PARTIAL_UPLOAD_DIR, upload_id)
+
+    @staticmethod
+    @contextmanager
+    def _session_lock(upload_id: str) -> Iterator[None]:
+        """세션 잠금 - 이미 다른 요청이 잡고 있으면 기다리지 않고 409"""
+        session_dir = UploadService._session_dir(upload_id)
+        try:
+            fd = os.open(os.path.join(session_dir, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        except FileNotFoundError:
+            raise UploadSessionNotFoundError()
+        try:
+            try:
+                _lock_file(fd)
+            except (BlockingIOError, PermissionError):
+                raise UploadInProgressError()
+            try:
+                yield
+            finally:
+                _unlock_file(fd)
+        finally:
+            os.close(fd)
+            # Windows는 열린 파일을 지울 수 없어 잠근 채 정리한 세션은 잠금 파일이 남는다
+            if not os.path.exists(os.path.join(session_dir, "session.json")):
+                shutil.rmtree(session_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write_session(upload_id: str, session: Dict):
+        session["updated_at"] = datetime.utcnow().isoformat()
+        session_path = os.path.join(UploadService._session_dir(upload_id), "session.json")
+        tmp_path = f"{session_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(session, f)
+        os.replace(tmp_path, session_path)
+
+    @staticmethod
+    def get_session(upload_id: str, user_id: Optional[int] = None) -> Dict:
+        """세션 조회 (다른 사용자의 세션은 없는 것으로 취급)"""
+        session_path = os.path.join(UploadService._session_dir(upload_id), "session.json")
+        if not os.path.exists(session_path):
+            raise UploadSessionNotFoundError()
+        with open(session_path, "r", encoding="utf-8") as f:
+            session = json.load(f)
+        if session.get("user_id") != user_id:
+            raise UploadSessionNotFoundError()
+        if _session_idle_seconds(session) > UPLOAD_SESSION_TTL:
+            raise UploadSessionNotFoundError(detail="업로드 세션이 만료되었습니다.")
+        return session
+
+    @staticmethod
+    def create_session(file_name: str, total_size: int, user_id: Optional[int] = None) -> Dict:
+        """청크 업로드 세션 생성 - 확장자와 전체 크기는 데이터를 받기 전에 검사"""
+        supported = set(config.get("audio", "supported_formats", []))
+        ext = os.path.splitext(file_name)[1].lower()
+        if ext not in supported:
+            raise UnsupportedMediaTypeError(
+                detail=f"지원하지 않는 파일 형식입니다: {ext or file_name}"
+            )
+        if total_size <= 0:
+            raise FileUploadError(detail="파일 크기가 올바르지 않습니다.")
+        validate_upload_size(total_size)
+        UploadService.expire_sessions(throttle=True)
+
+        upload_id = uuid.uuid4().hex
+        os.makedirs(UploadService._session_dir(upload_id), exist_ok=True)
+        session = {
+            "upload_id": upload_id,
+            "file_name": file_name,
+            "total_size": total_size,
+            "received": 0,
+            "user_id": user_id,
+            "probe": None,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        UploadService._write_session(upload_id, session)
+        _session_hashers[upload_id] = hashlib.sha256()
+        return session
+
+    @staticmethod
+    async def append_chunk(
+        upload_id: str, offset: int, stream, user_id: Optional[int] = None
+    ) -> Dict:
+        """
+        세션에 청크 추가
+
+        offset이 서버가 받은 크기와 다르면 409로 현재 위치를 알려주어
+        클라이언트가 그 지점부터 이어서 보내도록 한다.
+        같은 세션에 다른 청크가 기록 중이면 409 (UploadInProgressError).
+        """
+        with UploadService._session_lock(upload_id):
+            return await UploadService._append_locked(upload_id, offset, stream, user_id)
+
+    @staticmethod
+    async def _append_locked(upload_id: str, offset: int, stream, user_id: Optional[int]) -> Dict:
+        session = UploadService.get_session(upload_id, user_id)
+        if offset != session["received"]:
+            raise UploadOffsetMismatchError(session["received"])
+
+        data_path = os.path.join(UploadService._session_dir(upload_id), "data.part")
+        hasher = _session_hashers.get(upload_id) if offset == session.get("hashed", 0) else None
+        received = session["received"]
+        try:
+            async with aiofiles.open(data_path, "ab") as buffer:
+                async for chunk in stream:
+                    if not chunk:
+                        continue
+                    received += len(chunk)
+                    if received > session["total_size"]:
+                        raise FileUploadError(
+                            detail="선언한 파일 크기보다 많은 데이터가 전송되었습니다."
+                        )
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    await buffer.write(chunk)
+        except Exception:
+            # 이번 청크는 버리고 마지막으로 확정된 위치로 되돌린다
+            with open(data_path, "ab") as f:
+                f.truncate(session["received"])
+            _session_hashers.pop(upload_id, None)
+            session.pop("hashed", None)
+            UploadService._write_session(upload_id, session)
+            raise
+
+        session["received"] = received
+        if hasher is not None:
+            session["hashed"] = received
+        else:
+            session.pop("hashed", None)
+
+        # 앞부분이 모이면 형식/길이를 판별해 잘못된 파일은 나머지를 받기 전에 거부
+        if session["probe"] is None and (
+            received >= PROBE_HEADER_SIZE or received == session["total_size"]
+        ):
+            with open(data_path, "rb") as f:
+                header = f.read(PROBE_HEADER_SIZE)
+            probe = probe_audio_header(header, session["total_size"])
+            try:
+                validate_audio_probe(session["file_name"], probe)
+            except Exception:
+                UploadService.discard_session(upload_id)
+                raise
+            session["probe"] = probe
+
+        UploadService._write_session(upload_id, session)
+        return session
+
+    @staticmethod
+    def finalize_session(
+        upload_id: str, file_path: str, user_id: Optional[int] = None
+    ) -> StoredUpload:
+        """모든 청크를 받은 세션을 최종 경로로 옮기고 콘텐츠 해시 확정"""
+        with UploadService._session_lock(upload_id):
+            return UploadService._finalize_locked(upload_id, file_path, user_id)
+
+    @staticmethod
+    def _finalize_locked(upload_id: str, file_path: str, user_id: Optional[int]) -> StoredUpload:
+        session = UploadService.get_session(upload_id, user_id)
+        if session["received"] != session["total_size"]:
+            raise FileUploadError(
+                detail=f"업로드가 완료되지 않았습니다 ({session['received']}/{session['total_size']})."
+            )
+
+        data_path = os.path.join(UploadService._session_dir(upload_id), "data.part")
+        hasher = _session_hashers.pop(upload_id, None)
+        if hasher is not None and session.get("hashed") == session["received"]:
+            content_hash = hasher.hexdigest()
+        else:
+            # 다른 프로세스/재시작 후 이어진 세션은 한 번 더 읽어 해시 계산
+            from src.api.services.pipeline import hash_file
+
+            content_hash = hash_file(data_path)
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        shutil.move(data_path, file_path)
+        UploadService.discard_session(upload_id)
+        return StoredUpload(file_path, session["received"], content_hash, session["probe"])
+
+    @staticmethod
+    def discard_session(upload_id: str):
+        _session_hashers.pop(upload_id, None)
+        shutil.rmtree(UploadService._session_dir(upload_id), ignore_errors=True)
+
+    @staticmethod
+    def expire_sessions(now: Optional[datetime] = None, throttle: bool = False) -> int:
+        """UPLOAD_SESSION_TTL이 지난 세션 정리 - 지운 세션 수 반환
+
+        throttle이면 UPLOAD_SESSION_SWEEP_INTERVAL 안에 이미 훑었을 때 건너뛴다.
+        청크를 기록 중인(잠긴) 세션은 건드리지 않는다.
+        """
+        global _last_sweep
+        if throttle and time.monotonic() - _last_sweep < UPLOAD_SESSION_SWEEP_INTERVAL:
+            return 0
+        _last_sweep = time.monotonic()
+
+        try:
+            upload_ids = os.listdir(PARTIAL_UPLOAD_DIR)
+        except FileNotFoundError:
+            upload_ids = []
+
+        expired = 0
+        for upload_id in upload_ids:
+            session_path = os.path.join(PARTIAL_UPLOAD_DIR, upload_id, "session.json")
+            try:
+                with open(session_path, "r", encoding="utf-8") as f:
+                    session = json.load(f)
+            except (OSError, ValueError):
+                # 세션 파일이 없거나 깨졌으면 디렉터리 수정 시각으로 판단
+                try:
+                    modified = os.path.getmtime(os.path.join(PARTIAL_UPLOAD_DIR, upload_id))
+                except OSError:
+                    continue
+                session = {"updated_at": datetime.utcfromtimestamp(modified).isoformat()}
+            if _session_idle_seconds(session, now) <= UPLOAD_SESSION_TTL:
+                continue
+            try:
+                with UploadService._session_lock(upload_id):
+                    UploadService.discard_session(upload_id)
+            except (UploadInProgressError, UploadSessionNotFoundError):
+                continue
+            expired += 1
+
+        # 다른 프로세스가 정리한 세션의 해시 상태도 비운다
+        for upload_id in list(_session_hashers):
+            if not os.path.isdir(os.path.join(PARTIAL_UPLOAD_DIR, upload_id)):
+                _session_hashers.pop(upload_id, None)
+
+        if expired:
+            logger.info(f"Expired {expired} idle upload sessions")
+        return expired
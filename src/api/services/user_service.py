@@ -33,29 +33,25 @@ class UserService:
         return UserResponse.from_orm(user)
 
     @staticmethod
-    def upload_profile_image(db: Session, user: User, file_name: str, file_content) -> UserResponse:
+    def allocate_profile_image(user: User, file_name: str):
+        """프로필 이미지 저장 파일명과 경로 할당"""
         import os
-        import shutil
         import uuid
-        
+
         # 프로젝트 루트의 temp/uploads와 동일한 경로 사용 또는 별도 profile_images 디렉터리
         from src.api.services.project_service import UPLOAD_DIR
-        
+
         file_ext = os.path.splitext(file_name)[1]
         saved_filename = f"profile_{user.id}_{uuid.uuid4().hex[:8]}{file_ext}"
-        file_path = os.path.join(UPLOAD_DIR, saved_filename)
-        
-        try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file_content, buffer)
-        except Exception as e:
-            from src.api.exceptions import FileUploadError
-            raise FileUploadError(detail=f"프로필 이미지 업로드 실패: {str(e)}")
-            
+        return saved_filename, os.path.join(UPLOAD_DIR, saved_filename)
+
+    @staticmethod
+    def set_profile_image(db: Session, user: User, saved_filename: str) -> UserResponse:
+        """저장된 프로필 이미지를 사용자에 연결"""
         user.profile_image = f"/static/uploads/{saved_filename}"
         db.commit()
         db.refresh(user)
-        
+
         return UserResponse.from_orm(user)
 
     @staticmethod
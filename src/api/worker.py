@@ -0,0 +1,118 @@
+"""
+Celery 워커 생명주기 훅
+
+- 워커 자식 프로세스가 시작될 때 WORKER_PRELOAD_MODELS에 지정한 모델을 미리 올려
+  새 워커의 첫 작업이 TensorFlow/torch 로딩 시간을 떠안지 않게 한다.
+  Demucs는 작업마다 별도 프로세스로 실행되므로 메모리에 올리는 대신
+  메인 프로세스 시작 시 가중치를 내려받아 디스크/페이지 캐시를 데워 둔다.
+- 예열이 끝나면 WORKER_READY_FILE을 만들어 readiness probe가 확인할 수 있게 한다.
+- 자식 프로세스 재시작 기준(작업 수/메모리)은 celery_app 설정을 따른다.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Iterable, List
+
+from celery.signals import worker_init, worker_process_init, worker_ready, worker_shutdown
+
+logger = logging.getLogger(__name__)
+
+READY_FILE = os.getenv("WORKER_READY_FILE", "/tmp/justjam-worker-ready")
+DEMUCS_MODEL = os.getenv("WORKER_DEMUCS_MODEL", "htdemucs_6s")
+DEMUCS_WARMUP_TIMEOUT = int(os.getenv("WORKER_DEMUCS_WARMUP_TIMEOUT", "900"))
+
+
+def configured_models() -> List[str]:
+    """WORKER_PRELOAD_MODELS (쉼표 구분: basic_pitch, demucs)"""
+    raw = os.getenv("WORKER_PRELOAD_MODELS", "")
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+def _preload_basic_pitch():
+    from src.transcriber import get_model
+
+    get_model()
+
+
+def _warm_demucs_weights():
+    # 분리 작업과 같은 방식(별도 인터프리터)으로 가중치를 받아 두어 워커 메모리에는 torch를 올리지 않는다
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"from demucs.pretrained import get_model; get_model({DEMUCS_MODEL!r})",
+        ],
+        check=True,
+        timeout=DEMUCS_WARMUP_TIMEOUT,
+        capture_output=True,
+    )
+
+
+# 자식 프로세스마다 메모리에 올리는 모델
+PROCESS_PRELOADERS: Dict[str, Callable[[], None]] = {"basic_pitch": _preload_basic_pitch}
+# 워커당 한 번만 수행하면 되는 예열 (디스크 캐시)
+WORKER_PRELOADERS: Dict[str, Callable[[], None]] = {"demucs": _warm_demucs_weights}
+
+
+def preload(names: Iterable[str], preloaders: Dict[str, Callable[[], None]]) -> Dict[str, float]:
+    """지정한 모델 예열 - 실패해도 워커는 계속 뜨고, 해당 모델은 첫 작업에서 로드된다
+
+    Returns:
+        모델 이름 → 소요 시간(초) (성공한 것만)
+    """
+    timings = {}
+    for name in names:
+        loader = preloaders.get(name)
+        if loader is None:
+            continue
+        started = time.perf_counter()
+        try:
+            loader()
+        except Exception as e:
+            logger.error(f"Failed to preload {name}: {e}")
+            continue
+        timings[name] = time.perf_counter() - started
+        logger.info(f"Preloaded {name} in {timings[name]:.1f}s (pid {os.getpid()})")
+    return timings
+
+
+def mark_ready():
+    with open(READY_FILE, "w") as f:
+        f.write(str(os.getpid()))
+
+
+def clear_ready():
+    try:
+        os.remove(READY_FILE)
+    except FileNotFoundError:
+        pass
+
+
+@worker_init.connect
+def on_worker_init(**kwargs):
+    clear_ready()
+    preload(configured_models(), WORKER_PRELOADERS)
+
+
+@worker_process_init.connect
+def on_worker_process_init(**kwargs):
+    from src.api.database import dispose_engine_after_fork
+
+    # 부모에게서 복사된 DB 연결은 버리고 자식 프로세스마다 새로 연결한다
+    dispose_engine_after_fork()
+    # 자식 프로세스는 이 훅이 끝난 뒤에 작업을 받는다 (worker_proc_alive_timeout 이내)
+    preload(configured_models(), PROCESS_PRELOADERS)
+
+
+@worker_ready.connect
+def on_worker_ready(**kwargs):
+    mark_ready()
+    logger.info(f"Worker ready (preloaded: {', '.join(configured_models()) or 'none'})")
+
+
+@worker_shutdown.connect
+def on_worker_shutdown(**kwargs):
+    clear_ready()
@@ -34,6 +34,9 @@ DEFAULT_CONFIG = {
         "preferred_fret_range": {"min": 0, "max": 5},
         "max_fret": 15,
     },
+    "score": {
+        "backend": "native",  # "native" (direct MusicXML writer) or "music21"
+    },
     "chord_detection": {
         "min_score": 5,
         "enabled_chord_types": {
@@ -0,0 +1,155 @@
+"""
+Dynamic-programming fingering for tablature.
+
+Notes that start together form one event; an event's state is a joint
+assignment of its notes to distinct strings. A Viterbi pass picks one state
+per event so that the sum of per-position scores minus hand-movement costs is
+maximal. Every event keeps at most ``beam`` states, so the work per event is
+bounded and the whole pass is linear in the number of notes.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+# States kept per event (chord assignments and Viterbi survivors)
+BEAM_WIDTH = 8
+# Cost per fret the fretting hand travels between events
+MOVE_COST = 400
+# Extra cost for leaving the current position (more than a hand span away)
+SHIFT_COST = 1000
+# Frets one hand can cover without shifting
+HAND_SPAN = 4
+# Cost per fret a chord shape stretches beyond the hand span
+STRETCH_COST = 800
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A playable (string, fret) for one note with its static score (higher is better)."""
+
+    string: int
+    fret: int
+    score: float
+
+
+@dataclass(frozen=True)
+class _State:
+    positions: Tuple[
+        Optional[Candidate], ...
+    ]  # one entry per note in the event, None if unplayable
+    score: float
+    hand: Optional[int]  # lowest fretted fret, None when only open strings are played
+
+
+def hand_position(frets: Sequence[int]) -> Optional[int]:
+    fretted = [f for f in frets if f > 0]
+    return min(fretted) if fretted else None
+
+
+def transition_cost(previous: Optional[int], current: Optional[int]) -> float:
+    """Cost of moving the fretting hand (None: only open strings, the hand stays put)."""
+    if previous is None or current is None:
+        return 0.0
+    distance = abs(current - previous)
+    return distance * MOVE_COST + (SHIFT_COST if distance > HAND_SPAN else 0.0)
+
+
+def chord_states(
+    note_candidates: Sequence[Sequence[Candidate]], beam: int = BEAM_WIDTH
+) -> List[_State]:
+    """Best joint assignments of simultaneous notes to distinct strings.
+
+    Built note by note, keeping the ``beam`` best partial assignments. A note
+    that cannot get a free string is left unplayed (None) with a penalty.
+    """
+    partial: List[Tuple[Tuple[Optional[Candidate], ...], float]] = [((), 0.0)]
+    for candidates in note_candidates:
+        extended = []
+        for positions, score in partial:
+            used = {p.string for p in positions if p is not None}
+            options = [c for c in candidates if c.string not in used]
+            for c in options:
+                extended.append((positions + (c,), score + c.score))
+            if not options:
+                extended.append((positions + (None,), score - SHIFT_COST))
+        extended.sort(key=lambda item: -item[1])
+        partial = extended[:beam]
+
+    states = []
+    for positions, score in partial:
+        frets = [p.fret for p in positions if p is not None]
+        fretted = [f for f in frets if f > 0]
+        if fretted:
+            stretch = max(fretted) - min(fretted)
+            score -= max(0, stretch - HAND_SPAN) * STRETCH_COST
+        states.append(_State(positions, score, hand_position(frets)))
+    states.sort(key=lambda s: -s.score)
+    return states[:beam]
+
+
+def optimize_fingering(
+    events: Sequence[Sequence[Sequence[Candidate]]], beam: int = BEAM_WIDTH
+) -> List[List[Optional[Tuple[int, int]]]]:
+    """Choose positions for a sequence of events.
+
+    Args:
+        events: For each event, the ranked candidates of each of its notes
+        beam: States kept per event
+
+    Returns:
+        For each event, one (string, fret) per note, or None where a note
+        could not be placed.
+    """
+    if not events:
+        return []
+
+    layers: List[List[_State]] = []
+    totals: List[List[float]] = []
+    back: List[List[int]] = []
+    # Where the hand is after each state; open-string-only states inherit it from their predecessor
+    hands: List[List[Optional[int]]] = []
+
+    for event in events:
+        states = chord_states(event, beam) or [_State(tuple(None for _ in event), 0.0, None)]
+        if not layers:
+            totals.append([s.score for s in states])
+            back.append([-1] * len(states))
+            hands.append([s.hand for s in states])
+        else:
+            previous_totals, previous_hands = totals[-1], hands[-1]
+            layer_totals, layer_back, layer_hands = [], [], []
+            # Open-string-only states cost nothing to reach:
+            # the best predecessor is the overall best
+            free_index = max(range(len(previous_totals)), key=previous_totals.__getitem__)
+            for state in states:
+                if state.hand is None:
+                    best_index, best_total = free_index, previous_totals[free_index]
+                else:
+                    best_index, best_total = 0, -float("inf")
+                    for index, (prev_total, prev_hand) in enumerate(
+                        zip(previous_totals, previous_hands)
+                    ):
+                        total = prev_total - transition_cost(prev_hand, state.hand)
+                        if total > best_total:
+                            best_index, best_total = index, total
+                layer_totals.append(best_total + state.score)
+                layer_back.append(best_index)
+                layer_hands.append(
+                    state.hand if state.hand is not None else previous_hands[best_index]
+                )
+            totals.append(layer_totals)
+            back.append(layer_back)
+            hands.append(layer_hands)
+        layers.append(states)
+
+    # Trace back the best path
+    index = max(range(len(totals[-1])), key=totals[-1].__getitem__)
+    chosen: List[_State] = []
+    for layer in range(len(layers) - 1, -1, -1):
+        chosen.append(layers[layer][index])
+        index = back[layer][index]
+    chosen.reverse()
+
+    return [
+        [(p.string, p.fret) if p is not None else None for p in state.positions] for state in chosen
+    ]
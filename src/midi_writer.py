@@ -0,0 +1,96 @@
+"""
+In-memory MIDI encoder.
+
+Writes a Standard MIDI File (type 1) straight from grid-quantized notes with
+mido: one conductor track for tempo and meter, then one track per part on its
+own channel. Nothing touches the filesystem.
+"""
+
+import io
+from typing import Dict, List, Sequence
+
+import mido
+
+from src.notation import (
+    DIVISIONS,
+    PartSpec,
+    instrument_spec,
+    midi_channel,
+    quantize_notes,
+    stem_parts,
+)
+
+TICKS_PER_BEAT = 480
+TICKS_PER_STEP = TICKS_PER_BEAT // DIVISIONS
+
+
+def _velocity(value: float) -> int:
+    # Transcribed velocities are 0.0-1.0; tolerate raw MIDI values too
+    scaled = value * 127 if value <= 1.0 else value
+    return max(1, min(127, int(round(scaled))))
+
+
+def _part_track(part: PartSpec, channel: int) -> mido.MidiTrack:
+    track = mido.MidiTrack()
+    track.append(mido.MetaMessage("track_name", name=part.instrument.name, time=0))
+    if not part.instrument.percussion:
+        track.append(
+            mido.Message(
+                "program_change", program=part.instrument.midi_program, channel=channel, time=0
+            )
+        )
+
+    # (tick, order, message) - note_off sorts before note_on at the same tick
+    events = []
+    for n in part.notes:
+        pitch = max(0, min(127, n.pitch))
+        start = n.start * TICKS_PER_STEP
+        end = (n.start + n.duration) * TICKS_PER_STEP
+        events.append(
+            (
+                start,
+                1,
+                mido.Message(
+                    "note_on", note=pitch, velocity=_velocity(n.velocity), channel=channel
+                ),
+            )
+        )
+        events.append((end, 0, mido.Message("note_off", note=pitch, velocity=0, channel=channel)))
+    events.sort(key=lambda e: (e[0], e[1]))
+
+    now = 0
+    for tick, _, message in events:
+        track.append(message.copy(time=tick - now))
+        now = tick
+    track.append(mido.MetaMessage("end_of_track", time=0))
+    return track
+
+
+def write_midi(parts: Sequence[PartSpec], bpm: float, beats_per_measure: int = 4) -> bytes:
+    """Encode parts into MIDI file bytes (shared tempo and time signature)."""
+    midi = mido.MidiFile(type=1, ticks_per_beat=TICKS_PER_BEAT)
+
+    conductor = mido.MidiTrack()
+    conductor.append(mido.MetaMessage("set_tempo", tempo=mido.bpm2tempo(bpm), time=0))
+    conductor.append(
+        mido.MetaMessage("time_signature", numerator=beats_per_measure, denominator=4, time=0)
+    )
+    conductor.append(mido.MetaMessage("end_of_track", time=0))
+    midi.tracks.append(conductor)
+
+    for index, part in enumerate(parts):
+        midi.tracks.append(_part_track(part, midi_channel(index, part.instrument)))
+
+    buffer = io.BytesIO()
+    midi.save(file=buffer)
+    return buffer.getvalue()
+
+
+def notes_to_midi(notes: List[Dict], bpm: float, instrument_name: str = "Piano") -> bytes:
+    """Single-part convenience wrapper around write_midi."""
+    return write_midi([PartSpec(instrument_spec(instrument_name), quantize_notes(notes, bpm))], bpm)
+
+
+def stems_to_midi(stem_notes: Dict[str, List[Dict]], bpm: float) -> bytes:
+    """Multi-track MIDI with one track per stem (stems without notes are skipped)."""
+    return write_midi(stem_parts(stem_notes, bpm), bpm)
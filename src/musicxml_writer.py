@@ -0,0 +1,441 @@
+"""
+Lightweight MusicXML writer.
+
+Builds partwise MusicXML straight from transcribed notes without creating a
+music21 object tree: notes are quantized to a sixteenth grid, simultaneous
+notes with the same length become chords, overlapping notes are spread over
+voices, and notes crossing a barline are split and tied. Elements are written
+with ``XMLGenerator`` instead of being built as a tree; the per-voice measure
+layouts and the returned document are still held in memory.
+"""
+
+import copy
+import io
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
+from xml.sax.saxutils import XMLGenerator
+
+from src.notation import (
+    DIVISIONS,
+    GridNote,
+    InstrumentSpec,
+    PartSpec,
+    instrument_spec,
+    measure_count,
+    midi_channel,
+    quantize_notes,
+    stem_parts,
+)
+
+MAX_VOICES = 4
+
+STEPS = [
+    ("C", 0),
+    ("C", 1),
+    ("D", 0),
+    ("D", 1),
+    ("E", 0),
+    ("F", 0),
+    ("F", 1),
+    ("G", 0),
+    ("G", 1),
+    ("A", 0),
+    ("A", 1),
+    ("B", 0),
+]
+
+# Notated durations in grid steps (sixteenths) -> (type, dots), longest first
+NOTE_VALUES = [
+    (16, "whole", 0),
+    (12, "half", 1),
+    (8, "half", 0),
+    (6, "quarter", 1),
+    (4, "quarter", 0),
+    (3, "eighth", 1),
+    (2, "eighth", 0),
+    (1, "16th", 0),
+]
+
+DOCTYPE = (
+    '<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" '
+    '"http://www.musicxml.org/dtds/partwise.dtd">\n'
+)
+
+# Schema order of <attributes> children (used when merging carried-over attributes)
+ATTRIBUTE_ORDER = [
+    "footnote",
+    "level",
+    "divisions",
+    "key",
+    "time",
+    "staves",
+    "part-symbol",
+    "instruments",
+    "clef",
+    "staff-details",
+    "transpose",
+    "for-part",
+    "directive",
+    "measure-style",
+]
+
+CLEFS = {
+    "treble": ("G", 2, 0),
+    "guitar": ("G", 2, -1),
+    "bass": ("F", 4, 0),
+    "percussion": ("percussion", 2, 0),
+}
+
+
+@dataclass
+class _Event:
+    start: int
+    duration: int
+    pitches: List[int]
+
+
+@dataclass
+class _Item:
+    duration: int
+    pitches: List[int]  # empty for rests
+    tie_stop: bool = False
+    tie_start: bool = False
+
+
+def split_duration(duration: int) -> List[Tuple[int, str, int]]:
+    """Break a grid duration into notatable values (largest first)."""
+    parts = []
+    remaining = duration
+    while remaining > 0:
+        for steps, note_type, dots in NOTE_VALUES:
+            if steps <= remaining:
+                parts.append((steps, note_type, dots))
+                remaining -= steps
+                break
+    return parts
+
+
+def assign_voices(notes: List[GridNote], max_voices: int = MAX_VOICES) -> List[List[_Event]]:
+    """Group notes into chords and spread overlapping chords over voices."""
+    chords: Dict[Tuple[int, int], List[int]] = {}
+    for n in notes:
+        chords.setdefault((n.start, n.duration), []).append(n.pitch)
+
+    voices: List[List[_Event]] = []
+    for (start, duration), pitches in sorted(chords.items(), key=lambda kv: (kv[0][0], -kv[0][1])):
+        event = _Event(start, duration, sorted(set(pitches)))
+        target = next((v for v in voices if v[-1].start + v[-1].duration <= start), None)
+        if target is None and len(voices) < max_voices:
+            target = []
+            voices.append(target)
+        if target is None:
+            # Too many simultaneous lines: cut the voice that frees up first
+            target = min(voices, key=lambda v: v[-1].start + v[-1].duration)
+            previous = target[-1]
+            previous.duration = start - previous.start
+            if previous.duration <= 0:
+                target.pop()
+        target.append(event)
+    return voices
+
+
+def _voice_measures(
+    events: List[_Event], steps_per_measure: int, measures: int
+) -> List[List[_Item]]:
+    """Lay one voice out into measures of items (notes/rests), splitting at barlines."""
+    layout: List[List[_Item]] = [[] for _ in range(measures)]
+    cursor = 0
+
+    def place(start: int, duration: int, pitches: List[int]):
+        tie_stop = False
+        while duration > 0:
+            index = start // steps_per_measure
+            room = (index + 1) * steps_per_measure - start
+            chunk = min(duration, room)
+            duration -= chunk
+            layout[index].append(
+                _Item(chunk, pitches, tie_stop=tie_stop, tie_start=bool(pitches) and duration > 0)
+            )
+            tie_stop = bool(pitches)
+            start += chunk
+
+    for event in events:
+        if event.start > cursor:
+            place(cursor, event.start - cursor, [])
+        place(event.start, event.duration, event.pitches)
+        cursor = event.start + event.duration
+    end = measures * steps_per_measure
+    if cursor < end:
+        place(cursor, end - cursor, [])
+    return layout
+
+
+class MusicXMLWriter:
+    """Streams a partwise MusicXML document.
+
+    Args:
+        bpm: Tempo written into the first measure
+        beats_per_measure: Quarter notes per measure (time signature numerator)
+        title: Work title
+    """
+
+    def __init__(
+        self,
+        bpm: float = 120,
+        beats_per_measure: int = 4,
+        title: str = "",
+        composer: str = "Band-Mate AI",
+    ):
+        self.bpm = bpm
+        self.beats_per_measure = beats_per_measure
+        self.steps_per_measure = beats_per_measure * DIVISIONS
+        self.title = title
+        self.composer = composer
+
+    def write(self, parts: Sequence[PartSpec], out: Optional[TextIO] = None) -> Optional[str]:
+        """Write the score to ``out``, or return it as a string when ``out`` is None."""
+        buffer = out if out is not None else io.StringIO()
+        measures = measure_count([p.notes for p in parts], self.steps_per_measure)
+
+        xml = XMLGenerator(buffer, encoding="utf-8", short_empty_elements=True)
+        xml.startDocument()
+        buffer.write(DOCTYPE)
+        xml.startElement("score-partwise", {"version": "4.0"})
+
+        self._element(xml, "work", children=[("work-title", self.title)])
+        xml.startElement("identification", {})
+        self._text(xml, "creator", self.composer, {"type": "composer"})
+        self._element(xml, "encoding", children=[("software", "JustJam")])
+        xml.endElement("identification")
+
+        xml.startElement("part-list", {})
+        for index, part in enumerate(parts, start=1):
+            self._score_part(xml, index, part.instrument)
+        xml.endElement("part-list")
+
+        for index, part in enumerate(parts, start=1):
+            self._part(xml, index, part, measures)
+
+        xml.endElement("score-partwise")
+        xml.endDocument()
+
+        return buffer.getvalue() if out is None else None
+
+    @staticmethod
+    def _text(xml: XMLGenerator, name: str, value, attrs: Optional[Dict[str, str]] = None):
+        xml.startElement(name, attrs or {})
+        xml.characters(str(value))
+        xml.endElement(name)
+
+    def _element(self, xml: XMLGenerator, name: str, attrs=None, children=()):
+        xml.startElement(name, attrs or {})
+        for child, value in children:
+            self._text(xml, child, value)
+        xml.endElement(name)
+
+    def _score_part(self, xml: XMLGenerator, index: int, spec: InstrumentSpec):
+        part_id = f"P{index}"
+        xml.startElement("score-part", {"id": part_id})
+        self._text(xml, "part-name", spec.name)
+        xml.startElement("score-instrument", {"id": f"{part_id}-I1"})
+        self._text(xml, "instrument-name", spec.name)
+        xml.endElement("score-instrument")
+        xml.startElement("midi-instrument", {"id": f"{part_id}-I1"})
+        self._text(xml, "midi-channel", midi_channel(index - 1, spec) + 1)
+        self._text(xml, "midi-program", spec.midi_program + 1)
+        xml.endElement("midi-instrument")
+        xml.endElement("score-part")
+
+    def _attributes(self, xml: XMLGenerator, spec: InstrumentSpec):
+        xml.startElement("attributes", {})
+        self._text(xml, "divisions", DIVISIONS)
+        self._element(xml, "key", children=[("fifths", 0)])
+        self._element(xml, "time", children=[("beats", self.beats_per_measure), ("beat-type", 4)])
+        sign, line, octave_change = CLEFS.get(spec.clef, CLEFS["treble"])
+        xml.startElement("clef", {})
+        self._text(xml, "sign", sign)
+        self._text(xml, "line", line)
+        if octave_change:
+            self._text(xml, "clef-octave-change", octave_change)
+        xml.endElement("clef")
+        xml.endElement("attributes")
+
+    def _tempo(self, xml: XMLGenerator):
+        bpm = round(self.bpm, 2)
+        xml.startElement("direction", {"placement": "above"})
+        xml.startElement("direction-type", {})
+        self._element(xml, "metronome", children=[("beat-unit", "quarter"), ("per-minute", bpm)])
+        xml.endElement("direction-type")
+        xml.startElement("sound", {"tempo": str(bpm)})
+        xml.endElement("sound")
+        xml.endElement("direction")
+
+    def _part(self, xml: XMLGenerator, index: int, part: PartSpec, measures: int):
+        voices = assign_voices(part.notes) or [[]]
+        layouts = [_voice_measures(v, self.steps_per_measure, measures) for v in voices]
+
+        xml.startElement("part", {"id": f"P{index}"})
+        for number in range(measures):
+            xml.startElement("measure", {"number": str(number + 1)})
+            if number == 0:
+                self._attributes(xml, part.instrument)
+                self._tempo(xml)
+
+            written_voices = 0
+            for voice_index, layout in enumerate(layouts, start=1):
+                items = layout[number]
+                has_notes = any(item.pitches for item in items)
+                if voice_index > 1 and not has_notes:
+                    continue
+                if written_voices:
+                    xml.startElement("backup", {})
+                    self._text(xml, "duration", self.steps_per_measure)
+                    xml.endElement("backup")
+                if not has_notes:
+                    self._rest(xml, self.steps_per_measure, voice_index, whole_measure=True)
+                else:
+                    for item in items:
+                        self._item(xml, item, voice_index)
+                written_voices += 1
+            xml.endElement("measure")
+        xml.endElement("part")
+
+    def _rest(self, xml: XMLGenerator, duration: int, voice: int, whole_measure: bool = False):
+        if whole_measure:
+            xml.startElement("note", {})
+            xml.startElement("rest", {"measure": "yes"})
+            xml.endElement("rest")
+            self._text(xml, "duration", duration)
+            self._text(xml, "voice", voice)
+            xml.endElement("note")
+            return
+        for steps, note_type, dots in split_duration(duration):
+            xml.startElement("note", {})
+            xml.startElement("rest", {})
+            xml.endElement("rest")
+            self._text(xml, "duration", steps)
+            self._text(xml, "voice", voice)
+            self._text(xml, "type", note_type)
+            for _ in range(dots):
+                xml.startElement("dot", {})
+                xml.endElement("dot")
+            xml.endElement("note")
+
+    def _item(self, xml: XMLGenerator, item: _Item, voice: int):
+        if not item.pitches:
+            self._rest(xml, item.duration, voice)
+            return
+
+        pieces = split_duration(item.duration)
+        for piece_index, (steps, note_type, dots) in enumerate(pieces):
+            tie_stop = item.tie_stop or piece_index > 0
+            tie_start = item.tie_start or piece_index < len(pieces) - 1
+            for chord_index, midi in enumerate(item.pitches):
+                self._note(
+                    xml, midi, steps, note_type, dots, voice, chord_index > 0, tie_stop, tie_start
+                )
+
+    def _note(self, xml, midi, steps, note_type, dots, voice, in_chord, tie_stop, tie_start):
+        step, alter = STEPS[midi % 12]
+        xml.startElement("note", {})
+        if in_chord:
+            xml.startElement("chord", {})
+            xml.endElement("chord")
+        xml.startElement("pitch", {})
+        self._text(xml, "step", step)
+        if alter:
+            self._text(xml, "alter", alter)
+        self._text(xml, "octave", midi // 12 - 1)
+        xml.endElement("pitch")
+        self._text(xml, "duration", steps)
+        ties = (["stop"] if tie_stop else []) + (["start"] if tie_start else [])
+        for tie in ties:
+            xml.startElement("tie", {"type": tie})
+            xml.endElement("tie")
+        self._text(xml, "voice", voice)
+        self._text(xml, "type", note_type)
+        for _ in range(dots):
+            xml.startElement("dot", {})
+            xml.endElement("dot")
+        if ties:
+            xml.startElement("notations", {})
+            for tie in ties:
+                xml.startElement("tied", {"type": tie})
+                xml.endElement("tied")
+            xml.endElement("notations")
+        xml.endElement("note")
+
+
+def write_musicxml(
+    notes, bpm: float, instrument_name: str = "Piano", title: Optional[str] = None
+) -> str:
+    """Single-part convenience wrapper around MusicXMLWriter."""
+    spec = instrument_spec(instrument_name)
+    writer = MusicXMLWriter(bpm=bpm, title=title or f"Analyzed {instrument_name.capitalize()}")
+    return writer.write([PartSpec(spec, quantize_notes(notes, bpm))])
+
+
+def write_band_musicxml(
+    stem_notes: Dict[str, List[Dict]], bpm: float, title: str = "Full Band"
+) -> str:
+    """Multi-part score with one part per stem, sharing tempo and measures."""
+    return MusicXMLWriter(bpm=bpm, title=title).write(stem_parts(stem_notes, bpm))
+
+
+def _attribute_key(element: ET.Element) -> Tuple[str, Optional[str]]:
+    # Clefs, keys and staff details can be given per staff ("number" attribute)
+    return element.tag, element.get("number")
+
+
+def measure_range(document: str, start: int, count: int) -> Tuple[str, int]:
+    """
+    Cut measures [start, start + count) (0-based) out of a partwise MusicXML document.
+
+    Every part keeps its header (part-list entry), and its first kept measure
+    gets the attributes (divisions, key, time, clef, ...) and tempo in effect
+    at that point, so the page renders on its own. Measure numbers are kept.
+
+    Returns:
+        (page document, total number of measures in the song)
+    """
+    root = ET.fromstring(document.encode("utf-8") if isinstance(document, str) else document)
+    total = 0
+    for part in root.findall("part"):
+        measures = part.findall("measure")
+        total = max(total, len(measures))
+        carried: Dict[Tuple[str, Optional[str]], ET.Element] = {}
+        tempo: Optional[ET.Element] = None
+        for measure in measures[:start]:
+            for attributes in measure.findall("attributes"):
+                for child in attributes:
+                    carried[_attribute_key(child)] = child
+            for direction in measure.findall("direction"):
+                if direction.find("sound[@tempo]") is not None:
+                    tempo = direction
+
+        kept = measures[start : start + max(0, count)]
+        for measure in measures:
+            part.remove(measure)
+        for measure in kept:
+            part.append(measure)
+        if not kept or start == 0:
+            continue
+
+        first = kept[0]
+        own = first.find("attributes")
+        merged = dict(carried)
+        if own is not None:
+            merged.update((_attribute_key(child), child) for child in own)
+            first.remove(own)
+        if merged:
+            attributes = ET.Element("attributes")
+            order = {tag: index for index, tag in enumerate(ATTRIBUTE_ORDER)}
+            for key in sorted(merged, key=lambda k: (order.get(k[0], len(order)), k[1] or "")):
+                attributes.append(copy.deepcopy(merged[key]))
+            first.insert(0, attributes)
+        if tempo is not None and first.find("direction/sound[@tempo]") is None:
+            first.insert(1 if merged else 0, copy.deepcopy(tempo))
+
+    page = ET.tostring(root, encoding="unicode")
+    return '<?xml version="1.0" encoding="utf-8"?>\n' + DOCTYPE + page, total
@@ -0,0 +1,114 @@
+"""
+Shared notation helpers for the score writers.
+
+Transcribed notes are dicts with ``pitch`` (MIDI number), ``start`` and ``end``
+(seconds) and ``velocity`` (0.0-1.0). The writers work on a fixed grid of
+sixteenth notes, so everything here converts seconds to grid steps once.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+# Grid steps per quarter note (sixteenth-note resolution)
+DIVISIONS = 4
+
+
+@dataclass(frozen=True)
+class InstrumentSpec:
+    """Display and playback settings for one part."""
+
+    name: str
+    midi_program: int  # 0-based General MIDI program
+    clef: str = "treble"  # treble, bass, guitar (treble 8vb) or percussion
+    percussion: bool = False
+
+
+INSTRUMENTS: Dict[str, InstrumentSpec] = {
+    "vocals": InstrumentSpec("Vocals", 53),
+    "bass": InstrumentSpec("Bass", 33, clef="bass"),
+    "guitar": InstrumentSpec("Guitar", 27, clef="guitar"),
+    "piano": InstrumentSpec("Piano", 0),
+    "drums": InstrumentSpec("Drums", 0, clef="percussion", percussion=True),
+    "other": InstrumentSpec("Other", 0),
+}
+
+
+# Conventional top-to-bottom order of parts in a band score
+SCORE_ORDER = ["vocals", "guitar", "piano", "other", "bass", "drums"]
+
+
+def instrument_spec(instrument_name: str) -> InstrumentSpec:
+    spec = INSTRUMENTS.get(instrument_name.lower())
+    if spec is None:
+        return InstrumentSpec(instrument_name.capitalize(), 0)
+    return spec
+
+
+def midi_channel(part_index: int, spec: InstrumentSpec) -> int:
+    """0-based MIDI channel for the n-th part (channel 10 is reserved for drums)."""
+    if spec.percussion:
+        return 9
+    return min(part_index if part_index < 9 else part_index + 1, 15)
+
+
+@dataclass
+class GridNote:
+    """A note snapped to the sixteenth grid."""
+
+    start: int  # grid steps from the beginning
+    duration: int  # grid steps, >= 1
+    pitch: int
+    velocity: float = 0.8
+
+
+def quantize_notes(
+    notes: List[Dict[str, Any]], bpm: float, min_duration: int = 1
+) -> List[GridNote]:
+    """Snap notes to the sixteenth grid, dropping exact duplicates.
+
+    Returns notes sorted by start, then pitch.
+    """
+    steps_per_sec = bpm / 60.0 * DIVISIONS
+    seen = set()
+    grid = []
+    for n in notes:
+        start = max(0, int(round(n["start"] * steps_per_sec)))
+        end = int(round(n["end"] * steps_per_sec))
+        duration = max(min_duration, end - start)
+        pitch = int(n["pitch"])
+        if (start, pitch) in seen:
+            continue
+        seen.add((start, pitch))
+        grid.append(GridNote(start, duration, pitch, float(n.get("velocity", 0.8))))
+    grid.sort(key=lambda g: (g.start, g.pitch))
+    return grid
+
+
+def measure_count(
+    parts_notes: List[List[GridNote]], steps_per_measure: int, minimum: int = 1
+) -> int:
+    """Number of measures needed to hold every part (shared measure map)."""
+    end: int = max((g.start + g.duration for notes in parts_notes for g in notes), default=0)
+    return max(minimum, -(-end // steps_per_measure))
+
+
+@dataclass
+class PartSpec:
+    """One part of a score: instrument settings plus its notes."""
+
+    instrument: InstrumentSpec
+    notes: List[GridNote] = field(default_factory=list)
+
+
+def stem_parts(stem_notes: Dict[str, List[Dict[str, Any]]], bpm: float) -> List[PartSpec]:
+    """Quantized parts for every stem that has notes, in score order."""
+
+    def order(name: str):
+        key = name.lower()
+        return (SCORE_ORDER.index(key) if key in SCORE_ORDER else len(SCORE_ORDER), key)
+
+    return [
+        PartSpec(instrument_spec(name), quantize_notes(stem_notes[name], bpm))
+        for name in sorted(stem_notes, key=order)
+        if stem_notes[name]
+    ]
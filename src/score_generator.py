@@ -1,15 +1,27 @@
 import logging
 from typing import Any, Dict, List, Optional
 
-import music21
-from music21 import chord, clef, instrument, layout, metadata, meter, note, stream, tempo
+from src.config import config
 
 logger = logging.getLogger(__name__)
 
+SCORE_BACKENDS = ("native", "music21")
+
 
 class ScoreGenerator:
-    def __init__(self, bpm: float = 120):
+    """
+    Score generation from transcribed notes.
+
+    The default "native" backend writes MusicXML directly (see musicxml_writer).
+    The "music21" backend builds a full music21 stream; it is slower and far
+    more memory hungry but kept as an optional high-fidelity path.
+    """
+
+    def __init__(self, bpm: float = 120, backend: Optional[str] = None):
         self.bpm = bpm
+        self.backend = backend or config.get("score", "backend", "native")
+        if self.backend not in SCORE_BACKENDS:
+            raise ValueError(f"Unknown score backend: {self.backend}")
 
     def generate_musicxml(self, notes: List[Dict[str, Any]], instrument_name: str = "Piano") -> str:
         """
@@ -18,6 +30,15 @@ class ScoreGenerator:
         if not notes:
             return ""
 
+        if self.backend == "native":
+            from src.musicxml_writer import write_musicxml
+
+            return write_musicxml(notes, self.bpm, instrument_name)
+        return self._generate_musicxml_music21(notes, instrument_name)
+
+    def _generate_musicxml_music21(self, notes: List[Dict[str, Any]], instrument_name: str) -> str:
+        from music21 import clef, instrument, metadata, meter, note, stream, tempo
+
         # Create a Score
         s = stream.Score()
         s.metadata = metadata.Metadata()
@@ -125,9 +146,19 @@ class ScoreGenerator:
         if not notes:
             return b""
 
+        if self.backend == "native":
+            from src.midi_writer import notes_to_midi
+
+            return notes_to_midi(notes, self.bpm, instrument_name)
+        return self._generate_midi_music21(notes, instrument_name)
+
+    def _generate_midi_music21(self, notes: List[Dict[str, Any]], instrument_name: str) -> bytes:
+        from music21 import instrument, note, stream, tempo
+        from music21.midi import translate
+
         s = stream.Score()
         p = stream.Part()
-        
+
         # Assign Instrument
         inst_map = {
             "vocals": instrument.Vocalist(),
@@ -153,28 +184,57 @@ class ScoreGenerator:
             p.insert(round(start_beat * 4) / 4.0, m21_note)
 
         s.append(p)
-        
-        import tempfile
-        import os
-        
+
         try:
-            with tempfile.NamedTemporaryFile(suffix=".mid", delete=False) as tmp:
-                tmp_path = tmp.name
-            
-            s.write("midi", fp=tmp_path)
-            
-            with open(tmp_path, "rb") as f:
-                midi_bytes = f.read()
-            
-            os.remove(tmp_path)
-            return midi_bytes
+            # Serialize in memory instead of round-tripping through a temp file
+            return translate.streamToMidiFile(s).writestr()
         except Exception as e:
             logger.error(f"MIDI generation error: {e}")
             raise e
 
+    def generate_multipart_musicxml(self, stem_notes: Dict[str, List[Dict[str, Any]]]) -> str:
+        """
+        Generate one MusicXML score with a part per stem (shared tempo and measures).
 
-def create_score(notes: List[Dict[str, Any]], bpm: float, instrument: str, format: str = "musicxml") -> Any:
-    generator = ScoreGenerator(bpm=bpm)
+        Always uses the native writer; the music21 backend only covers single parts.
+        """
+        from src.musicxml_writer import write_band_musicxml
+
+        if not any(stem_notes.values()):
+            return ""
+        return write_band_musicxml(stem_notes, self.bpm)
+
+    def generate_multitrack_midi(self, stem_notes: Dict[str, List[Dict[str, Any]]]) -> bytes:
+        """
+        Generate one MIDI file with a track per stem (shared tempo).
+        """
+        from src.midi_writer import stems_to_midi
+
+        if not any(stem_notes.values()):
+            return b""
+        return stems_to_midi(stem_notes, self.bpm)
+
+
+def create_score(
+    notes: List[Dict[str, Any]],
+    bpm: float,
+    instrument: str,
+    format: str = "musicxml",
+    backend: Optional[str] = None,
+) -> Any:
+    generator = ScoreGenerator(bpm=bpm, backend=backend)
     if format == "midi":
         return generator.generate_midi(notes, instrument)
     return generator.generate_musicxml(notes, instrument)
+
+
+def create_band_score(
+    stem_notes: Dict[str, List[Dict[str, Any]]],
+    bpm: float,
+    format: str = "musicxml",
+    backend: Optional[str] = None,
+) -> Any:
+    generator = ScoreGenerator(bpm=bpm, backend=backend)
+    if format == "midi":
+        return generator.generate_multitrack_midi(stem_notes)
+    return generator.generate_multipart_musicxml(stem_notes)
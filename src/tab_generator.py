@@ -1,11 +1,14 @@
 import gettext
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from music21 import pitch
 
 from src.config import config
+from src.fingering import Candidate, optimize_fingering
+from src.tab_model import TabEvent, Tablature, TabMeasure, render_ascii
 
 # Setup logging
 logging.basicConfig(
@@ -19,15 +22,178 @@ localedir = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../locales
 translate = gettext.translation("messages", localedir, fallback=True)
 _ = translate.gettext
 
+# Candidate positions kept per note for the fingering optimizer
+MAX_CANDIDATES = 6
+# Score penalty for playing a note an octave (or two) away from its pitch
+OCTAVE_SHIFT_PENALTY = 1000
+# Score bonus for a position that matches the measure's chord shape
+CHORD_SHAPE_BONUS = 2000
+# Highest capo position accepted
+MAX_CAPO = 12
+
+# Named tunings per instrument (lowest string first)
+TUNING_PRESETS: Dict[str, Dict[str, List[str]]] = {
+    "guitar": {
+        "standard": ["E2", "A2", "D3", "G3", "B3", "E4"],
+        "half_step_down": ["Eb2", "Ab2", "Db3", "Gb3", "Bb3", "Eb4"],
+        "drop_d": ["D2", "A2", "D3", "G3", "B3", "E4"],
+        "drop_c": ["C2", "G2", "C3", "F3", "A3", "D4"],
+        "dadgad": ["D2", "A2", "D3", "G3", "A3", "D4"],
+        "open_g": ["D2", "G2", "D3", "G3", "B3", "D4"],
+        "open_d": ["D2", "A2", "D3", "F#3", "A3", "D4"],
+    },
+    "bass": {
+        "standard": ["E1", "A1", "D2", "G2"],
+        "half_step_down": ["Eb1", "Ab1", "Db2", "Gb2"],
+        "drop_d": ["D1", "A1", "D2", "G2"],
+        "five_string": ["B0", "E1", "A1", "D2", "G2"],
+    },
+}
+
+# Chord templates are standard-tuning guitar shapes; chord pitch classes are
+# read off this tuning so chord names do not depend on the tab's tuning or capo
+CHORD_REFERENCE_TUNING = (40, 45, 50, 55, 59, 64)
+
+
+def resolve_tuning(instrument: str, tuning: Optional[str] = None) -> List[str]:
+    """
+    Turn a preset name ("drop_d") or comma-separated notes ("D2,A2,D3,G3,B3,E4")
+    into a list of string tunings, lowest first.
+
+    Raises:
+        ValueError: If the preset is unknown or the note list is malformed
+    """
+    presets = TUNING_PRESETS.get(instrument, {})
+    if not tuning:
+        tuning = "standard"
+    if tuning in presets:
+        return list(presets[tuning])
+    strings = [t.strip() for t in tuning.split(",") if t.strip()]
+    if "," not in tuning or not 4 <= len(strings) <= 8:
+        raise ValueError(_("Unknown tuning: {}").format(tuning))
+    for name in strings:
+        try:
+            pitch.Pitch(name).midi
+        except Exception as e:
+            raise ValueError(_("Invalid tuning: {}").format(tuning)) from e
+    return strings
+
+
+def _octave_shifts(role: str) -> List[int]:
+    # Try various octave shifts to fit the range, prioritizing the original pitch
+    if role == "bass":
+        return [0, -12, -24]
+    if role == "melody":
+        return [0, 12, -12]
+    return [0, -12, 12]
+
+
+def _position_score(s_idx: int, fret: int, is_bass: bool, role: str) -> float:
+    """Static playability score of one string/fret (higher is better)."""
+    score = 0
+
+    # 1. Extreme Open Position Preference (The "Easy Tab" Factor)
+    if fret == 0:
+        score += 3000  # Open strings are King
+    elif fret <= 3:
+        score += 1500  # First position is Queen
+    elif fret <= 5:
+        score += 500  # Acceptable
+    else:
+        score -= fret * 100  # Check high frets heavily
+
+    # 2. Role-based string preference
+    if role == "melody":
+        if s_idx >= 3:
+            score += 500
+        if s_idx <= 1:
+            score -= 1000
+    elif role == "bass" or is_bass:
+        if s_idx <= 2:
+            score += 500
+        if s_idx >= 4:
+            score -= 1000
+
+    return score
+
+
+# Roles that change string/octave preferences; anything else scores like harmony
+ROLE_KEYS = ("melody", "bass", "harmony")
+
+
+def _role_key(role: str) -> str:
+    return role if role in ROLE_KEYS else "harmony"
+
+
+class PositionTable:
+    """
+    Playable positions of every MIDI pitch for one tuning, max fret and capo.
+
+    Built once per setup and shared by all generators (see position_table), so
+    choosing a position is a dictionary lookup instead of a scan over octave
+    shifts and strings. Frets are counted from the capo.
+    """
+
+    def __init__(self, tuning: Tuple[int, ...], max_fret: int, capo: int = 0):
+        self.open_pitches = tuple(t + capo for t in tuning)
+        self.max_fret = max_fret - capo
+        # (pitch, is_bass, role) -> per octave shift: ((string, fret, score), ...)
+        self._by_shift: Dict[
+            Tuple[int, bool, str], Tuple[Tuple[Tuple[int, int, float], ...], ...]
+        ] = {}
+        # (pitch, is_bass, role) -> best candidates over all shifts, best first
+        self._ranked: Dict[Tuple[int, bool, str], List[Candidate]] = {}
+        for role in ROLE_KEYS:
+            for is_bass in (False, True):
+                for midi_pitch in range(128):
+                    self._build((midi_pitch, is_bass, role))
+
+    def _build(self, key: Tuple[int, bool, str]):
+        midi_pitch, is_bass, role = key
+        per_shift = []
+        ranked = []
+        for shift_idx, octave_shift in enumerate(_octave_shifts(role)):
+            row = []
+            for s_idx, open_pitch in enumerate(self.open_pitches):
+                fret = midi_pitch + octave_shift - open_pitch
+                if 0 <= fret <= self.max_fret:
+                    score = _position_score(s_idx, fret, is_bass, role)
+                    row.append((s_idx, fret, score))
+                    ranked.append(Candidate(s_idx, fret, score - shift_idx * OCTAVE_SHIFT_PENALTY))
+            per_shift.append(tuple(row))
+        ranked.sort(key=lambda c: -c.score)
+        self._by_shift[key] = tuple(per_shift)
+        self._ranked[key] = ranked[:MAX_CANDIDATES]
+
+    def by_shift(self, midi_pitch: int, is_bass: bool, role: str):
+        key = (midi_pitch, bool(is_bass), _role_key(role))
+        if key not in self._by_shift:
+            self._build(key)  # pitch outside 0-127 (e.g. after transposition)
+        return self._by_shift[key]
+
+    def candidates(self, midi_pitch: int, is_bass: bool, role: str) -> List[Candidate]:
+        key = (midi_pitch, bool(is_bass), _role_key(role))
+        if key not in self._ranked:
+            self._build(key)
+        return self._ranked[key]
+
+
+@lru_cache(maxsize=32)
+def position_table(tuning: Tuple[int, ...], max_fret: int, capo: int = 0) -> PositionTable:
+    """Shared position table for a (tuning, max_fret, capo) setup."""
+    return PositionTable(tuning, max_fret, capo)
+
 
 class TabGenerator:
-    def __init__(self, tuning: List[str] = None, bpm: float = 75):
+
+    def __init__(self, tuning: List[str] = None, bpm: float = 75, capo: int = 0):
         """
         Initialize the TabGenerator.
 
         Args:
             tuning: List of string tunings (default: standard tuning from config)
             bpm: Beats per minute (default: 75, constrained by config limits)
+            capo: Capo fret; tab frets are counted from it (0 = no capo)
         """
         if tuning is None:
             tuning = config.get(
@@ -48,7 +214,11 @@ class TabGenerator:
 
         self.bass_threshold = config.get("tablature", "bass_threshold", 50)
         self.config_max_fret = config.get("tablature", "max_fret", 15)
-        self.capo = 0
+        if not 0 <= capo <= min(MAX_CAPO, self.config_max_fret - 1):
+            raise ValueError(_("Invalid capo position: {}").format(capo))
+        self.capo = capo
+        self._table_key = None
+        self._table: Optional[PositionTable] = None
 
         logger.info(
             _("TabGenerator initialized - Tuning: {}, BPM: {:.1f}").format(tuning, self.bpm)
@@ -104,7 +274,7 @@ class TabGenerator:
         # Filter based on enabled chord types in config (simple implementation)
         # This assumes chord names follow conventions (m, 7, sus, etc.)
         enabled_types = config.get("chord_detection", "enabled_chord_types", {})
-        self.chord_templates = {}
+        chord_templates = {}
 
         for name, template in all_templates.items():
             if "m" in name and "7" not in name and not enabled_types.get("minor", True):
@@ -116,12 +286,56 @@ class TabGenerator:
             if "add9" in name and not enabled_types.get("add9", True):
                 continue
             # Default to include if passing checks or simple major
-            self.chord_templates[name] = template
+            chord_templates[name] = template
+
+        self.chord_templates = chord_templates
+        self.positions()
+
+    @property
+    def chord_templates(self) -> Dict[str, Dict[int, int]]:
+        return self._chord_templates
+
+    @chord_templates.setter
+    def chord_templates(self, templates: Dict[str, Dict[int, int]]):
+        """Store templates with their pitch classes, root and simplicity precomputed."""
+        self._chord_templates = templates
+        self._chord_info: Dict[str, Tuple[FrozenSet[int], Optional[int], bool]] = {}
+        reference = CHORD_REFERENCE_TUNING
+        for name, shape in templates.items():
+            valid_strings = [
+                s for s in sorted(shape.keys()) if s < min(self.num_strings, len(reference))
+            ]
+            pitch_classes = frozenset((reference[s] + shape[s]) % 12 for s in valid_strings)
+            # Root: the lowest string used in the shape that exists on this instrument
+            root = (
+                (reference[valid_strings[0]] + shape[valid_strings[0]]) % 12
+                if valid_strings
+                else None
+            )
+            # Simplicity Bias: Prefer Triads (Major/Minor) over complex chords (7ths, sus, add9)
+            # Major (len 1 or 2 e.g. 'F#') or Minor (len 2 or 3 e.g. 'F#m')
+            is_simple = len(name) <= 3 and "7" not in name and "9" not in name and "sus" not in name
+            self._chord_info[name] = (pitch_classes, root, is_simple)
+
+    def chord_pitch_classes(self, chord_name: str) -> FrozenSet[int]:
+        info = self._chord_info.get(chord_name)
+        return info[0] if info else frozenset()
+
+    def positions(self) -> PositionTable:
+        """Position table for the current tuning, max fret and capo."""
+        key = (tuple(self.tuning), self.config_max_fret, self.capo)
+        if key != self._table_key:
+            self._table = position_table(*key)
+            self._table_key = key
+        return self._table
 
     def _auto_transpose(self, notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Detect key and transpose notes to the nearest guitar-friendly key (C, G, D, A, E).
         Effectively acts as a 'Smart Capo'.
+
+        Returns shifted copies; the caller's notes are left untouched so cached
+        notes can be rendered again (other tunings, capo positions).
         """
         if not notes:
             return notes
@@ -153,11 +367,21 @@ class TabGenerator:
                     best_shift
                 )
             )
-            for n in notes:
-                n["pitch"] += best_shift
+            notes = [{**n, "pitch": n["pitch"] + best_shift} for n in notes]
 
         return notes
 
+    def position_candidates(
+        self, midi_pitch: int, is_bass: bool = False, role: str = "harmony"
+    ) -> List[Candidate]:
+        """
+        Ranked playable positions for a pitch (best first), without chord context.
+
+        Positions in a shifted octave are penalized so the written pitch wins
+        unless it is much harder to play.
+        """
+        return self.positions().candidates(midi_pitch, is_bass, role)
+
     def find_best_pos(
         self,
         midi_pitch: int,
@@ -167,58 +391,24 @@ class TabGenerator:
     ) -> Optional[Tuple[int, int]]:
         """
         Find optimal string and fret position with role-based heuristics.
+
+        Greedy single-note choice; generate_ascii_tab optimizes whole
+        passages with optimize_fingering instead.
         """
         best_cand = None
         max_score = -float("inf")
 
-        # Try various octave shifts to fit the range, prioritizing the original pitch
-        shifts = [0, -12, 12]
-        if role == "bass":
-            shifts = [0, -12, -24]
-        if role == "melody":
-            shifts = [0, 12, -12]
-
-        for octave_shift in shifts:
-            shifted_pitch = midi_pitch + octave_shift
-            for s_idx in range(self.num_strings):
-                fret = shifted_pitch - self.tuning[s_idx]
-
-                # Use self.config_max_fret if available, else 15
-                max_fret = getattr(self, "config_max_fret", 15)
-
-                if 0 <= fret <= max_fret:
-                    score = 0
-
-                    # 1. Extreme Open Position Preference (The "Easy Tab" Factor)
-                    if fret == 0:
-                        score += 3000  # Open strings are King
-                    elif fret <= 3:
-                        score += 1500  # First position is Queen
-                    elif fret <= 5:
-                        score += 500  # Acceptable
-                    else:
-                        score -= fret * 100  # Check high frets heavily
-
-                    # 2. Role-based string preference
-                    if role == "melody":
-                        if s_idx >= 3:
-                            score += 500
-                        if s_idx <= 1:
-                            score -= 1000
-                    elif role == "bass" or is_bass:
-                        if s_idx <= 2:
-                            score += 500
-                        if s_idx >= 4:
-                            score -= 1000
-
-                    # 3. Chord Context
-                    if chord_shape and s_idx in chord_shape and chord_shape[s_idx] == fret:
-                        score += 2000  # Always obey the chord
-
-                    # Select best score
-                    if score > max_score:
-                        max_score = score
-                        best_cand = (s_idx, fret)
+        # Octave shifts are tried in order, prioritizing the original pitch
+        for row in self.positions().by_shift(midi_pitch, is_bass, role):
+            for s_idx, fret, score in row:
+                # 3. Chord Context
+                if chord_shape and chord_shape.get(s_idx) == fret:
+                    score += CHORD_SHAPE_BONUS  # Always obey the chord
+
+                # Select best score
+                if score > max_score:
+                    max_score = score
+                    best_cand = (s_idx, fret)
 
             # If we found an ideal candidate in original octave, stop
             if best_cand and max_score > 2000:
@@ -226,6 +416,46 @@ class TabGenerator:
 
         return best_cand
 
+    def plan_fingering(self, placements: List[Dict[str, Any]]) -> List[Optional[Tuple[int, int]]]:
+        """
+        Choose positions for notes on the tab grid with the DP optimizer.
+
+        Args:
+            placements: Dicts with 'pitch', 'is_bass', 'role', 'chord_shape'
+                and the grid position 'measure'/'slot', sorted by grid position
+
+        Returns:
+            (string, fret) or None for each placement, in the same order
+        """
+        events: List[List[List[Candidate]]] = []
+        owners: List[List[int]] = []
+        last_key = None
+        for index, p in enumerate(placements):
+            shape = p["chord_shape"] or {}
+            candidates = [
+                (
+                    Candidate(c.string, c.fret, c.score + CHORD_SHAPE_BONUS)
+                    if shape.get(c.string) == c.fret
+                    else c
+                )
+                for c in self.position_candidates(p["pitch"], p["is_bass"], p["role"])
+            ]
+            candidates.sort(key=lambda c: -c.score)
+
+            key = (p["measure"], p["slot"])
+            if key != last_key:
+                events.append([])
+                owners.append([])
+                last_key = key
+            events[-1].append(candidates)
+            owners[-1].append(index)
+
+        positions: List[Optional[Tuple[int, int]]] = [None] * len(placements)
+        for event_owners, event_positions in zip(owners, optimize_fingering(events)):
+            for index, pos in zip(event_owners, event_positions):
+                positions[index] = pos
+        return positions
+
     def generate_ascii_tab(self, notes: List[Dict[str, Any]]) -> str:
         """
         Generate ASCII tablature from a list of notes.
@@ -242,6 +472,19 @@ class TabGenerator:
         if not notes:
             logger.warning(_("No notes provided for tab generation"))
             return _("No notes detected.")
+        return render_ascii(self.generate_tab(notes))
+
+    def generate_tab(self, notes: List[Dict[str, Any]]) -> Tablature:
+        """
+        Build the structured tablature (measures, chords, string/fret events) for notes.
+
+        Render it with the functions in src.tab_model (ASCII, JSON, MusicXML).
+
+        Raises:
+            ValueError: If a note is missing required fields
+        """
+        if not notes:
+            return Tablature(list(self.tuning), list(self.tuning_names), self.bpm, capo=self.capo)
 
         try:
             # Auto-Transpose (Smart Capo)
@@ -259,24 +502,27 @@ class TabGenerator:
                 )
             )
 
-            # Initialize tab grid
-            full_tab = [
-                [["-" for ___ in range(slots_per_measure)] for ___ in range(num_measures)]
-                for ___ in range(self.num_strings)
+            # Occupancy grid: one byte row per string, measures laid end to end
+            occupied = [
+                bytearray(num_measures * slots_per_measure) for ___ in range(self.num_strings)
             ]
-            measure_chords = ["N.C." for ___ in range(num_measures)]
-
-            # Detect chords for each measure
-            for m_idx in range(num_measures):
-                m_notes = [n for n in notes if int(n["start"] / sec_per_measure) == m_idx]
-                measure_chords[m_idx] = self.detect_chord(m_notes)
 
-            # Place notes on the tab
+            # Bucket notes by measure in one pass
+            measure_notes: List[List[Dict[str, Any]]] = [[] for ___ in range(num_measures)]
             for n in notes:
                 m_idx = int(n["start"] / sec_per_measure)
-                if m_idx >= num_measures:
-                    continue
+                if m_idx < num_measures:
+                    measure_notes[m_idx].append(n)
+
+            # Detect chords for each measure
+            measure_chords = [self.detect_chord(m_notes) for m_notes in measure_notes]
+            measures = [TabMeasure(chord) for chord in measure_chords]
 
+            snap_to_chord = config.get("post_processing", "snap_harmony_to_key", True)
+
+            # Collect playable notes with their grid position and context
+            placements = []
+            for m_idx, n in ((m, n) for m, m_notes in enumerate(measure_notes) for n in m_notes):
                 chord_name = measure_chords[m_idx]
                 current_shape = self.chord_templates.get(chord_name, {})
 
@@ -285,50 +531,61 @@ class TabGenerator:
                 # Harmonic Filtering
                 # If enabled, remove 'harmony' notes that don't fit the detected chord
                 # This drastically cleans up the arrangement to sound like the chord.
-                snap_to_chord = config.get("post_processing", "snap_harmony_to_key", True)
                 if snap_to_chord and role == "harmony" and chord_name != "N.C." and current_shape:
-                    # Calculate allowable pitches (semitone classes 0-11)
-                    allowable_pcs = set()
-                    for s, f in current_shape.items():
-                        if s < self.num_strings:
-                            p = (self.tuning[s] + f) % 12
-                            allowable_pcs.add(p)
-
-                    if (n["pitch"] % 12) not in allowable_pcs:
+                    # Allowable pitches (semitone classes 0-11) of the chord
+                    if (n["pitch"] % 12) not in self.chord_pitch_classes(chord_name):
                         continue  # Skip this note (dissonant / busy)
 
-                # Role overrides distinct is_bass logic usually, but keep fallback
-                is_bass = (role == "bass") or (n["pitch"] <= self.bass_threshold)
-
-                pos = self.find_best_pos(
-                    n["pitch"], is_bass=is_bass, chord_shape=current_shape, role=role
+                rel_time = n["start"] % sec_per_measure
+                placements.append(
+                    {
+                        "pitch": n["pitch"],
+                        # Role overrides distinct is_bass logic usually, but keep fallback
+                        "is_bass": (role == "bass") or (n["pitch"] <= self.bass_threshold),
+                        "role": role,
+                        "chord_shape": current_shape,
+                        "measure": m_idx,
+                        "slot": int((rel_time / sec_per_measure) * slots_per_measure),
+                    }
                 )
 
-                if pos:
-                    s_idx, fret = pos
-                    rel_time = n["start"] % sec_per_measure
-                    slot_idx = int((rel_time / sec_per_measure) * slots_per_measure)
-                    line_idx = self.num_strings - 1 - s_idx
-
-                    fret_str = str(fret)
-                    for i, c in enumerate(fret_str):
-                        write_idx = slot_idx + i
-                        if write_idx < slots_per_measure:
-                            # 1. Collision Check (Don't overwrite existing notes)
-                            if full_tab[line_idx][m_idx][write_idx] != "-":
-                                continue
-
-                            # 2. Physical Spacer Check (Don't play same string too fast)
-                            # If previous 16th note on this string was played, skip this one
-                            # This clears up the 'machine gun' effect (1-1-1-1)
-                            if write_idx > 0 and full_tab[line_idx][m_idx][write_idx - 1] != "-":
-                                continue
-
-                            # Write the note
-                            full_tab[line_idx][m_idx][write_idx] = c
+            # Fingering is chosen over the whole passage so the hand does not jump around
+            placements.sort(key=lambda p: (p["measure"], p["slot"]))
+            positions = self.plan_fingering(placements)
+
+            # Place notes on the tab
+            for placement, pos in zip(placements, positions):
+                if not pos:
+                    continue
+                s_idx, fret = pos
+                m_idx = placement["measure"]
+                slot_idx = placement["slot"]
+                row = occupied[s_idx]
+                base = m_idx * slots_per_measure
+                width = min(len(str(fret)), slots_per_measure - slot_idx)
+
+                # 1. Collision Check (Don't overwrite existing notes, including multi-digit frets)
+                if any(row[base + slot_idx : base + slot_idx + width]):
+                    continue
+
+                # 2. Physical Spacer Check (Don't play same string too fast)
+                # If previous 16th note on this string was played, skip this one
+                # This clears up the 'machine gun' effect (1-1-1-1)
+                if slot_idx > 0 and row[base + slot_idx - 1]:
+                    continue
+
+                row[base + slot_idx : base + slot_idx + width] = b"\x01" * width
+                measures[m_idx].events.append(TabEvent(slot_idx, s_idx, fret))
 
             logger.info(_("Tab generation completed successfully"))
-            return self._render_layout(full_tab, measure_chords, num_measures, slots_per_measure)
+            return Tablature(
+                tuning=list(self.tuning),
+                tuning_names=list(self.tuning_names),
+                bpm=self.bpm,
+                slots_per_measure=slots_per_measure,
+                capo=self.capo,
+                measures=measures,
+            )
 
         except KeyError as e:
             logger.error(_("Missing required note field: {}").format(str(e)))
@@ -351,29 +608,18 @@ class TabGenerator:
             return "N.C."
 
         pitches = [n["pitch"] % 12 for n in m_notes]
+        present = set(pitches)
         scores = {}
 
-        for name, shape in self.chord_templates.items():
-            template_pitches = set(
-                [(self.tuning[s] + f) % 12 for s, f in shape.items() if s < self.num_strings]
-            )
+        for name, (template_pitches, root_pitch, is_simple) in self._chord_info.items():
             scores[name] = sum(3 for p in pitches if p in template_pitches)
 
             # Root note bonus
-            if shape:
-                # Find the lowest string used in the shape that exists on this instrument
-                valid_strings = [s for s in sorted(shape.keys()) if s < self.num_strings]
-                if valid_strings:
-                    first_s = valid_strings[0]
-                    root_pitch = (self.tuning[first_s] + shape[first_s]) % 12
-                    if root_pitch in pitches:
-                        scores[name] += 5
+            if root_pitch is not None and root_pitch in present:
+                scores[name] += 5
 
-            # Simplicity Bias: Prefer Triads (Major/Minor) over complex chords (7ths, sus, add9)
-            # This makes the chord progression more "standard/popular" unless strong evidence exists.
-            is_simple = len(name) <= 3 and "7" not in name and "9" not in name and "sus" not in name
-            # Major (len 1 or 2 e.g. 'F#') or Minor (len 2 or 3 e.g. 'F#m')
-            # Adjust bias as needed. 4 points = roughly 1-2 matching notes worth.
+            # Simplicity Bias: makes the chord progression more "standard/popular"
+            # unless strong evidence exists. 4 points = roughly 1-2 matching notes worth.
             if is_simple:
                 scores[name] += 4
 
@@ -386,48 +632,21 @@ class TabGenerator:
 
         return detected
 
-    def _render_layout(self, full_tab, measure_chords, num_measures, slots_per_measure):
-        measures_per_line = config.get("tablature", "measures_per_line", 4)
-
-        # Generate headers based on tuning names (high to low)
-        headers = []
-        for i in range(self.num_strings - 1, -1, -1):
-            name = self.tuning_names[i]
-            # Convert to e, B, G, etc.
-            if i == self.num_strings - 1:  # Highest string
-                name = name.lower()
-            headers.append(f"{name}|")
-
-        header_text = _("🎸 Fingerstyle Precision Analysis")
-        output = [f"{header_text} (BPM: {self.bpm:.1f})\n"]
-
-        for start_m in range(0, num_measures, measures_per_line):
-            end_m = min(start_m + measures_per_line, num_measures)
-            chord_line = "  "
-            for m_idx in range(start_m, end_m):
-                chord_line += measure_chords[m_idx].ljust(slots_per_measure) + " "
-            output.append(chord_line)
-
-            for s_idx in range(self.num_strings):
-                line = headers[s_idx]
-                for m_idx in range(start_m, end_m):
-                    line += "".join(full_tab[s_idx][m_idx]) + "|"
-                output.append(line)
-            output.append("")
-
-        return "\n".join(output)
-
 
-def create_tab(notes: List[Dict[str, Any]], bpm: float = 75) -> str:
+def create_tab(
+    notes: List[Dict[str, Any]], bpm: float = 75, tuning: List[str] = None, capo: int = 0
+) -> str:
     """
     Convenience function to create a tablature from notes.
 
     Args:
         notes: List of note dictionaries
         bpm: Beats per minute (default: 75)
+        tuning: List of string tunings (default: standard tuning)
+        capo: Capo fret (default: 0)
 
     Returns:
         ASCII tablature string
     """
-    generator = TabGenerator(bpm=bpm)
+    generator = TabGenerator(tuning=tuning, bpm=bpm, capo=capo)
     return generator.generate_ascii_tab(notes)
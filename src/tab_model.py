@@ -0,0 +1,315 @@
+"""
+Structured tablature model and its renderers.
+
+TabGenerator builds a ``Tablature`` once (measures, chord names and
+string/fret events on a slot grid). It is cached as compact JSON, and every
+presentation - ASCII, JSON for the client, MusicXML tablature - is rendered
+from it on demand, so changing the layout never re-runs transcription.
+"""
+
+import gettext
+import io
+import os
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence
+from xml.sax.saxutils import XMLGenerator
+
+from src.config import config
+from src.musicxml_writer import DOCTYPE, STEPS, split_duration
+
+# Internationalization Setup
+localedir = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../locales")
+translate = gettext.translation("messages", localedir, fallback=True)
+_ = translate.gettext
+
+MODEL_VERSION = 1
+
+
+@dataclass
+class TabEvent:
+    """One fretted (or open) note: slot within the measure, string index (0 = lowest), fret."""
+
+    slot: int
+    string: int
+    fret: int
+
+
+@dataclass
+class TabMeasure:
+    chord: str = "N.C."
+    events: List[TabEvent] = field(default_factory=list)
+
+
+@dataclass
+class Tablature:
+    tuning: List[int]  # open-string MIDI pitches, lowest string first
+    tuning_names: List[str]
+    bpm: float
+    slots_per_measure: int = 16
+    beats_per_measure: int = 4
+    capo: int = 0
+    measures: List[TabMeasure] = field(default_factory=list)
+    first_measure: int = 0  # index of measures[0] in the song (non-zero for a measure range)
+
+    @property
+    def num_strings(self) -> int:
+        return len(self.tuning)
+
+    def measure_range(self, start: int, count: int) -> "Tablature":
+        """Measures [start, start + count) as a tablature of their own (shares the events)."""
+        start = max(0, start)
+        return replace(
+            self,
+            measures=self.measures[start : start + max(0, count)],
+            first_measure=self.first_measure + start,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON form: events are [slot, string, fret] triples."""
+        return {
+            "version": MODEL_VERSION,
+            "tuning": self.tuning,
+            "tuning_names": self.tuning_names,
+            "bpm": self.bpm,
+            "slots_per_measure": self.slots_per_measure,
+            "beats_per_measure": self.beats_per_measure,
+            "capo": self.capo,
+            "first_measure": self.first_measure,
+            "measures": [
+                {"chord": m.chord, "events": [[e.slot, e.string, e.fret] for e in m.events]}
+                for m in self.measures
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Tablature":
+        return cls(
+            tuning=list(data["tuning"]),
+            tuning_names=list(data["tuning_names"]),
+            bpm=data["bpm"],
+            slots_per_measure=data.get("slots_per_measure", 16),
+            beats_per_measure=data.get("beats_per_measure", 4),
+            capo=data.get("capo", 0),
+            measures=[
+                TabMeasure(m["chord"], [TabEvent(*event) for event in m["events"]])
+                for m in data["measures"]
+            ],
+            first_measure=data.get("first_measure", 0),
+        )
+
+
+def render_ascii(tab: Tablature, measures_per_line: Optional[int] = None) -> str:
+    """Render the classic ASCII tab (highest string on top)."""
+    if not tab.measures:
+        return _("No notes detected.")
+    if measures_per_line is None:
+        measures_per_line = config.get("tablature", "measures_per_line", 4)
+    slots = tab.slots_per_measure
+    num_measures = len(tab.measures)
+
+    # One byte row per string line (high to low), measures laid end to end
+    rows = [bytearray(b"-" * (num_measures * slots)) for ___ in range(tab.num_strings)]
+    for m_idx, measure in enumerate(tab.measures):
+        base = m_idx * slots
+        for event in measure.events:
+            row = rows[tab.num_strings - 1 - event.string]
+            digits = str(event.fret).encode()[: max(0, slots - event.slot)]
+            row[base + event.slot : base + event.slot + len(digits)] = digits
+
+    # Generate headers based on tuning names (high to low)
+    headers = []
+    for i in range(tab.num_strings - 1, -1, -1):
+        name = tab.tuning_names[i]
+        # Convert to e, B, G, etc.
+        if i == tab.num_strings - 1:  # Highest string
+            name = name.lower()
+        headers.append(f"{name}|")
+
+    header_text = _("🎸 Fingerstyle Precision Analysis")
+    output = [f"{header_text} (BPM: {tab.bpm:.1f})\n"]
+
+    for start_m in range(0, num_measures, measures_per_line):
+        end_m = min(start_m + measures_per_line, num_measures)
+        chord_line = "  "
+        for m_idx in range(start_m, end_m):
+            chord_line += tab.measures[m_idx].chord.ljust(slots) + " "
+        output.append(chord_line)
+
+        for s_idx in range(tab.num_strings):
+            row = rows[s_idx]
+            cells = b"|".join(
+                row[m_idx * slots : (m_idx + 1) * slots] for m_idx in range(start_m, end_m)
+            )
+            output.append(headers[s_idx] + cells.decode("ascii") + "|")
+        output.append("")
+
+    return "\n".join(output)
+
+
+def render_json(tab: Tablature) -> Dict[str, Any]:
+    return tab.to_dict()
+
+
+def _text(xml: XMLGenerator, name: str, value, attrs: Optional[Dict[str, str]] = None):
+    xml.startElement(name, attrs or {})
+    xml.characters(str(value))
+    xml.endElement(name)
+
+
+def _empty(xml: XMLGenerator, name: str, attrs: Optional[Dict[str, str]] = None):
+    xml.startElement(name, attrs or {})
+    xml.endElement(name)
+
+
+def _tab_note(
+    xml: XMLGenerator,
+    duration: int,
+    note_type: str,
+    dots: int,
+    pitch: Optional[int] = None,
+    string: Optional[int] = None,
+    fret: Optional[int] = None,
+    chord: bool = False,
+    ties: Sequence[str] = (),
+):
+    """One <note>: a rest when pitch is None, otherwise a pitched note with string/fret marks."""
+    xml.startElement("note", {})
+    if chord:
+        _empty(xml, "chord")
+    if pitch is None:
+        _empty(xml, "rest")
+    else:
+        step, alter = STEPS[pitch % 12]
+        xml.startElement("pitch", {})
+        _text(xml, "step", step)
+        if alter:
+            _text(xml, "alter", alter)
+        _text(xml, "octave", pitch // 12 - 1)
+        xml.endElement("pitch")
+    _text(xml, "duration", duration)
+    for tie in ties:
+        _empty(xml, "tie", {"type": tie})
+    _text(xml, "voice", 1)
+    _text(xml, "type", note_type)
+    for ___ in range(dots):
+        _empty(xml, "dot")
+    if pitch is not None:
+        xml.startElement("notations", {})
+        for tie in ties:
+            _empty(xml, "tied", {"type": tie})
+        xml.startElement("technical", {})
+        _text(xml, "string", string)
+        _text(xml, "fret", fret)
+        xml.endElement("technical")
+        xml.endElement("notations")
+    xml.endElement("note")
+
+
+def _tab_rest(xml: XMLGenerator, steps: int):
+    for piece, note_type, dots in split_duration(steps):
+        _tab_note(xml, piece, note_type, dots)
+
+
+def _tab_attributes(xml: XMLGenerator, tab: Tablature):
+    """First-measure attributes: time signature, TAB clef and the tuning of every string."""
+    xml.startElement("attributes", {})
+    _text(xml, "divisions", 4)
+    xml.startElement("time", {})
+    _text(xml, "beats", tab.beats_per_measure)
+    _text(xml, "beat-type", 4)
+    xml.endElement("time")
+    xml.startElement("clef", {})
+    _text(xml, "sign", "TAB")
+    _text(xml, "line", 5)
+    xml.endElement("clef")
+    xml.startElement("staff-details", {})
+    _text(xml, "staff-lines", tab.num_strings)
+    for s_idx, open_pitch in enumerate(tab.tuning):
+        step, alter = STEPS[open_pitch % 12]
+        xml.startElement("staff-tuning", {"line": str(s_idx + 1)})
+        _text(xml, "tuning-step", step)
+        if alter:
+            _text(xml, "tuning-alter", alter)
+        _text(xml, "tuning-octave", open_pitch // 12 - 1)
+        xml.endElement("staff-tuning")
+    if tab.capo:
+        _text(xml, "capo", tab.capo)
+    xml.endElement("staff-details")
+    xml.endElement("attributes")
+
+
+def _tab_measure_notes(xml: XMLGenerator, tab: Tablature, measure: TabMeasure):
+    """Notes of one measure; each chord lasts until the next onset (rests fill the gaps)."""
+    # split_duration works in sixteenth-note steps
+    measure_steps = tab.beats_per_measure * 4
+    steps_per_slot = measure_steps / tab.slots_per_measure
+
+    onsets: Dict[int, List[TabEvent]] = {}
+    for event in measure.events:
+        onsets.setdefault(event.slot, []).append(event)
+    starts = sorted(onsets)
+    cursor = 0
+    for i, slot in enumerate(starts):
+        start = min(int(round(slot * steps_per_slot)), measure_steps - 1)
+        if start > cursor:
+            _tab_rest(xml, start - cursor)
+            cursor = start
+        if i + 1 < len(starts):
+            end = max(1, int(round(starts[i + 1] * steps_per_slot)))
+        else:
+            end = measure_steps
+        end = min(max(end, cursor + 1), measure_steps)
+        chord = sorted(onsets[slot], key=lambda e: e.string)
+        pieces = split_duration(end - cursor)
+        for p_idx, (duration, note_type, dots) in enumerate(pieces):
+            ties = (["stop"] if p_idx > 0 else []) + (["start"] if p_idx < len(pieces) - 1 else [])
+            for c_idx, event in enumerate(chord):
+                _tab_note(
+                    xml,
+                    duration,
+                    note_type,
+                    dots,
+                    pitch=tab.tuning[event.string] + tab.capo + event.fret,
+                    string=tab.num_strings
+                    - event.string,  # MusicXML counts strings from the highest
+                    fret=event.fret,
+                    chord=c_idx > 0,
+                    ties=ties,
+                )
+        cursor = end
+    if cursor < measure_steps:
+        _tab_rest(xml, measure_steps - cursor)
+
+
+def render_musicxml(tab: Tablature, title: str = "", instrument_name: str = "Guitar") -> str:
+    """Render MusicXML with a TAB staff (string/fret technical marks on every note).
+
+    Notes starting on the same slot form a chord; each chord lasts until the
+    next onset in the measure.
+    """
+    buffer = io.StringIO()
+    xml = XMLGenerator(buffer, encoding="utf-8", short_empty_elements=True)
+
+    xml.startDocument()
+    buffer.write(DOCTYPE)
+    xml.startElement("score-partwise", {"version": "4.0"})
+    xml.startElement("work", {})
+    _text(xml, "work-title", title)
+    xml.endElement("work")
+    xml.startElement("part-list", {})
+    xml.startElement("score-part", {"id": "P1"})
+    _text(xml, "part-name", instrument_name)
+    xml.endElement("score-part")
+    xml.endElement("part-list")
+
+    xml.startElement("part", {"id": "P1"})
+    for m_idx, measure in enumerate(tab.measures):
+        xml.startElement("measure", {"number": str(tab.first_measure + m_idx + 1)})
+        if m_idx == 0:
+            _tab_attributes(xml, tab)
+        _tab_measure_notes(xml, tab, measure)
+        xml.endElement("measure")
+    xml.endElement("part")
+    xml.endElement("score-partwise")
+    xml.endDocument()
+    return buffer.getvalue()
@@ -142,6 +142,198 @@ def _transcribe_chunk(
 
 from src.audio_processor import separate_audio
 
+# Stem name -> arrangement role
+STEM_ROLES = {
+    "vocals": "melody",
+    "bass": "bass",
+    "drums": "percussion",  # Drums usually ignored for melody notes but good for rhythm
+    "guitar": "harmony",
+    "piano": "harmony",
+    "other": "harmony",
+}
+
+# Stems without pitch content - Basic Pitch only turns them into noise notes
+UNPITCHED_STEMS = {"drums"}
+
+
+def _detect_bpm(
+    stems: Dict[str, str], audio_path: str, duration: float = None, start_offset: float = 0.0
+) -> float:
+    """Detect tempo from the most rhythmic source available (drums > original > bass)."""
+    bpm_source = stems.get("drums", stems.get("original", stems.get("bass", audio_path)))
+    logger.info(_("Detecting tempo from: {}").format(os.path.basename(bpm_source)))
+
+    bpm_detect_duration = min(60, duration if duration else 60)
+    y, sr = librosa.load(bpm_source, offset=start_offset, duration=bpm_detect_duration)
+    tempo, __ = librosa.beat.beat_track(y=y, sr=sr)
+    detected_bpm = float(tempo)
+    logger.info(_("Detected BPM: {:.2f}").format(detected_bpm))
+    return detected_bpm
+
+
+def _transcribe_stem(
+    path: str, role: str, duration: float = None, start_offset: float = 0.0
+) -> List[Dict[str, Any]]:
+    """Transcribe one stem file (chunked in parallel when long) and tag notes with a role."""
+    if not os.path.exists(path):
+        return []
+
+    # Determine duration for this stem
+    s_dur = float(librosa.get_duration(path=path))
+    if duration:
+        s_dur = min(s_dur, duration)
+
+    parallel_threshold = config.get("audio", "parallel_threshold", 45.0)
+
+    stem_notes = []
+    if s_dur < parallel_threshold:
+        stem_notes = _transcribe_chunk(path, duration=s_dur, start_offset=start_offset)
+    else:
+        # Parallel chunking for this stem
+        chunk_size = config.get("audio", "chunk_size", 30.0)
+        overlap = config.get("audio", "chunk_overlap", 2.0)
+        chunks = []
+        curr = start_offset
+        end_t = start_offset + s_dur
+        while curr < end_t:
+            d = min(chunk_size + overlap, end_t - curr)
+            chunks.append((curr, d))
+            if curr + chunk_size >= end_t:
+                break
+            curr += chunk_size
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_transcribe_chunk, path, d, s) for s, d in chunks]
+            for f in futures:
+                try:
+                    stem_notes.extend(f.result())
+                except Exception as e:
+                    logger.warning(f"Chunk transcription failed: {e}")
+
+    # Assign role
+    for n in stem_notes:
+        n["role"] = role
+    return stem_notes
+
+
+def stem_level_db(path: str, blocksize: int = 65536) -> float:
+    """RMS level of an audio file in dBFS, read block by block."""
+    import soundfile as sf
+
+    total = 0.0
+    count = 0
+    for block in sf.blocks(path, blocksize=blocksize, dtype="float32", always_2d=True):
+        total += float(np.square(block, dtype=np.float64).sum())
+        count += block.size
+    if not count or total <= 0:
+        return float("-inf")
+    return float(10 * np.log10(total / count))
+
+
+def is_silent_stem(path: str) -> bool:
+    """True when a separated stem carries (almost) nothing worth transcribing."""
+    threshold = config.get("transcription", "silence_threshold_db", -50.0)
+    try:
+        return stem_level_db(path) < threshold
+    except Exception as e:
+        logger.warning(f"Could not measure stem level for {path}: {e}")
+        return False
+
+
+def _clean_and_quantize(notes: List[Dict[str, Any]], bpm: float) -> List[Dict[str, Any]]:
+    """Velocity/duration filter, 16th-note snapping and per-onset polyphony limit."""
+    if not notes:
+        return []
+
+    min_vel = config.get("post_processing", "min_velocity", 0.3)
+    min_dur = config.get("post_processing", "min_note_duration", 0.1)
+    do_quantize = config.get("post_processing", "quantize", True)
+
+    # 16th note duration in seconds
+    beat_dur = 60.0 / bpm
+    sixteenth_dur = beat_dur / 4.0
+
+    cleaned = []
+    # Enforce strict fingering limits
+    max_poly = config.get("post_processing", "max_polyphony", 3)  # Reduced from 4 to 3
+
+    for n in notes:
+        # Velocity Filter
+        if n["velocity"] < min_vel:
+            continue
+
+        # Duration Filter
+        if (n["end"] - n["start"]) < min_dur:
+            continue
+
+        new_n = n.copy()
+        if do_quantize:
+            # Snap start to nearest 16th
+            grid_idx = round(n["start"] / sixteenth_dur)
+            new_n["start"] = grid_idx * sixteenth_dur
+            new_n["end"] = max(new_n["start"] + sixteenth_dur, n["end"])
+
+        cleaned.append(new_n)
+
+    # Polyphony Limiter & Deduplicate
+    # Group by start time
+    time_groups = {}
+    for n in cleaned:
+        t = int(n["start"] * 100)
+        if t not in time_groups:
+            time_groups[t] = []
+        time_groups[t].append(n)
+
+    final_notes = []
+    for t, group in time_groups.items():
+        # Deduplicate pitches at same time
+        pitch_map = {}
+        for n in group:
+            if n["pitch"] not in pitch_map or n["velocity"] > pitch_map[n["pitch"]]["velocity"]:
+                pitch_map[n["pitch"]] = n
+
+        unique_in_group = list(pitch_map.values())
+
+        # Priority Sorting: Melody > Bass > Harmony > Velocity
+        # We need to rely on the role assigned earlier OR pitch
+        # Heuristic: Highest pitch = Melody, Lowest = Bass. Middle = Harmony.
+        unique_in_group.sort(key=lambda x: x["pitch"])
+
+        # If we have too many notes, keep:
+        # 1. The highest note (Melody)
+        # 2. The lowest note (Bass)
+        # 3. The loudest remaining notes
+        if len(unique_in_group) > max_poly:
+            melody = unique_in_group[-1]
+            bass = unique_in_group[0]
+            others = unique_in_group[1:-1]
+
+            # Keep top (max_poly - 2) from others
+            others.sort(key=lambda x: -x["velocity"])
+            keep_others = others[: max(0, max_poly - 2)]
+
+            limited_group = [bass] + keep_others + [melody]
+            # Remove duplicates if bass==melody (unlikely but possible)
+            unique_in_group = []
+            seen_p = set()
+            for n in limited_group:
+                if n["pitch"] not in seen_p:
+                    unique_in_group.append(n)
+                    seen_p.add(n["pitch"])
+
+        final_notes.extend(unique_in_group)
+
+    # Horizontal Cleaning (Speed Limit)
+    # If notes are too close together (humanly impossible 32nd notes strumming?), thin them out.
+    # Simple implementation: Ensure unique start times are at least X ms apart?
+    # No, 16th quantization handles that.
+    # But we might have too many 16th notes in a row (machine gun effect).
+    # Let's trust quantization for now, but the Polyphony Limit is key.
+
+    return sorted(final_notes, key=lambda x: x["start"])
+
 
 def transcribe_audio(
     audio_path: str, duration: float = None, start_offset: float = 0.0, target_stem: str = None
@@ -157,77 +349,19 @@ def transcribe_audio(
     stems = separate_audio(audio_path_str)
 
     # 1. Detect BPM (Use original or drums/bass for best rhythm)
-    bpm_source = stems.get("drums", stems.get("original", stems.get("bass", audio_path_str)))
-    logger.info(_("Detecting tempo from: {}").format(os.path.basename(bpm_source)))
-
-    bpm_detect_duration = min(60, duration if duration else 60)
-    y, sr = librosa.load(bpm_source, offset=start_offset, duration=bpm_detect_duration)
-    tempo, __ = librosa.beat.beat_track(y=y, sr=sr)
-    detected_bpm = float(tempo)
-    logger.info(_("Detected BPM: {:.2f}").format(detected_bpm))
+    detected_bpm = _detect_bpm(stems, audio_path_str, duration, start_offset)
 
     # 2. Transcription Logic
     all_notes = []
 
-    # Helper to transcribe a specific file and assign a role
     def process_stem(path: str, role: str) -> List[Dict[str, Any]]:
-        if not os.path.exists(path):
-            return []
-
-        # Determine duration for this stem
-        s_dur = float(librosa.get_duration(path=path))
-        if duration:
-            s_dur = min(s_dur, duration)
-
-        parallel_threshold = config.get("audio", "parallel_threshold", 45.0)
-
-        stem_notes = []
-        if s_dur < parallel_threshold:
-            stem_notes = _transcribe_chunk(path, duration=s_dur, start_offset=start_offset)
-        else:
-            # Parallel chunking for this stem
-            chunk_size = config.get("audio", "chunk_size", 30.0)
-            overlap = config.get("audio", "chunk_overlap", 2.0)
-            chunks = []
-            curr = start_offset
-            end_t = start_offset + s_dur
-            while curr < end_t:
-                d = min(chunk_size + overlap, end_t - curr)
-                chunks.append((curr, d))
-                if curr + chunk_size >= end_t:
-                    break
-                curr += chunk_size
-
-            from concurrent.futures import ThreadPoolExecutor
-
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [executor.submit(_transcribe_chunk, path, d, s) for s, d in chunks]
-                for f in futures:
-                    try:
-                        stem_notes.extend(f.result())
-                    except:
-                        pass
-
-        # Assign role
-        for n in stem_notes:
-            n["role"] = role
-        return stem_notes
+        return _transcribe_stem(path, role, duration, start_offset)
 
     # If we have stems, process them
     if "vocals" in stems:
         if target_stem:
             logger.info(_("Transcribing single stem: {}").format(target_stem))
 
-            # Map stems to role
-            role_map = {
-                "vocals": "melody",
-                "bass": "bass",
-                "drums": "percussion",  # Drums usually ignored for melody notes but good for rhythm
-                "guitar": "harmony",
-                "piano": "harmony",
-                "other": "harmony",
-            }
-
             # Handle special cases where target_stem might not exist in dictionary keys directly but we want to map it
             # e.g. user asks for 'guitar' but we only have 4-stem model ('other')
             # For now assume exact match or fallback
@@ -237,7 +371,7 @@ def transcribe_audio(
                 stem_path = stems["other"]  # Fallback for 4-stem
 
             if stem_path:
-                role = role_map.get(target_stem, "harmony")
+                role = STEM_ROLES.get(target_stem, "harmony")
                 all_notes = process_stem(stem_path, role)
             else:
                 logger.warning(f"Target stem {target_stem} not found in separated files.")
@@ -287,99 +421,60 @@ def transcribe_audio(
         key=lambda x: (x["start"], role_priority.get(x.get("role", "harmony"), 2), -x["velocity"])
     )
 
-    # Define _clean_and_quantize helper
-    def _clean_and_quantize(notes: List[Dict[str, Any]], bpm: float) -> List[Dict[str, Any]]:
-        if not notes:
-            return []
-
-        min_vel = config.get("post_processing", "min_velocity", 0.3)
-        min_dur = config.get("post_processing", "min_note_duration", 0.1)
-        do_quantize = config.get("post_processing", "quantize", True)
-
-        # 16th note duration in seconds
-        beat_dur = 60.0 / bpm
-        sixteenth_dur = beat_dur / 4.0
-
-        cleaned = []
-        # Enforce strict fingering limits
-        max_poly = config.get("post_processing", "max_polyphony", 3)  # Reduced from 4 to 3
-
-        for n in notes:
-            # Velocity Filter
-            if n["velocity"] < min_vel:
-                continue
-
-            # Duration Filter
-            if (n["end"] - n["start"]) < min_dur:
-                continue
-
-            new_n = n.copy()
-            if do_quantize:
-                # Snap start to nearest 16th
-                grid_idx = round(n["start"] / sixteenth_dur)
-                new_n["start"] = grid_idx * sixteenth_dur
-                new_n["end"] = max(new_n["start"] + sixteenth_dur, n["end"])
-
-            cleaned.append(new_n)
-
-        # Polyphony Limiter & Deduplicate
-        # Group by start time
-        time_groups = {}
-        for n in cleaned:
-            t = int(n["start"] * 100)
-            if t not in time_groups:
-                time_groups[t] = []
-            time_groups[t].append(n)
-
-        final_notes = []
-        for t, group in time_groups.items():
-            # Deduplicate pitches at same time
-            pitch_map = {}
-            for n in group:
-                if n["pitch"] not in pitch_map or n["velocity"] > pitch_map[n["pitch"]]["velocity"]:
-                    pitch_map[n["pitch"]] = n
-
-            unique_in_group = list(pitch_map.values())
-
-            # Priority Sorting: Melody > Bass > Harmony > Velocity
-            # We need to rely on the role assigned earlier OR pitch
-            # Heuristic: Highest pitch = Melody, Lowest = Bass. Middle = Harmony.
-            unique_in_group.sort(key=lambda x: x["pitch"])
-
-            # If we have too many notes, keep:
-            # 1. The highest note (Melody)
-            # 2. The lowest note (Bass)
-            # 3. The loudest remaining notes
-            if len(unique_in_group) > max_poly:
-                melody = unique_in_group[-1]
-                bass = unique_in_group[0]
-                others = unique_in_group[1:-1]
-
-                # Keep top (max_poly - 2) from others
-                others.sort(key=lambda x: -x["velocity"])
-                keep_others = others[: max(0, max_poly - 2)]
-
-                limited_group = [bass] + keep_others + [melody]
-                # Remove duplicates if bass==melody (unlikely but possible)
-                unique_in_group = []
-                seen_p = set()
-                for n in limited_group:
-                    if n["pitch"] not in seen_p:
-                        unique_in_group.append(n)
-                        seen_p.add(n["pitch"])
-
-            final_notes.extend(unique_in_group)
-
-        # Horizontal Cleaning (Speed Limit)
-        # If notes are too close together (humanly impossible 32nd notes strumming?), thin them out.
-        # Simple implementation: Ensure unique start times are at least X ms apart?
-        # No, 16th quantization handles that.
-        # But we might have too many 16th notes in a row (machine gun effect).
-        # Let's trust quantization for now, but the Polyphony Limit is key.
-
-        return sorted(final_notes, key=lambda x: x["start"])
-
     # Apply cleaning
     unique_notes = _clean_and_quantize(all_notes, detected_bpm)
 
     return unique_notes, detected_bpm
+
+
+def transcribe_stems(
+    audio_path: str, duration: float = None, start_offset: float = 0.0
+) -> Tuple[Dict[str, List[Dict[str, Any]]], float]:
+    """
+    Transcribe every non-silent stem in one run for a multi-part score.
+
+    Separation and BPM detection happen once and stems are transcribed in
+    parallel. Each stem is cleaned on its own (per-instrument polyphony limit)
+    and all stems share the detected tempo. Drums are only used for tempo
+    detection, like in ``transcribe_audio``.
+
+    Returns:
+        (stem name -> notes, bpm). Without source separation the original mix
+        comes back as a single "other" part.
+    """
+    validated_path = validate_audio_file(audio_path)
+    audio_path_str = str(validated_path)
+
+    stems = separate_audio(audio_path_str)
+    detected_bpm = _detect_bpm(stems, audio_path_str, duration, start_offset)
+
+    if "original" in stems:
+        targets = {"other": stems["original"]}
+    else:
+        targets = {
+            name: path
+            for name, path in stems.items()
+            if name not in UNPITCHED_STEMS and not is_silent_stem(path)
+        }
+        skipped = sorted(set(stems) - set(targets) - UNPITCHED_STEMS)
+        if skipped:
+            logger.info(f"Skipping silent stems: {', '.join(skipped)}")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    stem_notes: Dict[str, List[Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            name: executor.submit(
+                _transcribe_stem, path, STEM_ROLES.get(name, "harmony"), duration, start_offset
+            )
+            for name, path in targets.items()
+        }
+        for name, future in futures.items():
+            try:
+                stem_notes[name] = _clean_and_quantize(future.result(), detected_bpm)
+            except Exception as e:
+                logger.error(f"Stem transcription failed for {name}: {e}")
+
+    logger.info(_("Merged {} notes from stems.").format(sum(len(n) for n in stem_notes.values())))
+    return stem_notes, detected_bpm
@@ -33,6 +33,37 @@ def setup_test_db():
         os.remove("./test.db")
 
 
+@pytest.fixture(autouse=True)
+def blob_store(tmp_path):
+    """생성 자산 저장소를 테스트별 임시 디렉터리로 교체"""
+    from src.api.services.blob_store import LocalBlobStore, set_blob_store
+
+    store = LocalBlobStore(str(tmp_path / "assets"))
+    set_blob_store(store)
+    yield store
+    set_blob_store(None)
+
+
+@pytest.fixture(autouse=True)
+def response_cache():
+    """테스트마다 프로젝트 응답 캐시를 비운다 (테스트 DB는 롤백되지만 캐시는 남으므로)"""
+    from src.api.services.response_cache import response_cache as cache
+
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def token_cache():
+    """테스트마다 토큰 검증 캐시를 비운다 (롤백된 사용자 id가 다음 테스트에서 재사용되므로)"""
+    from src.api.auth.token_cache import token_cache as cache
+
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 @pytest.fixture
 def db():
     connection = engine.connect()
@@ -0,0 +1,240 @@
+import io
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import status
+
+from src.api.models import ProjectAsset, ProjectModel
+from src.api.services import project_service
+from src.api.services.blob_store import BlobStore, LocalBlobStore, S3BlobStore, content_key
+from src.api.services.project_service import ProjectService, collect_asset_blobs, store_asset
+
+API_PREFIX = "/api/v1/projects"
+
+MIDI_BYTES = b"MThd\x00\x00\x00\x06\x00\x01\x00\x01\x01\xe0MTrk\x00\x00\x00\x04\x00\xff\x2f\x00"
+
+
+@pytest.fixture
+def completed_project(db, test_user):
+    project = ProjectModel(
+        id=str(uuid.uuid4()),
+        name="Blob Song",
+        original_filename="blob.mp3",
+        user_id=test_user.id,
+        status="completed",
+        bpm=100,
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+@pytest.fixture
+def dispatched_jobs(monkeypatch):
+    job_ids = []
+    monkeypatch.setattr(
+        "src.api.services.project_service.dispatch_generation_job",
+        lambda job_id, **options: job_ids.append(job_id),
+    )
+    return job_ids
+
+
+def test_local_store_is_content_addressed(tmp_path):
+    """같은 내용은 같은 키로 한 번만 저장"""
+    store = LocalBlobStore(str(tmp_path))
+    key = store.put(b"<score-partwise/>")
+
+    assert key == content_key(b"<score-partwise/>")
+    assert store.put(b"<score-partwise/>") == key
+    assert store.get(key) == b"<score-partwise/>"
+    assert store.local_path(key).endswith(f"{key[:2]}/{key[2:4]}/{key}")
+    assert b"".join(store.iter_chunks(key)) == b"<score-partwise/>"
+
+    store.delete(key)
+    assert not store.exists(key)
+    assert store.local_path(key) is None
+    with pytest.raises(ValueError):
+        store.get("../../etc/passwd")
+
+
+def _age(store, key, seconds):
+    """저장된 내용의 마지막 저장 시각을 seconds만큼 과거로 돌린다"""
+    past = time.time() - seconds
+    os.utime(store.local_path(key), (past, past))
+
+
+def test_blob_store_requires_all_operations():
+    """저장소 구현이 필수 연산을 빠뜨리면 인스턴스를 만들 수 없다"""
+
+    class PutOnly(BlobStore):
+        def put(self, data):
+            return content_key(data)
+
+    with pytest.raises(TypeError):
+        PutOnly()
+
+
+def test_put_refreshes_existing_blob(tmp_path):
+    """이미 있는 내용을 다시 저장하면 마지막 저장 시각이 갱신되어 GC 대상에서 빠진다"""
+    store = LocalBlobStore(str(tmp_path))
+    key = store.put(MIDI_BYTES)
+    _age(store, key, 7200)
+
+    store.put(MIDI_BYTES)
+    assert not store.delete_if_older(key, time.time() - 3600)
+    assert store.get(key) == MIDI_BYTES
+
+    _age(store, key, 7200)
+    assert store.delete_if_older(key, time.time() - 3600)
+    assert not store.exists(key)
+    assert list(store.iter_keys()) == []
+
+
+class _FakeS3Client:
+    """put/get/head/delete/copy/list만 흉내 내는 S3 클라이언트"""
+
+    def __init__(self):
+        self.objects = {}
+        self.modified = {}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[(Bucket, Key)] = Body
+        self.modified[(Bucket, Key)] = datetime.now(timezone.utc)
+
+    def copy_object(self, Bucket, Key, CopySource, MetadataDirective):
+        self.put_object(Bucket, Key, self.objects[(CopySource["Bucket"], CopySource["Key"])])
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise KeyError(Key)
+        return {"LastModified": self.modified[(Bucket, Key)]}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        keys = [key for bucket, key in self.objects if bucket == Bucket and key.startswith(Prefix)]
+        yield {"Contents": [{"Key": key} for key in keys]}
+
+
+def test_s3_store_uses_prefixed_keys():
+    """S3 호환 저장소는 prefix 아래에 키별 객체로 저장하고 이미 있으면 다시 올리지 않음"""
+    client = _FakeS3Client()
+    store = S3BlobStore("justjam", prefix="assets/", client=client)
+
+    key = store.put(MIDI_BYTES)
+    store.put(MIDI_BYTES)
+    assert list(client.objects) == [("justjam", f"assets/{key[:2]}/{key}")]
+    assert store.get(key) == MIDI_BYTES
+    assert b"".join(store.iter_chunks(key)) == MIDI_BYTES
+    assert store.local_path(key) is None
+    assert list(store.iter_keys()) == [key]
+    assert not store.delete_if_older(key, time.time() - 3600)
+
+    store.delete(key)
+    assert not store.exists(key)
+
+
+def test_stored_midi_served_from_blob_store(
+    client, auth_headers, completed_project, db, blob_store, dispatched_jobs
+):
+    """저장소에 있는 MIDI는 base64 없이 원본 바이트 그대로 전송"""
+    asset = store_asset(db, completed_project.id, "midi", "bass", MIDI_BYTES)
+    db.commit()
+
+    assert asset.content is None
+    assert asset.size == len(MIDI_BYTES)
+    assert blob_store.get(asset.content_hash) == MIDI_BYTES
+
+    response = client.post(f"{API_PREFIX}/{completed_project.id}/midi/bass", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Cache"] == "HIT"
+    assert response.headers["content-type"] == "audio/midi"
+    assert response.content == MIDI_BYTES
+    assert dispatched_jobs == []
+
+
+def test_stored_tab_rendered_from_blob_store(client, auth_headers, completed_project, db):
+    """타브는 저장소에서 읽어 요청한 형식으로 렌더링"""
+    store_asset(db, completed_project.id, "tab", "guitar", '{"tab": "e|-0-|", "bpm": 100}')
+    db.commit()
+
+    response = client.post(f"{API_PREFIX}/{completed_project.id}/tabs/guitar", headers=auth_headers)
+    assert response.json()["tab"] == "e|-0-|"
+
+
+def test_listing_does_not_load_asset_content(completed_project, db, test_user):
+    """목록 조회는 자산의 종류/악기만 읽는다"""
+    asset = store_asset(db, completed_project.id, "score", "piano", "<score-partwise/>")
+    db.commit()
+    db.expunge(asset)
+
+    projects, next_cursor = ProjectService.list_projects(db, test_user)
+    assert projects[0].has_score
+    assert projects[0].score_instruments == ["piano"]
+    assert "assets" not in projects[0].__dict__
+
+
+def test_deleting_project_releases_unshared_blobs(
+    completed_project, db, test_user, blob_store, monkeypatch
+):
+    """프로젝트 삭제 시 다른 자산이 쓰지 않는 내용만 저장소에서 지운다"""
+    monkeypatch.setattr(project_service, "ASSET_BLOB_GRACE", 0)
+    other = ProjectModel(
+        id=str(uuid.uuid4()),
+        name="Other",
+        original_filename="o.mp3",
+        user_id=test_user.id,
+        status="completed",
+    )
+    db.add(other)
+    shared = store_asset(db, completed_project.id, "score", "piano", "<score-partwise/>")
+    store_asset(db, other.id, "score", "piano", "<score-partwise/>")
+    own = store_asset(db, completed_project.id, "midi", "piano", MIDI_BYTES)
+    db.commit()
+
+    ProjectService.delete_project(db, completed_project.id, test_user)
+
+    assert blob_store.exists(shared.content_hash)
+    assert not blob_store.exists(own.content_hash)
+    assert (
+        db.query(ProjectAsset).filter(ProjectAsset.project_id == completed_project.id).count() == 0
+    )
+
+
+def test_recently_stored_blob_survives_project_delete(completed_project, db, test_user, blob_store):
+    """참조가 없어져도 유예 기간 안에 저장된 내용은 남겨 두고 GC가 나중에 지운다"""
+    asset = store_asset(db, completed_project.id, "midi", "piano", MIDI_BYTES)
+    db.commit()
+    key = asset.content_hash
+
+    ProjectService.delete_project(db, completed_project.id, test_user)
+    assert blob_store.exists(key)
+
+    assert collect_asset_blobs(db) == 0
+    _age(blob_store, key, project_service.ASSET_BLOB_GRACE + 60)
+    assert collect_asset_blobs(db) == 1
+    assert not blob_store.exists(key)
+
+
+def test_gc_keeps_referenced_blobs(completed_project, db, blob_store):
+    """GC는 자산이 가리키는 내용은 오래되었어도 지우지 않는다"""
+    asset = store_asset(db, completed_project.id, "score", "piano", "<score-partwise/>")
+    db.commit()
+    orphan = blob_store.put(b"orphan")
+    for key in (asset.content_hash, orphan):
+        _age(blob_store, key, project_service.ASSET_BLOB_GRACE + 60)
+
+    assert collect_asset_blobs(db, batch_size=1) == 1
+    assert blob_store.exists(asset.content_hash)
+    assert not blob_store.exists(orphan)
@@ -0,0 +1,114 @@
+"""
+Load test: API latency while several uploads are in flight
+
+업로드 핸들러의 블로킹 작업(DB 커밋 등)이 스레드풀로 넘어가는지 확인한다.
+이벤트 루프가 막히면 /health 응답이 업로드가 끝날 때까지 밀린다.
+"""
+
+import asyncio
+import os
+import statistics
+import struct
+import time
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.api.database import Base, get_db
+from src.api.main import app
+
+CONCURRENT_UPLOADS = 8
+UPLOAD_SIZE = 2 * 1024 * 1024
+BLOCKING_DELAY = 0.5  # 업로드마다 서비스 레이어가 블로킹되는 시간 (느린 DB 흉내)
+
+load_engine = create_engine("sqlite:///./test_load.db", connect_args={"check_same_thread": False})
+LoadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=load_engine)
+
+
+@pytest.fixture
+def load_app(monkeypatch, tmp_path):
+    Base.metadata.create_all(bind=load_engine)
+
+    def override_get_db():
+        db = LoadSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    from src.api.routes import projects as project_routes
+    from src.api.services import project_service
+    from src.api.services.project_service import ProjectService
+
+    real_create = ProjectService.create_project
+
+    def slow_create(*args, **kwargs):
+        time.sleep(BLOCKING_DELAY)
+        return real_create(*args, **kwargs)
+
+    monkeypatch.setattr(ProjectService, "create_project", staticmethod(slow_create))
+    monkeypatch.setattr(project_routes, "generate_thumbnail", lambda *args: None)
+    monkeypatch.setattr(project_service, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(project_routes, "UPLOAD_DIR", str(tmp_path))
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield app
+    del app.dependency_overrides[get_db]
+    load_engine.dispose()
+    if os.path.exists("./test_load.db"):
+        os.remove("./test_load.db")
+
+
+def _wav_bytes(data_size: int) -> bytes:
+    header = b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE"
+    header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 2, 44100, 44100 * 4, 4, 16)
+    header += b"data" + struct.pack("<I", data_size)
+    return header + os.urandom(data_size)
+
+
+@pytest.mark.slow
+def test_health_latency_under_concurrent_uploads(load_app, tmp_path):
+    payload = _wav_bytes(UPLOAD_SIZE)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=load_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            uploads = [
+                asyncio.create_task(
+                    ac.post(
+                        "/api/v1/projects/",
+                        files={"file": (f"load_{i}.wav", payload, "audio/wav")},
+                    )
+                )
+                for i in range(CONCURRENT_UPLOADS)
+            ]
+
+            latencies = []
+            while not all(task.done() for task in uploads):
+                started = time.perf_counter()
+                await ac.get("/health")
+                latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+            return await asyncio.gather(*uploads), latencies
+
+    started = time.perf_counter()
+    responses, latencies = asyncio.run(scenario())
+    elapsed = time.perf_counter() - started
+
+    for response in responses:
+        assert response.status_code == 200
+        saved = tmp_path / response.json()["original_filename"]
+        assert saved.stat().st_size == len(payload)
+
+    report = (
+        f"{CONCURRENT_UPLOADS} concurrent uploads in {elapsed:.2f}s, "
+        f"/health latency p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"max={max(latencies) * 1000:.1f}ms over {len(latencies)} probes"
+    )
+
+    # 블로킹 호출이 이벤트 루프에서 실행되면 업로드가 직렬화되고 /health가 그 뒤로 밀린다
+    assert elapsed < CONCURRENT_UPLOADS * BLOCKING_DELAY, report
+    assert max(latencies) < BLOCKING_DELAY, report
@@ -0,0 +1,430 @@
+import uuid
+
+import pytest
+from fastapi import status
+
+from src.api.models import GenerationJob, ProjectAsset, ProjectModel
+
+API_PREFIX = "/api/v1/projects"
+
+
+@pytest.fixture
+def completed_project(db, test_user):
+    project = ProjectModel(
+        id=str(uuid.uuid4()),
+        name="Band Song",
+        original_filename="band.mp3",
+        user_id=test_user.id,
+        status="completed",
+        bpm=120,
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+@pytest.fixture
+def dispatched(monkeypatch):
+    """Celery/로컬 워커로 넘기지 않고 요청된 작업 ID만 기록"""
+    job_ids = []
+    monkeypatch.setattr(
+        "src.api.services.project_service.dispatch_generation_job",
+        lambda job_id, **options: job_ids.append(job_id),
+    )
+    return job_ids
+
+
+def test_score_request_queues_job(client, auth_headers, completed_project, dispatched):
+    """캐시가 없으면 202와 작업 정보를 반환"""
+    response = client.post(f"{API_PREFIX}/{completed_project.id}/score/piano", headers=auth_headers)
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    data = response.json()
+    assert data["status"] == "pending"
+    assert data["asset_type"] == "score"
+    assert data["result_url"].endswith(f"/jobs/{data['id']}/result")
+    assert dispatched == [data["id"]]
+
+
+def test_duplicate_request_reuses_active_job(client, auth_headers, completed_project, dispatched):
+    """진행 중인 작업이 있으면 새로 만들지 않음"""
+    first = client.post(f"{API_PREFIX}/{completed_project.id}/midi/bass", headers=auth_headers)
+    second = client.post(f"{API_PREFIX}/{completed_project.id}/midi/bass", headers=auth_headers)
+
+    assert first.json()["id"] == second.json()["id"]
+    assert len(dispatched) == 1
+
+
+def test_stale_job_is_failed_and_requeued(client, auth_headers, completed_project, db, dispatched):
+    """제한 시간 동안 갱신이 없는 작업은 실패로 표시하고 새 작업을 만든다"""
+    from datetime import datetime, timedelta
+
+    from src.api.services import project_service
+
+    stale_at = datetime.utcnow() - timedelta(seconds=project_service.GENERATION_JOB_TIMEOUT + 60)
+    stale = GenerationJob(
+        id=str(uuid.uuid4()),
+        project_id=completed_project.id,
+        asset_type="midi",
+        instrument="bass",
+        status="processing",
+        created_at=stale_at,
+        updated_at=stale_at,
+    )
+    db.add(stale)
+    db.commit()
+
+    response = client.post(f"{API_PREFIX}/{completed_project.id}/midi/bass", headers=auth_headers)
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["id"] != stale.id
+    assert dispatched == [response.json()["id"]]
+    db.refresh(stale)
+    assert stale.status == "failed"
+
+
+def test_concurrent_request_reuses_job_created_first(
+    client, auth_headers, completed_project, db, dispatched, monkeypatch
+):
+    """확인과 생성 사이에 다른 요청이 작업을 만들면 유일 인덱스로 막고 그 작업을 반환"""
+    from src.api.services import project_service
+
+    other = GenerationJob(
+        id=str(uuid.uuid4()),
+        project_id=completed_project.id,
+        asset_type="midi",
+        instrument="bass",
+        status="pending",
+    )
+    db.add(other)
+    db.commit()
+
+    lookup = project_service._active_generation_job
+    misses = iter([None])
+    monkeypatch.setattr(
+        project_service,
+        "_active_generation_job",
+        lambda *args: next(misses, None) or lookup(*args),
+    )
+
+    response = client.post(f"{API_PREFIX}/{completed_project.id}/midi/bass", headers=auth_headers)
+
+    assert response.json()["id"] == other.id
+    assert dispatched == []
+    assert (
+        db.query(GenerationJob).filter(GenerationJob.project_id == completed_project.id).count()
+        == 1
+    )
+
+
+def test_cache_hit_returns_immediately(client, auth_headers, completed_project, db, dispatched):
+    """이미 생성된 자산은 작업 없이 바로 반환"""
+    db.add(
+        ProjectAsset(
+            project_id=completed_project.id,
+            asset_type="score",
+            instrument="piano",
+            content="<score-partwise/>",
+        )
+    )
+    db.commit()
+
+    response = client.post(f"{API_PREFIX}/{completed_project.id}/score/piano", headers=auth_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Cache"] == "HIT"
+    assert response.text == "<score-partwise/>"
+    assert dispatched == []
+
+
+def test_job_result_after_completion(client, auth_headers, completed_project, db, dispatched):
+    """작업이 끝나면 결과 엔드포인트에서 자산 반환"""
+    queued = client.post(
+        f"{API_PREFIX}/{completed_project.id}/tabs/guitar", headers=auth_headers
+    ).json()
+
+    pending = client.get(queued["result_url"], headers=auth_headers)
+    assert pending.status_code == status.HTTP_202_ACCEPTED
+
+    job = db.query(GenerationJob).filter(GenerationJob.id == queued["id"]).first()
+    job.status = "completed"
+    job.progress = 100
+    db.add(
+        ProjectAsset(
+            project_id=completed_project.id,
+            asset_type="tab",
+            instrument="guitar",
+            content='{"tab": "e|---|", "bpm": 120}',
+        )
+    )
+    db.commit()
+
+    job_status = client.get(queued["status_url"], headers=auth_headers)
+    assert job_status.json()["progress"] == 100
+
+    result = client.get(queued["result_url"], headers=auth_headers)
+    assert result.status_code == status.HTTP_200_OK
+    assert result.json()["tab"] == "e|---|"
+
+
+@pytest.fixture
+def tab_model_asset(db, completed_project):
+    """구조화 모델로 저장된 기타 타브"""
+    import json
+
+    from src.api.services.project_service import pack_notes
+    from src.tab_generator import TabGenerator
+
+    notes = [
+        {"pitch": 64, "start": 0.0, "end": 0.5, "velocity": 0.8, "role": "melody"},
+        {"pitch": 40, "start": 2.5, "end": 3.0, "velocity": 0.8, "role": "bass"},
+    ]
+    tab = TabGenerator(bpm=120).generate_tab(notes)
+    content = json.dumps(
+        {
+            "project_id": completed_project.id,
+            "instrument": "guitar",
+            "bpm": 120,
+            "notes_count": len(notes),
+            "model": tab.to_dict(),
+            "notes": pack_notes(notes),
+        }
+    )
+    db.add(
+        ProjectAsset(
+            project_id=completed_project.id, asset_type="tab", instrument="guitar", content=content
+        )
+    )
+    db.commit()
+    return tab
+
+
+def test_tab_rendered_in_requested_format(
+    client, auth_headers, completed_project, tab_model_asset, dispatched
+):
+    """저장된 타브 모델에서 ASCII/JSON/MusicXML을 다시 채보 없이 렌더링"""
+    url = f"{API_PREFIX}/{completed_project.id}/tabs/guitar"
+
+    ascii_tab = client.post(url, headers=auth_headers).json()
+    assert ascii_tab["notes_count"] == 2
+    assert "e|" in ascii_tab["tab"]
+
+    narrow = client.post(f"{url}?measures_per_line=1", headers=auth_headers).json()
+    assert narrow["tab"].count("e|") == 2
+
+    model = client.post(f"{url}?format=json", headers=auth_headers).json()["model"]
+    assert len(model["measures"]) == 2
+    assert model["tuning"] == tab_model_asset.tuning
+
+    musicxml = client.post(f"{url}?format=musicxml", headers=auth_headers)
+    assert musicxml.headers["content-type"].startswith("application/xml")
+    assert "<sign>TAB</sign>" in musicxml.text
+
+    invalid = client.post(f"{url}?format=gp5", headers=auth_headers)
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+    assert dispatched == []
+
+
+def test_tab_tuning_and_capo_variants(
+    client, auth_headers, completed_project, tab_model_asset, dispatched
+):
+    """튜닝/카포 변형은 저장된 음표로 운지만 다시 계산 (작업 없음)"""
+    url = f"{API_PREFIX}/{completed_project.id}/tabs/guitar"
+
+    standard = client.post(f"{url}?format=json", headers=auth_headers).json()
+    assert standard["tuning"] == ["E", "A", "D", "G", "B", "E"]
+    assert standard["capo"] == 0
+
+    drop_d = client.post(f"{url}?format=json&tuning=drop_d", headers=auth_headers).json()
+    assert drop_d["tuning"][0] == "D"
+    assert drop_d["model"]["tuning"][0] == 38
+    # The low E is now the 2nd fret of the low D string
+    assert drop_d["model"]["measures"][1]["events"] == [[4, 0, 2]]
+
+    capo = client.post(f"{url}?tuning=E2,A2,D3,G3,B3,E4&capo=2", headers=auth_headers).json()
+    assert capo["capo"] == 2
+    assert "e|" in capo["tab"]
+
+    for query in ("tuning=nashville", "capo=13", "tuning=E2"):
+        assert (
+            client.post(f"{url}?{query}", headers=auth_headers).status_code
+            == status.HTTP_400_BAD_REQUEST
+        )
+    assert dispatched == []
+
+
+def test_tab_variant_needs_stored_notes(client, auth_headers, completed_project, db, dispatched):
+    """음표가 저장되지 않은 타브는 기본 튜닝만 제공"""
+    import json
+
+    from src.tab_generator import TabGenerator
+
+    tab = TabGenerator(bpm=120).generate_tab([])
+    db.add(
+        ProjectAsset(
+            project_id=completed_project.id,
+            asset_type="tab",
+            instrument="bass",
+            content=json.dumps(
+                {"instrument": "bass", "bpm": 120, "notes_count": 0, "model": tab.to_dict()}
+            ),
+        )
+    )
+    db.commit()
+    url = f"{API_PREFIX}/{completed_project.id}/tabs/bass"
+
+    assert client.post(url, headers=auth_headers).status_code == status.HTTP_200_OK
+    assert (
+        client.post(f"{url}?tuning=standard", headers=auth_headers).status_code
+        == status.HTTP_200_OK
+    )
+    assert (
+        client.post(f"{url}?tuning=five_string", headers=auth_headers).status_code
+        == status.HTTP_409_CONFLICT
+    )
+
+
+def test_tab_measure_pages(client, auth_headers, completed_project, tab_model_asset, dispatched):
+    """마디 구간 조회 - 구간 정보와 구간별 ETag, 같은 ETag면 304"""
+    url = f"{API_PREFIX}/{completed_project.id}/tabs/guitar/measures"
+
+    first = client.get(f"{url}?from_measure=1&count=1&format=json", headers=auth_headers)
+    assert first.status_code == status.HTTP_200_OK
+    body = first.json()
+    assert len(body["model"]["measures"]) == 1
+    assert body["page"] == {
+        "from_measure": 1,
+        "count": 1,
+        "total_measures": 2,
+        "next_from_measure": 2,
+    }
+    assert first.headers["X-Next-From-Measure"] == "2"
+
+    second = client.get(f"{url}?from_measure=2&count=1&format=json", headers=auth_headers)
+    assert second.json()["model"]["first_measure"] == 1
+    assert second.json()["page"]["next_from_measure"] is None
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+    cached = client.get(
+        f"{url}?from_measure=1&count=1&format=json",
+        headers={**auth_headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached.headers["ETag"] == first.headers["ETag"]
+
+    musicxml = client.get(f"{url}?from_measure=2&count=4&format=musicxml", headers=auth_headers)
+    assert '<measure number="2">' in musicxml.text
+    assert musicxml.headers["X-Total-Measures"] == "2"
+
+    assert (
+        client.get(f"{url}?from_measure=0", headers=auth_headers).status_code
+        == status.HTTP_400_BAD_REQUEST
+    )
+    assert (
+        client.get(f"{url}?count=65", headers=auth_headers).status_code
+        == status.HTTP_400_BAD_REQUEST
+    )
+    assert dispatched == []
+
+
+def test_score_measure_pages(client, auth_headers, completed_project, db, dispatched):
+    """악보 마디 구간 조회 - 생성 전이면 404, 생성 후에는 구간별 MusicXML"""
+    from src.musicxml_writer import write_musicxml
+
+    url = f"{API_PREFIX}/{completed_project.id}/score/piano/measures"
+    assert client.get(url, headers=auth_headers).status_code == status.HTTP_404_NOT_FOUND
+
+    notes = [
+        {"pitch": 60 + i % 12, "start": i * 0.5, "end": i * 0.5 + 0.4, "velocity": 0.8}
+        for i in range(40)
+    ]
+    db.add(
+        ProjectAsset(
+            project_id=completed_project.id,
+            asset_type="score",
+            instrument="piano",
+            content=write_musicxml(notes, bpm=120),
+        )
+    )
+    db.commit()
+
+    page = client.get(f"{url}?from_measure=3&count=2", headers=auth_headers)
+    assert page.status_code == status.HTTP_200_OK
+    assert page.headers["content-type"].startswith("application/xml")
+    assert page.headers["X-Total-Measures"] == "10"
+    assert page.headers["X-Next-From-Measure"] == "5"
+    assert '<measure number="3">' in page.text and '<measure number="5">' not in page.text
+
+    cached = client.get(
+        f"{url}?from_measure=3&count=2",
+        headers={**auth_headers, "If-None-Match": f'W/{page.headers["ETag"]}'},
+    )
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert dispatched == []
+
+
+def test_legacy_tab_asset_only_renders_ascii(
+    client, auth_headers, completed_project, db, dispatched
+):
+    """구조화 모델이 없는 예전 타브는 ASCII로만 제공"""
+    db.add(
+        ProjectAsset(
+            project_id=completed_project.id,
+            asset_type="tab",
+            instrument="guitar",
+            content='{"tab": "e|---|", "bpm": 120}',
+        )
+    )
+    db.commit()
+    url = f"{API_PREFIX}/{completed_project.id}/tabs/guitar"
+
+    assert client.post(url, headers=auth_headers).json()["tab"] == "e|---|"
+    assert (
+        client.post(f"{url}?format=json", headers=auth_headers).status_code
+        == status.HTTP_409_CONFLICT
+    )
+
+
+def test_invalid_tab_format_rejected_before_queueing(
+    client, auth_headers, completed_project, dispatched
+):
+    """잘못된 형식은 작업을 만들지 않고 400"""
+    response = client.post(
+        f"{API_PREFIX}/{completed_project.id}/tabs/guitar?format=gp5", headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert dispatched == []
+
+
+def test_unsupported_tab_instrument(client, auth_headers, completed_project, dispatched):
+    """타브는 기타/베이스만 지원"""
+    response = client.post(f"{API_PREFIX}/{completed_project.id}/tabs/vocals", headers=auth_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert dispatched == []
+
+
+def test_combined_asset_transcribes_all_stems_once(monkeypatch):
+    """합본 요청은 스템 전체를 한 번만 채보하고 트랙 하나씩 묶는다"""
+    import io
+
+    import mido
+
+    from src import transcriber
+    from src.api.services.project_service import build_asset_content, decode_asset_content
+
+    calls = []
+
+    def fake_transcribe_stems(path):
+        calls.append(path)
+        note = [{"pitch": 45, "start": 0.0, "end": 0.5, "velocity": 0.8}]
+        return {"bass": note, "vocals": note}, 100.0
+
+    monkeypatch.setattr(transcriber, "transcribe_stems", fake_transcribe_stems)
+
+    content = build_asset_content("song.wav", "p1", "midi", "all")
+    midi = mido.MidiFile(file=io.BytesIO(decode_asset_content("midi", content)))
+    assert calls == ["song.wav"]
+    assert len(midi.tracks) == 3
+
+    score = build_asset_content("song.wav", "p1", "score", "all")
+    assert score.count("<score-part ") == 2
@@ -0,0 +1,64 @@
+"""
+API 시작 시 무거운 오디오/ML 라이브러리를 불러오지 않는지 검사하는 import-time 벤치마크
+
+새 프로세스에서 src.api.main을 import한 뒤 로드된 모듈과 소요 시간을 확인한다.
+실패하면 해당 라이브러리를 모듈 최상단이 아니라 사용하는 함수 안에서 import해야 한다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# API 프로세스에서는 로드되면 안 되는 모듈 (워커 경로 전용)
+HEAVY_MODULES = [
+    "tensorflow",
+    "basic_pitch",
+    "librosa",
+    "music21",
+    "torch",
+    "demucs",
+    "pydub",
+    "soundfile",
+    "matplotlib",
+    "numba",
+    "numpy",
+    "scipy",
+]
+
+# 여유 있게 잡은 상한 - TensorFlow가 끌려 들어오면 이 값을 크게 넘는다
+IMPORT_TIME_BUDGET_SEC = float(os.getenv("IMPORT_TIME_BUDGET_SEC", "4.0"))
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import src.api.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+def _import_api():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, APP_ENV="test", PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE % (HEAVY_MODULES,)],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_api_import_skips_heavy_libraries():
+    report = _import_api()
+    assert report["loaded"] == [], f"Heavy modules imported at API startup: {report['loaded']}"
+
+
+def test_api_import_time_within_budget():
+    report = _import_api()
+    print(f"\nsrc.api.main import: {report['elapsed']:.2f}s")
+    assert report["elapsed"] < IMPORT_TIME_BUDGET_SEC
@@ -0,0 +1,164 @@
+"""
+Tests for the processing stage graph executor
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.api.services.pipeline import Pipeline, PipelineError, Stage
+
+
+class TestPipeline:
+    """Tests for Pipeline"""
+
+    def test_runs_stages_in_dependency_order(self, tmp_path):
+        """Dependent stages receive their inputs' results"""
+        stages = [
+            Stage("a", lambda deps: 1),
+            Stage("b", lambda deps: deps["a"] + 1, inputs=["a"]),
+            Stage("c", lambda deps: deps["a"] + deps["b"], inputs=["a", "b"]),
+        ]
+        results = Pipeline(stages, str(tmp_path), "hash").run()
+        assert results == {"a": 1, "b": 2, "c": 3}
+
+    def test_independent_stages_run_in_parallel(self, tmp_path):
+        """Two independent stages overlap in time"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(_deps):
+            barrier.wait()
+            return True
+
+        stages = [Stage("left", meet), Stage("right", meet)]
+        results = Pipeline(stages, str(tmp_path), "hash", max_workers=2).run()
+        assert results == {"left": True, "right": True}
+
+    def test_resume_skips_completed_stages(self, tmp_path):
+        """A second run after a crash only executes the unfinished stages"""
+        calls = []
+
+        def record(name, fail=False):
+            def func(_deps):
+                calls.append(name)
+                if fail:
+                    raise RuntimeError("worker crashed")
+                return name
+
+            return func
+
+        output = tmp_path / "stems.wav"
+        output.write_bytes(b"")
+
+        first = [
+            Stage("separate", record("separate"), outputs=[str(output)]),
+            Stage("analysis", record("analysis", fail=True), inputs=["separate"]),
+        ]
+        with pytest.raises(PipelineError):
+            Pipeline(first, str(tmp_path), "hash").run()
+
+        calls.clear()
+        second = [
+            Stage("separate", record("separate"), outputs=[str(output)]),
+            Stage("analysis", record("analysis"), inputs=["separate"]),
+        ]
+        pipeline = Pipeline(second, str(tmp_path), "hash")
+        results = pipeline.run()
+        assert calls == ["analysis"]
+        assert pipeline.skipped == ["separate"]
+        assert results["separate"] == "separate"
+
+    def test_changed_source_invalidates_manifest(self, tmp_path):
+        """Stage keys depend on the source content hash"""
+        calls = []
+        stage = Stage("a", lambda deps: calls.append("a"))
+        Pipeline([stage], str(tmp_path), "hash-1").run()
+        Pipeline([stage], str(tmp_path), "hash-2").run()
+        assert calls == ["a", "a"]
+
+    def test_missing_output_reruns_stage(self, tmp_path):
+        """A manifest entry whose output file is gone is not trusted"""
+        calls = []
+        output = tmp_path / "master.wav"
+
+        def write(_deps):
+            calls.append("write")
+            output.write_bytes(b"data")
+
+        stages = [Stage("master", write, outputs=[str(output)])]
+        Pipeline(stages, str(tmp_path), "hash").run()
+        output.unlink()
+        Pipeline(stages, str(tmp_path), "hash").run()
+        assert calls == ["write", "write"]
+
+    def test_optional_failure_passes_none(self, tmp_path):
+        """Dependents of a failed optional stage still run with a None input"""
+
+        def boom(_deps):
+            raise RuntimeError("bpm failed")
+
+        stages = [
+            Stage("bpm", boom, required=False),
+            Stage("analysis", lambda deps: deps["bpm"] or 120, inputs=["bpm"]),
+        ]
+        pipeline = Pipeline(stages, str(tmp_path), "hash")
+        results = pipeline.run()
+        assert results == {"analysis": 120}
+        assert "bpm" in pipeline.errors
+
+    def test_required_failure_skips_dependents(self, tmp_path):
+        """Dependents of a failed required stage never run"""
+        calls = []
+
+        def boom(_deps):
+            raise RuntimeError("demucs failed")
+
+        stages = [
+            Stage("separate", boom),
+            Stage("bpm", lambda deps: calls.append("bpm"), inputs=["separate"], required=False),
+        ]
+        with pytest.raises(PipelineError, match="separate"):
+            Pipeline(stages, str(tmp_path), "hash").run()
+        assert calls == []
+
+    def test_on_poll_called_while_running(self, tmp_path):
+        """on_poll runs on the calling thread during long stages"""
+        polls = []
+        stages = [Stage("slow", lambda deps: time.sleep(0.2))]
+        Pipeline(stages, str(tmp_path), "hash").run(
+            on_poll=lambda: polls.append(threading.current_thread()), poll_interval=0.05
+        )
+        assert polls
+        assert all(t is threading.main_thread() for t in polls)
+
+    def test_cycle_rejected(self, tmp_path):
+        """Cyclic graphs are rejected at construction"""
+        stages = [
+            Stage("a", lambda deps: None, inputs=["b"]),
+            Stage("b", lambda deps: None, inputs=["a"]),
+        ]
+        with pytest.raises(ValueError, match="Cycle"):
+            Pipeline(stages, str(tmp_path), "hash")
+
+    def test_on_stage_reports_transitions(self, tmp_path):
+        """on_stage sees each stage start and finish on the calling thread"""
+        events = []
+
+        def fail(_deps):
+            raise RuntimeError("boom")
+
+        stages = [
+            Stage("a", lambda deps: 1),
+            Stage("b", fail, inputs=["a"], required=False),
+        ]
+        Pipeline(stages, str(tmp_path), "hash").run(
+            on_stage=lambda name, state: events.append((name, state, threading.current_thread()))
+        )
+        assert [(n, s) for n, s, _ in events] == [
+            ("a", "started"),
+            ("a", "completed"),
+            ("b", "started"),
+            ("b", "failed"),
+        ]
+        assert all(t is threading.main_thread() for _, _, t in events)
@@ -0,0 +1,225 @@
+"""
+처리 진행률 브로커와 SSE 엔드포인트 테스트
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+
+import httpx
+
+from src.api.main import app
+from src.api.models import ProjectModel
+from src.api.services.progress_broker import ProgressBroker
+
+API_PREFIX = "/api/v1/projects"
+
+
+def _parse_sse(body: str):
+    return [
+        json.loads(line[len("data: ") :]) for line in body.splitlines() if line.startswith("data: ")
+    ]
+
+
+def test_broker_delivers_events_from_other_threads():
+    broker = ProgressBroker()
+
+    async def scenario():
+        received = []
+
+        async def consume():
+            async for event in broker.subscribe("p1", heartbeat=5):
+                received.append(event)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+
+        def produce():
+            broker.publish("p1", status="processing", stage="separate", percent=10)
+            broker.publish("p1", status="processing", stage="separate", percent=50)
+            broker.publish("p1", status="completed", percent=100)
+
+        threading.Thread(target=produce).start()
+        await asyncio.wait_for(consumer, timeout=5)
+        return received
+
+    received = asyncio.run(scenario())
+    assert [e["percent"] for e in received] == [10, 50, 100]
+    assert received[-1]["status"] == "completed"
+
+
+def test_late_subscriber_gets_last_event():
+    broker = ProgressBroker()
+    broker.publish("p2", status="failed", percent=40, error="demucs crashed")
+
+    async def scenario():
+        return [event async for event in broker.subscribe("p2")]
+
+    events = asyncio.run(scenario())
+    assert events == [
+        {"project_id": "p2", "status": "failed", "percent": 40, "error": "demucs crashed"}
+    ]
+
+
+def test_heartbeat_when_idle():
+    broker = ProgressBroker()
+
+    async def scenario():
+        stream = broker.subscribe("p3", heartbeat=0.05)
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_idle_stream_closes_after_max_idle():
+    broker = ProgressBroker()
+
+    async def scenario():
+        return [event async for event in broker.subscribe("p4", heartbeat=0.02, max_idle=0.1)]
+
+    events = asyncio.run(scenario())
+    assert events and all(event is None for event in events)
+
+
+def test_status_check_ends_stream_without_terminal_event():
+    broker = ProgressBroker()
+    checks = []
+
+    def check_status():
+        checks.append(1)
+        return {"project_id": "p5", "status": "failed", "percent": 40} if len(checks) > 1 else None
+
+    async def scenario():
+        return [
+            event
+            async for event in broker.subscribe("p5", heartbeat=0.02, check_status=check_status)
+        ]
+
+    assert asyncio.run(scenario()) == [
+        None,
+        {"project_id": "p5", "status": "failed", "percent": 40},
+    ]
+
+
+def test_redis_subscription_is_confirmed_before_reading_last_event(monkeypatch):
+    """Redis 구독이 확인된 뒤에 마지막 이벤트를 읽어 그 사이 발행된 이벤트를 놓치지 않는다"""
+    broker = ProgressBroker("redis://unused")
+    order = []
+
+    async def fake_forward(project_id, queue, subscribed):
+        await asyncio.sleep(0.05)
+        order.append("subscribed")
+        subscribed.set()
+        await asyncio.sleep(3600)
+
+    def fake_last_event(project_id):
+        order.append("last_event")
+        return {"project_id": project_id, "status": "completed", "percent": 100}
+
+    monkeypatch.setattr(broker, "_forward_redis", fake_forward)
+    monkeypatch.setattr(broker, "last_event", fake_last_event)
+
+    async def scenario():
+        return [event async for event in broker.subscribe("p6")]
+
+    assert [e["status"] for e in asyncio.run(scenario())] == ["completed"]
+    assert order == ["subscribed", "last_event"]
+
+
+def _project(db, status, progress=0):
+    project = ProjectModel(
+        id=str(uuid.uuid4()),
+        name="Live Take",
+        original_filename="take.wav",
+        status=status,
+        progress=progress,
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+def test_events_for_finished_project_return_current_state(client, db):
+    project = _project(db, "completed", 100)
+
+    response = client.get(f"{API_PREFIX}/{project.id}/events")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert _parse_sse(response.text) == [
+        {"project_id": project.id, "status": "completed", "percent": 100}
+    ]
+
+
+def test_events_stream_until_completion(client, db, monkeypatch):
+    from src.api.routes import projects as project_routes
+
+    project = _project(db, "processing", 5)
+    broker = ProgressBroker()
+    monkeypatch.setattr(project_routes, "progress_broker", broker)
+
+    def produce():
+        # 구독이 등록될 때까지 잠시 기다린 뒤 발행
+        for _ in range(100):
+            if broker._subscribers.get(project.id):
+                break
+            threading.Event().wait(0.01)
+        broker.publish(project.id, status="processing", stage="separate", percent=30)
+        broker.publish(
+            project.id, status="processing", stage="bpm", stage_status="completed", percent=95
+        )
+        broker.publish(project.id, status="completed", percent=100)
+
+    async def scenario():
+        threading.Thread(target=produce).start()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await ac.get(f"{API_PREFIX}/{project.id}/events", timeout=10)
+
+    response = asyncio.run(scenario())
+    events = _parse_sse(response.text)
+    assert [e["percent"] for e in events] == [30, 95, 100]
+    assert events[-1]["status"] == "completed"
+
+
+def test_events_end_when_worker_stops_without_event(client, db, monkeypatch):
+    """완료/실패 이벤트 없이 처리가 끝나도 (워커 종료 등) 하트비트 때 DB 상태를 보고 종료"""
+    from functools import partial
+
+    from src.api.routes import projects as project_routes
+
+    project = _project(db, "processing", 40)
+    project_id = project.id  # 상태 확인이 세션을 닫아 project는 분리된다
+    broker = ProgressBroker()
+    broker.subscribe = partial(broker.subscribe, heartbeat=0.05)
+    monkeypatch.setattr(project_routes, "progress_broker", broker)
+
+    def fail_project():
+        for _ in range(100):
+            if broker._subscribers.get(project_id):
+                break
+            threading.Event().wait(0.01)
+        project.status = "failed"
+        db.commit()
+
+    async def scenario():
+        threading.Thread(target=fail_project).start()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await ac.get(f"{API_PREFIX}/{project_id}/events", timeout=10)
+
+    response = asyncio.run(scenario())
+    assert _parse_sse(response.text) == [
+        {"project_id": project_id, "status": "failed", "percent": 40}
+    ]
+
+
+def test_events_require_access(client, db, test_user):
+    project = _project(db, "processing")
+    project.user_id = test_user.id
+    db.commit()
+
+    response = client.get(f"{API_PREFIX}/{project.id}/events")
+    assert response.status_code == 401
@@ -0,0 +1,174 @@
+import uuid
+
+import pytest
+from fastapi import status
+from sqlalchemy import event
+
+from src.api.auth.jwt import create_access_token
+from src.api.models import ProjectMember, ProjectModel, User
+from src.api.services.project_access import EDIT, OWNER, VIEW, load_project_access
+
+API_PREFIX = "/api/v1/projects"
+
+
+def _user(db, name):
+    user = User(
+        email=f"{name}@example.com", nickname=name, provider="google", provider_id=f"{name}_1"
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _headers(user):
+    return {
+        "Authorization": f"Bearer {create_access_token({'user_id': user.id, 'email': user.email})}"
+    }
+
+
+@pytest.fixture
+def project(db, test_user):
+    project = ProjectModel(
+        id=str(uuid.uuid4()),
+        name="Band Song",
+        original_filename="band.mp3",
+        user_id=test_user.id,
+        status="completed",
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+@pytest.fixture
+def viewer(db, project):
+    user = _user(db, "viewer")
+    db.add(ProjectMember(project_id=project.id, user_id=user.id, role="viewer"))
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def editor(db, project):
+    user = _user(db, "editor")
+    db.add(ProjectMember(project_id=project.id, user_id=user.id, role="editor"))
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def statements(db):
+    """실행된 SQL 문"""
+    executed = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_execute)
+
+
+def test_roles_resolve_in_one_query(db, project, test_user, viewer, editor, statements):
+    """프로젝트와 역할을 쿼리 한 번으로 읽고 역할별 단계를 판정"""
+    stranger = _user(db, "stranger")
+    project_id = project.id
+    test_user.id  # commit으로 만료된 속성은 미리 다시 읽어 둔다
+    statements.clear()
+
+    owner_access = load_project_access(db, project_id, test_user)
+    assert len(statements) == 1
+    assert owner_access.is_owner and owner_access.allows(OWNER)
+
+    viewer_access = load_project_access(db, project_id, viewer)
+    assert (viewer_access.allows(VIEW), viewer_access.allows(EDIT)) == (True, False)
+
+    editor_access = load_project_access(db, project_id, editor)
+    assert (editor_access.allows(EDIT), editor_access.allows(OWNER)) == (True, False)
+
+    assert not load_project_access(db, project_id, stranger).allows(VIEW)
+    assert not load_project_access(db, project_id, None).allows(VIEW)
+
+
+def test_anonymous_project_allows_everyone(db):
+    """소유자가 없는 프로젝트는 누구나 모든 작업 가능"""
+    project = ProjectModel(
+        id=str(uuid.uuid4()), name="Guest", original_filename="guest.mp3", status="pending"
+    )
+    db.add(project)
+    db.commit()
+
+    assert load_project_access(db, project.id, None).allows(OWNER)
+
+
+def test_route_reads_project_once(client, auth_headers, project, statements):
+    """토큰 캐시가 찬 뒤 스템 조회는 권한 확인을 포함해 쿼리 한 번"""
+    client.get(f"{API_PREFIX}/{project.id}/stems", headers=auth_headers)
+    statements.clear()
+
+    response = client.get(f"{API_PREFIX}/{project.id}/stems", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 1
+
+
+def test_members_get_the_same_view_permissions(client, project, viewer, monkeypatch):
+    """멤버는 모든 자산 종류 생성과 스템 조회가 가능 (이전에는 MIDI만 허용)"""
+    monkeypatch.setattr(
+        "src.api.services.project_service.dispatch_generation_job", lambda job_id, **options: None
+    )
+    headers = _headers(viewer)
+
+    assert (
+        client.get(f"{API_PREFIX}/{project.id}/stems", headers=headers).status_code
+        == status.HTTP_200_OK
+    )
+    for asset_type in ("score", "midi", "tabs"):
+        response = client.post(f"{API_PREFIX}/{project.id}/{asset_type}/guitar", headers=headers)
+        assert response.status_code == status.HTTP_202_ACCEPTED
+    assert (
+        client.get(f"{API_PREFIX}/{project.id}/members", headers=headers).status_code
+        == status.HTTP_200_OK
+    )
+
+
+def test_edit_and_owner_actions(client, auth_headers, project, viewer, editor):
+    """이름 수정은 editor까지, 삭제/공유는 소유자만"""
+    response = client.patch(
+        f"{API_PREFIX}/{project.id}", json={"name": "Viewer"}, headers=_headers(viewer)
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = client.patch(
+        f"{API_PREFIX}/{project.id}", json={"name": "Editor"}, headers=_headers(editor)
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["name"] == "Editor"
+
+    assert client.delete(f"{API_PREFIX}/{project.id}", headers=_headers(editor)).status_code == 403
+    response = client.post(
+        f"{API_PREFIX}/{project.id}/share",
+        json={"email": "x@example.com"},
+        headers=_headers(editor),
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = client.post(
+        f"{API_PREFIX}/{project.id}/share", json={"email": editor.email}, headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert (response.json()["user_id"], response.json()["role"]) == (editor.id, "viewer")
+    response = client.patch(
+        f"{API_PREFIX}/{project.id}", json={"name": "Again"}, headers=_headers(editor)
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_strangers_are_rejected(client, db, project):
+    """접근 권한이 없으면 멤버 목록과 처리 시작도 거부"""
+    headers = _headers(_user(db, "stranger"))
+
+    assert client.get(f"{API_PREFIX}/{project.id}/members", headers=headers).status_code == 401
+    assert client.post(f"{API_PREFIX}/{project.id}/process", headers=headers).status_code == 401
+    assert client.post(f"{API_PREFIX}/{project.id}/process").status_code == 401
+    assert client.get(f"{API_PREFIX}/missing/stems", headers=headers).status_code == 404
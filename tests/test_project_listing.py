@@ -0,0 +1,142 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+from sqlalchemy import event
+
+from src.api.models import ProjectAsset, ProjectMember, ProjectModel, User
+from src.api.services.project_service import ProjectService
+
+API_PREFIX = "/api/v1/projects"
+
+
+@pytest.fixture
+def other_user(db):
+    user = User(
+        email="owner@example.com", nickname="Owner", provider="google", provider_id="owner_123"
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _add_projects(db, user, count, created_at=None):
+    base = created_at or datetime(2026, 1, 1)
+    projects = []
+    for i in range(count):
+        project = ProjectModel(
+            id=str(uuid.uuid4()),
+            name=f"Song {i:02d}",
+            original_filename=f"song{i}.mp3",
+            user_id=user.id,
+            status="completed",
+            created_at=base if created_at else base + timedelta(minutes=i),
+        )
+        db.add(project)
+        projects.append(project)
+    db.commit()
+    return projects
+
+
+def _fetch_all(client, auth_headers, **params):
+    names, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get(f"{API_PREFIX}/", params=query, headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        names.extend(p["name"] for p in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return names
+
+
+def test_keyset_pages_cover_every_project_once(client, auth_headers, test_user, db):
+    """cursor로 이어 읽으면 모든 프로젝트가 정렬 순서대로 한 번씩 나온다"""
+    _add_projects(db, test_user, 7)
+
+    newest = _fetch_all(client, auth_headers, limit=3)
+    assert newest == [f"Song {i:02d}" for i in range(6, -1, -1)]
+    assert _fetch_all(client, auth_headers, sort="oldest", limit=2) == newest[::-1]
+    assert _fetch_all(client, auth_headers, sort="name", limit=4) == newest[::-1]
+
+
+def test_keyset_pages_with_equal_sort_keys(client, auth_headers, test_user, db):
+    """정렬 키가 같아도 id로 순서가 고정되어 페이지 경계에서 빠지거나 겹치지 않는다"""
+    projects = _add_projects(db, test_user, 5, created_at=datetime(2026, 2, 1))
+
+    names = _fetch_all(client, auth_headers, limit=2)
+    assert sorted(names) == sorted(p.name for p in projects)
+    assert len(set(names)) == 5
+
+
+def test_listing_includes_shared_projects_and_asset_summary(db, test_user, other_user):
+    """공유받은 프로젝트도 포함되고, 자산은 (종류, 악기) 집계로만 채워진다"""
+    own = _add_projects(db, test_user, 1)[0]
+    shared, private = _add_projects(db, other_user, 2)
+    db.add(ProjectMember(project_id=shared.id, user_id=test_user.id, role="viewer"))
+    for asset_type, instrument in [
+        ("score", "piano"),
+        ("score", "piano"),
+        ("tab", "guitar"),
+        ("midi", "bass"),
+    ]:
+        db.add(ProjectAsset(project_id=own.id, asset_type=asset_type, instrument=instrument))
+    db.commit()
+
+    projects, next_cursor = ProjectService.list_projects(db, test_user)
+
+    assert next_cursor is None
+    assert {p.id for p in projects} == {own.id, shared.id}
+    listed = {p.id: p for p in projects}
+    assert listed[own.id].is_owner and not listed[shared.id].is_owner
+    assert listed[own.id].score_instruments == ["piano"]
+    assert listed[own.id].tab_instruments == ["guitar"]
+    assert listed[own.id].has_score and listed[own.id].has_tab
+    assert not listed[shared.id].has_score and listed[shared.id].score_instruments == []
+
+
+def test_listing_runs_a_single_query(db, test_user):
+    """멤버십, 페이지, 자산 집계를 한 번의 쿼리로 읽는다"""
+    projects = _add_projects(db, test_user, 3)
+    for project in projects:
+        db.add(ProjectAsset(project_id=project.id, asset_type="score", instrument="vocals"))
+    db.commit()
+    db.expire_all()
+    db.refresh(test_user)
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        listed, ___ = ProjectService.list_projects(db, test_user)
+        for project in listed:
+            project.members
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+
+    assert len(listed) == 3
+    assert len(statements) == 1, statements
+    assert "project_assets.content" not in statements[0]
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers, test_user, db):
+    """잘못된 cursor나 다른 정렬의 cursor는 400"""
+    _add_projects(db, test_user, 3)
+    response = client.get(f"{API_PREFIX}/", params={"limit": 1}, headers=auth_headers)
+    cursor = response.headers["X-Next-Cursor"]
+
+    assert (
+        client.get(
+            f"{API_PREFIX}/", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        ).status_code
+        == 400
+    )
+    mismatched = client.get(
+        f"{API_PREFIX}/", params={"cursor": cursor, "sort": "name"}, headers=auth_headers
+    )
+    assert mismatched.status_code == status.HTTP_400_BAD_REQUEST
@@ -7,9 +7,9 @@ from fastapi import status
 
 def test_create_project(client, auth_headers):
     """프로젝트 생성 테스트"""
-    # 임시 오디오 파일 생성
+    # 임시 오디오 파일 생성 (MPEG-1 Layer III 프레임 헤더 + 빈 프레임)
     with open("test_audio.mp3", "wb") as f:
-        f.write(b"fake audio data")
+        f.write(b"\xff\xfb\x90\x64" + b"\x00" * 413)
 
     with open("test_audio.mp3", "rb") as f:
         response = client.post(
@@ -0,0 +1,137 @@
+import json
+import uuid
+
+import pytest
+from fastapi import status
+
+from src.api.models import ProjectMember, ProjectModel, ProjectSearchDocument, User
+from src.api.services.project_service import ProjectService
+from src.api.services.search_index import rebuild_search_index, search_terms
+
+API_PREFIX = "/api/v1/projects"
+
+
+@pytest.fixture
+def collaborator(db):
+    user = User(
+        email="jamie@example.com", nickname="Jamie", provider="kakao", provider_id="jamie_1"
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _project(db, user, name, **fields):
+    project = ProjectModel(
+        id=str(uuid.uuid4()),
+        name=name,
+        original_filename="song.mp3",
+        user_id=user.id,
+        status="completed",
+        **fields,
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+def _search(db, user, q, sort="newest", **kwargs):
+    projects, next_cursor = ProjectService.list_projects(db, user, q=q, sort=sort, **kwargs)
+    return [p.name for p in projects], next_cursor
+
+
+def test_search_terms_drop_punctuation():
+    """검색어는 단어 단위로 나누고 코드 이름의 '#'은 유지"""
+    assert search_terms('  Summer "song" (F#m7)  ') == ["Summer", "song", "F#m7"]
+    assert search_terms("%%%") == []
+
+
+def test_prefix_search_over_name_key_and_chords(db, test_user):
+    """이름/키/코드 진행을 단어 접두사로 찾는다"""
+    _project(db, test_user, "Summer Breeze", detected_key="A Minor")
+    _project(
+        db,
+        test_user,
+        "봄날 연습",
+        chord_progression=json.dumps([{"name": "F#m7", "start": 0}, {"name": "Bm", "start": 2}]),
+    )
+    _project(db, test_user, "Winter Song")
+
+    assert _search(db, test_user, "sum")[0] == ["Summer Breeze"]
+    assert _search(db, test_user, "봄")[0] == ["봄날 연습"]
+    assert _search(db, test_user, "f#m")[0] == ["봄날 연습"]
+    assert _search(db, test_user, "minor")[0] == ["Summer Breeze"]
+    assert _search(db, test_user, "summer winter")[0] == []
+    assert sorted(_search(db, test_user, "!!")[0]) == ["Summer Breeze", "Winter Song", "봄날 연습"]
+
+
+def test_index_follows_project_changes(db, test_user):
+    """생성/수정/삭제가 같은 트랜잭션에서 검색 문서에 반영된다"""
+    project = _project(db, test_user, "Old Title")
+    assert _search(db, test_user, "old")[0] == ["Old Title"]
+
+    ProjectService.update_project(db, project.id, "New Title", test_user)
+    assert _search(db, test_user, "old")[0] == []
+    assert _search(db, test_user, "new")[0] == ["New Title"]
+
+    ProjectService.delete_project(db, project.id, test_user)
+    assert (
+        db.query(ProjectSearchDocument)
+        .filter(ProjectSearchDocument.project_id == project.id)
+        .count()
+        == 0
+    )
+    assert _search(db, test_user, "new")[0] == []
+
+
+def test_index_follows_member_names(db, test_user, collaborator):
+    """멤버 추가/닉네임 변경/제거가 검색에 반영된다"""
+    project = _project(db, test_user, "Band Practice")
+    member = ProjectMember(project_id=project.id, user_id=collaborator.id, role="viewer")
+    db.add(member)
+    db.commit()
+    assert _search(db, test_user, "jam")[0] == ["Band Practice"]
+
+    collaborator.nickname = "Robin"
+    db.commit()
+    assert _search(db, test_user, "jam")[0] == []
+    assert _search(db, test_user, "rob")[0] == ["Band Practice"]
+
+    db.delete(member)
+    db.commit()
+    assert _search(db, test_user, "rob")[0] == []
+
+
+def test_relevance_sort_ranks_name_matches_first(db, test_user):
+    """관련도 정렬은 이름 일치를 코드 일치보다 앞에 두고 cursor로 이어진다"""
+    _project(db, test_user, "Blue Notes", chord_progression=json.dumps(["Am"]))
+    _project(db, test_user, "Am I Dreaming")
+    _project(db, test_user, "Unrelated")
+
+    names, next_cursor = _search(db, test_user, "am", sort="relevance", limit=1)
+    assert names == ["Am I Dreaming"]
+    names, next_cursor = _search(db, test_user, "am", sort="relevance", limit=1, cursor=next_cursor)
+    assert names == ["Blue Notes"]
+    assert next_cursor is None
+
+
+def test_search_only_returns_accessible_projects(client, auth_headers, db, test_user, collaborator):
+    """검색 결과도 소유/공유 프로젝트로 한정된다"""
+    _project(db, test_user, "Shared Riff")
+    _project(db, collaborator, "Secret Riff")
+
+    response = client.get(
+        f"{API_PREFIX}/", params={"q": "riff", "sort": "relevance"}, headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [p["name"] for p in response.json()] == ["Shared Riff"]
+
+
+def test_rebuild_restores_documents(db, test_user):
+    """일괄 수정 뒤에는 rebuild로 문서를 다시 채울 수 있다"""
+    _project(db, test_user, "Rebuilt Song")
+    db.query(ProjectSearchDocument).delete()
+    assert _search(db, test_user, "rebuilt")[0] == []
+
+    assert rebuild_search_index(db.connection()) >= 1
+    assert _search(db, test_user, "rebuilt")[0] == ["Rebuilt Song"]
@@ -0,0 +1,145 @@
+import uuid
+
+import pytest
+from fastapi import status
+
+from src.api.auth.jwt import create_access_token
+from src.api.models import ProjectModel, User
+from src.api.services import project_service
+from src.api.services.response_cache import ResponseCache
+
+API_PREFIX = "/api/v1/projects"
+
+
+@pytest.fixture
+def project(db, test_user):
+    project = ProjectModel(
+        id=str(uuid.uuid4()),
+        name="Cached Song",
+        original_filename="cached.mp3",
+        user_id=test_user.id,
+        status="pending",
+        content_hash="c" * 64,
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+@pytest.fixture
+def friend(db):
+    user = User(
+        email="friend@example.com", nickname="Friend", provider="google", provider_id="friend_1"
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def friend_headers(friend):
+    token = create_access_token({"user_id": friend.id, "email": friend.email})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_local_cache_tag_versions_and_lru():
+    """태그 버전이 오르면 키가 바뀌고, 항목 수는 상한을 넘지 않는다"""
+    cache = ResponseCache(max_entries=2)
+    key = cache.key("projects", 1, [("q", "a")], ["projects:user:1"])
+    assert cache.key("projects", 1, [("q", "a")], ["projects:user:1"]) == key
+    assert cache.key("projects", 2, [("q", "a")], ["projects:user:1"]) != key
+
+    cache.invalidate("projects:user:1")
+    assert cache.key("projects", 1, [("q", "a")], ["projects:user:1"]) != key
+
+    from src.api.services.response_cache import CachedResponse
+
+    for name in ("a", "b", "c"):
+        cache.set(name, CachedResponse(b"[]", '"x"'))
+    assert cache.get("a") is None
+    assert cache.get("c").body == b"[]"
+
+
+def test_list_is_cached_per_user_with_etag(client, auth_headers, friend_headers, project):
+    """목록은 사용자별로 캐시되고 같은 ETag로 다시 요청하면 304"""
+    first = client.get(f"{API_PREFIX}/", headers=auth_headers)
+    assert first.headers["X-Cache"] == "MISS"
+    assert [p["name"] for p in first.json()] == ["Cached Song"]
+
+    second = client.get(f"{API_PREFIX}/", headers=auth_headers)
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+
+    # 다른 사용자는 같은 URL이어도 자기 목록을 받는다
+    assert client.get(f"{API_PREFIX}/", headers=friend_headers).json() == []
+
+    revalidated = client.get(
+        f"{API_PREFIX}/", headers={**auth_headers, "If-None-Match": first.headers["ETag"]}
+    )
+    assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+    assert revalidated.content == b""
+
+
+def test_update_invalidates_detail_and_list(client, auth_headers, project):
+    """이름 수정은 상세와 목록 캐시를 바로 무효화"""
+    client.get(f"{API_PREFIX}/", headers=auth_headers)
+    detail = client.get(f"{API_PREFIX}/{project.id}", headers=auth_headers)
+    assert detail.json()["name"] == "Cached Song"
+
+    client.patch(f"{API_PREFIX}/{project.id}", json={"name": "Renamed"}, headers=auth_headers)
+
+    detail = client.get(f"{API_PREFIX}/{project.id}", headers=auth_headers)
+    assert detail.headers["X-Cache"] == "MISS"
+    assert detail.json()["name"] == "Renamed"
+    assert client.get(f"{API_PREFIX}/", headers=auth_headers).json()[0]["name"] == "Renamed"
+
+
+def test_share_and_unshare_invalidate_member_views(
+    client, auth_headers, friend_headers, friend, project, db, test_user
+):
+    """공유/공유 해제는 멤버의 목록과 상세 접근 권한에 바로 반영"""
+    assert client.get(f"{API_PREFIX}/", headers=friend_headers).json() == []
+    assert client.get(f"{API_PREFIX}/{project.id}", headers=friend_headers).status_code == 401
+
+    project_service.ProjectService.share_project(db, project.id, friend.email, "viewer", test_user)
+    assert [p["id"] for p in client.get(f"{API_PREFIX}/", headers=friend_headers).json()] == [
+        project.id
+    ]
+    assert client.get(f"{API_PREFIX}/{project.id}", headers=friend_headers).status_code == 200
+
+    client.delete(f"{API_PREFIX}/{project.id}/members/{friend.id}", headers=auth_headers)
+    assert client.get(f"{API_PREFIX}/", headers=friend_headers).json() == []
+    assert client.get(f"{API_PREFIX}/{project.id}", headers=friend_headers).status_code == 401
+
+
+def test_processing_state_changes_invalidate(client, auth_headers, project, db, monkeypatch):
+    """처리 상태가 바뀌면 캐시된 상세/목록이 바로 새 상태를 보여준다"""
+    project_id = project.id
+    assert (
+        client.get(f"{API_PREFIX}/{project_id}", headers=auth_headers).json()["status"] == "pending"
+    )
+    assert client.get(f"{API_PREFIX}/", headers=auth_headers).json()[0]["status"] == "pending"
+
+    class FakePipeline:
+        errors = {}
+
+        def __init__(self, stages, work_dir, source_hash):
+            pass
+
+        def run(self, on_poll=None, on_stage=None):
+            return {"bpm": 98}
+
+    monkeypatch.setattr(project_service, "SessionLocal", lambda: db)
+    monkeypatch.setattr(project_service, "Pipeline", FakePipeline)
+    project_service.process_audio_logic(project_id)
+
+    detail = client.get(f"{API_PREFIX}/{project_id}", headers=auth_headers).json()
+    assert (detail["status"], detail["progress"], detail["bpm"]) == ("completed", 100, 98)
+    assert client.get(f"{API_PREFIX}/", headers=auth_headers).json()[0]["status"] == "completed"
+
+
+def test_delete_invalidates_list(client, auth_headers, project):
+    """삭제한 프로젝트는 캐시된 목록에서도 바로 사라진다"""
+    assert len(client.get(f"{API_PREFIX}/", headers=auth_headers).json()) == 1
+    client.delete(f"{API_PREFIX}/{project.id}", headers=auth_headers)
+    assert client.get(f"{API_PREFIX}/", headers=auth_headers).json() == []
@@ -0,0 +1,253 @@
+"""
+Tests for the score generator and the direct MusicXML/MIDI writers
+"""
+
+import io
+import tempfile
+import xml.etree.ElementTree as ET
+
+import mido
+import pytest
+
+from src.midi_writer import notes_to_midi, stems_to_midi
+from src.musicxml_writer import (
+    MusicXMLWriter,
+    PartSpec,
+    assign_voices,
+    measure_range,
+    split_duration,
+    write_band_musicxml,
+    write_musicxml,
+)
+from src.notation import GridNote, instrument_spec, quantize_notes
+from src.score_generator import ScoreGenerator, create_band_score, create_score
+
+
+def _notes(root):
+    return root.findall("./part/measure/note")
+
+
+class TestMusicXMLWriter:
+    """Tests for the native MusicXML backend"""
+
+    def test_simultaneous_notes_become_chord(self):
+        """Notes with the same start and length are written as one chord"""
+        notes = [
+            {"pitch": 60, "start": 0.0, "end": 0.5, "velocity": 0.9},
+            {"pitch": 64, "start": 0.0, "end": 0.5, "velocity": 0.9},
+            {"pitch": 67, "start": 0.0, "end": 0.5, "velocity": 0.9},
+        ]
+        root = ET.fromstring(write_musicxml(notes, bpm=120).split("\n", 2)[2])
+        pitched = [n for n in _notes(root) if n.find("pitch") is not None]
+        assert len(pitched) == 3
+        assert [n.find("chord") is not None for n in pitched] == [False, True, True]
+
+    def test_measures_are_filled_and_ties_cross_barlines(self):
+        """A note held over the barline is split and tied; every measure sums to 4/4"""
+        notes = [{"pitch": 62, "start": 1.5, "end": 2.5, "velocity": 0.8}]  # beats 3-5 at 120 BPM
+        root = ET.fromstring(write_musicxml(notes, bpm=120).split("\n", 2)[2])
+
+        measures = root.findall("./part/measure")
+        assert len(measures) == 2
+        for measure in measures:
+            total = sum(
+                int(n.find("duration").text)
+                for n in measure.findall("note")
+                if n.find("chord") is None
+            )
+            assert total == 16
+
+        ties = [t.get("type") for t in root.iter("tie")]
+        assert ties == ["start", "stop"]
+
+    def test_overlapping_notes_use_second_voice(self):
+        """A melody note over a held note is written in another voice with a backup"""
+        notes = [
+            {"pitch": 48, "start": 0.0, "end": 2.0, "velocity": 0.8},
+            {"pitch": 72, "start": 0.5, "end": 1.0, "velocity": 0.8},
+        ]
+        xml = write_musicxml(notes, bpm=120)
+        root = ET.fromstring(xml.split("\n", 2)[2])
+        assert {v.text for v in root.iter("voice")} == {"1", "2"}
+        assert root.find("./part/measure/backup/duration").text == "16"
+
+    def test_multi_part_scores_share_measure_count(self):
+        """Every part gets the same number of measures"""
+        short = quantize_notes([{"pitch": 40, "start": 0, "end": 0.5}], 120)
+        long = quantize_notes([{"pitch": 64, "start": 5.0, "end": 6.0}], 120)
+        xml = MusicXMLWriter(bpm=120, title="Band").write(
+            [PartSpec(instrument_spec("bass"), short), PartSpec(instrument_spec("guitar"), long)]
+        )
+        root = ET.fromstring(xml.split("\n", 2)[2])
+        parts = root.findall("./part")
+        assert [p.get("id") for p in parts] == ["P1", "P2"]
+        assert len(parts[0].findall("measure")) == len(parts[1].findall("measure")) == 3
+        assert parts[0].find("./measure/attributes/clef/sign").text == "F"
+
+    def test_split_duration_uses_notatable_values(self):
+        assert split_duration(5) == [(4, "quarter", 0), (1, "16th", 0)]
+        assert split_duration(14) == [(12, "half", 1), (2, "eighth", 0)]
+
+    def test_voice_limit_truncates_instead_of_dropping(self):
+        grid = [GridNote(start=i, duration=16, pitch=60 + i) for i in range(6)]
+        voices = assign_voices(grid, max_voices=2)
+        assert len(voices) == 2
+        assert sum(len(v) for v in voices) >= 2
+
+    def test_output_parses_with_music21(self):
+        """The native output stays readable by music21"""
+        music21 = pytest.importorskip("music21")
+        notes = [
+            {"pitch": 60 + (i % 12), "start": i * 0.3, "end": i * 0.3 + 0.7, "velocity": 0.8}
+            for i in range(40)
+        ]
+        score = music21.converter.parse(
+            write_musicxml(notes, bpm=100, instrument_name="piano"), format="musicxml"
+        )
+        assert len(score.parts) == 1
+        assert len(score.flatten().notes) > 0
+
+
+class TestMeasureRange:
+    """Tests for cutting measure ranges out of a MusicXML score"""
+
+    STEMS = {
+        "vocals": [
+            {"pitch": 60 + i % 12, "start": i * 0.5, "end": i * 0.5 + 0.4, "velocity": 0.8}
+            for i in range(80)
+        ],
+        "bass": [
+            {"pitch": 36 + i % 12, "start": i * 1.0, "end": i * 1.0 + 0.9, "velocity": 0.8}
+            for i in range(40)
+        ],
+    }
+
+    def test_page_keeps_measure_numbers_and_total(self):
+        page, total = measure_range(write_band_musicxml(self.STEMS, bpm=120), 4, 3)
+        assert total == 20
+        root = ET.fromstring(page.split("\n", 2)[2])
+        for part in root.findall("part"):
+            assert [m.get("number") for m in part.findall("measure")] == ["5", "6", "7"]
+        assert len(root.findall("part-list/score-part")) == 2
+
+    def test_page_carries_attributes_and_tempo(self):
+        """A page starting mid-song still has divisions, time, clef and tempo"""
+        page, _ = measure_range(write_band_musicxml(self.STEMS, bpm=96), 10, 2)
+        root = ET.fromstring(page.split("\n", 2)[2])
+        for part in root.findall("part"):
+            first = part.find("measure")
+            assert [c.tag for c in first.find("attributes")] == ["divisions", "key", "time", "clef"]
+            assert first.find("direction/sound").get("tempo") == "96"
+        clefs = [p.find("measure/attributes/clef/sign").text for p in root.findall("part")]
+        assert clefs == ["G", "F"]
+
+    def test_range_past_the_end_is_empty(self):
+        page, total = measure_range(write_band_musicxml(self.STEMS, bpm=120), 40, 8)
+        assert total == 20
+        assert ET.fromstring(page.split("\n", 2)[2]).findall("part/measure") == []
+
+
+class TestMidiWriter:
+    """Tests for the native in-memory MIDI encoder"""
+
+    def test_round_trip_with_mido(self):
+        """Notes, tempo and program survive a parse with mido"""
+        notes = [
+            {"pitch": 40, "start": 0.0, "end": 0.5, "velocity": 1.0},
+            {"pitch": 43, "start": 0.5, "end": 1.0, "velocity": 0.5},
+        ]
+        midi = mido.MidiFile(file=io.BytesIO(notes_to_midi(notes, bpm=120, instrument_name="bass")))
+
+        assert midi.type == 1
+        conductor, track = midi.tracks
+        assert mido.tempo2bpm(
+            next(m for m in conductor if m.type == "set_tempo").tempo
+        ) == pytest.approx(120)
+        assert next(m for m in track if m.type == "program_change").program == 33
+
+        note_ons = [m for m in track if m.type == "note_on"]
+        assert [m.note for m in note_ons] == [40, 43]
+        assert [m.velocity for m in note_ons] == [127, 64]
+        assert midi.length == pytest.approx(1.0)
+
+    def test_one_track_per_stem(self):
+        """Each stem gets its own track (in score order) and channel; drums go to channel 10"""
+        note = [{"pitch": 38, "start": 0.0, "end": 0.25, "velocity": 0.8}]
+        midi = mido.MidiFile(
+            file=io.BytesIO(
+                stems_to_midi({"bass": note, "drums": note, "vocals": note, "other": []}, bpm=100)
+            )
+        )
+
+        assert len(midi.tracks) == 4  # conductor + three non-empty stems
+        names = [next(m.name for m in t if m.type == "track_name") for t in midi.tracks[1:]]
+        assert names == ["Vocals", "Bass", "Drums"]
+        channels = [next(m.channel for m in t if m.type == "note_on") for t in midi.tracks[1:]]
+        assert channels == [0, 1, 9]
+
+    def test_repeated_pitch_releases_before_retrigger(self):
+        """A note ending where the next one starts is released first"""
+        notes = [
+            {"pitch": 60, "start": 0.0, "end": 0.5, "velocity": 0.8},
+            {"pitch": 60, "start": 0.5, "end": 1.0, "velocity": 0.8},
+        ]
+        track = mido.MidiFile(file=io.BytesIO(notes_to_midi(notes, bpm=120))).tracks[1]
+        kinds = [m.type for m in track if m.type in ("note_on", "note_off")]
+        assert kinds == ["note_on", "note_off", "note_on", "note_off"]
+
+    def test_no_temp_files(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("temp file created")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail)
+        data = create_score(
+            [{"pitch": 60, "start": 0, "end": 1, "velocity": 0.8}], 120, "piano", format="midi"
+        )
+        assert data.startswith(b"MThd")
+
+
+class TestScoreGenerator:
+    """Tests for backend selection"""
+
+    def test_default_backend_is_native(self):
+        assert ScoreGenerator().backend == "native"
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            ScoreGenerator(backend="lilypond")
+
+    def test_create_score_native(self):
+        xml = create_score([{"pitch": 57, "start": 0, "end": 1, "velocity": 0.7}], 90, "bass")
+        assert "<score-partwise" in xml
+        assert "<per-minute>90</per-minute>" in xml
+
+    def test_empty_notes(self):
+        assert create_score([], 120, "piano") == ""
+
+    def test_music21_backend_still_available(self):
+        pytest.importorskip("music21")
+        xml = ScoreGenerator(bpm=120, backend="music21").generate_musicxml(
+            [{"pitch": 60, "start": 0, "end": 0.5, "velocity": 0.8}], "piano"
+        )
+        assert "score-partwise" in xml
+
+    def test_music21_midi_backend_in_memory(self):
+        pytest.importorskip("music21")
+        data = ScoreGenerator(bpm=120, backend="music21").generate_midi(
+            [{"pitch": 60, "start": 0, "end": 0.5, "velocity": 0.8}], "piano"
+        )
+        assert data.startswith(b"MThd")
+
+    def test_multitrack_midi_empty(self):
+        assert ScoreGenerator().generate_multitrack_midi({"bass": [], "drums": []}) == b""
+
+    def test_band_score_shares_measures_in_score_order(self):
+        """Parts follow score order and every part has the same number of measures"""
+        short = [{"pitch": 40, "start": 0.0, "end": 1.0, "velocity": 0.8}]
+        long = [{"pitch": 72, "start": 0.0, "end": 9.0, "velocity": 0.8}]
+        xml = create_band_score({"drums": short, "vocals": long, "bass": short, "piano": []}, 120)
+
+        root = ET.fromstring(xml.split("\n", 2)[2])
+        names = [p.findtext("part-name") for p in root.findall("./part-list/score-part")]
+        assert names == ["Vocals", "Bass", "Drums"]
+        assert {len(p.findall("measure")) for p in root.findall("part")} == {5}
@@ -4,7 +4,9 @@ Tests for the tab generator module
 
 import pytest
 
-from src.tab_generator import TabGenerator, create_tab
+from src.fingering import Candidate, chord_states, optimize_fingering
+from src.tab_generator import TUNING_PRESETS, TabGenerator, create_tab, resolve_tuning
+from src.tab_model import Tablature, render_ascii, render_musicxml
 
 
 class TestTabGenerator:
@@ -85,6 +87,19 @@ class TestTabGenerator:
         assert "|" in result  # Tab should have pipe characters
         assert "-" in result  # Tab should have dashes
 
+    def test_notes_land_in_their_measure(self):
+        """Unsorted notes are bucketed into the right measure and slot"""
+        generator = TabGenerator(bpm=120)  # 2 seconds per measure
+        notes = [
+            {"start": 6.0, "end": 6.5, "pitch": 64, "velocity": 0.8, "role": "melody"},
+            {"start": 0.0, "end": 0.5, "pitch": 64, "velocity": 0.8, "role": "melody"},
+            {"start": 2.5, "end": 3.0, "pitch": 64, "velocity": 0.8, "role": "melody"},
+        ]
+        tab = generator.generate_ascii_tab(notes)
+        high_e = next(line for line in tab.splitlines() if line.startswith("e|"))
+        measures = high_e[2:].split("|")[:4]
+        assert [m.index("0") if "0" in m else None for m in measures] == [0, 4, None, 0]
+
     def test_detect_chord_empty(self):
         """Test chord detection with no notes"""
         generator = TabGenerator()
@@ -114,6 +129,222 @@ class TestTabGenerator:
             generator.generate_ascii_tab(invalid_notes)
 
 
+class TestPositionTables:
+    """Tests for the shared pitch-to-position lookup tables"""
+
+    def test_tables_shared_across_instances(self):
+        """Generators with the same tuning reuse one table"""
+        assert TabGenerator().positions() is TabGenerator(bpm=140).positions()
+        drop_d = TabGenerator(tuning=["D2", "A2", "D3", "G3", "B3", "E4"])
+        assert drop_d.positions() is not TabGenerator().positions()
+
+    def test_capo_counts_frets_from_capo(self):
+        generator = TabGenerator()
+        generator.capo = 2
+        # F#2 is the open low string with a capo on the 2nd fret
+        assert generator.find_best_pos(42, role="bass") == (0, 0)
+        assert all(
+            c.fret <= generator.config_max_fret - 2 for c in generator.position_candidates(80)
+        )
+
+    def test_candidates_ranked_best_first(self):
+        candidates = TabGenerator().position_candidates(64, role="melody")
+        assert candidates[0].string == 5 and candidates[0].fret == 0
+        assert [c.score for c in candidates] == sorted((c.score for c in candidates), reverse=True)
+
+    def test_reassigned_chord_templates_are_precomputed(self):
+        """Replacing the templates refreshes their pitch classes"""
+        generator = TabGenerator()
+        generator.chord_templates = {"E5": {0: 0, 1: 2}}
+        assert generator.chord_pitch_classes("E5") == frozenset({4, 11})
+        notes = [
+            {"pitch": 40, "start": 0, "end": 1, "velocity": 0.8},
+            {"pitch": 47, "start": 0, "end": 1, "velocity": 0.8},
+        ]
+        assert generator.detect_chord(notes) == "E5"
+
+
+class TestTuningsAndCapo:
+    """Tests for alternate tunings and capo positions"""
+
+    def test_resolve_tuning(self):
+        assert resolve_tuning("guitar") == TUNING_PRESETS["guitar"]["standard"]
+        assert resolve_tuning("guitar", "drop_d")[0] == "D2"
+        assert len(resolve_tuning("bass", "five_string")) == 5
+        assert resolve_tuning("guitar", "C2, G2, D3, A3, E4, G4") == [
+            "C2",
+            "G2",
+            "D3",
+            "A3",
+            "E4",
+            "G4",
+        ]
+        for invalid in ("nashville", "E2", "X2,A2,D3,G3"):
+            with pytest.raises(ValueError):
+                resolve_tuning("guitar", invalid)
+
+    def test_invalid_capo(self):
+        with pytest.raises(ValueError):
+            TabGenerator(capo=-1)
+        with pytest.raises(ValueError):
+            TabGenerator(capo=20)
+
+    def test_drop_d_uses_low_d(self):
+        generator = TabGenerator(tuning=resolve_tuning("guitar", "drop_d"))
+        assert generator.find_best_pos(38, role="bass") == (0, 0)
+
+    def test_capo_is_recorded_in_model(self):
+        notes = [{"pitch": 45, "start": 0.0, "end": 0.5, "velocity": 0.8, "role": "bass"}]
+        tab = TabGenerator(bpm=120, capo=5).generate_tab(notes)
+        assert tab.capo == 5
+        assert tab.measures[0].events[0].fret == 0  # A2 is the open low string with capo 5
+
+    def test_chord_names_do_not_depend_on_tuning(self):
+        notes = [
+            {"pitch": p, "start": 0.0, "end": 1.0, "velocity": 0.8}
+            for p in (43, 47, 50, 55)  # G major
+        ]
+        standard = TabGenerator().detect_chord(notes)
+        assert standard == "G"
+        assert (
+            TabGenerator(tuning=resolve_tuning("guitar", "dadgad")).detect_chord(notes) == standard
+        )
+        assert TabGenerator(capo=2).detect_chord(notes) == standard
+
+    def test_cached_notes_are_not_mutated(self):
+        """Auto-transpose works on copies so the same notes render every variant"""
+        notes = [{"pitch": 61, "start": 0.0, "end": 0.5, "velocity": 0.8, "role": "melody"}]
+        TabGenerator().generate_tab(notes)
+        TabGenerator(capo=3).generate_tab(notes)
+        assert notes[0]["pitch"] == 61
+
+
+class TestFingering:
+    """Tests for the dynamic-programming fingering optimizer"""
+
+    def test_stays_in_position(self):
+        """An ambiguous note is played where the hand already is"""
+        events = [
+            [[Candidate(3, 7, 500)]],
+            [[Candidate(2, 2, 600), Candidate(3, 9, 500)]],  # greedy would jump to fret 2
+            [[Candidate(4, 8, 500)]],
+        ]
+        assert optimize_fingering(events) == [[(3, 7)], [(3, 9)], [(4, 8)]]
+
+    def test_chord_notes_use_distinct_strings(self):
+        """Simultaneous notes are assigned jointly, never sharing a string"""
+        shared = [Candidate(1, 2, 1500), Candidate(2, 0, 1000)]
+        states = chord_states([shared, shared])
+        best = states[0].positions
+        assert {p.string for p in best} == {1, 2}
+
+    def test_unplayable_chord_note_is_dropped(self):
+        one_string = [Candidate(0, 3, 1000)]
+        assert optimize_fingering([[one_string, one_string]]) == [[(0, 3), None]]
+
+    def test_plan_fingering_reduces_hand_jumps(self):
+        """Over a long walking line the optimizer moves the hand less than the greedy choice"""
+        import random
+
+        generator = TabGenerator()
+        rng = random.Random(3)
+        pitches, p = [], 68
+        for _ in range(2000):
+            p = max(52, min(84, p + rng.choice([-4, -2, -1, 1, 2, 4, 5, 7])))
+            pitches.append(p)
+
+        def travel(positions):
+            frets = [f for _, f in positions if f > 0]
+            return sum(abs(a - b) for a, b in zip(frets, frets[1:]))
+
+        greedy = [generator.find_best_pos(p, role="melody") for p in pitches]
+        planned = generator.plan_fingering(
+            [
+                {
+                    "pitch": p,
+                    "is_bass": False,
+                    "role": "melody",
+                    "chord_shape": {},
+                    "measure": i // 16,
+                    "slot": i % 16,
+                }
+                for i, p in enumerate(pitches)
+            ]
+        )
+        assert all(planned)
+        assert travel(planned) < travel(greedy)
+
+    def test_tab_chord_notes_all_written(self):
+        """A three-note chord lands on three different strings of the same slot"""
+        generator = TabGenerator(bpm=120)
+        notes = [
+            {"start": 0.0, "end": 1.0, "pitch": pitch, "velocity": 0.8, "role": "melody"}
+            for pitch in (67, 71, 74)
+        ]
+        tab = generator.generate_ascii_tab(notes)
+        string_lines = [line for line in tab.splitlines() if "|" in line and line[1] == "|"]
+        first_slots = [line[2] for line in string_lines]
+        assert sum(c != "-" for c in first_slots) == 3
+
+
+class TestTabModel:
+    """Tests for the structured tab model and its renderers"""
+
+    NOTES = [
+        {"pitch": 64, "start": 0.0, "end": 0.5, "velocity": 0.8, "role": "melody"},
+        {"pitch": 86, "start": 0.5, "end": 1.0, "velocity": 0.8, "role": "melody"},
+        {"pitch": 40, "start": 2.5, "end": 3.0, "velocity": 0.8, "role": "bass"},
+    ]
+
+    def test_round_trip_through_dict(self):
+        tab = TabGenerator(bpm=120).generate_tab(self.NOTES)
+        restored = Tablature.from_dict(tab.to_dict())
+        assert restored == tab
+        assert render_ascii(restored) == TabGenerator(bpm=120).generate_ascii_tab(self.NOTES)
+
+    def test_two_digit_frets_written_in_full(self):
+        tab = TabGenerator(bpm=120).generate_tab(self.NOTES)
+        high = [e for m in tab.measures for e in m.events if e.string == 5 and e.fret >= 10]
+        assert high
+        high_line = next(line for line in render_ascii(tab).splitlines() if line.startswith("e|"))
+        assert str(high[0].fret) in high_line
+
+    def test_measures_per_line_only_changes_layout(self):
+        tab = TabGenerator(bpm=120).generate_tab(self.NOTES)
+        assert len(tab.measures) == 2
+        assert render_ascii(tab, measures_per_line=1).count("e|") == 2
+        assert render_ascii(tab, measures_per_line=4).count("e|") == 1
+
+    def test_empty_model_renders_same_message_as_generator(self):
+        tab = TabGenerator(bpm=120).generate_tab(self.NOTES).measure_range(5, 1)
+        assert render_ascii(tab) == TabGenerator(bpm=120).generate_ascii_tab([])
+
+    def test_measure_range_keeps_song_numbering(self):
+        import xml.etree.ElementTree as ET
+
+        tab = TabGenerator(bpm=120).generate_tab(self.NOTES)
+        second = tab.measure_range(1, 4)
+        assert second.first_measure == 1
+        assert second.measures == tab.measures[1:]
+        assert Tablature.from_dict(second.to_dict()) == second
+        root = ET.fromstring(render_musicxml(second).split("\n", 2)[2])
+        assert [m.get("number") for m in root.findall(".//measure")] == ["2"]
+
+    def test_musicxml_has_tab_staff(self):
+        import xml.etree.ElementTree as ET
+
+        root = ET.fromstring(
+            render_musicxml(TabGenerator(bpm=120).generate_tab(self.NOTES)).split("\n", 2)[2]
+        )
+        assert root.find(".//clef/sign").text == "TAB"
+        assert len(root.findall(".//staff-tuning")) == 6
+        assert len(root.findall(".//technical/fret")) == 3
+        assert all(1 <= int(s.text) <= 6 for s in root.findall(".//technical/string"))
+        # Every measure is filled to four beats (divisions = 4)
+        for measure in root.findall(".//measure"):
+            assert sum(int(d.text) for d in measure.findall("note/duration")) == 16
+
+
 class TestCreateTab:
     """Tests for create_tab convenience function"""
 
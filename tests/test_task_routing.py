@@ -0,0 +1,99 @@
+"""
+Celery 큐/우선순위 결정 테스트
+"""
+
+import struct
+import uuid
+
+from src.api.celery_app import celery_app
+from src.api.models import GenerationJob, ProjectModel
+from src.api.services import task_routing
+from src.api.services.task_routing import generation_route, processing_route
+
+
+def write_wav(path, duration_sec: float, sample_rate: int = 8000):
+    data_size = int(duration_sec * sample_rate) * 2
+    header = b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE"
+    header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    header += b"data" + struct.pack("<I", data_size)
+    # 길이 판별은 헤더만 읽으므로 데이터는 일부만 기록
+    path.write_bytes(header + bytes(1024))
+    return str(path)
+
+
+def _project(db, user_id=None, status="pending"):
+    project = ProjectModel(
+        id=str(uuid.uuid4()),
+        name="song",
+        original_filename="song.wav",
+        status=status,
+        user_id=user_id,
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+def test_tasks_are_routed_to_resource_queues():
+    routes = celery_app.conf.task_routes
+    assert routes["process_audio_task"]["queue"] == "separation"
+    assert routes["generate_asset_task"]["queue"] == "transcription"
+    assert {q.name for q in celery_app.conf.task_queues} == {
+        "separation",
+        "separation_long",
+        "transcription",
+        "light",
+    }
+
+
+def test_short_song_gets_higher_priority_than_long_one(db, tmp_path):
+    project = _project(db)
+    short = processing_route(db, project, write_wav(tmp_path / "short.wav", 180))
+    medium = processing_route(db, project, write_wav(tmp_path / "medium.wav", 900))
+    assert short["queue"] == medium["queue"] == "separation"
+    assert short["priority"] < medium["priority"]
+
+
+def test_long_recording_goes_to_dedicated_queue(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(task_routing, "LONG_AUDIO_SEC", 3600)
+    project = _project(db)
+    route = processing_route(db, project, write_wav(tmp_path / "rehearsal.wav", 90 * 60))
+    assert route["queue"] == "separation_long"
+
+
+def test_user_with_many_active_jobs_is_deprioritised(db, tmp_path, test_user):
+    path = write_wav(tmp_path / "song.wav", 180)
+    first = _project(db, user_id=test_user.id)
+    baseline = processing_route(db, first, path)["priority"]
+
+    for _ in range(3):
+        _project(db, user_id=test_user.id, status="processing")
+    busy = processing_route(db, first, path)["priority"]
+
+    other = _project(db, user_id=None)
+    assert busy == baseline + 3
+    assert processing_route(db, other, path)["priority"] == baseline
+
+
+def test_unknown_duration_uses_default_priority(db, tmp_path):
+    path = tmp_path / "mystery.mp3"
+    path.write_bytes(b"not really audio")
+    route = processing_route(db, _project(db), str(path))
+    assert route == {"queue": "separation", "priority": task_routing.DEFAULT_PRIORITY}
+
+
+def test_generation_route_counts_other_jobs_only(db, test_user):
+    project = _project(db, user_id=test_user.id, status="completed")
+    job = GenerationJob(
+        id=str(uuid.uuid4()),
+        project_id=project.id,
+        asset_type="midi",
+        instrument="bass",
+        status="pending",
+    )
+    db.add(job)
+    db.commit()
+
+    route = generation_route(db, job)
+    assert route["queue"] == "transcription"
+    assert route["priority"] == task_routing.DEFAULT_PRIORITY - 1
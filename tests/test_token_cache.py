@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event
+
+from src.api.auth.jwt import create_access_token
+from src.api.auth.token_cache import TokenCache
+
+API_PREFIX = "/api/v1"
+
+
+@pytest.fixture
+def user_queries(db):
+    """users 테이블 SELECT 횟수"""
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_execute)
+
+
+def test_repeated_requests_skip_user_lookup(client, auth_headers, user_queries):
+    """같은 토큰의 반복 요청은 users를 다시 조회하지 않는다"""
+    assert client.get(f"{API_PREFIX}/users/me", headers=auth_headers).status_code == 200
+    first = len(user_queries)
+    assert first >= 1
+
+    for _ in range(3):
+        response = client.get(f"{API_PREFIX}/users/me", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["nickname"] == "TestUser"
+    assert len(user_queries) == first
+
+
+def test_profile_update_through_cached_user(client, auth_headers):
+    """캐시에서 꺼낸 사용자도 수정/commit되고, 수정 뒤에는 새 값이 보인다"""
+    client.get(f"{API_PREFIX}/users/me", headers=auth_headers)
+
+    response = client.patch(
+        f"{API_PREFIX}/users/me", json={"nickname": "Renamed"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert (
+        client.get(f"{API_PREFIX}/users/me", headers=auth_headers).json()["nickname"] == "Renamed"
+    )
+
+
+def test_soft_delete_revokes_cached_token(client, auth_headers, token_cache, test_user):
+    """탈퇴하면 캐시된 토큰도 바로 거부된다"""
+    client.get(f"{API_PREFIX}/users/me", headers=auth_headers)
+    assert client.delete(f"{API_PREFIX}/users/me", headers=auth_headers).status_code == 200
+
+    assert test_user.id not in token_cache._tokens_by_user
+    assert client.get(f"{API_PREFIX}/users/me", headers=auth_headers).status_code == 401
+
+
+def test_logout_drops_cached_entries(client, auth_headers, token_cache, test_user):
+    """로그아웃은 그 사용자의 캐시 항목을 지운다"""
+    client.get(f"{API_PREFIX}/users/me", headers=auth_headers)
+    assert test_user.id in token_cache._tokens_by_user
+
+    assert client.post(f"{API_PREFIX}/auth/logout", headers=auth_headers).status_code == 200
+    assert test_user.id not in token_cache._tokens_by_user
+
+
+def test_entries_expire_with_token_and_lru(db, test_user):
+    """항목은 토큰 exp를 넘기지 않고, 상한을 넘으면 오래된 것부터 빠진다"""
+    cache = TokenCache(ttl=60, max_entries=2)
+    expired = create_access_token({"user_id": test_user.id}, expires_delta=timedelta(seconds=-1))
+    cache.set(expired, {"exp": 1}, test_user)
+    assert cache.get(db, expired) is None
+
+    tokens = [f"token-{i}" for i in range(3)]
+    for token in tokens:
+        cache.set(token, {"exp": 4102444800}, test_user)
+    assert cache.get(db, tokens[0]) is None
+    assert cache.get(db, tokens[2]) is test_user
+    assert cache._tokens_by_user[test_user.id] == set(tokens[1:])
+
+    assert TokenCache(ttl=0).get(db, tokens[2]) is None
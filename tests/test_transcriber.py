@@ -4,9 +4,19 @@ Tests for the transcriber module
 
 from pathlib import Path
 
+import numpy as np
 import pytest
+import soundfile as sf
 
-from src.transcriber import SUPPORTED_FORMATS, transcribe_audio, validate_audio_file
+from src import transcriber
+from src.transcriber import (
+    SUPPORTED_FORMATS,
+    is_silent_stem,
+    stem_level_db,
+    transcribe_audio,
+    transcribe_stems,
+    validate_audio_file,
+)
 
 
 class TestValidateAudioFile:
@@ -65,3 +75,59 @@ class TestTranscribeAudio:
         audio_file.write_text("not an audio file")
         with pytest.raises(ValueError):
             transcribe_audio(str(audio_file))
+
+
+def _write_tone(path, amplitude, sr=8000):
+    t = np.arange(sr) / sr
+    sf.write(str(path), amplitude * np.sin(2 * np.pi * 220 * t), sr)
+    return str(path)
+
+
+class TestTranscribeStems:
+    """Tests for the single-pass multi-stem transcription"""
+
+    def test_stem_level_db(self, tmp_path):
+        """A full-scale sine is about -3 dBFS; digital silence is -inf"""
+        assert stem_level_db(_write_tone(tmp_path / "tone.wav", 1.0)) == pytest.approx(
+            -3.01, abs=0.05
+        )
+        assert stem_level_db(_write_tone(tmp_path / "zero.wav", 0.0)) == float("-inf")
+
+    def test_is_silent_stem(self, tmp_path):
+        assert is_silent_stem(_write_tone(tmp_path / "quiet.wav", 0.0005))
+        assert not is_silent_stem(_write_tone(tmp_path / "loud.wav", 0.3))
+
+    def test_skips_silent_stems_and_shares_bpm(self, tmp_path, monkeypatch):
+        """Separation and tempo detection run once; silent stems and drums are not transcribed"""
+        source = tmp_path / "song.wav"
+        source.touch()
+        stems = {
+            "vocals": _write_tone(tmp_path / "vocals.wav", 0.3),
+            "bass": _write_tone(tmp_path / "bass.wav", 0.3),
+            "piano": _write_tone(tmp_path / "piano.wav", 0.0),
+            "drums": _write_tone(tmp_path / "drums.wav", 0.3),
+        }
+        calls = {"separate": 0, "bpm": 0, "stems": []}
+
+        def fake_separate(path):
+            calls["separate"] += 1
+            return stems
+
+        def fake_bpm(*args):
+            calls["bpm"] += 1
+            return 120.0
+
+        def fake_transcribe(path, role, duration=None, start_offset=0.0):
+            calls["stems"].append(path)
+            return [{"pitch": 60, "start": 0.0, "end": 0.5, "velocity": 0.9, "role": role}]
+
+        monkeypatch.setattr(transcriber, "separate_audio", fake_separate)
+        monkeypatch.setattr(transcriber, "_detect_bpm", fake_bpm)
+        monkeypatch.setattr(transcriber, "_transcribe_stem", fake_transcribe)
+
+        stem_notes, bpm = transcribe_stems(str(source))
+
+        assert bpm == 120.0
+        assert set(stem_notes) == {"vocals", "bass"}
+        assert sorted(calls["stems"]) == sorted([stems["vocals"], stems["bass"]])
+        assert calls["separate"] == 1 and calls["bpm"] == 1
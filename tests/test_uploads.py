@@ -0,0 +1,279 @@
+"""
+업로드 형식 판별, 크기/길이 검사, 이어받기 청크 업로드 테스트
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import types
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.models import ProjectModel
+from src.api.services import upload_service
+from src.api.services.upload_service import probe_audio_header
+
+
+def make_wav(duration_sec: float = 1.0, sample_rate: int = 8000) -> bytes:
+    data_size = int(duration_sec * sample_rate) * 2
+    header = b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE"
+    header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    header += b"data" + struct.pack("<I", data_size)
+    return header + bytes(data_size)
+
+
+@pytest.fixture
+def upload_dirs(tmp_path, monkeypatch):
+    from src.api.routes import projects as project_routes
+    from src.api.services import project_service
+
+    monkeypatch.setattr(upload_service, "PARTIAL_UPLOAD_DIR", str(tmp_path / "partial"))
+    monkeypatch.setattr(project_service, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(project_routes, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(project_routes, "generate_thumbnail", lambda *args: None)
+    return tmp_path
+
+
+def test_probe_wav_duration():
+    info = probe_audio_header(make_wav(2.0))
+    assert info["format"] == "wav"
+    assert info["sample_rate"] == 8000
+    assert info["duration"] == pytest.approx(2.0)
+
+
+def test_probe_flac_streaminfo():
+    sample_rate, channels, total_samples = 44100, 2, 44100 * 90
+    packed = (sample_rate << 44) | ((channels - 1) << 41) | (15 << 36) | total_samples
+    streaminfo = struct.pack(">HH", 4096, 4096) + bytes(6) + packed.to_bytes(8, "big") + bytes(16)
+    header = b"fLaC" + bytes([0x80]) + (34).to_bytes(3, "big") + streaminfo
+
+    info = probe_audio_header(header)
+    assert info["format"] == "flac"
+    assert info["sample_rate"] == sample_rate
+    assert info["channels"] == channels
+    assert info["duration"] == pytest.approx(90.0)
+
+
+def test_probe_mp3_estimates_duration_from_bitrate():
+    frame = b"\xff\xfb\x90\x64"  # MPEG-1 Layer III, 128kbps, 44.1kHz
+    info = probe_audio_header(frame + bytes(100), total_size=16000 * 60)
+    assert info["format"] == "mp3"
+    assert info["sample_rate"] == 44100
+    assert info["duration"] == pytest.approx(60.0, rel=0.01)
+
+
+def test_probe_rejects_unknown_data():
+    assert probe_audio_header(b"this is not audio at all") is None
+
+
+def test_upload_rejects_non_audio(client, upload_dirs):
+    response = client.post(
+        "/api/v1/projects/", files={"file": ("fake.mp3", b"fake audio data", "audio/mpeg")}
+    )
+    assert response.status_code == 415
+    assert not os.listdir(upload_dirs / "uploads")
+
+
+def test_upload_rejects_too_long_audio(client, upload_dirs, monkeypatch):
+    monkeypatch.setattr(upload_service, "MAX_AUDIO_DURATION", 1.0)
+    response = client.post(
+        "/api/v1/projects/", files={"file": ("long.wav", make_wav(2.0), "audio/wav")}
+    )
+    assert response.status_code == 413
+
+
+def test_upload_stores_content_hash(client, upload_dirs, db):
+    payload = make_wav(0.5)
+    response = client.post("/api/v1/projects/", files={"file": ("take.wav", payload, "audio/wav")})
+    assert response.status_code == 200
+
+    project = db.query(ProjectModel).filter(ProjectModel.id == response.json()["id"]).first()
+    assert project.content_hash == hashlib.sha256(payload).hexdigest()
+
+
+def test_resumable_upload_flow(client, upload_dirs, db):
+    payload = make_wav(12.0)  # 192KB -> 3 chunks
+    chunk = 64 * 1024
+
+    session = client.post(
+        "/api/v1/projects/uploads", json={"file_name": "rehearsal.wav", "total_size": len(payload)}
+    )
+    assert session.status_code == 201
+    upload_id = session.json()["upload_id"]
+
+    # 첫 청크 전송 후 연결이 끊겼다고 가정하고 상태 조회로 이어서 보낼 위치 확인
+    first = client.put(f"/api/v1/projects/uploads/{upload_id}?offset=0", content=payload[:chunk])
+    assert first.json()["received"] == chunk
+
+    mismatch = client.put(f"/api/v1/projects/uploads/{upload_id}?offset=0", content=payload[:chunk])
+    assert mismatch.status_code == 409
+    assert mismatch.headers["Upload-Offset"] == str(chunk)
+
+    offset = client.get(f"/api/v1/projects/uploads/{upload_id}").json()["received"]
+    while offset < len(payload):
+        resp = client.put(
+            f"/api/v1/projects/uploads/{upload_id}?offset={offset}",
+            content=payload[offset : offset + chunk],
+        )
+        assert resp.status_code == 200
+        offset = resp.json()["received"]
+
+    done = client.post(f"/api/v1/projects/uploads/{upload_id}/complete")
+    assert done.status_code == 200
+    assert done.json()["name"] == "rehearsal.wav"
+
+    project = db.query(ProjectModel).filter(ProjectModel.id == done.json()["id"]).first()
+    assert project.content_hash == hashlib.sha256(payload).hexdigest()
+    with open(upload_dirs / "uploads" / project.original_filename, "rb") as f:
+        assert f.read() == payload
+    assert client.get(f"/api/v1/projects/uploads/{upload_id}").status_code == 404
+
+
+def test_resumable_upload_rejects_bad_header_early(client, upload_dirs):
+    session = client.post(
+        "/api/v1/projects/uploads", json={"file_name": "noise.wav", "total_size": 200 * 1024}
+    )
+    upload_id = session.json()["upload_id"]
+
+    resp = client.put(
+        f"/api/v1/projects/uploads/{upload_id}?offset=0", content=os.urandom(64 * 1024)
+    )
+    assert resp.status_code == 415
+    assert client.get(f"/api/v1/projects/uploads/{upload_id}").status_code == 404
+
+
+def test_resumable_upload_session_is_private(client, upload_dirs, auth_headers):
+    session = client.post(
+        "/api/v1/projects/uploads",
+        json={"file_name": "mine.wav", "total_size": 1024},
+        headers=auth_headers,
+    )
+    upload_id = session.json()["upload_id"]
+
+    assert client.get(f"/api/v1/projects/uploads/{upload_id}").status_code == 404
+    assert (
+        client.get(f"/api/v1/projects/uploads/{upload_id}", headers=auth_headers).status_code == 200
+    )
+
+
+def test_concurrent_chunks_for_same_offset_are_serialized(upload_dirs):
+    """같은 위치로 동시에 들어온 두 청크 중 하나만 기록되고 나머지는 409"""
+    import asyncio
+
+    from src.api.exceptions import UploadInProgressError
+    from src.api.services.upload_service import UploadService
+
+    payload = make_wav(12.0)
+    chunk = payload[: 64 * 1024]
+    upload_id = UploadService.create_session("take.wav", len(payload))["upload_id"]
+
+    async def slow_stream():
+        await asyncio.sleep(0.05)
+        yield chunk
+
+    async def send_twice():
+        return await asyncio.gather(
+            UploadService.append_chunk(upload_id, 0, slow_stream()),
+            UploadService.append_chunk(upload_id, 0, slow_stream()),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(send_twice())
+    assert sum(isinstance(r, UploadInProgressError) for r in results) == 1
+    assert UploadService.get_session(upload_id)["received"] == len(chunk)
+    with open(upload_dirs / "partial" / upload_id / "data.part", "rb") as f:
+        assert f.read() == chunk
+
+
+def _set_last_activity(upload_dirs, upload_id, when):
+    session_path = upload_dirs / "partial" / upload_id / "session.json"
+    session = json.loads(session_path.read_text())
+    session["updated_at"] = when.isoformat()
+    session_path.write_text(json.dumps(session))
+
+
+def test_idle_upload_sessions_expire(upload_dirs):
+    """TTL 동안 청크가 없던 세션은 조회되지 않고, 정리하면 디렉터리와 해시 상태가 지워진다"""
+    from src.api.exceptions import UploadSessionNotFoundError
+    from src.api.services.upload_service import UploadService
+
+    ttl = timedelta(seconds=upload_service.UPLOAD_SESSION_TTL)
+    idle = UploadService.create_session("old.wav", 1024)["upload_id"]
+    recent = UploadService.create_session("new.wav", 1024)["upload_id"]
+    _set_last_activity(upload_dirs, idle, datetime.utcnow() - ttl - timedelta(minutes=1))
+
+    with pytest.raises(UploadSessionNotFoundError):
+        UploadService.get_session(idle)
+
+    assert UploadService.expire_sessions() == 1
+    assert not (upload_dirs / "partial" / idle).exists()
+    assert idle not in upload_service._session_hashers
+    assert UploadService.get_session(recent)["upload_id"] == recent
+
+
+def test_session_lock_without_fcntl_uses_msvcrt(upload_dirs, monkeypatch):
+    """fcntl이 없는 플랫폼(Windows)에서는 msvcrt.locking으로 잠그고 정리한 세션은 잠금 해제 후 지운다"""
+    from src.api.exceptions import UploadInProgressError
+    from src.api.services.upload_service import UploadService
+
+    locked = set()
+
+    def locking(fd, mode, nbytes):
+        inode = os.fstat(fd).st_ino
+        if mode == fake_msvcrt.LK_UNLCK:
+            locked.discard(inode)
+        elif inode in locked:
+            raise PermissionError(13, "Permission denied")
+        else:
+            locked.add(inode)
+
+    fake_msvcrt = types.SimpleNamespace(LK_NBLCK=2, LK_UNLCK=0, locking=locking)
+    monkeypatch.setitem(sys.modules, "fcntl", None)
+    monkeypatch.setitem(sys.modules, "msvcrt", fake_msvcrt)
+
+    upload_id = UploadService.create_session("take.wav", 1024)["upload_id"]
+    with UploadService._session_lock(upload_id):
+        with pytest.raises(UploadInProgressError):
+            with UploadService._session_lock(upload_id):
+                pass
+        UploadService.discard_session(upload_id)
+
+    assert not locked
+    assert not (upload_dirs / "partial" / upload_id).exists()
+
+
+def test_duplicate_upload_reuses_processed_stems(db, tmp_path, monkeypatch):
+    from src.api.services import project_service
+    from src.api.services.pipeline import MANIFEST_FILENAME
+
+    monkeypatch.setattr(project_service, "SEPARATED_DIR", str(tmp_path))
+    done = ProjectModel(
+        id="done",
+        name="a.wav",
+        original_filename="done.wav",
+        status="completed",
+        content_hash="abc",
+    )
+    fresh = ProjectModel(
+        id="fresh",
+        name="a.wav",
+        original_filename="fresh.wav",
+        status="pending",
+        content_hash="abc",
+    )
+    db.add_all([done, fresh])
+    db.commit()
+
+    done_dir = tmp_path / "htdemucs_6s" / "done"
+    done_dir.mkdir(parents=True)
+    (done_dir / "drums.wav").write_bytes(b"stem")
+    (done_dir / MANIFEST_FILENAME).write_text("{}")
+
+    fresh_dir = tmp_path / "htdemucs_6s" / "fresh"
+    assert project_service.reuse_processed_stems(db, fresh, str(fresh_dir))
+    assert (fresh_dir / "drums.wav").read_bytes() == b"stem"
+    # 이미 manifest가 있으면 다시 가져오지 않는다
+    assert not project_service.reuse_processed_stems(db, fresh, str(fresh_dir))
@@ -0,0 +1,63 @@
+"""
+Celery 워커 예열/readiness/재시작 설정 테스트
+"""
+
+import os
+
+from src.api import worker
+from src.api.celery_app import celery_app
+
+
+def test_configured_models_parses_env(monkeypatch):
+    monkeypatch.setenv("WORKER_PRELOAD_MODELS", " basic_pitch, demucs ,")
+    assert worker.configured_models() == ["basic_pitch", "demucs"]
+
+    monkeypatch.delenv("WORKER_PRELOAD_MODELS")
+    assert worker.configured_models() == []
+
+
+def test_preload_runs_known_loaders_and_survives_failures():
+    calls = []
+
+    def broken():
+        calls.append("broken")
+        raise RuntimeError("no GPU")
+
+    preloaders = {"good": lambda: calls.append("good"), "broken": broken}
+    timings = worker.preload(["broken", "unknown", "good"], preloaders)
+
+    assert calls == ["broken", "good"]
+    assert set(timings) == {"good"}
+
+
+def test_process_init_preloads_only_in_process_models(monkeypatch):
+    loaded = []
+    monkeypatch.setenv("WORKER_PRELOAD_MODELS", "basic_pitch,demucs")
+    monkeypatch.setitem(
+        worker.PROCESS_PRELOADERS, "basic_pitch", lambda: loaded.append("basic_pitch")
+    )
+    monkeypatch.setitem(worker.WORKER_PRELOADERS, "demucs", lambda: loaded.append("demucs"))
+
+    worker.on_worker_process_init()
+    assert loaded == ["basic_pitch"]
+
+    worker.on_worker_init()
+    assert loaded == ["basic_pitch", "demucs"]
+
+
+def test_ready_file_lifecycle(tmp_path, monkeypatch):
+    ready_file = tmp_path / "ready"
+    monkeypatch.setattr(worker, "READY_FILE", str(ready_file))
+    monkeypatch.setenv("WORKER_PRELOAD_MODELS", "")
+
+    worker.on_worker_ready()
+    assert ready_file.read_text() == str(os.getpid())
+
+    worker.on_worker_shutdown()
+    assert not ready_file.exists()
+
+
+def test_workers_recycle_children():
+    assert celery_app.conf.worker_max_tasks_per_child > 0
+    assert celery_app.conf.worker_max_memory_per_child > 0
+    assert celery_app.conf.worker_proc_alive_timeout >= 60